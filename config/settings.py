@@ -84,10 +84,10 @@ DATABASES = {"default": env.db("DATABASE_URL")}
 DATABASES["default"]["CONN_MAX_AGE"] = 0
 if DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql":
     # https://blog.heroku.com/postgres-essentials#set-a-code-statement_timeout-code-for-web-dynos
-    DATABASES["OPTIONS"] = {"options": "-c statement_timeout=30000", "pool": True}
+    DATABASES["default"]["OPTIONS"] = {"options": "-c statement_timeout=30000", "pool": True}
 elif DATABASES["default"]["ENGINE"] == "django.db.backends.sqlite3":
     # https://alldjango.com/articles/definitive-guide-to-using-django-sqlite-in-production
-    DATABASES["OPTIONS"] = {
+    DATABASES["default"]["OPTIONS"] = {
         "transaction_mode": "IMMEDIATE",
         "timeout": 30,  # seconds
         "init_command": """
@@ -668,6 +668,14 @@ NINJA_PAGINATION_CLASS = "ninja.pagination.LimitOffsetPagination"
 ARTICLE_FETCH_TIMEOUT = env.int("LEGADILO_ARTICLE_FETCH_TIMEOUT", default=50)
 RSS_FETCH_TIMEOUT = env.int("LEGADILO_RSS_FETCH_TIMEOUT", default=300)
 CONTACT_EMAIL = env.str("LEGADILO_CONTACT_EMAIL", default=None)
+ARTICLE_SEARCH_CONFIG_FROM_LANGUAGE = env.bool(
+    "LEGADILO_ARTICLE_SEARCH_CONFIG_FROM_LANGUAGE", default=False
+)
+QUERY_TELEMETRY_ENABLED = env.bool("LEGADILO_QUERY_TELEMETRY_ENABLED", default=False)
+# In milliseconds.
+QUERY_TELEMETRY_SLOW_QUERY_THRESHOLD = env.int(
+    "LEGADILO_QUERY_TELEMETRY_SLOW_QUERY_THRESHOLD", default=500
+)
 TOKEN_LENGTH = 50
 JWT_ALGORITHM = "HS256"
 ACCESS_TOKEN_MAX_AGE = timedelta(hours=24)
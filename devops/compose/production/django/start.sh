@@ -33,6 +33,9 @@ case "${cmd}" in
     cron)
         exec python manage.py cron
         ;;
+    import_jobs)
+        exec python manage.py run_import_jobs --wait
+        ;;
     *)
         echo "Unknown command" >&2
         exit 1
@@ -6,6 +6,7 @@ from http import HTTPStatus
 from unittest.mock import patch
 
 import pytest
+from django.core.cache import cache
 from django.urls import reverse
 
 from legadilo.core.models import Timezone
@@ -44,6 +45,12 @@ def _setup_settings(settings, tmpdir):
     settings.TEMPLATES[0]["OPTIONS"]["debug"] = True
 
 
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def user(db) -> User:
     return UserFactory()
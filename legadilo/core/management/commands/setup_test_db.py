@@ -46,7 +46,7 @@ class Command(BaseCommand):
 
     def _subscribe_to_feeds(self, user):
         for feed_url in self.feeds:
-            if Feed.objects.filter(feed_url=feed_url).exists():
+            if Feed.objects.get_queryset().for_feed_urls_search([feed_url]).exists():
                 continue
 
             with get_rss_sync_client() as client:
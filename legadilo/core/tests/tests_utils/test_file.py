@@ -0,0 +1,52 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import json
+from io import BytesIO
+
+import pytest
+
+from legadilo.core.utils.file import iter_json_array_items
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param([], id="empty"),
+        pytest.param([{"title": "Claudius", "tags": ["é", "😀"]}, {"id": 1}], id="objects"),
+        pytest.param([123456, -1.5e10, "Some text", None, True, []], id="other-values"),
+    ],
+)
+@pytest.mark.parametrize("indent", [None, 2])
+def test_iter_json_array_items(data, chunk_size, indent):
+    file = BytesIO(json.dumps(data, indent=indent, ensure_ascii=False).encode())
+
+    items = list(iter_json_array_items(file, chunk_size=chunk_size))
+
+    assert items == data
+
+
+def test_iter_json_array_items_with_bom():
+    file = BytesIO(b"\xef\xbb\xbf[1, 2]")
+
+    assert list(iter_json_array_items(file)) == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        pytest.param(b"", id="empty"),
+        pytest.param(b'{"key": "value"}', id="not-an-array"),
+        pytest.param(b"[1, 2", id="not-closed"),
+        pytest.param(b"[1 2]", id="no-delimiter"),
+        pytest.param(b"[1, ]", id="trailing-comma"),
+        pytest.param(b'[{"key": }]', id="invalid-item"),
+        pytest.param(b"[1] 2", id="extra-data"),
+        pytest.param(b'["\xff"]', id="invalid-unicode"),
+    ],
+)
+def test_iter_json_array_items_invalid(content):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array_items(BytesIO(content), chunk_size=2))
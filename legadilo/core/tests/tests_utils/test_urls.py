@@ -7,6 +7,7 @@ from django.test import RequestFactory
 
 from legadilo.core.utils.urls import (
     add_query_params,
+    hash_url,
     pop_query_param,
     validate_from_url,
     validate_referer_url,
@@ -158,3 +159,12 @@ def test_pop_query_param_missing_param():
     built_url = pop_query_param("https://example.com/test", "my-param")
 
     assert built_url == ("https://example.com/test", None)
+
+
+def test_hash_url():
+    url_hash = hash_url("https://example.com/Some/Path?q=Value#Title")
+
+    assert -(2**63) <= url_hash < 2**63
+    assert url_hash == hash_url(" HTTPS://EXAMPLE.COM/Some/Path?q=Value#Title")
+    assert url_hash != hash_url("https://example.com/some/path?q=Value#Title")
+    assert hash_url("http://[invalid") == hash_url("http://[invalid ")
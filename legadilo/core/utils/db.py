@@ -2,7 +2,7 @@
 #
 #  SPDX-License-Identifier: AGPL-3.0-or-later
 
-from django.db import models
+from django.db import connection, migrations, models
 
 
 class CaseInsensitiveEmailField(models.EmailField):
@@ -31,3 +31,53 @@ class ExtractEpoch(models.Func):
             template=r"%(function)s('%%%%s', %(expressions)s)",
             **extra_context,
         )
+
+
+class FullTextSearchField(models.TextField):
+    """Hidden column of a SQLite FTS5 table.
+
+    It has the same name as the table and is used to match documents or to rank them.
+    """
+
+
+@FullTextSearchField.register_lookup
+class FullTextMatch(models.Lookup):
+    lookup_name = "match"
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs} MATCH {rhs}", (*lhs_params, *rhs_params)
+
+
+class Bm25(models.Func):
+    """Rank of a SQLite FTS5 match. The smaller the value, the better the match."""
+
+    function = "bm25"
+    output_field = models.FloatField()
+
+
+class Fts5Snippet(models.Func):
+    """Fragment of a SQLite FTS5 match with the matched terms highlighted.
+
+    Expects the hidden column, the index of the column to extract the fragment from (-1 to let
+    SQLite pick the best one), the text to insert before and after each matched term, the
+    ellipsis and the max number of tokens of the fragment.
+    """
+
+    function = "snippet"
+    output_field = models.TextField()
+
+
+def disable_statement_timeout() -> list[migrations.RunSQL]:
+    """Disable the statement_timeout of PostgreSQL for the rest of the migration.
+
+    Backfills and index builds on big tables can take longer than the timeout set in the settings.
+    Use it as the first operation: migrations run in a transaction on PostgreSQL.
+    """
+    if connection.vendor != "postgresql":
+        return []
+
+    return [
+        migrations.RunSQL("SET LOCAL statement_timeout = 0", reverse_sql=migrations.RunSQL.noop)
+    ]
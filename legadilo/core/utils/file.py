@@ -2,37 +2,92 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
+import codecs
 import contextlib
+import json
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 from tempfile import NamedTemporaryFile
+from typing import IO, Any
 
-from django.core.files.uploadedfile import InMemoryUploadedFile, TemporaryUploadedFile
+import ijson
+from django.core.files import File
 
 
 @contextlib.contextmanager
-def ensure_file_on_disk(django_file: TemporaryUploadedFile | InMemoryUploadedFile):
-    """Ensure the uploaded file is on the disk.
+def ensure_file_on_disk(django_file: File):
+    """Ensure the file is on the disk.
 
-    For TemporaryUploadedFile it yields the existing file path and for InMemoryUploadedFile it saves
-    the content into a temporary file and yields its path.
+    For TemporaryUploadedFile it yields the existing file path. For other files (like
+    InMemoryUploadedFile or files from the storage) it copies the content into a temporary file
+    and yields its path.
     """
     if hasattr(django_file, "temporary_file_path"):
         yield django_file.temporary_file_path()
         return
 
     with NamedTemporaryFile() as f:
-        f.write(django_file.read())
+        for chunk in django_file.chunks():
+            f.write(chunk)
         f.flush()
         yield f.name
 
 
 @contextlib.contextmanager
-def file_or_stdout(file_path: str | None = None):
-    """Return a file object for the given file path or stdout if None is supplied."""
+def file_or_stdout(file_path: str | None = None, *, binary: bool = False):
+    """Return a file object for the given file path or stdout if None is supplied.
+
+    With binary, the file object expects bytes instead of str.
+    """
     if file_path is None:
-        yield sys.stdout
+        yield sys.stdout.buffer if binary else sys.stdout
         return
 
-    with Path(file_path).open(mode="w", encoding="UTF-8") as f:
-        yield f
+    if binary:
+        with Path(file_path).open(mode="wb") as f:
+            yield f
+    else:
+        with Path(file_path).open(mode="w", encoding="UTF-8") as f:
+            yield f
+
+
+class _Utf8BomSkippingReader:
+    """Skip the UTF-8 BOM some tools write at the start of their files."""
+
+    def __init__(self, file: IO[bytes]):
+        self._file = file
+        self._is_start = True
+
+    def read(self, size: int = -1) -> bytes:
+        # ijson reads 0 bytes to check the type of the file: the start must not be consumed yet.
+        if not self._is_start or size == 0:
+            return self._file.read(size)
+
+        self._is_start = False
+        start = self._file.read(len(codecs.BOM_UTF8)).removeprefix(codecs.BOM_UTF8)
+        if size < 0:
+            return start + self._file.read()
+        return start + self._file.read(max(size - len(start), 0))
+
+
+def _ensure_array(events: Iterator[tuple[str, str, Any]]) -> Iterator[tuple[str, str, Any]]:
+    first_event = next(events, None)
+    if first_event is None or first_event[1] != "start_array":
+        raise json.JSONDecodeError("Expecting '['", "", 0)
+
+    yield first_event
+    yield from events
+
+
+def iter_json_array_items(file: IO[bytes], *, chunk_size: int = 64 * 1024) -> Iterator[Any]:
+    """Decode the items of a JSON array one by one while the file is read.
+
+    Only the item being decoded is kept in memory: it can be used on files too big to be loaded at
+    once with json.load. Raise json.JSONDecodeError if the file is not a valid JSON array.
+    """
+    events = ijson.parse(_Utf8BomSkippingReader(file), buf_size=chunk_size, use_float=True)
+    try:
+        yield from ijson.items(_ensure_array(events), "item")
+    except ijson.JSONError as e:
+        raise json.JSONDecodeError(f"Invalid JSON array: {e}", "", 0) from e
@@ -2,7 +2,11 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
+from collections.abc import Callable
+
 # This is for: (TotalNbModelsDeleted, {"RelatedModel": NbDeleted, "Model": NbDeleted})
 type DeletionResult = tuple[int, dict[str, int]]
 type FormChoice = tuple[str, str]
 type FormChoices = list[FormChoice]
+# Called with the number of items processed so far.
+type ProgressCallback = Callable[[int], None]
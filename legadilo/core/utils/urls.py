@@ -2,6 +2,7 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
+import hashlib
 from urllib.parse import parse_qs, urlencode, urlparse, urlsplit, urlunsplit
 
 from django.db.models import TextChoices
@@ -77,3 +78,24 @@ def pop_query_param(url: str, param: str) -> tuple[str, str | None]:
     read_param = query.pop(param, [])
     url_fragments[3] = urlencode(query, doseq=True)
     return urlunsplit(url_fragments), next(iter(read_param), None)
+
+
+def hash_url(url: str) -> int:
+    """Hash a URL into a signed 64 bits integer, to look it up with a narrow index.
+
+    The scheme and the domain are case-insensitive, so they are lowered before hashing. Since
+    different URLs can share the same hash, lookups must still compare the URLs themselves.
+    """
+    url = url.strip()
+    try:
+        url_fragments = urlsplit(url)
+    except ValueError:
+        canonical_url = url
+    else:
+        canonical_url = urlunsplit(
+            url_fragments._replace(
+                scheme=url_fragments.scheme.lower(), netloc=url_fragments.netloc.lower()
+            )
+        )
+    digest = hashlib.blake2b(canonical_url.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, signed=True)
@@ -58,7 +58,7 @@ class OutFeedSchema(ModelSchema):
 
     class Meta:
         model = Feed
-        exclude = ("user", "created_at", "updated_at", "articles")
+        exclude = ("user", "created_at", "updated_at", "articles", "feed_url_hash")
 
 
 class FeedsSearchQuery(Schema):
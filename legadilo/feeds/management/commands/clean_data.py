@@ -5,17 +5,19 @@
 import logging
 
 from django.core.management import BaseCommand
+from django.db import connection
 
 from legadilo.feeds.models import FeedUpdate
-from legadilo.reading.models import Article, ArticleFetchError
+from legadilo.reading.models import Article, ArticleFetchError, DeletedArticle
 
 logger = logging.getLogger(__name__)
 
 
 class Command(BaseCommand):
     help = (
-        "Clean data from database: old feed updates, article fetch errors and articles whose "
-        "retention dates are passed"
+        "Clean data from database: old feed updates, article fetch errors, records of deleted "
+        "articles and articles whose retention dates are passed. Also refresh the statistics of "
+        "the query planner on SQLite."
     )
 
     def handle(self, *args, **options):
@@ -25,3 +27,17 @@ class Command(BaseCommand):
         logger.info("Deleted %s article fetch errors.", deletion_result)
         deletion_result = Article.objects.cleanup_articles()
         logger.info("Deleted %s articles.", deletion_result)
+        deletion_result = DeletedArticle.objects.cleanup()
+        logger.info("Deleted %s records of deleted articles.", deletion_result)
+
+        if connection.vendor == "sqlite":
+            self._analyze_database()
+
+    def _analyze_database(self):
+        # Without statistics, SQLite may choose bad plans. For instance, it can look up the full
+        # text search index once per article of the user instead of reading matches directly.
+        # Limit the number of rows read per index to keep this fast on big databases.
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA analysis_limit=1000")
+            cursor.execute("ANALYZE")
+        logger.info("Refreshed statistics of the query planner.")
@@ -0,0 +1,44 @@
+# Generated by Django 6.0.4 on 2026-10-19 00:41
+
+from django.core.paginator import Paginator
+from django.db import migrations, models
+
+from legadilo.core.utils.db import disable_statement_timeout
+from legadilo.core.utils.urls import hash_url
+
+
+def fill_feed_url_hashes(apps, schema_editor):
+    Feed = apps.get_model("feeds", "Feed")
+    paginator = Paginator(Feed.objects.only("id", "feed_url").order_by("id"), 500)
+    for page in paginator:
+        feeds = list(page.object_list)
+        for feed in feeds:
+            feed.feed_url_hash = hash_url(feed.feed_url)
+        Feed.objects.bulk_update(feeds, fields=["feed_url_hash"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("feeds", "0003_fill_missing_slugs"),
+    ]
+
+    operations = [
+        *disable_statement_timeout(),
+        migrations.AddField(
+            model_name="feed",
+            name="feed_url_hash",
+            field=models.BigIntegerField(
+                default=0,
+                editable=False,
+                help_text="Hash of the feed URL, used to look feeds up by URL with a narrow index.",
+            ),
+            preserve_default=False,
+        ),
+        migrations.RunPython(fill_feed_url_hashes, reverse_code=migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="feed",
+            index=models.Index(
+                fields=["user", "feed_url_hash"], name="feeds_feed_user_id_2936ac_idx"
+            ),
+        ),
+    ]
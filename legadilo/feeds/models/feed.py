@@ -4,6 +4,7 @@
 
 
 import calendar
+from collections.abc import Iterable
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any, cast
 from zoneinfo import ZoneInfo
@@ -14,8 +15,10 @@ from django.utils.translation import gettext_lazy as _
 from slugify import slugify
 
 from legadilo.core.utils.time_utils import utcnow
+from legadilo.core.utils.urls import hash_url
 from legadilo.reading.models.article import Article, ArticleQuerySet, SaveArticleResult
 from legadilo.reading.models.tag import Tag
+from legadilo.reading.services.unread_counters import invalidate_unread_counters
 from legadilo.users.models import User
 
 from ...users.models import Notification
@@ -138,12 +141,11 @@ class FeedQuerySet(models.QuerySet["Feed"]):
     def for_api(self):
         return self.select_related("category").prefetch_related("tags")
 
-    def for_feed_urls_search(self, urls: list[str]):
-        filters = models.Q()
-        for url in urls:
-            filters |= models.Q(feed_url=url)
-
-        return self.filter(filters)
+    def for_feed_urls_search(self, urls: Iterable[str]):
+        urls = list(urls)
+        # The hashes are used to find the feeds with a narrow index. Comparing the URLs too rules
+        # out hash collisions.
+        return self.filter(feed_url_hash__in=[hash_url(url) for url in urls], feed_url__in=urls)
 
     def for_status_search(self, *, enabled: bool):
         return self.filter(enabled=enabled)
@@ -194,6 +196,7 @@ class FeedManager(models.Manager["Feed"]):
     ) -> tuple[Feed, bool]:
         feed, created = self.get_or_create(
             user=user,
+            feed_url_hash=hash_url(feed_data.feed_url),
             feed_url=feed_data.feed_url,
             defaults={
                 "site_url": feed_data.site_url,
@@ -285,9 +288,7 @@ class FeedManager(models.Manager["Feed"]):
         }
         articles_to_update = []
         article_urls_already_exist = set(
-            Article.objects.filter(
-                user=feed.user, url__in=feed_article_id_to_article_url.values()
-            ).values_list("url", flat=True)
+            Article.objects.get_by_urls(feed.user, feed_article_id_to_article_url.values())
         )
         for feed_article in (
             FeedArticle.objects
@@ -308,12 +309,13 @@ class FeedManager(models.Manager["Feed"]):
                 continue
 
             feed_article.article.url = new_article_url
+            feed_article.article.url_hash = hash_url(new_article_url)
             articles_to_update.append(feed_article.article)
 
-        Article.objects.bulk_update(articles_to_update, fields=["url"])
+        Article.objects.bulk_update(articles_to_update, fields=["url", "url_hash"])
 
     def _mark_republished_articles_as_unread(self, feed: Feed, feed_data: FeedData):
-        Article.objects.filter(
+        nb_republished_articles = Article.objects.filter(
             feed_articles__feed=feed,
             feed_articles__feed_article_id__in=[
                 article.external_article_id for article in feed_data.articles
@@ -322,6 +324,8 @@ class FeedManager(models.Manager["Feed"]):
             - timedelta(days=feeds_constants.DELAY_BEFORE_REPUBLICATION),
             read_at__lt=utcnow() - timedelta(days=feeds_constants.DELAY_BEFORE_REPUBLICATION),
         ).update(read_at=None)
+        if nb_republished_articles > 0:
+            invalidate_unread_counters([feed.user_id])
 
     def _delete_feed_article_linked_wrong_article(
         self, feed: Feed, save_results: list[SaveArticleResult]
@@ -393,6 +397,10 @@ class FeedManager(models.Manager["Feed"]):
 
 class Feed(models.Model):
     feed_url = models.URLField()
+    feed_url_hash = models.BigIntegerField(
+        editable=False,
+        help_text=_("Hash of the feed URL, used to look feeds up by URL with a narrow index."),
+    )
     site_url = models.URLField()
     enabled = models.GeneratedField(
         expression=models.Case(
@@ -473,11 +481,23 @@ class Feed(models.Model):
                 | models.Q(enabled=False),
             ),
         ]
+        indexes = [
+            models.Index(fields=["user", "feed_url_hash"]),
+        ]
 
     def __str__(self):
         category_title = self.category.title if self.category else "None"
         return f"Feed(title={self.title}, feed_type={self.feed_type}, category={category_title})"
 
+    def save(self, *args, **kwargs):
+        self.feed_url_hash = hash_url(self.feed_url)
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        # The main feed of the articles is set to NULL by the database: it doesn't update them.
+        self.articles_main_feed.all().mark_as_updated()
+        return super().delete(*args, **kwargs)
+
     def disable(self, reason=""):
         self.disabled_reason = reason
         self.disabled_at = utcnow()
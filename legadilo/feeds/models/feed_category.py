@@ -11,6 +11,7 @@ from django.utils.translation import gettext_lazy as _
 from slugify import slugify
 
 from legadilo.core.utils.types import FormChoices
+from legadilo.reading.models.article import Article
 
 if TYPE_CHECKING:
     from django_stubs_ext.db.models import TypedModelMeta
@@ -91,3 +92,9 @@ class FeedCategory(models.Model):
     def save(self, *args, **kwargs):
         self.slug = slugify(self.title)
         return super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        # The category of the feeds is set to NULL by the database: it doesn't update the articles
+        # exported with the category of their main feed.
+        Article.objects.get_queryset().filter(main_feed__category=self).mark_as_updated()
+        return super().delete(*args, **kwargs)
@@ -6,6 +6,8 @@ import logging
 import re
 import sys
 import time
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import UTC, datetime
 from html import unescape
 from itertools import chain
@@ -19,6 +21,8 @@ from feedparser import parse as parse_feed
 from pydantic import BaseModel as BaseSchema
 from pydantic import model_validator
 
+from legadilo import constants as legadilo_constants
+from legadilo.core.utils.http_utils import get_rss_sync_client
 from legadilo.core.utils.time_utils import dt_to_http_date
 from legadilo.core.utils.validators import (
     CleanedString,
@@ -109,6 +113,26 @@ def get_feed_data(
     return build_feed_data_from_parsed_feed(parsed_feed, str(resolved_url))
 
 
+def get_feeds_data(urls: Iterable[str]) -> dict[str, Future[FeedData]]:
+    """Fetch the data of all the supplied feed URLs concurrently.
+
+    Each URL is fetched once and the number of parallel connections is bounded. All fetches are
+    completed when this returns: calling result on a future returns the feed data or raises the
+    error of its fetch. Nothing is saved in the database here so it can be done from the caller
+    thread.
+    """
+    futures = {}
+    with (
+        get_rss_sync_client() as client,
+        ThreadPoolExecutor(max_workers=legadilo_constants.MAX_PARALLEL_CONNECTIONS) as executor,
+    ):
+        for url in urls:
+            if url not in futures:
+                futures[url] = executor.submit(get_feed_data, url, client=client)
+
+    return futures
+
+
 def _find_youtube_rss_feed_url(url: str) -> str:
     is_youtube_feed = (
         re.match(
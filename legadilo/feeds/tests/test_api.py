@@ -204,7 +204,7 @@ class TestDeleteCategoryView:
         assert response.status_code == HTTPStatus.NOT_FOUND
 
     def test_delete(self, logged_in_sync_client, django_assert_num_queries):
-        with django_assert_num_queries(8):
+        with django_assert_num_queries(9):
             response = logged_in_sync_client.delete(self.url)
 
         assert response.status_code == HTTPStatus.NO_CONTENT
@@ -624,7 +624,7 @@ class TestDeleteFeedView:
         assert response.status_code == HTTPStatus.NOT_FOUND
 
     def test_delete(self, logged_in_sync_client, django_assert_num_queries):
-        with django_assert_num_queries(11):
+        with django_assert_num_queries(12):
             response = logged_in_sync_client.delete(self.url)
 
         assert response.status_code == HTTPStatus.NO_CONTENT
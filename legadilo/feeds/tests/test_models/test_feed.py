@@ -11,6 +11,7 @@ import time_machine
 from legadilo.core.models import Timezone
 from legadilo.core.utils.testing import serialize_for_snapshot
 from legadilo.core.utils.time_utils import utcdt, utcnow
+from legadilo.core.utils.urls import hash_url
 from legadilo.feeds.models import FeedArticle, FeedUpdate
 from legadilo.feeds.services.feed_parsing import ArticleData, FeedData
 from legadilo.feeds.tests.factories import (
@@ -231,6 +232,11 @@ class TestFeedQuerySet:
 
         assert feeds == [feed1]
 
+    def test_save_sets_feed_url_hash(self):
+        feed = FeedFactory(feed_url="https://example.com/feed.xml")
+
+        assert feed.feed_url_hash == hash_url("https://example.com/feed.xml")
+
     def test_for_status_search(self):
         feed1 = FeedFactory(disabled_at=None)
         feed2 = FeedFactory(disabled_at=utcnow())
@@ -616,6 +622,7 @@ class TestFeedManager:
         assert self.feed.feed_updates.count() == 1
         existing_article.refresh_from_db()
         assert existing_article.url == "http://example.com/new-url"
+        assert existing_article.url_hash == hash_url("http://example.com/new-url")
         existing_article_feed_article = FeedArticle.objects.get(
             feed=self.feed, article=existing_article
         )
@@ -890,3 +897,16 @@ class TestFeedModel:
         assert feed.enabled
         assert feed.disabled_at is None
         assert not feed.disabled_reason
+
+    @pytest.mark.django_db
+    def test_delete_marks_articles_as_updated(self, user):
+        feed = FeedFactory(user=user)
+        with time_machine.travel("2024-06-01 12:00:00", tick=False):
+            article = ArticleFactory(user=user, main_feed=feed)
+
+        with time_machine.travel("2024-06-02 12:00:00", tick=False):
+            feed.delete()
+
+        article.refresh_from_db()
+        assert article.main_feed is None
+        assert article.obj_updated_at == utcdt(2024, 6, 2, 12)
@@ -8,7 +8,8 @@ import time_machine
 from legadilo.core.utils.testing import serialize_for_snapshot
 from legadilo.core.utils.time_utils import utcdt
 from legadilo.feeds.models import FeedCategory
-from legadilo.feeds.tests.factories import FeedCategoryFactory
+from legadilo.feeds.tests.factories import FeedCategoryFactory, FeedFactory
+from legadilo.reading.tests.factories import ArticleFactory
 
 
 @pytest.mark.django_db
@@ -75,3 +76,18 @@ class TestFeedCategoryManager:
 
         assert len(exports) == 1
         assert exports[0]["category_id"] == recently_updated_category.id
+
+
+@pytest.mark.django_db
+class TestFeedCategoryModel:
+    def test_delete_marks_articles_as_updated(self, user):
+        category = FeedCategoryFactory(user=user)
+        feed = FeedFactory(user=user, category=category)
+        with time_machine.travel("2024-06-01 12:00:00", tick=False):
+            article = ArticleFactory(user=user, main_feed=feed)
+
+        with time_machine.travel("2024-06-02 12:00:00", tick=False):
+            category.delete()
+
+        article.refresh_from_db()
+        assert article.obj_updated_at == utcdt(2024, 6, 2, 12)
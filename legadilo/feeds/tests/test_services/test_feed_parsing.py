@@ -18,6 +18,7 @@ from legadilo.feeds.services.feed_parsing import (
     _get_feed_site_url,
     _parse_articles_in_feed,
     get_feed_data,
+    get_feeds_data,
     parse_feed,
 )
 
@@ -260,6 +261,37 @@ class TestGetFeedData:
         snapshot.assert_match(serialize_for_snapshot(feed_data), "feed_data.json")
 
 
+def test_get_feeds_data(httpx_mock):
+    httpx_mock.add_response(
+        text=get_feed_fixture_content("sample_rss.xml"), url="https://example.com/rss.xml"
+    )
+    httpx_mock.add_response(
+        text=get_feed_fixture_content("sample_atom.xml"), url="https://example.com/atom.xml"
+    )
+    httpx_mock.add_exception(
+        httpx.HTTPError("Failed to fetch"), url="https://example.com/error.xml"
+    )
+
+    feeds_data = get_feeds_data([
+        "https://example.com/rss.xml",
+        "https://example.com/atom.xml",
+        "https://example.com/error.xml",
+        "https://example.com/rss.xml",
+    ])
+
+    assert list(feeds_data) == [
+        "https://example.com/rss.xml",
+        "https://example.com/atom.xml",
+        "https://example.com/error.xml",
+    ]
+    assert all(future.done() for future in feeds_data.values())
+    assert feeds_data["https://example.com/rss.xml"].result().feed_type == SupportedFeedType.rss20
+    assert feeds_data["https://example.com/atom.xml"].result().feed_type == SupportedFeedType.atom10
+    with pytest.raises(httpx.HTTPError):
+        feeds_data["https://example.com/error.xml"].result()
+    assert len(httpx_mock.get_requests()) == 3
+
+
 class TestParseArticlesInFeed:
     @pytest.mark.parametrize(
         "feed_content",
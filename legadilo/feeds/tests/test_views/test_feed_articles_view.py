@@ -5,7 +5,6 @@
 from http import HTTPStatus
 
 import pytest
-from django.core.paginator import Paginator
 from django.urls import reverse
 
 from legadilo.conftest import assert_redirected_to_login_page
@@ -45,12 +44,11 @@ class TestFeedArticlesView:
         assert response.context_data["page_title"] == f"Articles of feed '{self.feed.title}'"
         assert response.context_data["displayed_reading_list"] is None
         assert response.context_data["js_cfg"] == {}
-        assert isinstance(response.context_data["articles_paginator"], Paginator)
-        assert response.context_data["articles_page"].object_list == [self.article]
+        assert response.context_data["articles"] == [self.article]
         assert response.context_data["update_articles_form"] is not None
 
     def test_only_article_update_action(self, logged_in_sync_client, django_assert_num_queries):
-        with django_assert_num_queries(14):
+        with django_assert_num_queries(15):
             response = logged_in_sync_client.post(
                 self.url, {"update_action": reading_constants.UpdateArticleActions.MARK_AS_READ}
             )
@@ -84,7 +84,7 @@ class TestEditFeedView:
         article = ArticleFactory(user=user)
         FeedArticle.objects.create(feed=self.feed, article=article)
 
-        with django_assert_num_queries(15):
+        with django_assert_num_queries(16):
             response = logged_in_sync_client.post(self.url, data={"delete": ""})
 
         assert response.status_code == HTTPStatus.FOUND
@@ -0,0 +1,22 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from django.contrib import admin
+
+from legadilo.import_export.models import ImportFingerprint, ImportJob
+
+
+@admin.register(ImportJob)
+class ImportJobAdmin(admin.ModelAdmin):
+    search_fields = ["file_name"]
+    autocomplete_fields = ["user"]
+    list_display = ["__str__", "created_at", "finished_at"]
+    list_filter = ["source_type", "status"]
+
+
+@admin.register(ImportFingerprint)
+class ImportFingerprintAdmin(admin.ModelAdmin):
+    search_fields = ["external_article_id"]
+    autocomplete_fields = ["user", "article"]
+    list_display = ["__str__", "created_at", "updated_at"]
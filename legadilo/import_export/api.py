@@ -2,7 +2,8 @@
 #
 #  SPDX-License-Identifier: AGPL-3.0-or-later
 from datetime import datetime
-from typing import Literal, assert_never
+from http import HTTPStatus
+from typing import Any, Literal, assert_never
 
 from django.http.response import StreamingHttpResponse
 from django.template.response import TemplateResponse
@@ -10,8 +11,15 @@ from ninja import Query, Router
 from ninja.schema import Schema
 from pydantic import Field
 
+from legadilo.core.utils.api import ApiError
 from legadilo.feeds.api import OutFeedSchema
-from legadilo.import_export.services.export import build_feeds_export_context, export_articles
+from legadilo.import_export.services.export import (
+    ExportChangesCursor,
+    build_feeds_export_context,
+    export_articles,
+    export_articles_jsonl,
+    export_changes,
+)
 from legadilo.users.user_types import AuthenticatedApiRequest
 
 export_api_router = Router(tags=["export"])
@@ -54,6 +62,11 @@ def export_feeds_view(
 
 
 class ExportArticlesQuery(Schema):
+    format: Literal["csv", "jsonl"] = Field(
+        default="csv",
+        description="With jsonl, each row of the CSV export is a JSON object on its own line and "
+        "the file is compressed with gzip.",
+    )
     include_feeds: bool = True
     updated_since: datetime | None = Field(
         default=None,
@@ -66,14 +79,85 @@ class ExportArticlesQuery(Schema):
 
 
 @export_api_router.get(
-    "/articles/", url_name="export_articles", summary="Export articles in CSV format"
+    "/articles/",
+    url_name="export_articles",
+    summary="Export articles in CSV or compressed JSON Lines format",
 )
 def export_articles_view(
     request: AuthenticatedApiRequest, query: Query[ExportArticlesQuery]
 ) -> StreamingHttpResponse:
-    return StreamingHttpResponse(
-        export_articles(
-            request.auth, include_feeds=query.include_feeds, updated_since=query.updated_since
-        ),
-        content_type="text/csv",
+    match query.format:
+        case "csv":
+            return StreamingHttpResponse(
+                export_articles(
+                    request.auth,
+                    include_feeds=query.include_feeds,
+                    updated_since=query.updated_since,
+                ),
+                content_type="text/csv",
+            )
+        case "jsonl":
+            return StreamingHttpResponse(
+                export_articles_jsonl(
+                    request.auth,
+                    include_feeds=query.include_feeds,
+                    updated_since=query.updated_since,
+                ),
+                content_type="application/gzip",
+            )
+        case _:
+            assert_never(query.format)
+
+
+class ExportArticlesChangesQuery(Schema):
+    cursor: str = Field(
+        default="",
+        description="The next_cursor of the previous response. Leave empty to export everything.",
+    )
+
+
+class OutDeletedArticleSchema(Schema):
+    article_id: int
+    url: str
+    deleted_at: datetime
+
+
+class OutArticlesChangesSchema(Schema):
+    articles: list[dict[str, Any]] = Field(
+        description="Articles updated since the cursor with the same fields as the CSV export."
     )
+    deleted_articles: list[OutDeletedArticleSchema]
+    next_cursor: str
+    has_more: bool = Field(
+        description="Whether more changes are available: fetch them with next_cursor."
+    )
+
+
+@export_api_router.get(
+    "/articles/changes/",
+    url_name="export_articles_changes",
+    response={HTTPStatus.OK: OutArticlesChangesSchema, HTTPStatus.BAD_REQUEST: ApiError},
+    summary="Export the articles updated or deleted since the last export",
+)
+def export_articles_changes_view(
+    request: AuthenticatedApiRequest, query: Query[ExportArticlesChangesQuery]
+):
+    """Export articles incrementally, for instance to back them up.
+
+    Call it without cursor to get all the articles, then with the next_cursor of each response
+    until has_more is false. Keep the last next_cursor to only get the changes on the next call.
+    Deleted articles are reported for 90 days: export everything again if your last export is
+    older than this.
+    """
+    cursor = None
+    if query.cursor and (cursor := ExportChangesCursor.decode(query.cursor)) is None:
+        return HTTPStatus.BAD_REQUEST, {"detail": "Invalid cursor"}
+
+    changes = export_changes(request.auth, cursor)
+
+    return HTTPStatus.OK, {
+        "articles": changes.articles,
+        "deleted_articles": changes.deleted_articles,
+        "next_cursor": changes.next_cursor.encode(),
+        "has_more": changes.has_more,
+    }
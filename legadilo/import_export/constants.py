@@ -2,6 +2,26 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
+import zlib
+
+from django.db.models import TextChoices
+from django.utils.translation import gettext_lazy as _
+
+
+class ImportJobSourceType(TextChoices):
+    CUSTOM_CSV = "CUSTOM_CSV", _("Custom CSV")
+    CUSTOM_JSONL = "CUSTOM_JSONL", _("Custom JSON Lines")
+    WALLABAG = "WALLABAG", _("Wallabag")
+    OPML = "OPML", _("OPML")
+
+
+class ImportJobStatus(TextChoices):
+    PENDING = "PENDING", _("Pending")
+    RUNNING = "RUNNING", _("Running")
+    SUCCESS = "SUCCESS", _("Success")
+    FAILURE = "FAILURE", _("Failure")
+
+
 MAX_SIZE_OPML_FILE = 1024 * 1024  # 1MiB in bytes.
 MAX_ARTICLES_FILE = 10 * 1024 * 1024  # 10MiB in bytes.
 CSV_HEADER_FIELDS = (
@@ -29,3 +49,15 @@ CSV_HEADER_FIELDS = (
     "article_lang",
     "article_comments",
 )
+WALLABAG_IMPORT_BATCH_SIZE = 100
+CUSTOM_CSV_IMPORT_BATCH_SIZE = 1_000
+OPML_IMPORT_BATCH_SIZE = 100
+EXPORT_CHANGES_PAGE_SIZE = 500
+BULK_DATA_DEFAULT_NB_WORKERS = 4
+# Write a gzip header and trailer with zlib.
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+IMPORT_JOBS_POLLING_INTERVAL = 5  # In seconds.
+IMPORT_JOBS_CLEANUP_INTERVAL = 3_600  # In seconds.
+IMPORT_JOB_STATUS_POLLING_INTERVAL = 2  # In seconds.
+RUNNING_IMPORT_JOB_TIMEOUT = 3  # In hours.
+KEEP_IMPORT_JOBS_FOR = 30  # In days.
@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import logging
+from pathlib import Path
+
+from django.core.management import BaseCommand, CommandError, CommandParser
+
+from legadilo.import_export import constants
+from legadilo.import_export.services.bulk import export_user_data, run_for_users, write_manifest
+from legadilo.users.models import User
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = """Export the data of several users at once, for instance to back up an instance.
+
+    The data of each user is written in a compressed JSON Lines file of the output directory, like
+    the JSON Lines export of the articles. A manifest.json file lists, for each user, the file, the
+    number of exported rows, the duration of the export and the error if it failed.
+    """
+
+    def add_arguments(self, parser: CommandParser):
+        users_group = parser.add_mutually_exclusive_group(required=True)
+        users_group.add_argument(
+            "--user-ids",
+            "-u",
+            dest="user_ids",
+            type=int,
+            nargs="+",
+            help="For which users to export the data",
+        )
+        users_group.add_argument(
+            "--all-users",
+            dest="all_users",
+            default=False,
+            action="store_true",
+            help="Export the data of all users",
+        )
+        parser.add_argument(
+            "--output-dir",
+            "-o",
+            dest="output_dir",
+            type=Path,
+            required=True,
+            help="Directory in which to write the files. It's created if needed.",
+        )
+        parser.add_argument(
+            "--workers",
+            "-w",
+            dest="nb_workers",
+            type=int,
+            default=constants.BULK_DATA_DEFAULT_NB_WORKERS,
+            help="Number of users to process in parallel.",
+        )
+
+    def handle(self, *args, **options):
+        if options["all_users"]:
+            user_ids = list(User.objects.order_by("id").values_list("id", flat=True))
+        else:
+            user_ids = options["user_ids"]
+        output_dir = options["output_dir"]
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        logger.info("Exporting the data of %s users into %s", len(user_ids), output_dir)
+        results = run_for_users(
+            export_user_data, user_ids, str(output_dir), nb_workers=options["nb_workers"]
+        )
+        manifest_path = output_dir / "manifest.json"
+        write_manifest(manifest_path, results)
+
+        nb_failures = sum(1 for result in results if result["status"] == "failure")
+        if nb_failures:
+            raise CommandError(
+                f"Failed to export the data of {nb_failures} users, see {manifest_path}"
+            )
+        logger.info("Exported the data of %s users", len(results))
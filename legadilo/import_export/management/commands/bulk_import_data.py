@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import logging
+from pathlib import Path
+
+from django.core.management import BaseCommand, CommandError, CommandParser
+from django.db import connection
+
+from legadilo.import_export import constants
+from legadilo.import_export.services.bulk import (
+    get_user_file_name,
+    import_user_data,
+    run_for_users,
+    write_manifest,
+)
+from legadilo.users.models import User
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = """Import the files created by bulk_export_data for several users at once.
+
+    The users must already exist: the file of each user is imported with the same user id. An
+    import_manifest.json file is written in the input directory with, for each user, the number of
+    imported objects, the duration of the import and the error if it failed. Nothing is imported
+    for a user if their import fails.
+
+    With SQLite, the users are imported one by one: only one transaction can write at a time.
+    """
+
+    def add_arguments(self, parser: CommandParser):
+        users_group = parser.add_mutually_exclusive_group(required=True)
+        users_group.add_argument(
+            "--user-ids",
+            "-u",
+            dest="user_ids",
+            type=int,
+            nargs="+",
+            help="For which users to import the data",
+        )
+        users_group.add_argument(
+            "--all-users",
+            dest="all_users",
+            default=False,
+            action="store_true",
+            help="Import the data of all users with a file in the input directory",
+        )
+        parser.add_argument(
+            "--input-dir",
+            "-i",
+            dest="input_dir",
+            type=Path,
+            required=True,
+            help="Directory in which the files were exported",
+        )
+        parser.add_argument(
+            "--workers",
+            "-w",
+            dest="nb_workers",
+            type=int,
+            default=constants.BULK_DATA_DEFAULT_NB_WORKERS,
+            help="Number of users to process in parallel. Ignored with SQLite.",
+        )
+
+    def handle(self, *args, **options):
+        input_dir = options["input_dir"]
+        if not input_dir.is_dir():
+            raise CommandError(f"{input_dir} is not a directory")
+
+        if options["all_users"]:
+            user_ids = [
+                user_id
+                for user_id in User.objects.order_by("id").values_list("id", flat=True)
+                if (input_dir / get_user_file_name(user_id)).exists()
+            ]
+        else:
+            user_ids = options["user_ids"]
+
+        nb_workers = options["nb_workers"]
+        if nb_workers > 1 and connection.vendor == "sqlite":
+            # Each user is imported in a single transaction: with several workers, they would wait
+            # for each other until the database is locked.
+            logger.warning("SQLite can't import several users in parallel, using one worker")
+            nb_workers = 1
+
+        logger.info("Importing the data of %s users from %s", len(user_ids), input_dir)
+        results = run_for_users(import_user_data, user_ids, str(input_dir), nb_workers=nb_workers)
+        manifest_path = input_dir / "import_manifest.json"
+        write_manifest(manifest_path, results)
+
+        nb_failures = sum(1 for result in results if result["status"] == "failure")
+        if nb_failures:
+            raise CommandError(
+                f"Failed to import the data of {nb_failures} users, see {manifest_path}"
+            )
+        logger.info("Imported the data of %s users", len(results))
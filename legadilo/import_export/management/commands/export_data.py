@@ -6,7 +6,11 @@ from django.core.management import BaseCommand, CommandError, CommandParser
 from django.template.loader import render_to_string
 
 from legadilo.core.utils.file import file_or_stdout
-from legadilo.import_export.services.export import build_feeds_export_context, export_articles
+from legadilo.import_export.services.export import (
+    build_feeds_export_context,
+    export_articles,
+    export_articles_jsonl,
+)
 from legadilo.users.models import User
 
 
@@ -28,6 +32,14 @@ class Command(BaseCommand):
             default=None,
             help="Output file. Data will be printed to stdout if not set.",
         )
+        parser.add_argument(
+            "--format",
+            "-f",
+            dest="format",
+            choices=["csv", "jsonl"],
+            default="csv",
+            help="Format of the articles export. jsonl is compressed with gzip.",
+        )
         parser.add_argument(
             "export_type",
             choices=["feeds", "articles"],
@@ -38,13 +50,18 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         user = User.objects.get(id=options["user_id"])
 
-        with file_or_stdout(options["output"]) as output:
-            match options["export_type"][0]:
-                case "feeds":
+        match options["export_type"][0]:
+            case "feeds":
+                with file_or_stdout(options["output"]) as output:
                     context = build_feeds_export_context(user)
                     output.write(render_to_string("import_export/export_feeds.opml", context))
-                case "articles":
+            case "articles" if options["format"] == "jsonl":
+                with file_or_stdout(options["output"], binary=True) as output:
+                    for chunk in export_articles_jsonl(user):
+                        output.write(chunk)
+            case "articles":
+                with file_or_stdout(options["output"]) as output:
                     for data in export_articles(user):
                         output.write(data)
-                case _:
-                    raise CommandError("Unknown export type")
+            case _:
+                raise CommandError("Unknown export type")
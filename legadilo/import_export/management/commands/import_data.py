@@ -12,6 +12,7 @@ from django.db import transaction
 from pydantic import ValidationError as PydanticValidationError
 
 from legadilo.import_export.services.custom_csv import import_custom_csv_file
+from legadilo.import_export.services.custom_jsonl import import_custom_jsonl_file
 from legadilo.import_export.services.exceptions import DataImportError
 from legadilo.import_export.services.opml import import_opml_file_sync
 from legadilo.import_export.services.wallabag import import_wallabag_json_file_path
@@ -33,7 +34,7 @@ class Command(BaseCommand):
             dest="source_type",
             required=True,
             type=str,
-            choices=["wallabag", "opml", "custom_csv"],
+            choices=["wallabag", "opml", "custom_csv", "custom_jsonl"],
             help="What is the source type you are trying to import",
         )
         parser.add_argument(
@@ -78,10 +79,18 @@ class Command(BaseCommand):
         user = User.objects.get(id=options["user_id"])
         match options["source_type"]:
             case "wallabag":
-                nb_imported_articles = import_wallabag_json_file_path(
-                    user, options["file_to_import"][0]
+                nb_imported_articles, nb_skipped_articles = import_wallabag_json_file_path(
+                    user,
+                    options["file_to_import"][0],
+                    progress_callback=lambda nb_articles: logger.info(
+                        "Processed %s articles so far", nb_articles
+                    ),
+                )
+                logger.info(
+                    "Imported %s articles and skipped %s unchanged articles",
+                    nb_imported_articles,
+                    nb_skipped_articles,
                 )
-                logger.info("Imported %s articles", nb_imported_articles)
             case "opml":
                 nb_imported_feeds, nb_imported_categories = import_opml_file_sync(
                     user, options["file_to_import"][0]
@@ -91,15 +100,25 @@ class Command(BaseCommand):
                     nb_imported_feeds,
                     nb_imported_categories,
                 )
-            case "custom_csv":
-                nb_imported_articles, nb_imported_feeds, nb_imported_categories = (
-                    import_custom_csv_file(user, options["file_to_import"][0])
+            case "custom_csv" | "custom_jsonl":
+                import_custom_file = (
+                    import_custom_csv_file
+                    if options["source_type"] == "custom_csv"
+                    else import_custom_jsonl_file
                 )
+                (
+                    nb_imported_articles,
+                    nb_imported_feeds,
+                    nb_imported_categories,
+                    nb_skipped_articles,
+                ) = import_custom_file(user, options["file_to_import"][0])
                 logger.info(
-                    "Imported %s articles, %s feeds and %s feed categories",
+                    "Imported %s articles, %s feeds and %s feed categories and skipped %s "
+                    "unchanged articles",
                     nb_imported_articles,
                     nb_imported_feeds,
                     nb_imported_categories,
+                    nb_skipped_articles,
                 )
             case _:
                 raise CommandError("Unknown source type")
@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import logging
+import signal
+import threading
+import time
+
+from django.core.management import BaseCommand, CommandParser
+from django.utils.translation import gettext_lazy as _
+
+from legadilo.import_export import constants
+from legadilo.import_export.models import ImportJob
+from legadilo.import_export.services.import_jobs import notify_import_job_finished, run_import_job
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = """Run the pending import jobs, the oldest first.
+
+    Jobs that have been running for too long are marked as failed and old jobs are deleted.
+    """
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument(
+            "--wait",
+            default=False,
+            action="store_true",
+            help="Wait for new jobs once all pending jobs are run instead of exiting.",
+        )
+        parser.add_argument(
+            "--polling-interval",
+            dest="polling_interval",
+            type=int,
+            default=constants.IMPORT_JOBS_POLLING_INTERVAL,
+            help="Number of seconds to wait between two checks for new jobs with --wait.",
+        )
+
+    def handle(self, *args, **options):
+        shutdown_event = threading.Event()
+
+        def _signal_handler(signal, frame):
+            logger.info("Received signal %s, exiting once the current job is done", signal)
+            shutdown_event.set()
+
+        if options["wait"]:
+            signal.signal(signal.SIGINT, _signal_handler)
+            signal.signal(signal.SIGTERM, _signal_handler)
+
+        last_cleanup_at = None
+        while not shutdown_event.is_set():
+            if (
+                last_cleanup_at is None
+                or time.monotonic() - last_cleanup_at > constants.IMPORT_JOBS_CLEANUP_INTERVAL
+            ):
+                self._cleanup()
+                last_cleanup_at = time.monotonic()
+
+            while not shutdown_event.is_set() and (job := ImportJob.objects.claim_next()):
+                run_import_job(job)
+
+            if not options["wait"]:
+                break
+
+            shutdown_event.wait(options["polling_interval"])
+
+    def _cleanup(self):
+        for job in ImportJob.objects.get_queryset().only_stale():
+            logger.warning("Import job %s has been running for too long, marking it failed", job.id)
+            if ImportJob.objects.mark_as_failure(
+                job, str(_("The import took too long and was stopped."))
+            ):
+                notify_import_job_finished(job)
+
+        deletion_result = ImportJob.objects.cleanup()
+        logger.info("Deleted %s import jobs.", deletion_result)
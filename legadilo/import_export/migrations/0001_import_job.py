@@ -0,0 +1,86 @@
+# Generated by Django 6.0.4 on 2026-10-19 01:06
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ImportJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "source_type",
+                    models.CharField(
+                        choices=[
+                            ("CUSTOM_CSV", "Custom CSV"),
+                            ("WALLABAG", "Wallabag"),
+                            ("OPML", "OPML"),
+                        ],
+                        max_length=100,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("PENDING", "Pending"),
+                            ("RUNNING", "Running"),
+                            ("SUCCESS", "Success"),
+                            ("FAILURE", "Failure"),
+                        ],
+                        default="PENDING",
+                        max_length=100,
+                    ),
+                ),
+                ("file", models.FileField(blank=True, upload_to="import_jobs/%Y/%m/%d/")),
+                ("file_name", models.CharField(max_length=255)),
+                ("nb_processed_items", models.PositiveIntegerField(default=0)),
+                ("nb_imported_articles", models.PositiveIntegerField(default=0)),
+                ("nb_imported_feeds", models.PositiveIntegerField(default=0)),
+                ("nb_imported_categories", models.PositiveIntegerField(default=0)),
+                ("error_message", models.TextField(blank=True)),
+                ("started_at", models.DateTimeField(blank=True, null=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="import_jobs",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-created_at"],
+                "constraints": [
+                    models.CheckConstraint(
+                        condition=models.Q(("source_type__in", ["CUSTOM_CSV", "WALLABAG", "OPML"])),
+                        name="import_export_importjob_source_type_valid",
+                    ),
+                    models.CheckConstraint(
+                        condition=models.Q((
+                            "status__in",
+                            ["PENDING", "RUNNING", "SUCCESS", "FAILURE"],
+                        )),
+                        name="import_export_importjob_status_valid",
+                    ),
+                ],
+            },
+        ),
+    ]
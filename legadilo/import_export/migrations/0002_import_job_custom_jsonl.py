@@ -0,0 +1,41 @@
+# Generated by Django 6.0.4 on 2026-10-19 01:13
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("import_export", "0001_import_job"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name="importjob",
+            name="import_export_importjob_source_type_valid",
+        ),
+        migrations.AlterField(
+            model_name="importjob",
+            name="source_type",
+            field=models.CharField(
+                choices=[
+                    ("CUSTOM_CSV", "Custom CSV"),
+                    ("CUSTOM_JSONL", "Custom JSON Lines"),
+                    ("WALLABAG", "Wallabag"),
+                    ("OPML", "OPML"),
+                ],
+                max_length=100,
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="importjob",
+            constraint=models.CheckConstraint(
+                condition=models.Q((
+                    "source_type__in",
+                    ["CUSTOM_CSV", "CUSTOM_JSONL", "WALLABAG", "OPML"],
+                )),
+                name="import_export_importjob_source_type_valid",
+            ),
+        ),
+    ]
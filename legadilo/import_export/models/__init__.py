@@ -1,3 +1,11 @@
 # SPDX-FileCopyrightText: 2023-2025 Legadilo contributors
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
+
+from .import_fingerprint import ImportFingerprint
+from .import_job import ImportJob
+
+__all__ = [
+    "ImportFingerprint",
+    "ImportJob",
+]
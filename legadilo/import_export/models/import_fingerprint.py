@@ -0,0 +1,121 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Self
+
+from django.db import models
+
+from legadilo.reading import constants as reading_constants
+from legadilo.reading.models.article import SaveArticleResult
+from legadilo.reading.services.article_fetching import ArticleData
+from legadilo.users.models import User
+
+if TYPE_CHECKING:
+    from django_stubs_ext.db.models import TypedModelMeta
+else:
+    TypedModelMeta = object
+
+
+class ImportFingerprintQuerySet(models.QuerySet["ImportFingerprint"]):
+    def for_user(self, user: User) -> Self:
+        return self.filter(user=user)
+
+
+class ImportFingerprintManager(models.Manager["ImportFingerprint"]):
+    _hints: dict
+
+    def get_queryset(self) -> ImportFingerprintQuerySet:
+        return ImportFingerprintQuerySet(model=self.model, using=self._db, hints=self._hints)
+
+    def get_unchanged_external_ids(self, user: User, content_hashes: dict[str, str]) -> set[str]:
+        """Find the external article ids already imported with the same content hash.
+
+        Only the ids and hashes are loaded: the articles themselves are never read.
+        """
+        if not content_hashes:
+            return set()
+
+        return {
+            external_article_id
+            for external_article_id, content_hash in (
+                self
+                .get_queryset()
+                .for_user(user)
+                .filter(external_article_id__in=content_hashes.keys())
+                .values_list("external_article_id", "content_hash")
+            )
+            if content_hashes[external_article_id] == content_hash
+        }
+
+    def save_fingerprints(
+        self,
+        user: User,
+        content_hashes: dict[str, str],
+        articles_data: Iterable[ArticleData],
+        save_results: Iterable[SaveArticleResult],
+    ):
+        """Create or update the fingerprints of the articles saved from the imported data.
+
+        Articles are saved once per URL: the saved articles are matched to the data by URL so all
+        the external ids sharing a URL get a fingerprint.
+        """
+        articles_by_url = {result.article.url: result.article for result in save_results}
+        fingerprints = {
+            article_data.external_article_id: self.model(
+                user=user,
+                external_article_id=article_data.external_article_id,
+                content_hash=content_hashes[article_data.external_article_id],
+                article=articles_by_url[article_data.url],
+            )
+            for article_data in articles_data
+            if article_data.external_article_id in content_hashes
+            and article_data.url in articles_by_url
+        }
+        self.bulk_create(
+            fingerprints.values(),
+            update_conflicts=True,
+            unique_fields=["user", "external_article_id"],
+            update_fields=["content_hash", "article", "updated_at"],
+        )
+
+
+class ImportFingerprint(models.Model):
+    """Hash of the imported data of an article to skip it if it's imported again unchanged.
+
+    The external article id is prefixed by the source of the import, so it identifies the article
+    in its source.
+    """
+
+    external_article_id = models.CharField(
+        max_length=reading_constants.EXTERNAL_ARTICLE_ID_MAX_LENGTH
+    )
+    content_hash = models.CharField(max_length=64)
+
+    user = models.ForeignKey(
+        "users.User", related_name="import_fingerprints", on_delete=models.CASCADE
+    )
+    article = models.ForeignKey(
+        "reading.Article", related_name="import_fingerprints", on_delete=models.CASCADE
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = ImportFingerprintManager()
+
+    class Meta(TypedModelMeta):
+        constraints = [
+            models.UniqueConstraint(
+                "user",
+                "external_article_id",
+                name="%(app_label)s_%(class)s_unique_external_article_id_for_user",
+            ),
+        ]
+
+    def __str__(self):
+        return (
+            f"ImportFingerprint(external_article_id={self.external_article_id}, "
+            f"article={self.article_id})"
+        )
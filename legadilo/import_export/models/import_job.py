@@ -0,0 +1,216 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from datetime import timedelta
+from typing import TYPE_CHECKING, Self
+
+from django.core.files import File
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from legadilo.core.utils.time_utils import utcnow
+from legadilo.core.utils.types import DeletionResult
+from legadilo.users.models import User
+
+from .. import constants
+
+if TYPE_CHECKING:
+    from django_stubs_ext.db.models import TypedModelMeta
+else:
+    TypedModelMeta = object
+
+
+class ImportJobQuerySet(models.QuerySet["ImportJob"]):
+    def for_user(self, user: User) -> Self:
+        return self.filter(user=user)
+
+    def only_pending(self) -> Self:
+        return self.filter(status=constants.ImportJobStatus.PENDING)
+
+    def only_stale(self) -> Self:
+        return self.filter(
+            status=constants.ImportJobStatus.RUNNING,
+            updated_at__lt=utcnow() - timedelta(hours=constants.RUNNING_IMPORT_JOB_TIMEOUT),
+        )
+
+    def for_cleanup(self) -> Self:
+        return self.filter(
+            status__in=[constants.ImportJobStatus.SUCCESS, constants.ImportJobStatus.FAILURE],
+            finished_at__lt=utcnow() - timedelta(days=constants.KEEP_IMPORT_JOBS_FOR),
+        )
+
+
+class ImportJobManager(models.Manager["ImportJob"]):
+    _hints: dict
+
+    def get_queryset(self) -> ImportJobQuerySet:
+        return ImportJobQuerySet(model=self.model, using=self._db, hints=self._hints)
+
+    def create_from_file(
+        self, user: User, source_type: constants.ImportJobSourceType, file: File
+    ) -> ImportJob:
+        """Store the file and create the job to import it later."""
+        return self.create(user=user, source_type=source_type, file=file, file_name=file.name)
+
+    def claim_next(self) -> ImportJob | None:
+        """Mark the oldest pending job as running and return it.
+
+        The status is only updated if the job is still pending: if several workers run, each job
+        is claimed only once.
+        """
+        while (
+            job := self.get_queryset().only_pending().order_by("created_at").first()
+        ) is not None:
+            now = utcnow()
+            nb_updated = (
+                self
+                .get_queryset()
+                .only_pending()
+                .filter(id=job.id)
+                .update(status=constants.ImportJobStatus.RUNNING, started_at=now, updated_at=now)
+            )
+            if nb_updated == 1:
+                job.refresh_from_db()
+                return job
+
+        return None
+
+    def update_progress(self, job: ImportJob, nb_processed_items: int):
+        job.nb_processed_items = nb_processed_items
+        job.save(update_fields=["nb_processed_items", "updated_at"])
+
+    def mark_as_success(
+        self,
+        job: ImportJob,
+        *,
+        nb_imported_articles: int = 0,
+        nb_imported_feeds: int = 0,
+        nb_imported_categories: int = 0,
+        nb_skipped_articles: int = 0,
+    ) -> bool:
+        return self._mark_as_finished(
+            job,
+            constants.ImportJobStatus.SUCCESS,
+            nb_imported_articles=nb_imported_articles,
+            nb_imported_feeds=nb_imported_feeds,
+            nb_imported_categories=nb_imported_categories,
+            nb_skipped_articles=nb_skipped_articles,
+        )
+
+    def mark_as_failure(self, job: ImportJob, error_message: str) -> bool:
+        return self._mark_as_finished(
+            job, constants.ImportJobStatus.FAILURE, error_message=error_message
+        )
+
+    def _mark_as_finished(
+        self, job: ImportJob, status: constants.ImportJobStatus, **fields
+    ) -> bool:
+        """Mark the job as finished if it's still running and return whether it was updated.
+
+        A job may be marked as failed by another worker if it looks stale: it must not be marked
+        as finished again by the worker running it.
+        """
+        now = utcnow()
+        nb_updated = (
+            self
+            .get_queryset()
+            .filter(id=job.id, status=constants.ImportJobStatus.RUNNING)
+            .update(status=status, finished_at=now, updated_at=now, file="", **fields)
+        )
+        if nb_updated == 1:
+            # The file is not needed anymore and may be big.
+            job.file.delete(save=False)
+        job.refresh_from_db()
+        return nb_updated == 1
+
+    def cleanup(self) -> DeletionResult:
+        return self.get_queryset().for_cleanup().delete()
+
+
+class ImportJob(models.Model):
+    source_type = models.CharField(choices=constants.ImportJobSourceType.choices, max_length=100)
+    status = models.CharField(
+        choices=constants.ImportJobStatus.choices,
+        default=constants.ImportJobStatus.PENDING,
+        max_length=100,
+    )
+    file = models.FileField(upload_to="import_jobs/%Y/%m/%d/", blank=True)
+    file_name = models.CharField(max_length=255)
+    nb_processed_items = models.PositiveIntegerField(default=0)
+    nb_imported_articles = models.PositiveIntegerField(default=0)
+    nb_imported_feeds = models.PositiveIntegerField(default=0)
+    nb_imported_categories = models.PositiveIntegerField(default=0)
+    nb_skipped_articles = models.PositiveIntegerField(default=0)
+    error_message = models.TextField(blank=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    user = models.ForeignKey("users.User", related_name="import_jobs", on_delete=models.CASCADE)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = ImportJobManager()
+
+    class Meta(TypedModelMeta):
+        ordering = ["-created_at"]
+        constraints = [
+            models.CheckConstraint(
+                name="%(app_label)s_%(class)s_source_type_valid",
+                condition=models.Q(source_type__in=constants.ImportJobSourceType.names),
+            ),
+            models.CheckConstraint(
+                name="%(app_label)s_%(class)s_status_valid",
+                condition=models.Q(status__in=constants.ImportJobStatus.names),
+            ),
+        ]
+
+    def __str__(self):
+        return (
+            f"ImportJob(id={self.id}, source_type={self.source_type}, status={self.status}, "
+            f"user={self.user_id})"
+        )
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in {constants.ImportJobStatus.SUCCESS, constants.ImportJobStatus.FAILURE}
+
+    @property
+    def summary(self) -> str:
+        match self.source_type:
+            case (
+                constants.ImportJobSourceType.CUSTOM_CSV
+                | constants.ImportJobSourceType.CUSTOM_JSONL
+            ):
+                summary = _(
+                    "Successfully imported %(nb_imported_feeds)s feeds, %(nb_imported_categories)s "
+                    "feed categories and %(nb_imported_articles)s articles."
+                ) % {
+                    "nb_imported_feeds": self.nb_imported_feeds,
+                    "nb_imported_categories": self.nb_imported_categories,
+                    "nb_imported_articles": self.nb_imported_articles,
+                }
+                if self.nb_skipped_articles:
+                    summary += " " + _("Skipped %s unchanged articles.") % self.nb_skipped_articles
+                return summary
+            case constants.ImportJobSourceType.WALLABAG if self.nb_skipped_articles:
+                return _(
+                    "Successfully imported %(nb_imported_articles)s articles and skipped "
+                    "%(nb_skipped_articles)s unchanged articles."
+                ) % {
+                    "nb_imported_articles": self.nb_imported_articles,
+                    "nb_skipped_articles": self.nb_skipped_articles,
+                }
+            case constants.ImportJobSourceType.WALLABAG:
+                return _("Successfully imported %s articles") % self.nb_imported_articles
+            case constants.ImportJobSourceType.OPML:
+                return _(
+                    "Successfully imported %(nb_imported_feeds)s feeds into "
+                    "%(nb_imported_categories)s categories."
+                ) % {
+                    "nb_imported_feeds": self.nb_imported_feeds,
+                    "nb_imported_categories": self.nb_imported_categories,
+                }
+            case _:
+                return ""
@@ -0,0 +1,116 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import json
+import logging
+import multiprocessing
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import django
+from django.db import connections, transaction
+
+from legadilo.core.utils.time_utils import utcnow
+from legadilo.users.models import User
+
+from .custom_jsonl import import_custom_jsonl_file
+from .export import export_articles_jsonl
+
+logger = logging.getLogger(__name__)
+
+type UserResult = dict[str, Any]
+type UserTask = Callable[[int, str], UserResult]
+
+
+def get_user_file_name(user_id: int) -> str:
+    return f"user_{user_id}.jsonl.gz"
+
+
+def export_user_data(user_id: int, output_dir: str) -> UserResult:
+    """Export all the data of a user in a compressed JSON Lines file of the output directory."""
+
+    def _export(result: UserResult):
+        user = User.objects.get(id=user_id)
+        result["nb_rows"] = 0
+
+        def progress_callback(nb_rows: int):
+            result["nb_rows"] = nb_rows
+
+        with (Path(output_dir) / result["file"]).open("wb") as f:
+            for chunk in export_articles_jsonl(user, progress_callback=progress_callback):
+                f.write(chunk)
+
+    return _run_for_user(user_id, _export)
+
+
+def import_user_data(user_id: int, input_dir: str) -> UserResult:
+    """Import the file of the input directory created by export_user_data for the user.
+
+    The import is done in a transaction: nothing is imported if it fails.
+    """
+
+    def _import(result: UserResult):
+        user = User.objects.get(id=user_id)
+        with transaction.atomic():
+            (
+                nb_imported_articles,
+                nb_imported_feeds,
+                nb_imported_categories,
+                nb_skipped_articles,
+            ) = import_custom_jsonl_file(user, Path(input_dir) / result["file"])
+        result["nb_imported_articles"] = nb_imported_articles
+        result["nb_imported_feeds"] = nb_imported_feeds
+        result["nb_imported_categories"] = nb_imported_categories
+        result["nb_skipped_articles"] = nb_skipped_articles
+
+    return _run_for_user(user_id, _import)
+
+
+def _run_for_user(user_id: int, task: Callable[[UserResult], None]) -> UserResult:
+    result: UserResult = {"user_id": user_id, "file": get_user_file_name(user_id)}
+    start = time.perf_counter()
+    try:
+        task(result)
+    except Exception as e:
+        # Errors must not stop the processing of the other users.
+        logger.exception("Failed to process the data of user %s", user_id)
+        result["status"] = "failure"
+        result["error"] = str(e) or type(e).__name__
+    else:
+        result["status"] = "success"
+    result["duration"] = round(time.perf_counter() - start, 3)
+
+    return result
+
+
+def run_for_users(
+    task: UserTask, user_ids: Iterable[int], directory: str, *, nb_workers: int
+) -> list[UserResult]:
+    """Run the task for each user, in a pool of processes if there are several workers.
+
+    Results are returned in the order of the users.
+    """
+    user_ids = list(user_ids)
+    if nb_workers <= 1:
+        return [task(user_id, directory) for user_id in user_ids]
+
+    # Connections can't be shared with the worker processes. They open their own.
+    connections.close_all()
+    with ProcessPoolExecutor(
+        max_workers=nb_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=django.setup,
+    ) as executor:
+        return list(executor.map(task, user_ids, [directory] * len(user_ids)))
+
+
+def write_manifest(path: Path, results: list[UserResult]):
+    """Write a summary of the processing of each user as JSON."""
+    path.write_text(
+        json.dumps({"created_at": utcnow().isoformat(), "users": results}, indent=2),
+        encoding="utf-8",
+    )
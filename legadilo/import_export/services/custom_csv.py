@@ -3,9 +3,13 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
 import csv
+import hashlib
 import json
 import logging
 import sys
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from itertools import batched, groupby
 from json import JSONDecodeError
 from pathlib import Path
 from ssl import SSLCertVerificationError
@@ -15,8 +19,8 @@ import httpx
 from django.db import IntegrityError, models
 from slugify import slugify
 
-from legadilo.core.utils.http_utils import get_rss_sync_client
 from legadilo.core.utils.time_utils import safe_datetime_parse
+from legadilo.core.utils.types import ProgressCallback
 from legadilo.core.utils.validators import is_url_valid
 from legadilo.feeds import constants as feeds_constants
 from legadilo.feeds.models import Feed, FeedArticle, FeedCategory
@@ -25,7 +29,7 @@ from legadilo.feeds.services.feed_parsing import (
     FeedFileTooBigError,
     InvalidFeedFileError,
     NoFeedUrlFoundError,
-    get_feed_data,
+    get_feeds_data,
 )
 from legadilo.import_export.services.exceptions import DataImportError
 from legadilo.reading.models import Article, ArticlesGroup, Tag
@@ -33,6 +37,7 @@ from legadilo.reading.services.article_fetching import ArticleData
 from legadilo.users.models import User
 
 from .. import constants
+from ..models import ImportFingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -40,27 +45,69 @@ logger = logging.getLogger(__name__)
 csv.field_size_limit(sys.maxsize)
 
 
-def import_custom_csv_file(user: User, path_to_file) -> tuple[int, int, int]:
-    nb_imported_articles = 0
-    nb_imported_feeds = 0
-    nb_imported_categories = 0
-
+def import_custom_csv_file(
+    user: User, path_to_file, progress_callback: ProgressCallback | None = None
+) -> tuple[int, int, int, int]:
     with Path(path_to_file).open(encoding="utf-8") as f:
-        dict_reader = csv.DictReader(f)
-        # This is used to cache feed values: the URL in the file may not be the latest available URL
-        # To avoid making too many HTTP requests, we cache the result to reuse the latest URL as
-        # soon as possible.
-        feed_url_in_file_to_true_feed: dict[str, Feed] = {}
-        for row in dict_reader:
-            _check_keys_in_row(row)
-            nb_articles, nb_feeds, nb_categories = _process_row(
-                user, row, feed_url_in_file_to_true_feed
-            )
-            nb_imported_articles += nb_articles
-            nb_imported_feeds += nb_feeds
-            nb_imported_categories += nb_categories
 
-    return nb_imported_articles, nb_imported_feeds, nb_imported_categories
+        def read_rows() -> Iterable[dict]:
+            f.seek(0)
+            return csv.DictReader(f)
+
+        return import_custom_rows(user, read_rows, progress_callback)
+
+
+def import_custom_rows(
+    user: User,
+    read_rows: Callable[[], Iterable[dict]],
+    progress_callback: ProgressCallback | None = None,
+) -> tuple[int, int, int, int]:
+    """Import the rows of a custom export in stages to limit the number of queries with big files.
+
+    Categories, feeds and groups are collected and imported first: there are few of them compared
+    to the articles. The rows are then read again, with a new call to read_rows, to save the
+    articles by batches. Articles already imported from the same row are skipped.
+
+    Return the number of imported articles, feeds and categories and the number of skipped articles.
+    """
+    category_titles, feed_rows, group_rows = _collect_linked_objects(read_rows())
+    categories, nb_imported_categories = _import_categories(user, category_titles)
+    feeds, nb_imported_feeds = _import_feeds(user, feed_rows, categories, progress_callback)
+    groups = _import_articles_groups(user, group_rows)
+
+    nb_processed_articles = 0
+    nb_skipped_articles = 0
+    article_rows = (
+        row for row in read_rows() if row["article_url"] and is_url_valid(row["article_url"])
+    )
+    for rows in batched(article_rows, constants.CUSTOM_CSV_IMPORT_BATCH_SIZE, strict=False):
+        content_hashes = {
+            _get_external_article_id(row): hashlib.sha256(
+                json.dumps(row, sort_keys=True, default=str).encode()
+            ).hexdigest()
+            for row in rows
+            # Rows without id can't be told apart: they are always imported.
+            if row["article_id"]
+        }
+        unchanged_external_ids = ImportFingerprint.objects.get_unchanged_external_ids(
+            user, content_hashes
+        )
+        changed_rows = tuple(
+            row for row in rows if _get_external_article_id(row) not in unchanged_external_ids
+        )
+        if changed_rows:
+            _import_articles(user, changed_rows, feeds, groups, content_hashes)
+        nb_processed_articles += len(rows)
+        nb_skipped_articles += len(rows) - len(changed_rows)
+        if progress_callback is not None:
+            progress_callback(nb_processed_articles)
+
+    return (
+        nb_processed_articles - nb_skipped_articles,
+        nb_imported_feeds,
+        nb_imported_categories,
+        nb_skipped_articles,
+    )
 
 
 def _check_keys_in_row(row: dict):
@@ -68,52 +115,92 @@ def _check_keys_in_row(row: dict):
         raise DataImportError
 
 
-def _process_row(user: User, row: dict, feed_url_in_file_to_true_feed: dict[str, Feed]):
-    category = None
-    created_category = False
-    if row["category_title"]:
-        category, created_category = _import_category(user, row)
+def _collect_linked_objects(
+    rows: Iterable[dict],
+) -> tuple[list[str], dict[str, dict], dict[str, dict]]:
+    category_titles: dict[str, None] = {}
+    feed_rows: dict[str, dict] = {}
+    group_rows: dict[str, dict] = {}
+    for row in rows:
+        _check_keys_in_row(row)
+        if row["category_title"]:
+            category_titles[row["category_title"]] = None
+
+        if row["feed_url"] not in feed_rows and _has_valid_feed(row):
+            feed_rows[row["feed_url"]] = {
+                key: row[key]
+                for key in ("feed_url", "feed_site_url", "feed_title", "category_title")
+            }
+
+        if row["group_title"] and row["group_title"] not in group_rows:
+            group_rows[row["group_title"]] = {
+                key: row[key] for key in ("group_title", "group_description", "group_tags")
+            }
+
+    return list(category_titles), feed_rows, group_rows
 
-    feed = None
-    created_feed = False
-    if (
+
+def _has_valid_feed(row: dict) -> bool:
+    return bool(
         row["feed_url"]
         and is_url_valid(row["feed_url"])
         and is_url_valid(row["feed_site_url"])
         and row["feed_title"]
         and slugify(row["feed_title"])
-    ):
-        feed, created_feed = _import_feed(user, category, row, feed_url_in_file_to_true_feed)
-
-    articles_group = None
-    if row["group_title"]:
-        articles_group = _import_articles_group(user, row)
-
-    created_article = False
-    if row["article_url"] and is_url_valid(row["article_url"]):
-        created_article = _import_article(user, feed, articles_group, row)
-
-    return (
-        1 if created_article else 0,
-        1 if created_feed else 0,
-        1 if created_category else 0,
     )
 
 
-def _import_category(user, row):
-    return FeedCategory.objects.get_or_create(user=user, title=row["category_title"])
-
+def _import_categories(user: User, titles: list[str]) -> tuple[dict[str, FeedCategory], int]:
+    existing_categories = FeedCategory.objects.filter(user=user).filter(
+        models.Q(title__in=titles) | models.Q(slug__in=[slugify(title) for title in titles])
+    )
+    categories_by_title = {category.title: category for category in existing_categories}
+    categories_by_slug = {category.slug: category for category in existing_categories}
+    categories_to_create = []
+    for title in titles:
+        if title in categories_by_title:
+            continue
+
+        slug = slugify(title)
+        if slug not in categories_by_slug:
+            categories_by_slug[slug] = FeedCategory(user=user, title=title, slug=slug)
+            categories_to_create.append(categories_by_slug[slug])
+        categories_by_title[title] = categories_by_slug[slug]
+
+    FeedCategory.objects.bulk_create(categories_to_create)
+
+    return categories_by_title, len(categories_to_create)
+
+
+def _import_feeds(
+    user: User,
+    feed_rows: dict[str, dict],
+    categories: dict[str, FeedCategory],
+    progress_callback: ProgressCallback | None = None,
+) -> tuple[dict[str, Feed], int]:
+    # Feeds are fetched to get their latest metadata: the URL in the file may not be the latest
+    # available URL. Each feed is fetched only once and concurrently with the others.
+    feeds_data = get_feeds_data(feed_rows.keys())
+    feeds = {}
+    nb_imported_feeds = 0
+    for feed_url, row in feed_rows.items():
+        feed, created = _import_feed(
+            user, categories.get(row["category_title"]), row, feeds_data[feed_url]
+        )
+        if feed is not None:
+            feeds[feed_url] = feed
+        nb_imported_feeds += int(created)
+        # No article is processed yet but fetching many feeds can be long: report the progress to
+        # show the import is still running.
+        if progress_callback is not None:
+            progress_callback(0)
 
-def _import_feed(user, category, row, feed_url_in_file_to_true_feed):
-    feed = feed_url_in_file_to_true_feed.get(row["feed_url"])
+    return feeds, nb_imported_feeds
 
-    if feed:
-        return feed, False
 
+def _import_feed(user, category, row, feed_data_future):
     try:
-        with get_rss_sync_client() as client:
-            feed_data = get_feed_data(row["feed_url"], client=client)
-
+        feed_data = feed_data_future.result()
         feed, created = Feed.objects.create_from_metadata(
             feed_data,
             user,
@@ -122,7 +209,6 @@ def _import_feed(user, category, row, feed_url_in_file_to_true_feed):
             tags=[],
             category=category,
         )
-        feed_url_in_file_to_true_feed[row["feed_url"]] = feed
         return feed, created
     except (
         httpx.HTTPError,
@@ -156,32 +242,96 @@ def _import_feed(user, category, row, feed_url_in_file_to_true_feed):
             feed.disable("Failed to reach feed URL while importing from custom CSV.")
             feed.save()
 
-        feed_url_in_file_to_true_feed[row["feed_url"]] = feed
         return feed, created
     except IntegrityError:
         logger.info("You are already subscribed to %s", row["feed_url"])
         return None, False
 
 
-def _import_articles_group(user, row):
-    if existing_group := ArticlesGroup.objects.filter(user=user, title=row["group_title"]).first():
-        return existing_group
+def _import_articles_groups(user: User, group_rows: dict[str, dict]) -> dict[str, ArticlesGroup]:
+    groups: dict[str, ArticlesGroup] = {}
+    existing_groups = ArticlesGroup.objects.filter(user=user, title__in=group_rows.keys())
+    for group in existing_groups.order_by("id"):
+        groups.setdefault(group.title, group)
+
+    for title, row in group_rows.items():
+        if title in groups:
+            continue
+
+        tags = _safe_json_parse(row["group_tags"], [])
+        if tags:
+            tags = Tag.objects.get_or_create_from_list(user, tags)
+
+        groups[title] = ArticlesGroup.objects.create_with_tags(
+            user,
+            title,
+            row["group_description"],
+            tags,
+        )
+
+    return groups
+
+
+def _import_articles(
+    user: User,
+    rows: tuple[dict, ...],
+    feeds: dict[str, Feed],
+    groups: dict[str, ArticlesGroup],
+    content_hashes: dict[str, str],
+):
+    # Articles are saved with their main feed. Rows are usually sorted by feed: save consecutive
+    # rows of the same feed together to keep the order of the file. The URL of the data is used
+    # after that: the fragment of the URL of the row is removed when the data is built.
+    data_by_feed = [
+        (feed, [(row, _build_article_data(feed, row)) for row in feed_rows])
+        for feed, feed_rows in groupby(rows, key=lambda row: feeds.get(row["feed_url"]))
+    ]
+    articles_by_url = {}
+    all_save_results = []
+    for feed, rows_data in data_by_feed:
+        save_results = Article.objects.save_from_list_of_data(
+            user=user,
+            articles_data=[article_data for _row, article_data in rows_data],
+            tags=[],
+            initial_main_feed_id=feed.id if feed else None,
+        )
+        articles_by_url.update({result.article.url: result.article for result in save_results})
+        all_save_results.extend(save_results)
+
+    # Links that already exist for the article or its URL are skipped by the unique constraints.
+    FeedArticle.objects.bulk_create(
+        [
+            FeedArticle(
+                feed=feed,
+                article=articles_by_url[article_data.url],
+                feed_article_id=article_data.url,
+            )
+            for feed, rows_data in data_by_feed
+            if feed is not None
+            for _row, article_data in rows_data
+        ],
+        ignore_conflicts=True,
+    )
 
-    tags = _safe_json_parse(row["group_tags"], [])
-    if tags:
-        tags = Tag.objects.get_or_create_from_list(user, tags)
+    articles_by_group: dict[ArticlesGroup, dict[str, Article]] = defaultdict(dict)
+    for _feed, rows_data in data_by_feed:
+        for row, article_data in rows_data:
+            if group := groups.get(row["group_title"]):
+                articles_by_group[group][article_data.url] = articles_by_url[article_data.url]
+    for group, articles in articles_by_group.items():
+        Article.objects.link_articles_to_group(group, articles.values())
 
-    return ArticlesGroup.objects.create_with_tags(
+    ImportFingerprint.objects.save_fingerprints(
         user,
-        row["group_title"],
-        row["group_description"],
-        tags,
+        content_hashes,
+        [article_data for _feed, rows_data in data_by_feed for _row, article_data in rows_data],
+        all_save_results,
     )
 
 
-def _import_article(user, feed, group, row):
-    article_data = ArticleData(
-        external_article_id=f"custom_csv:{row['article_id']}",
+def _build_article_data(feed: Feed | None, row: dict) -> ArticleData:
+    return ArticleData(
+        external_article_id=_get_external_article_id(row),
         source_title=feed.title if feed else urlparse(row["article_url"]).netloc,
         title=row["article_title"],
         summary="",
@@ -199,33 +349,16 @@ def _import_article(user, feed, group, row):
         read_at=safe_datetime_parse(row["article_read_at"]),
         is_favorite=_get_bool(row["article_is_favorite"]),
     )
-    save_results = Article.objects.save_from_list_of_data(
-        user=user,
-        articles_data=[article_data],
-        tags=[],
-        initial_main_feed_id=feed.id if feed else None,
-    )
 
-    if (
-        feed
-        and not FeedArticle.objects.filter(
-            models.Q(feed=feed, article=save_results[0].article)
-            | models.Q(feed=feed, feed_article_id=article_data.url)
-        ).exists()
-    ):
-        FeedArticle.objects.create(
-            feed=feed,
-            article=save_results[0].article,
-            feed_article_id=article_data.url,
-        )
 
-    if group:
-        Article.objects.link_articles_to_group(group, [save_results[0].article])
-
-    return True
+def _get_external_article_id(row: dict) -> str:
+    return f"custom_csv:{row['article_id']}"
 
 
 def _get_bool(value):
+    if isinstance(value, bool):
+        return value
+
     return value.lower() in {"true", "1", "t", "yes"}
 
 
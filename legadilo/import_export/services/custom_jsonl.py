@@ -0,0 +1,40 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import gzip
+import json
+import zlib
+from collections.abc import Iterator
+
+from legadilo.core.utils.types import ProgressCallback
+from legadilo.import_export.services.exceptions import DataImportError
+from legadilo.users.models import User
+
+from .custom_csv import import_custom_rows
+
+
+def import_custom_jsonl_file(
+    user: User, path_to_file, progress_callback: ProgressCallback | None = None
+) -> tuple[int, int, int, int]:
+    """Import a gzip compressed JSON Lines export.
+
+    Each line holds the fields of a row of the custom CSV export: it's imported the same way.
+    """
+    with gzip.open(path_to_file, "rt", encoding="utf-8") as f:
+
+        def read_rows() -> Iterator[dict]:
+            f.seek(0)
+            for line in f:
+                if not line.strip():
+                    continue
+
+                row = json.loads(line)
+                if not isinstance(row, dict):
+                    raise DataImportError("Each line must be a JSON object")
+                yield row
+
+        try:
+            return import_custom_rows(user, read_rows, progress_callback)
+        except (EOFError, gzip.BadGzipFile, zlib.error) as e:
+            raise DataImportError("The file is not a valid gzip file") from e
@@ -2,36 +2,149 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
+import base64
+import binascii
 import csv
+import json
+import zlib
+from collections.abc import Iterator
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Self
 
 from legadilo.core.utils.text import ClearableStringIO
 from legadilo.core.utils.time_utils import utcnow
+from legadilo.core.utils.types import ProgressCallback
 from legadilo.feeds.models import Feed, FeedCategory
 from legadilo.import_export import constants
-from legadilo.reading.models import Article
+from legadilo.reading.models import Article, DeletedArticle
 from legadilo.users.models import User
 
 
 def export_articles(
     user: User, *, include_feeds: bool = True, updated_since: datetime | None = None
-):
+) -> Iterator[str]:
     buffer = ClearableStringIO()
     writer = csv.DictWriter(buffer, constants.CSV_HEADER_FIELDS)
     writer.writeheader()
     yield buffer.getvalue()
 
-    if include_feeds:
-        feed_categories = FeedCategory.objects.export(user, updated_since=updated_since)
-        writer.writerows(feed_categories)
-        yield buffer.getvalue()
-        feeds = Feed.objects.export(user, updated_since=updated_since)
-        writer.writerows(feeds)
+    for rows in _iter_export_rows(user, include_feeds=include_feeds, updated_since=updated_since):
+        writer.writerows(rows)
         yield buffer.getvalue()
 
-    for articles_batch in Article.objects.export(user, updated_since=updated_since):
-        writer.writerows(articles_batch)
-        yield buffer.getvalue()
+
+def export_articles_jsonl(
+    user: User,
+    *,
+    include_feeds: bool = True,
+    updated_since: datetime | None = None,
+    progress_callback: ProgressCallback | None = None,
+) -> Iterator[bytes]:
+    """Export the same rows as the CSV export as gzip compressed JSON Lines.
+
+    Each line is a JSON object with all the fields of the CSV export, missing values are empty
+    strings like in the CSV. The data is compressed as it is produced: only the compressed data
+    not yet transmitted is kept in memory.
+    """
+    compressor = zlib.compressobj(wbits=constants.GZIP_WBITS)
+    nb_exported_rows = 0
+    for rows in _iter_export_rows(user, include_feeds=include_feeds, updated_since=updated_since):
+        lines = "".join(
+            json.dumps({field: row.get(field, "") for field in constants.CSV_HEADER_FIELDS}) + "\n"
+            for row in rows
+        )
+        if compressed_data := compressor.compress(lines.encode("utf-8")):
+            yield compressed_data
+        nb_exported_rows += len(rows)
+        if progress_callback is not None:
+            progress_callback(nb_exported_rows)
+
+    yield compressor.flush()
+
+
+def _iter_export_rows(
+    user: User, *, include_feeds: bool, updated_since: datetime | None
+) -> Iterator[list[dict]]:
+    if include_feeds:
+        yield FeedCategory.objects.export(user, updated_since=updated_since)
+        yield Feed.objects.export(user, updated_since=updated_since)
+
+    yield from Article.objects.export(user, updated_since=updated_since)
+
+
+@dataclass(frozen=True)
+class ExportChangesCursor:
+    """Position in the changes of the articles: last exported update and deletion."""
+
+    obj_updated_at: datetime | None = None
+    article_id: int = 0
+    deleted_article_id: int = 0
+
+    @classmethod
+    def decode(cls, value: str) -> Self | None:
+        try:
+            raw_obj_updated_at, raw_article_id, raw_deleted_article_id = (
+                base64.urlsafe_b64decode(value.encode()).decode().split("|")
+            )
+            return cls(
+                obj_updated_at=datetime.fromisoformat(raw_obj_updated_at)
+                if raw_obj_updated_at
+                else None,
+                article_id=int(raw_article_id),
+                deleted_article_id=int(raw_deleted_article_id),
+            )
+        except ValueError, UnicodeDecodeError, binascii.Error:
+            return None
+
+    def encode(self) -> str:
+        raw_obj_updated_at = self.obj_updated_at.isoformat() if self.obj_updated_at else ""
+        return base64.urlsafe_b64encode(
+            f"{raw_obj_updated_at}|{self.article_id}|{self.deleted_article_id}".encode()
+        ).decode()
+
+
+@dataclass(frozen=True)
+class ExportChanges:
+    articles: list[dict]
+    deleted_articles: list[dict]
+    next_cursor: ExportChangesCursor
+    has_more: bool
+
+
+def export_changes(user: User, cursor: ExportChangesCursor | None = None) -> ExportChanges:
+    """Export the articles updated and deleted since the cursor, everything without cursor.
+
+    Rows of articles are the same as in the CSV export. Follow next_cursor until has_more is false
+    and keep the last cursor to get the next changes later on.
+    """
+    cursor = cursor or ExportChangesCursor()
+    limit = constants.EXPORT_CHANGES_PAGE_SIZE
+    articles, last_article_position = Article.objects.export_changes(
+        user,
+        after=(cursor.obj_updated_at, cursor.article_id) if cursor.obj_updated_at else None,
+        limit=limit,
+    )
+    deleted_articles = DeletedArticle.objects.export_after(
+        user, deleted_article_id=cursor.deleted_article_id, limit=limit
+    )
+
+    obj_updated_at, article_id = last_article_position or (
+        cursor.obj_updated_at,
+        cursor.article_id,
+    )
+    return ExportChanges(
+        articles=articles,
+        deleted_articles=deleted_articles,
+        next_cursor=ExportChangesCursor(
+            obj_updated_at=obj_updated_at,
+            article_id=article_id,
+            deleted_article_id=deleted_articles[-1]["id"]
+            if deleted_articles
+            else cursor.deleted_article_id,
+        ),
+        has_more=len(articles) == limit or len(deleted_articles) == limit,
+    )
 
 
 def build_feeds_export_context(user: User):
@@ -0,0 +1,137 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import logging
+from json import JSONDecodeError
+
+from defusedxml.ElementTree import ParseError as XmlParseError
+from django.urls import reverse
+from django.utils.translation import gettext_lazy as _
+from pydantic import ValidationError as PydanticValidationError
+
+from legadilo.core.utils.file import ensure_file_on_disk
+from legadilo.users.models import Notification
+
+from .. import constants
+from ..models import ImportJob
+from .custom_csv import import_custom_csv_file
+from .custom_jsonl import import_custom_jsonl_file
+from .exceptions import DataImportError
+from .opml import import_opml_file
+from .wallabag import import_wallabag_file
+
+logger = logging.getLogger(__name__)
+
+
+def run_import_job(job: ImportJob):
+    """Import the file of a job claimed by a worker and notify its user once done.
+
+    Errors are recorded on the job instead of being raised so the worker can run the next jobs. The
+    user is not notified if the job was already marked as finished by another worker.
+    """
+    logger.info("Running import job %s", job.id)
+    try:
+        is_marked_as_finished = _import(job)
+    except (
+        DataImportError,
+        JSONDecodeError,
+        PydanticValidationError,
+        UnicodeDecodeError,
+        XmlParseError,
+    ):
+        logger.info("Import job %s failed because its file is invalid", job.id)
+        is_marked_as_finished = ImportJob.objects.mark_as_failure(
+            job, str(_("The file you supplied is not valid."))
+        )
+    except Exception:
+        logger.exception("Failed to run import job %s", job.id)
+        is_marked_as_finished = ImportJob.objects.mark_as_failure(
+            job, str(_("An unexpected error occurred while importing the file."))
+        )
+    else:
+        logger.info("Import job %s completed", job.id)
+
+    if is_marked_as_finished:
+        notify_import_job_finished(job)
+    else:
+        logger.warning("Import job %s was already marked as %s", job.id, job.status)
+
+
+def _import(job: ImportJob) -> bool:
+    def progress_callback(nb_processed_items: int):
+        ImportJob.objects.update_progress(job, nb_processed_items)
+
+    match job.source_type:
+        case constants.ImportJobSourceType.CUSTOM_CSV:
+            with ensure_file_on_disk(job.file) as file_path:
+                (
+                    nb_imported_articles,
+                    nb_imported_feeds,
+                    nb_imported_categories,
+                    nb_skipped_articles,
+                ) = import_custom_csv_file(job.user, file_path, progress_callback=progress_callback)
+            return ImportJob.objects.mark_as_success(
+                job,
+                nb_imported_articles=nb_imported_articles,
+                nb_imported_feeds=nb_imported_feeds,
+                nb_imported_categories=nb_imported_categories,
+                nb_skipped_articles=nb_skipped_articles,
+            )
+        case constants.ImportJobSourceType.CUSTOM_JSONL:
+            with ensure_file_on_disk(job.file) as file_path:
+                (
+                    nb_imported_articles,
+                    nb_imported_feeds,
+                    nb_imported_categories,
+                    nb_skipped_articles,
+                ) = import_custom_jsonl_file(
+                    job.user, file_path, progress_callback=progress_callback
+                )
+            return ImportJob.objects.mark_as_success(
+                job,
+                nb_imported_articles=nb_imported_articles,
+                nb_imported_feeds=nb_imported_feeds,
+                nb_imported_categories=nb_imported_categories,
+                nb_skipped_articles=nb_skipped_articles,
+            )
+        case constants.ImportJobSourceType.WALLABAG:
+            with job.file.open("rb") as f:
+                nb_imported_articles, nb_skipped_articles = import_wallabag_file(
+                    job.user, f, progress_callback=progress_callback
+                )
+            return ImportJob.objects.mark_as_success(
+                job,
+                nb_imported_articles=nb_imported_articles,
+                nb_skipped_articles=nb_skipped_articles,
+            )
+        case constants.ImportJobSourceType.OPML:
+            with job.file.open("rb") as f:
+                nb_imported_feeds, nb_imported_categories = import_opml_file(
+                    job.user, f, progress_callback=progress_callback
+                )
+            return ImportJob.objects.mark_as_success(
+                job,
+                nb_imported_feeds=nb_imported_feeds,
+                nb_imported_categories=nb_imported_categories,
+            )
+        case _:
+            raise DataImportError(f"Unsupported source type {job.source_type}")
+
+
+def notify_import_job_finished(job: ImportJob):
+    source_type = constants.ImportJobSourceType(job.source_type).label
+    if job.status == constants.ImportJobStatus.SUCCESS:
+        title = _("Import of your %s file succeeded") % source_type
+        content = job.summary
+    else:
+        title = _("Import of your %s file failed") % source_type
+        content = job.error_message
+
+    Notification.objects.create(
+        user=job.user,
+        title=title,
+        content=content,
+        info_link=reverse("import_export:import_job", kwargs={"import_job_id": job.id}),
+        info_link_text=str(_("See import")),
+    )
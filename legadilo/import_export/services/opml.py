@@ -3,133 +3,184 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
 import logging
+from collections.abc import Iterator
+from dataclasses import dataclass
+from itertools import batched
 from pathlib import Path
+from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
 import httpx
-from defusedxml.ElementTree import parse
+from defusedxml.ElementTree import iterparse
+from django.core.files import File
 from django.db import IntegrityError
 from pydantic import ValidationError as PydanticValidationError
 from slugify import slugify
 
-from legadilo.core.utils.http_utils import get_rss_sync_client
 from legadilo.core.utils.time_utils import utcnow
+from legadilo.core.utils.types import ProgressCallback
+from legadilo.core.utils.urls import hash_url
 from legadilo.core.utils.validators import is_url_valid
 from legadilo.feeds import constants as feeds_constants
 from legadilo.feeds.models import Feed, FeedCategory
 from legadilo.feeds.services.feed_parsing import (
     FeedFileTooBigError,
     InvalidFeedFileError,
-    get_feed_data,
+    get_feeds_data,
 )
 from legadilo.users.models import User
 
-logger = logging.getLogger(__name__)
+from .. import constants
 
+if TYPE_CHECKING:
+    # Only used for typing: files are parsed with defusedxml.
+    from xml.etree.ElementTree import Element
 
-class OutlineElt:
-    def __init__(self, node):
-        self._node = node
+logger = logging.getLogger(__name__)
 
-    @property
-    def children_outline(self):
-        if not self.is_category:
-            yield []
-            return
+# Depth of the outlines directly in the body: opml > body > outline.
+_BODY_OUTLINE_DEPTH = 3
+
+
+@dataclass(frozen=True)
+class OpmlFeed:
+    feed_url: str
+    site_url: str
+
+
+def iter_opml_outlines(file: str | Path | File) -> Iterator[tuple[str | None, OpmlFeed | None]]:
+    """Read the categories and feeds of an OPML file without loading the whole document.
+
+    Yield (category title, None) when a category starts and (category title, feed) for each feed
+    of this category. Feeds outside categories are yielded with None as category title. Only the
+    outlines of the body and the feeds directly in categories are read: nested categories are not
+    supported.
+    """
+    path: list[Element] = []
+    category_title = None
+    for event, element in iterparse(file, events=("start", "end")):
+        if event == "end":
+            path.pop()
+            if element.tag == "outline":
+                element.clear()
+            if len(path) == _BODY_OUTLINE_DEPTH - 1 and path[-1].tag == "body":
+                # The outline is fully read: remove it from the body to free the memory.
+                category_title = None
+                path[-1].clear()
+            continue
 
-        for outline_node in self._node.findall("outline"):
-            yield OutlineElt(outline_node)
+        path.append(element)
+        if element.tag != "outline" or len(path) < _BODY_OUTLINE_DEPTH or path[1].tag != "body":
+            continue
 
-    @property
-    def text(self):
-        return self._node.get("text")
+        is_body_outline = len(path) == _BODY_OUTLINE_DEPTH
+        is_category_outline = len(path) == _BODY_OUTLINE_DEPTH + 1 and category_title is not None
+        if is_body_outline and _is_category(element):
+            category_title = element.get("text")
+            yield category_title, None
+        elif (is_body_outline or is_category_outline) and _is_feed(element):
+            yield (
+                category_title,
+                OpmlFeed(feed_url=element.get("xmlUrl"), site_url=element.get("htmlUrl")),
+            )
 
-    @property
-    def feed_url(self):
-        return self._node.get("xmlUrl")
 
-    @property
-    def site_url(self):
-        return self._node.get("htmlUrl")
+def _is_category(element: Element) -> bool:
+    text = element.get("text")
+    return bool(
+        element.get("xmlUrl") is None
+        and element.get("htmlUrl") is None
+        and text
+        and text not in {"tt-rss-labels", "tt-rss-prefs"}
+        and slugify(text)
+    )
 
-    @property
-    def is_category(self):
-        return (
-            self.feed_url is None
-            and self.site_url is None
-            and self.text
-            and self.text not in {"tt-rss-labels", "tt-rss-prefs"}
-        )
 
-    @property
-    def is_feed(self):
-        return is_url_valid(self.feed_url) and is_url_valid(self.site_url) and self.text
+def _is_feed(element: Element) -> bool:
+    return bool(
+        is_url_valid(element.get("xmlUrl"))
+        and is_url_valid(element.get("htmlUrl"))
+        and element.get("text")
+    )
 
 
-def import_opml_file_sync(user: User, file: str | Path) -> tuple[int, int]:
+def import_opml_file_sync(user: User, file: str | Path | File) -> tuple[int, int]:
     return import_opml_file(user, file)
 
 
-def import_opml_file(user: User, file: str | Path) -> tuple[int, int]:
-    tree = parse(file)
-    root = tree.getroot()
-    return _process_opml_data(user, root)
-
+def import_opml_file(
+    user: User, file: str | Path | File, progress_callback: ProgressCallback | None = None
+) -> tuple[int, int]:
+    """Import the categories and feeds of an OPML file by batches.
 
-def _process_opml_data(user, root) -> tuple[int, int]:
+    The file is read while it's imported so big files are never fully loaded in memory. Each
+    batch is saved before the rest of the file is read: wrap the call in a transaction to save
+    nothing if the file is invalid. The progress is reported after each batch with the number of
+    processed feeds.
+    """
+    nb_processed_feeds = 0
     nb_imported_feeds = 0
     nb_imported_categories = 0
-    body = root.find("body")
-    if body is None or len(body) == 0:
-        return 0, 0
-
-    with get_rss_sync_client() as client:
-        for outline_node in body.findall("outline"):
-            outline = OutlineElt(outline_node)
-            outline_nb_imported_feeds, outline_nb_imported_categories = _process_outline(
-                user, client, outline
-            )
-            nb_imported_categories += outline_nb_imported_categories
-            nb_imported_feeds += outline_nb_imported_feeds
-
-    return nb_imported_feeds, nb_imported_categories
-
-
-def _process_outline(user, client, outline):
-    nb_imported_categories = 0
-    nb_imported_feeds = 0
-
-    if outline.is_category and outline.text and slugify(outline.text):
-        nb_imported_feeds, nb_imported_categories = _process_category(user, client, outline)
-    elif outline.is_feed:
-        nb_imported_feeds = _process_feed(user, client, outline)
+    categories_by_slug: dict[str, FeedCategory] = {}
+    for outlines in batched(
+        iter_opml_outlines(file), constants.OPML_IMPORT_BATCH_SIZE, strict=False
+    ):
+        nb_imported_categories += _import_categories(
+            user, [title for title, _feed in outlines if title], categories_by_slug
+        )
+        feed_outlines = [
+            (feed, categories_by_slug[slugify(title)] if title else None)
+            for title, feed in outlines
+            if feed is not None
+        ]
+        if feed_outlines:
+            # Feeds of the batch are fetched concurrently. They are then saved one by one.
+            feeds_data = get_feeds_data(feed.feed_url for feed, _category in feed_outlines)
+            for feed, category in feed_outlines:
+                nb_imported_feeds += _process_feed(user, feed, feeds_data[feed.feed_url], category)
+            nb_processed_feeds += len(feed_outlines)
+        if progress_callback is not None:
+            progress_callback(nb_processed_feeds)
 
     return nb_imported_feeds, nb_imported_categories
 
 
-def _process_category(user, client, outline):
-    category, created = FeedCategory.objects.get_or_create(
-        user=user, slug=slugify(outline.text), defaults={"title": outline.text}
-    )
-    nb_imported_categories = 0
-    if created:
+def _import_categories(
+    user: User, titles: list[str], categories_by_slug: dict[str, FeedCategory]
+) -> int:
+    """Create the categories missing from categories_by_slug and add them to it.
+
+    Return the number of created categories.
+    """
+    titles_by_slug: dict[str, str] = {}
+    for title in titles:
+        if (slug := slugify(title)) not in categories_by_slug:
+            titles_by_slug.setdefault(slug, title)
+    if not titles_by_slug:
+        return 0
+
+    categories_by_slug.update({
+        category.slug: category
+        for category in FeedCategory.objects.filter(user=user, slug__in=titles_by_slug.keys())
+    })
+    categories_to_create = [
+        FeedCategory(user=user, title=title, slug=slug)
+        for slug, title in titles_by_slug.items()
+        if slug not in categories_by_slug
+    ]
+    FeedCategory.objects.bulk_create(categories_to_create)
+    for category in categories_to_create:
         logger.info("Imported category %s", category)
-        nb_imported_categories = 1
-    nb_imported_feeds = 0
-    for feed_outline in outline.children_outline:
-        if not feed_outline.is_feed:
-            continue
-
-        nb_imported_feeds += _process_feed(user, client, feed_outline, category)
+        categories_by_slug[category.slug] = category
 
-    return nb_imported_feeds, nb_imported_categories
+    return len(categories_to_create)
 
 
-def _process_feed(user, client, outline, category=None):
+def _process_feed(user, feed: OpmlFeed, feed_data_future, category=None):
     nb_imported_feeds = 0
     try:
-        logger.debug("Importing feed %s", outline.feed_url)
-        feed_data = get_feed_data(outline.feed_url, client=client)
+        logger.debug("Importing feed %s", feed.feed_url)
+        feed_data = feed_data_future.result()
         _feed, created = Feed.objects.create_from_metadata(
             feed_data,
             user,
@@ -140,17 +191,18 @@ def _process_feed(user, client, outline, category=None):
         )
         if created:
             nb_imported_feeds += 1
-        logger.debug("Feed %s imported successfully with all its metadata", outline.feed_url)
+        logger.debug("Feed %s imported successfully with all its metadata", feed.feed_url)
     except httpx.HTTPError:
         logger.exception(
-            "Failed to import feed %s. Created with basic data and disabled.", outline.feed_url
+            "Failed to import feed %s. Created with basic data and disabled.", feed.feed_url
         )
         Feed.objects.get_or_create(
-            feed_url=outline.feed_url,
+            feed_url_hash=hash_url(feed.feed_url),
+            feed_url=feed.feed_url,
             user=user,
             defaults={
-                "site_url": outline.site_url,
-                "title": urlparse(outline.feed_url).netloc,
+                "site_url": feed.site_url,
+                "title": urlparse(feed.feed_url).netloc,
                 "refresh_delay": feeds_constants.FeedRefreshDelays.DAILY_AT_NOON,
                 "description": "",
                 "feed_type": feeds_constants.SupportedFeedType.rss,
@@ -161,7 +213,7 @@ def _process_feed(user, client, outline, category=None):
         )
         nb_imported_feeds += 1
     except IntegrityError:
-        logger.info("You are already subscribed to %s", outline.feed_url)
+        logger.info("You are already subscribed to %s", feed.feed_url)
     except FeedFileTooBigError, InvalidFeedFileError, PydanticValidationError:
         logger.exception("Failed to import the feed")
 
@@ -2,16 +2,22 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
-import json
+import hashlib
 import logging
+from collections.abc import Iterable
 from datetime import datetime
+from itertools import batched
 from pathlib import Path
 from typing import Annotated
 
 from django.core.files import File
+from django.db import transaction
 from pydantic import BaseModel as BaseSchema
 from pydantic import ConfigDict, TypeAdapter
+from slugify import slugify
 
+from legadilo.core.utils.file import iter_json_array_items
+from legadilo.core.utils.types import ProgressCallback
 from legadilo.core.utils.validators import (
     CleanedString,
     SlugifiableValidator,
@@ -21,10 +27,13 @@ from legadilo.core.utils.validators import (
     truncate,
 )
 from legadilo.reading import constants as reading_constants
-from legadilo.reading.models import Article, Tag
+from legadilo.reading.models import Article, ArticleTag, Tag
 from legadilo.reading.services.article_fetching import ArticleData, Language, OptionalUrl
 from legadilo.users.models import User
 
+from .. import constants
+from ..models import ImportFingerprint
+
 logger = logging.getLogger(__name__)
 
 
@@ -55,47 +64,106 @@ class WallabagArticle(BaseSchema):
 ListOfWallabagArticles = TypeAdapter(list[WallabagArticle])
 
 
-def import_wallabag_json_file_path(user: User, path_to_file: str) -> int:
+def import_wallabag_json_file_path(
+    user: User, path_to_file: str, progress_callback: ProgressCallback | None = None
+) -> tuple[int, int]:
     with Path(path_to_file).open("rb") as f:
-        data = json.load(f)
-
-    return _import_wallabag_data(user, data)
-
-
-def import_wallabag_file(user: User, file: File) -> int:
-    return _import_wallabag_data(user, json.load(file))
-
-
-def _import_wallabag_data(user: User, data: list[dict]) -> int:
-    wallabag_articles = ListOfWallabagArticles.validate_python(data)
-    nb_added_articles = 0
-    for wallabag_article in wallabag_articles:
-        url = wallabag_article.url
-
-        tags = Tag.objects.get_or_create_from_list(user, wallabag_article.tags)
-        article_data = ArticleData(
-            external_article_id=f"wallabag:{wallabag_article.id}",
-            source_title=wallabag_article.domain_name,
-            title=wallabag_article.title,
-            summary="",
-            content=wallabag_article.content,
-            content_type="text/html",
-            authors=wallabag_article.published_by,
-            contributors=(),
-            tags=(),
-            url=url,
-            annotations=wallabag_article.annotations,
-            preview_picture_url=str(wallabag_article.preview_picture),
-            preview_picture_alt="",
-            published_at=wallabag_article.created_at,
-            updated_at=wallabag_article.updated_at,
-            language=wallabag_article.language,
+        return _import_wallabag_data(user, iter_json_array_items(f), progress_callback)
+
+
+def import_wallabag_file(
+    user: User, file: File, progress_callback: ProgressCallback | None = None
+) -> tuple[int, int]:
+    return _import_wallabag_data(user, iter_json_array_items(file), progress_callback)
+
+
+def _import_wallabag_data(
+    user: User, data: Iterable[dict], progress_callback: ProgressCallback | None = None
+) -> tuple[int, int]:
+    """Import the articles by batches to keep the memory usage bounded with big files.
+
+    Each batch is saved in its own transaction so the progress of the import is visible to other
+    connections. Wrap the call in a transaction to save nothing if an article is invalid.
+
+    Articles already imported with the same data are skipped. Return the number of imported and
+    skipped articles.
+    """
+    nb_processed_articles = 0
+    nb_skipped_articles = 0
+    for batch in batched(data, constants.WALLABAG_IMPORT_BATCH_SIZE, strict=False):
+        wallabag_articles = ListOfWallabagArticles.validate_python(batch)
+        content_hashes = {
+            _get_external_article_id(wallabag_article): hashlib.sha256(
+                wallabag_article.model_dump_json().encode()
+            ).hexdigest()
+            for wallabag_article in wallabag_articles
+        }
+        unchanged_external_ids = ImportFingerprint.objects.get_unchanged_external_ids(
+            user, content_hashes
         )
-        Article.objects.save_from_list_of_data(
-            user=user,
-            articles_data=[article_data],
-            tags=tags,
+        changed_wallabag_articles = [
+            wallabag_article
+            for wallabag_article in wallabag_articles
+            if _get_external_article_id(wallabag_article) not in unchanged_external_ids
+        ]
+        if changed_wallabag_articles:
+            with transaction.atomic():
+                _save_wallabag_articles(user, changed_wallabag_articles, content_hashes)
+        nb_processed_articles += len(wallabag_articles)
+        nb_skipped_articles += len(wallabag_articles) - len(changed_wallabag_articles)
+        if progress_callback is not None:
+            progress_callback(nb_processed_articles)
+
+    return nb_processed_articles - nb_skipped_articles, nb_skipped_articles
+
+
+def _get_external_article_id(wallabag_article: WallabagArticle) -> str:
+    return f"wallabag:{wallabag_article.id}"
+
+
+def _save_wallabag_articles(
+    user: User, wallabag_articles: list[WallabagArticle], content_hashes: dict[str, str]
+):
+    tag_titles_by_slug = {
+        slugify(tag): tag for wallabag_article in wallabag_articles for tag in wallabag_article.tags
+    }
+    tags_by_slug = {
+        tag.slug: tag
+        for tag in Tag.objects.get_or_create_from_list(user, tag_titles_by_slug.values())
+    }
+    articles_data = []
+    tags_by_external_article_id = {}
+    for wallabag_article in wallabag_articles:
+        external_article_id = _get_external_article_id(wallabag_article)
+        articles_data.append(
+            ArticleData(
+                external_article_id=external_article_id,
+                source_title=wallabag_article.domain_name,
+                title=wallabag_article.title,
+                summary="",
+                content=wallabag_article.content,
+                content_type="text/html",
+                authors=wallabag_article.published_by,
+                contributors=(),
+                tags=(),
+                url=wallabag_article.url,
+                annotations=wallabag_article.annotations,
+                preview_picture_url=str(wallabag_article.preview_picture),
+                preview_picture_alt="",
+                published_at=wallabag_article.created_at,
+                updated_at=wallabag_article.updated_at,
+                language=wallabag_article.language,
+            )
         )
-        nb_added_articles += 1
-
-    return nb_added_articles
+        tags_by_external_article_id[external_article_id] = [
+            tags_by_slug[slug] for slug in dict.fromkeys(map(slugify, wallabag_article.tags))
+        ]
+
+    results = Article.objects.save_from_list_of_data(user, articles_data, tags=[])
+    # Like when articles are saved one by one, only new articles are tagged.
+    ArticleTag.objects.associate_new_articles_with_tags([
+        (result.article, tags_by_external_article_id[result.article_id_in_data])
+        for result in results
+        if result.was_created
+    ])
+    ImportFingerprint.objects.save_fingerprints(user, content_hashes, articles_data, results)
@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import json
+import os
+
+import pytest
+from django.apps import apps
+from django.core.management import CommandError, call_command
+
+from legadilo.feeds.tests.factories import FeedCategoryFactory
+from legadilo.import_export.services.bulk import run_for_users
+from legadilo.reading.models import Article
+from legadilo.reading.tests.factories import ArticleFactory
+
+
+def _read_manifest(path) -> list[dict]:
+    return json.loads(path.read_text(encoding="utf-8"))["users"]
+
+
+def _get_worker_state(user_id: int, directory: str) -> dict:
+    # Run in the worker processes: it must be importable from them.
+    return {"user_id": user_id, "pid": os.getpid(), "are_apps_ready": apps.ready}
+
+
+def test_run_for_users_with_several_workers():
+    results = run_for_users(_get_worker_state, [1, 2, 3], "some_dir", nb_workers=2)
+
+    assert [result["user_id"] for result in results] == [1, 2, 3]
+    assert all(result["are_apps_ready"] for result in results)
+    assert os.getpid() not in {result["pid"] for result in results}
+
+
+@pytest.mark.django_db
+class TestBulkExportAndImportDataCommands:
+    @pytest.fixture(autouse=True)
+    def _setup_data(self, user, other_user):
+        FeedCategoryFactory(user=user, title="Some category")
+        ArticleFactory(user=user, title="Article of user", url="https://example.com/article/1")
+        ArticleFactory(
+            user=other_user, title="Article of other user", url="https://example.com/article/2"
+        )
+
+    def test_export_then_import(self, user, other_user, tmp_path):
+        call_command("bulk_export_data", "--all-users", "--workers", "1", "-o", str(tmp_path))
+
+        export_manifest = _read_manifest(tmp_path / "manifest.json")
+        assert [(result["user_id"], result["status"]) for result in export_manifest] == [
+            (user.id, "success"),
+            (other_user.id, "success"),
+        ]
+        assert [result["nb_rows"] for result in export_manifest] == [2, 1]
+        assert (tmp_path / f"user_{user.id}.jsonl.gz").exists()
+        assert (tmp_path / f"user_{other_user.id}.jsonl.gz").exists()
+
+        Article.objects.all().delete()
+        call_command("bulk_import_data", "--all-users", "--workers", "1", "-i", str(tmp_path))
+
+        import_manifest = _read_manifest(tmp_path / "import_manifest.json")
+        assert [
+            (result["user_id"], result["status"], result["nb_imported_articles"])
+            for result in import_manifest
+        ] == [(user.id, "success", 1), (other_user.id, "success", 1)]
+        assert list(Article.objects.order_by("user_id").values_list("user_id", "title")) == [
+            (user.id, "Article of user"),
+            (other_user.id, "Article of other user"),
+        ]
+
+    def test_errors_are_isolated_per_user(self, user, tmp_path, mocker):
+        mocked_logger = mocker.patch("legadilo.import_export.services.bulk.logger")
+
+        with pytest.raises(CommandError, match="Failed to export the data of 1 users"):
+            call_command(
+                "bulk_export_data", "-u", str(user.id), "0", "--workers", "1", "-o", str(tmp_path)
+            )
+
+        manifest = _read_manifest(tmp_path / "manifest.json")
+        assert [(result["user_id"], result["status"]) for result in manifest] == [
+            (user.id, "success"),
+            (0, "failure"),
+        ]
+        assert manifest[1]["error"] == "User matching query does not exist."
+        mocked_logger.exception.assert_called_once()
+
+        with pytest.raises(CommandError, match="Failed to import the data of 1 users"):
+            call_command(
+                "bulk_import_data", "-u", str(user.id), "0", "--workers", "1", "-i", str(tmp_path)
+            )
+
+        manifest = _read_manifest(tmp_path / "import_manifest.json")
+        assert [(result["user_id"], result["status"]) for result in manifest] == [
+            (user.id, "success"),
+            (0, "failure"),
+        ]
+
+    def test_import_with_several_workers_on_sqlite(self, user, other_user, tmp_path, mocker):
+        call_command("bulk_export_data", "--all-users", "--workers", "1", "-o", str(tmp_path))
+        Article.objects.all().delete()
+        mocked_logger = mocker.patch(
+            "legadilo.import_export.management.commands.bulk_import_data.logger"
+        )
+
+        call_command("bulk_import_data", "--all-users", "--workers", "2", "-i", str(tmp_path))
+
+        import_manifest = _read_manifest(tmp_path / "import_manifest.json")
+        assert [(result["user_id"], result["status"]) for result in import_manifest] == [
+            (user.id, "success"),
+            (other_user.id, "success"),
+        ]
+        assert Article.objects.count() == 2
+        mocked_logger.warning.assert_called_once_with(
+            "SQLite can't import several users in parallel, using one worker"
+        )
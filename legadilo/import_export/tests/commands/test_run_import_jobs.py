@@ -0,0 +1,47 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pytest
+import time_machine
+from django.core.management import call_command
+
+from legadilo.core.utils.time_utils import utcdt
+from legadilo.import_export import constants
+from legadilo.import_export.models import ImportJob
+from legadilo.import_export.tests.factories import ImportJobFactory
+from legadilo.users.models import Notification
+
+
+@pytest.mark.django_db
+class TestRunImportJobsCommand:
+    def test_no_job(self):
+        call_command("run_import_jobs")
+
+        assert ImportJob.objects.count() == 0
+
+    def test_run_pending_jobs(self):
+        import_jobs = ImportJobFactory.create_batch(2)
+
+        call_command("run_import_jobs")
+
+        for import_job in import_jobs:
+            import_job.refresh_from_db()
+            assert import_job.status == constants.ImportJobStatus.SUCCESS
+        assert Notification.objects.count() == 2
+
+    def test_fail_stale_jobs_and_cleanup(self):
+        with time_machine.travel("2026-10-01 08:00:00", tick=False):
+            stale_job = ImportJobFactory(status=constants.ImportJobStatus.RUNNING)
+        ImportJobFactory(status=constants.ImportJobStatus.SUCCESS, finished_at=utcdt(2026, 8, 1))
+
+        with time_machine.travel("2026-10-01 12:00:00", tick=False):
+            call_command("run_import_jobs")
+
+        assert list(ImportJob.objects.all()) == [stale_job]
+        stale_job.refresh_from_db()
+        assert stale_job.status == constants.ImportJobStatus.FAILURE
+        assert stale_job.error_message == "The import took too long and was stopped."
+        assert list(Notification.objects.values_list("title", flat=True)) == [
+            "Import of your Wallabag file failed"
+        ]
@@ -0,0 +1,40 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from http import HTTPStatus
+
+import factory
+from django.core.management import call_command
+from django.urls import reverse
+from factory.django import DjangoModelFactory
+
+from legadilo.users.tests.factories import UserFactory
+
+from .. import constants
+from ..models import ImportJob
+
+
+class ImportJobFactory(DjangoModelFactory):
+    source_type = constants.ImportJobSourceType.WALLABAG
+    file = factory.django.FileField(filename="wallabag.json", data=b"[]")
+    file_name = "wallabag.json"
+
+    user = factory.SubFactory(UserFactory)
+
+    class Meta:
+        model = ImportJob
+
+
+def run_import_job_from_response(response) -> ImportJob:
+    """Run the import job created by the view that returned the response."""
+    import_job = ImportJob.objects.get()
+    assert response.status_code == HTTPStatus.FOUND  # noqa: S101 use of assert detected
+    assert response["Location"] == reverse(  # noqa: S101 use of assert detected
+        "import_export:import_job", kwargs={"import_job_id": import_job.id}
+    )
+
+    call_command("run_import_jobs")
+
+    import_job.refresh_from_db()
+    return import_job
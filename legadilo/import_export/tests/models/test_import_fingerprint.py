@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pytest
+
+from legadilo.reading.models.article import SaveArticleResult
+from legadilo.reading.tests.factories import ArticleDataFactory, ArticleFactory
+from legadilo.users.tests.factories import UserFactory
+
+from ...models import ImportFingerprint
+
+
+@pytest.mark.django_db
+class TestImportFingerprintManager:
+    def test_get_unchanged_external_ids(self, user, django_assert_num_queries):
+        article = ArticleFactory(user=user)
+        other_article = ArticleFactory(user=user)
+        ImportFingerprint.objects.create(
+            user=user, external_article_id="wallabag:1", content_hash="hash1", article=article
+        )
+        ImportFingerprint.objects.create(
+            user=user,
+            external_article_id="wallabag:2",
+            content_hash="hash2",
+            article=other_article,
+        )
+        ImportFingerprint.objects.create(
+            user=UserFactory(),
+            external_article_id="wallabag:3",
+            content_hash="hash3",
+            article=ArticleFactory(),
+        )
+
+        with django_assert_num_queries(1):
+            unchanged_external_ids = ImportFingerprint.objects.get_unchanged_external_ids(
+                user,
+                {
+                    "wallabag:1": "hash1",
+                    "wallabag:2": "updated",
+                    "wallabag:3": "hash3",
+                    "wallabag:4": "hash4",
+                },
+            )
+
+        assert unchanged_external_ids == {"wallabag:1"}
+
+    def test_get_unchanged_external_ids_without_hashes(self, user, django_assert_num_queries):
+        with django_assert_num_queries(0):
+            assert ImportFingerprint.objects.get_unchanged_external_ids(user, {}) == set()
+
+    def test_save_fingerprints(self, user, django_assert_num_queries):
+        article = ArticleFactory(user=user, url="https://example.com/article-1.html")
+        new_article = ArticleFactory(user=user, url="https://example.com/article-2.html")
+        ImportFingerprint.objects.create(
+            user=user, external_article_id="wallabag:1", content_hash="old", article=article
+        )
+
+        with django_assert_num_queries(1):
+            ImportFingerprint.objects.save_fingerprints(
+                user,
+                {"wallabag:1": "updated", "wallabag:2": "new", "wallabag:3": "same-url"},
+                [
+                    ArticleDataFactory(external_article_id="wallabag:1", url=article.url),
+                    ArticleDataFactory(external_article_id="wallabag:2", url=new_article.url),
+                    ArticleDataFactory(external_article_id="wallabag:3", url=new_article.url),
+                ],
+                # Articles are saved once per URL.
+                [
+                    SaveArticleResult(article=article, article_id_in_data="wallabag:1"),
+                    SaveArticleResult(article=new_article, article_id_in_data="wallabag:2"),
+                ],
+            )
+
+        assert set(
+            ImportFingerprint.objects.values_list(
+                "external_article_id", "content_hash", "article_id"
+            )
+        ) == {
+            ("wallabag:1", "updated", article.id),
+            ("wallabag:2", "new", new_article.id),
+            ("wallabag:3", "same-url", new_article.id),
+        }
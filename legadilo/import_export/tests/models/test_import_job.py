@@ -0,0 +1,127 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pytest
+import time_machine
+
+from legadilo.core.utils.time_utils import utcdt
+
+from ... import constants
+from ...models import ImportJob
+from ..factories import ImportJobFactory
+
+
+@pytest.mark.django_db
+class TestImportJobManager:
+    def test_claim_next(self):
+        with time_machine.travel("2026-10-01 10:00:00", tick=False):
+            ImportJobFactory(status=constants.ImportJobStatus.RUNNING)
+            oldest_pending_job = ImportJobFactory()
+        with time_machine.travel("2026-10-01 11:00:00", tick=False):
+            other_pending_job = ImportJobFactory()
+
+        with time_machine.travel("2026-10-01 12:00:00", tick=False):
+            claimed_job = ImportJob.objects.claim_next()
+
+        assert claimed_job == oldest_pending_job
+        assert claimed_job.status == constants.ImportJobStatus.RUNNING
+        assert claimed_job.started_at == utcdt(2026, 10, 1, 12)
+        assert ImportJob.objects.claim_next() == other_pending_job
+        assert ImportJob.objects.claim_next() is None
+
+    def test_update_progress(self):
+        import_job = ImportJobFactory(status=constants.ImportJobStatus.RUNNING)
+
+        ImportJob.objects.update_progress(import_job, 100)
+
+        import_job.refresh_from_db()
+        assert import_job.nb_processed_items == 100
+
+    def test_mark_as_success(self):
+        import_job = ImportJobFactory(status=constants.ImportJobStatus.RUNNING)
+        file_name = import_job.file.name
+        storage = import_job.file.storage
+
+        with time_machine.travel("2026-10-01 12:00:00", tick=False):
+            ImportJob.objects.mark_as_success(import_job, nb_imported_articles=10)
+
+        import_job.refresh_from_db()
+        assert import_job.status == constants.ImportJobStatus.SUCCESS
+        assert import_job.is_finished
+        assert import_job.finished_at == utcdt(2026, 10, 1, 12)
+        assert import_job.nb_imported_articles == 10
+        assert import_job.summary == "Successfully imported 10 articles"
+        assert not import_job.file
+        assert not storage.exists(file_name)
+
+    def test_mark_as_success_with_skipped_articles(self):
+        import_job = ImportJobFactory(
+            source_type=constants.ImportJobSourceType.CUSTOM_CSV,
+            status=constants.ImportJobStatus.RUNNING,
+        )
+
+        ImportJob.objects.mark_as_success(
+            import_job, nb_imported_articles=2, nb_imported_feeds=1, nb_skipped_articles=8
+        )
+
+        import_job.refresh_from_db()
+        assert import_job.nb_skipped_articles == 8
+        assert import_job.summary == (
+            "Successfully imported 1 feeds, 0 feed categories and 2 articles. "
+            "Skipped 8 unchanged articles."
+        )
+
+    def test_mark_as_failure(self):
+        import_job = ImportJobFactory(status=constants.ImportJobStatus.RUNNING)
+
+        ImportJob.objects.mark_as_failure(import_job, "Some error")
+
+        import_job.refresh_from_db()
+        assert import_job.status == constants.ImportJobStatus.FAILURE
+        assert import_job.is_finished
+        assert import_job.error_message == "Some error"
+        assert not import_job.file
+
+    def test_mark_as_success_already_finished(self):
+        import_job = ImportJobFactory(status=constants.ImportJobStatus.RUNNING)
+        ImportJob.objects.filter(id=import_job.id).update(
+            status=constants.ImportJobStatus.FAILURE, error_message="Stale"
+        )
+
+        is_marked_as_finished = ImportJob.objects.mark_as_success(
+            import_job, nb_imported_articles=10
+        )
+
+        assert not is_marked_as_finished
+        assert import_job.status == constants.ImportJobStatus.FAILURE
+        assert import_job.error_message == "Stale"
+        assert import_job.nb_imported_articles == 0
+
+    def test_only_stale(self):
+        with time_machine.travel("2026-10-01 08:00:00", tick=False):
+            stale_job = ImportJobFactory(status=constants.ImportJobStatus.RUNNING)
+            ImportJobFactory(status=constants.ImportJobStatus.PENDING)
+        with time_machine.travel("2026-10-01 10:00:00", tick=False):
+            ImportJobFactory(status=constants.ImportJobStatus.RUNNING)
+
+        with time_machine.travel("2026-10-01 12:00:00", tick=False):
+            stale_jobs = list(ImportJob.objects.get_queryset().only_stale())
+
+        assert stale_jobs == [stale_job]
+
+    def test_cleanup(self):
+        old_finished_job = ImportJobFactory(
+            status=constants.ImportJobStatus.SUCCESS, finished_at=utcdt(2026, 8, 1)
+        )
+        recent_finished_job = ImportJobFactory(
+            status=constants.ImportJobStatus.FAILURE, finished_at=utcdt(2026, 9, 30)
+        )
+        pending_job = ImportJobFactory()
+
+        with time_machine.travel("2026-10-01 12:00:00", tick=False):
+            deletion_result = ImportJob.objects.cleanup()
+
+        assert deletion_result == (1, {"import_export.ImportJob": 1})
+        assert set(ImportJob.objects.all()) == {recent_finished_job, pending_job}
+        assert not ImportJob.objects.filter(id=old_finished_job.id).exists()
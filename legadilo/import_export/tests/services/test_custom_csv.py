@@ -2,6 +2,8 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
+import csv
+
 import httpx
 import pytest
 import time_machine
@@ -11,6 +13,7 @@ from legadilo.core.utils.testing import all_model_fields_except, serialize_for_s
 from legadilo.feeds.models import Feed, FeedArticle, FeedCategory
 from legadilo.feeds.tests.factories import FeedCategoryFactory, FeedFactory
 from legadilo.feeds.tests.fixtures import get_feed_fixture_content
+from legadilo.import_export import constants
 from legadilo.import_export.services.custom_csv import import_custom_csv_file
 from legadilo.import_export.services.exceptions import DataImportError
 from legadilo.reading.models import Article, ArticlesGroup
@@ -26,13 +29,16 @@ def test_import_invalid_custom_csv(user):
 
 @pytest.mark.django_db
 def test_import_empty_file(user):
-    nb_imported_articles, nb_imported_feeds, nb_imported_categories = import_custom_csv_file(
-        user, settings.APPS_DIR / "import_export/tests/fixtures/custom_csv/empty_file.csv"
+    nb_imported_articles, nb_imported_feeds, nb_imported_categories, nb_skipped_articles = (
+        import_custom_csv_file(
+            user, settings.APPS_DIR / "import_export/tests/fixtures/custom_csv/empty_file.csv"
+        )
     )
 
     assert nb_imported_articles == 0
     assert nb_imported_feeds == 0
     assert nb_imported_categories == 0
+    assert nb_skipped_articles == 0
     assert Article.objects.count() == 0
     assert Feed.objects.count() == 0
     assert FeedCategory.objects.count() == 0
@@ -76,13 +82,16 @@ def test_import_custom_csv(user, httpx_mock, snapshot):
         url="https://example.com/rss8.xml",
     )
 
-    nb_imported_articles, nb_imported_feeds, nb_imported_categories = import_custom_csv_file(
-        user, settings.APPS_DIR / "import_export/tests/fixtures/custom_csv/custom_csv.csv"
+    nb_imported_articles, nb_imported_feeds, nb_imported_categories, nb_skipped_articles = (
+        import_custom_csv_file(
+            user, settings.APPS_DIR / "import_export/tests/fixtures/custom_csv/custom_csv.csv"
+        )
     )
 
     assert nb_imported_articles == 8
     assert nb_imported_feeds == 3
     assert nb_imported_categories == 2
+    assert nb_skipped_articles == 0
     assert Article.objects.count() == 10
     assert ArticlesGroup.objects.count() == 2
     assert articles_group.articles.all().count() == 1
@@ -102,7 +111,16 @@ def test_import_custom_csv(user, httpx_mock, snapshot):
                 Article.objects.order_by("id").values(
                     *all_model_fields_except(
                         Article,
-                        {"id", "user", "obj_created_at", "obj_updated_at", "main_feed", "group"},
+                        {
+                            "id",
+                            "user",
+                            "obj_created_at",
+                            "obj_updated_at",
+                            "main_feed",
+                            "group",
+                            "search_vector",
+                            "url_hash",
+                        },
                     )
                 )
             )
@@ -114,7 +132,8 @@ def test_import_custom_csv(user, httpx_mock, snapshot):
             list(
                 Feed.objects.order_by("id").values(
                     *all_model_fields_except(
-                        Feed, {"id", "user", "category", "created_at", "updated_at"}
+                        Feed,
+                        {"id", "user", "category", "created_at", "updated_at", "feed_url_hash"},
                     ),
                     "category__title",
                 )
@@ -134,3 +153,81 @@ def test_import_custom_csv(user, httpx_mock, snapshot):
         ),
         "feed_categories.json",
     )
+
+
+@pytest.mark.django_db
+def test_import_custom_csv_by_batches(user, httpx_mock, monkeypatch):
+    monkeypatch.setattr(constants, "CUSTOM_CSV_IMPORT_BATCH_SIZE", 2)
+    existing_feed = FeedFactory(user=user, feed_url="https://example.com/rss2.xml", title="Feed 2")
+    httpx_mock.add_response(url="https://example.com/rss2.xml", content="")
+    httpx_mock.add_response(url="https://example.com/rss4.xml", content="")
+    httpx_mock.add_exception(httpx.HTTPError("Failed to fetch"), url="https://example.com/rss8.xml")
+    httpx_mock.add_response(url="https://example.com/existing.xml", content="")
+    progress = []
+
+    nb_imported_articles, nb_imported_feeds, nb_imported_categories, nb_skipped_articles = (
+        import_custom_csv_file(
+            user,
+            settings.APPS_DIR / "import_export/tests/fixtures/custom_csv/custom_csv.csv",
+            progress_callback=progress.append,
+        )
+    )
+
+    assert nb_imported_articles == 8
+    assert progress == [0, 0, 0, 0, 2, 4, 6, 8]
+    assert nb_imported_feeds == 3
+    assert nb_imported_categories == 3
+    assert nb_skipped_articles == 0
+    assert Article.objects.count() == 8
+    assert list(existing_feed.articles.all()) == []
+    assert set(
+        FeedArticle.objects.values_list("feed__feed_url", "article__url", "feed_article_id")
+    ) == {
+        (
+            "https://example.com/rss4.xml",
+            "https://example.com/article/4",
+            "https://example.com/article/4",
+        ),
+        (
+            "https://example.com/existing.xml",
+            "https://example.com/article/existing",
+            "https://example.com/article/existing",
+        ),
+    }
+    assert set(Article.objects.filter(group__isnull=False).values_list("url", "group__title")) == {
+        ("https://example.com/article/10", "Existing group"),
+        ("https://example.com/article/11", "New group"),
+    }
+
+
+@pytest.mark.django_db
+def test_import_custom_csv_article_url_with_fragment(user, httpx_mock, tmp_path):
+    feed = FeedFactory(user=user, feed_url="https://example.com/feed.xml", title="Feed")
+    httpx_mock.add_response(url="https://example.com/feed.xml", content="")
+    file = tmp_path / "custom_csv.csv"
+    with file.open("w", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=constants.CSV_HEADER_FIELDS, restval="")
+        writer.writeheader()
+        writer.writerow({
+            "group_title": "Group",
+            "feed_title": "Feed",
+            "feed_url": "https://example.com/feed.xml",
+            "feed_site_url": "https://example.com/",
+            "article_id": "1",
+            "article_title": "Article",
+            "article_url": "https://example.com/article#comments",
+            "article_content_type": "text/html",
+            "article_is_favorite": "false",
+        })
+
+    nb_imported_articles, _nb_feeds, _nb_categories, _nb_skipped = import_custom_csv_file(
+        user, file
+    )
+
+    assert nb_imported_articles == 1
+    article = Article.objects.get()
+    assert article.url == "https://example.com/article"
+    assert article.group.title == "Group"
+    assert list(FeedArticle.objects.values_list("feed_id", "article_id", "feed_article_id")) == [
+        (feed.id, article.id, "https://example.com/article")
+    ]
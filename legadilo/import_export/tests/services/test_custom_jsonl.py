@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import gzip
+import json
+
+import pytest
+
+from legadilo.feeds.models import FeedCategory
+from legadilo.feeds.tests.factories import FeedCategoryFactory
+from legadilo.import_export import constants
+from legadilo.import_export.models import ImportFingerprint
+from legadilo.import_export.services.custom_jsonl import import_custom_jsonl_file
+from legadilo.import_export.services.exceptions import DataImportError
+from legadilo.import_export.services.export import export_articles_jsonl
+from legadilo.reading.models import Article
+from legadilo.reading.tests.factories import ArticleFactory, TagFactory
+from legadilo.users.tests.factories import UserFactory
+
+
+def test_import_invalid_gzip(user, tmp_path):
+    file_path = tmp_path / "articles.jsonl.gz"
+    file_path.write_bytes(b"not gzip")
+
+    with pytest.raises(DataImportError):
+        import_custom_jsonl_file(user, file_path)
+
+
+def test_import_invalid_line(user, tmp_path):
+    file_path = tmp_path / "articles.jsonl.gz"
+    file_path.write_bytes(gzip.compress(b"[]\n"))
+
+    with pytest.raises(DataImportError):
+        import_custom_jsonl_file(user, file_path)
+
+
+@pytest.mark.django_db
+def test_export_then_import(user, tmp_path):
+    FeedCategoryFactory(user=user, title="Some category")
+    article = ArticleFactory(user=user, title="Some article", url="https://example.com/article/1")
+    article.tags.add(TagFactory(user=user, title="Some tag"))
+    file_path = tmp_path / "articles.jsonl.gz"
+    file_path.write_bytes(b"".join(export_articles_jsonl(user)))
+    rows = [json.loads(line) for line in gzip.decompress(file_path.read_bytes()).splitlines()]
+    other_user = UserFactory()
+    progress = []
+
+    nb_imported_articles, nb_imported_feeds, nb_imported_categories, nb_skipped_articles = (
+        import_custom_jsonl_file(other_user, file_path, progress_callback=progress.append)
+    )
+
+    assert len(rows) == 2
+    assert all(list(row) == list(constants.CSV_HEADER_FIELDS) for row in rows)
+    assert nb_imported_articles == 1
+    assert nb_imported_feeds == 0
+    assert nb_imported_categories == 1
+    assert nb_skipped_articles == 0
+    assert progress == [1]
+    assert FeedCategory.objects.get(user=other_user).title == "Some category"
+    imported_article = Article.objects.get(user=other_user)
+    assert imported_article.title == "Some article"
+    assert imported_article.url == "https://example.com/article/1"
+    assert imported_article.external_tags == ["Some tag"]
+
+
+@pytest.mark.django_db
+def test_import_same_file_again_skips_unchanged_articles(user, tmp_path):
+    ArticleFactory(user=user, title="Article 1", url="https://example.com/article/1")
+    ArticleFactory(user=user, title="Article 2", url="https://example.com/article/2")
+    file_path = tmp_path / "articles.jsonl.gz"
+    file_path.write_bytes(b"".join(export_articles_jsonl(user)))
+    other_user = UserFactory()
+    import_custom_jsonl_file(other_user, file_path)
+
+    nb_imported_articles, _, _, nb_skipped_articles = import_custom_jsonl_file(
+        other_user, file_path
+    )
+
+    assert nb_imported_articles == 0
+    assert nb_skipped_articles == 2
+    assert Article.objects.filter(user=other_user).count() == 2
+    assert set(
+        ImportFingerprint.objects.filter(user=other_user).values_list("article__url", flat=True)
+    ) == {"https://example.com/article/1", "https://example.com/article/2"}
@@ -0,0 +1,105 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import json
+
+import pytest
+from django.core.files.base import ContentFile
+
+from legadilo.import_export import constants
+from legadilo.import_export.models import ImportJob
+from legadilo.import_export.services.import_jobs import run_import_job
+from legadilo.import_export.tests.factories import ImportJobFactory
+from legadilo.reading.models import Article
+from legadilo.users.models import Notification
+
+
+@pytest.mark.django_db
+class TestRunImportJob:
+    def test_import_by_batches(self, user, monkeypatch):
+        monkeypatch.setattr(constants, "WALLABAG_IMPORT_BATCH_SIZE", 1)
+        import_job = ImportJobFactory(
+            user=user,
+            status=constants.ImportJobStatus.RUNNING,
+            file=ContentFile(
+                json.dumps([
+                    {
+                        "is_archived": 0,
+                        "is_starred": 0,
+                        "tags": [],
+                        "id": article_id,
+                        "title": f"Article {article_id}",
+                        "url": f"https://www.example.com/articles/{article_id}.html",
+                        "content": "<p>Some content</p>",
+                        "domain_name": "www.example.com",
+                    }
+                    for article_id in (1, 2)
+                ]).encode(),
+                name="wallabag.json",
+            ),
+        )
+
+        run_import_job(import_job)
+
+        import_job.refresh_from_db()
+        assert import_job.status == constants.ImportJobStatus.SUCCESS
+        assert import_job.nb_processed_items == 2
+        assert import_job.nb_imported_articles == 2
+        assert Article.objects.count() == 2
+        assert list(Notification.objects.values_list("user", "title", "content")) == [
+            (user.id, "Import of your Wallabag file succeeded", "Successfully imported 2 articles")
+        ]
+
+    def test_invalid_file(self, user):
+        import_job = ImportJobFactory(
+            user=user,
+            source_type=constants.ImportJobSourceType.OPML,
+            status=constants.ImportJobStatus.RUNNING,
+            file=ContentFile(b"stuff", name="feeds.opml"),
+        )
+
+        run_import_job(import_job)
+
+        import_job.refresh_from_db()
+        assert import_job.status == constants.ImportJobStatus.FAILURE
+        assert import_job.error_message == "The file you supplied is not valid."
+        assert list(Notification.objects.values_list("title", "content")) == [
+            ("Import of your OPML file failed", "The file you supplied is not valid.")
+        ]
+
+    def test_unexpected_error(self, user, mocker):
+        mocker.patch(
+            "legadilo.import_export.services.import_jobs.import_wallabag_file",
+            side_effect=RuntimeError("Unexpected"),
+        )
+        mocked_logger = mocker.patch("legadilo.import_export.services.import_jobs.logger")
+        import_job = ImportJobFactory(user=user, status=constants.ImportJobStatus.RUNNING)
+
+        run_import_job(import_job)
+
+        import_job.refresh_from_db()
+        assert import_job.status == constants.ImportJobStatus.FAILURE
+        assert import_job.error_message == "An unexpected error occurred while importing the file."
+        mocked_logger.exception.assert_called_once()
+        assert Notification.objects.count() == 1
+
+    def test_job_marked_as_failed_while_running(self, user, mocker):
+        import_job = ImportJobFactory(user=user, status=constants.ImportJobStatus.RUNNING)
+
+        def mark_as_stale(*args, **kwargs):
+            ImportJob.objects.filter(id=import_job.id).update(
+                status=constants.ImportJobStatus.FAILURE
+            )
+            return 0, 0
+
+        mocker.patch(
+            "legadilo.import_export.services.import_jobs.import_wallabag_file",
+            side_effect=mark_as_stale,
+        )
+
+        run_import_job(import_job)
+
+        import_job.refresh_from_db()
+        assert import_job.status == constants.ImportJobStatus.FAILURE
+        assert Notification.objects.count() == 0
@@ -4,16 +4,59 @@
 
 import httpx
 import pytest
+from defusedxml import EntitiesForbidden
 from django.conf import settings
 
 from legadilo.feeds.models import Feed, FeedArticle, FeedCategory
 from legadilo.feeds.services.feed_parsing import FeedFileTooBigError
 from legadilo.feeds.tests.factories import FeedCategoryFactory, FeedFactory
 from legadilo.feeds.tests.fixtures import get_feed_fixture_content
-from legadilo.import_export.services.opml import import_opml_file_sync
+from legadilo.import_export import constants
+from legadilo.import_export.services.opml import (
+    OpmlFeed,
+    import_opml_file,
+    import_opml_file_sync,
+    iter_opml_outlines,
+)
 from legadilo.reading.models import Article
 
 
+def test_iter_opml_outlines():
+    outlines = list(
+        iter_opml_outlines(settings.APPS_DIR / "import_export/tests/fixtures/opml/valid.opml")
+    )
+
+    assert outlines == [
+        ("Category 1", None),
+        (
+            "Category 1",
+            OpmlFeed(
+                feed_url="https://www.example.com/feeds/all.rss.xml",
+                site_url="https://www.example.com/",
+            ),
+        ),
+        (
+            None,
+            OpmlFeed(
+                feed_url="https://www.example.eu/feeds/all.atom.xml", site_url="//www.example.eu/"
+            ),
+        ),
+    ]
+
+
+def test_iter_opml_outlines_forbids_entities(tmp_path):
+    file_path = tmp_path / "feeds.opml"
+    file_path.write_text(
+        """<?xml version="1.0" encoding="utf-8"?>
+<!DOCTYPE opml [<!ENTITY title "Category">]>
+<opml version="1.0"><body><outline text="&title;"/></body></opml>
+"""
+    )
+
+    with pytest.raises(EntitiesForbidden):
+        list(iter_opml_outlines(file_path))
+
+
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     "file_name",
@@ -124,3 +167,50 @@ def test_import_valid_files_with_network_errors(user, httpx_mock):
     ]
     assert Article.objects.count() == 0
     assert FeedArticle.objects.count() == 0
+
+
+def test_import_by_batches(user, tmp_path, httpx_mock, monkeypatch):
+    monkeypatch.setattr(constants, "OPML_IMPORT_BATCH_SIZE", 2)
+    httpx_mock.add_response(
+        url="https://www.example.com/feeds/all.rss.xml",
+        content=get_feed_fixture_content("sample_rss.xml"),
+    )
+    httpx_mock.add_response(
+        url="https://www.example.eu/feeds/all.atom.xml",
+        content=get_feed_fixture_content("sample_atom.xml"),
+    )
+    file_path = tmp_path / "feeds.opml"
+    file_path.write_text(
+        """<?xml version="1.0" encoding="utf-8"?>
+<opml version="1.0">
+  <body>
+    <outline text="Category 1">
+      <outline text="Blog" xmlUrl="https://www.example.com/feeds/all.rss.xml" htmlUrl="https://www.example.com/"/>
+      <outline text="Other blog" xmlUrl="https://www.example.eu/feeds/all.atom.xml" htmlUrl="https://www.example.eu/"/>
+      <outline text="Nested category">
+        <outline text="Nested blog" xmlUrl="https://www.example.org/feeds/all.rss.xml" htmlUrl="https://www.example.org/"/>
+      </outline>
+    </outline>
+    <outline text="Empty category"/>
+  </body>
+</opml>
+"""
+    )
+
+    progress = []
+
+    nb_imported_feeds, nb_imported_categories = import_opml_file(
+        user, file_path, progress_callback=progress.append
+    )
+
+    assert nb_imported_feeds == 2
+    assert nb_imported_categories == 2
+    assert progress == [1, 2]
+    assert sorted(FeedCategory.objects.values_list("title", flat=True)) == [
+        "Category 1",
+        "Empty category",
+    ]
+    assert sorted(Feed.objects.values_list("feed_url", "category__title")) == [
+        ("https://www.example.com/feeds/all.rss.xml", "Category 1"),
+        ("https://www.example.eu/feeds/all.atom.xml", "Category 1"),
+    ]
@@ -2,25 +2,142 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
+import json
+
 import pytest
 from pydantic import ValidationError as PydanticValidationError
 
-from legadilo.import_export.services.wallabag import _import_wallabag_data
+from legadilo.import_export import constants
+from legadilo.import_export.models import ImportFingerprint
+from legadilo.import_export.services.wallabag import (
+    _import_wallabag_data,
+    import_wallabag_json_file_path,
+)
 from legadilo.reading import constants as reading_constants
-from legadilo.reading.models import Article
+from legadilo.reading.models import Article, Tag
 from legadilo.reading.tests.factories import ArticleFactory, TagFactory
 
 
+def _build_wallabag_article(id_: int, tags: list[str]) -> dict:
+    return {
+        "is_archived": 0,
+        "is_starred": 0,
+        "tags": tags,
+        "id": id_,
+        "title": f"Article {id_}",
+        "url": f"https://www.example.com/articles/{id_}.html",
+        "content": "<p>Some content</p>",
+        "domain_name": "www.example.com",
+    }
+
+
 def test_import_invalid_data(user):
     with pytest.raises(PydanticValidationError):
         _import_wallabag_data(user, [{"key": "value"}])
 
 
+def test_import_invalid_data_after_first_batch(user, monkeypatch):
+    monkeypatch.setattr(constants, "WALLABAG_IMPORT_BATCH_SIZE", 1)
+
+    with pytest.raises(PydanticValidationError):
+        _import_wallabag_data(user, [_build_wallabag_article(1, []), {"key": "value"}])
+
+    # Each batch is saved in its own transaction.
+    assert list(Article.objects.values_list("external_article_id", flat=True)) == ["wallabag:1"]
+
+
+def test_import_file_by_batches(user, tmp_path, monkeypatch, django_assert_num_queries):
+    monkeypatch.setattr(constants, "WALLABAG_IMPORT_BATCH_SIZE", 2)
+    TagFactory(user=user, title="Existing", slug="existing")
+    path_to_file = tmp_path / "wallabag.json"
+    path_to_file.write_text(
+        json.dumps([
+            _build_wallabag_article(1, ["Existing", "New tag", "new TAG"]),
+            _build_wallabag_article(2, ["New tag"]),
+            _build_wallabag_article(3, ["Other tag"]),
+        ])
+    )
+    progress = []
+
+    with django_assert_num_queries(26):
+        nb_imported_articles, nb_skipped_articles = import_wallabag_json_file_path(
+            user, str(path_to_file), progress_callback=progress.append
+        )
+
+    assert nb_imported_articles == 3
+    assert nb_skipped_articles == 0
+    assert progress == [2, 3]
+    assert set(Tag.objects.values_list("slug", flat=True)) == {"existing", "new-tag", "other-tag"}
+    assert {
+        article.external_article_id: sorted(tag.slug for tag in article.tags.all())
+        for article in Article.objects.prefetch_related("tags")
+    } == {
+        "wallabag:1": ["existing", "new-tag"],
+        "wallabag:2": ["new-tag"],
+        "wallabag:3": ["other-tag"],
+    }
+
+
+def test_import_same_file_again_skips_unchanged_articles(user, tmp_path, django_assert_num_queries):
+    path_to_file = tmp_path / "wallabag.json"
+    path_to_file.write_text(
+        json.dumps([_build_wallabag_article(1, ["Tag"]), _build_wallabag_article(2, [])])
+    )
+    import_wallabag_json_file_path(user, str(path_to_file))
+    updated_article = {
+        **_build_wallabag_article(2, []),
+        "content": "<p>Updated content</p>",
+        "updated_at": "2030-01-01T00:00:00+00:00",
+    }
+    path_to_file.write_text(json.dumps([_build_wallabag_article(1, ["Tag"]), updated_article]))
+
+    with django_assert_num_queries(10):
+        nb_imported_articles, nb_skipped_articles = import_wallabag_json_file_path(
+            user, str(path_to_file)
+        )
+
+    assert nb_imported_articles == 1
+    assert nb_skipped_articles == 1
+    assert Article.objects.get(external_article_id="wallabag:2").content == "<p>Updated content</p>"
+    assert ImportFingerprint.objects.count() == 2
+
+    with django_assert_num_queries(1):
+        nb_imported_articles, nb_skipped_articles = import_wallabag_json_file_path(
+            user, str(path_to_file)
+        )
+
+    assert nb_imported_articles == 0
+    assert nb_skipped_articles == 2
+
+
+def test_import_same_file_again_skips_articles_sharing_a_url(user, tmp_path):
+    path_to_file = tmp_path / "wallabag.json"
+    path_to_file.write_text(
+        json.dumps([
+            _build_wallabag_article(1, []),
+            {**_build_wallabag_article(2, []), "url": "https://www.example.com/articles/1.html"},
+        ])
+    )
+    import_wallabag_json_file_path(user, str(path_to_file))
+
+    nb_imported_articles, nb_skipped_articles = import_wallabag_json_file_path(
+        user, str(path_to_file)
+    )
+
+    assert Article.objects.count() == 1
+    assert set(ImportFingerprint.objects.values_list("external_article_id", flat=True)) == {
+        "wallabag:1",
+        "wallabag:2",
+    }
+    assert nb_imported_articles == 0
+    assert nb_skipped_articles == 2
+
+
 def test_import_valid_data(user):
     TagFactory(user=user, title="existing", slug="existing")
     existing_article = ArticleFactory(user=user, title="Existing title", content="Existing content")
 
-    nb_imported_articles = _import_wallabag_data(
+    nb_imported_articles, nb_skipped_articles = _import_wallabag_data(
         user,
         [
             {
@@ -89,6 +206,7 @@ def test_import_valid_data(user):
     )
 
     assert nb_imported_articles == 3
+    assert nb_skipped_articles == 0
     assert Article.objects.count() == 3
     article = Article.objects.exclude(id=existing_article.id).first()
     assert article is not None
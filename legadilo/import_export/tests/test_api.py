@@ -2,6 +2,8 @@
 #
 #  SPDX-License-Identifier: AGPL-3.0-or-later
 
+import gzip
+import json
 from http import HTTPStatus
 
 import pytest
@@ -12,6 +14,7 @@ from legadilo.core.utils.testing import read_streamable_response, serialize_for_
 from legadilo.core.utils.time_utils import utcdt
 from legadilo.feeds.models import FeedArticle
 from legadilo.feeds.tests.factories import FeedCategoryFactory, FeedFactory
+from legadilo.import_export import constants
 from legadilo.reading.tests.factories import ArticleFactory
 
 
@@ -115,3 +118,95 @@ class TestExportArticlesApi:
         response = logged_in_sync_client.get(self.url, data={"updated_since": utcdt(2025, 6, 1)})
 
         snapshot.assert_match(read_streamable_response(response), "articles.csv")
+
+    def test_export_as_jsonl(self, logged_in_sync_client):
+        response = logged_in_sync_client.get(
+            self.url, data={"format": "jsonl", "include_feeds": False}
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers["Content-Type"] == "application/gzip"
+        rows = [
+            json.loads(line)
+            for line in gzip.decompress(b"".join(response.streaming_content)).splitlines()
+        ]
+        assert [row["article_title"] for row in rows] == [
+            "Some article",
+            "Recently updated article",
+        ]
+
+
+@pytest.mark.django_db
+class TestExportArticlesChangesApi:
+    @pytest.fixture(autouse=True)
+    def _setup_data(self, user):
+        self.url = reverse("api-1.0.0:export_articles_changes")
+        with time_machine.travel("2024-06-20 22:00:00", tick=False):
+            self.article = ArticleFactory(
+                user=user, title="Some article", url="https://example.com/article/1"
+            )
+            self.deleted_article = ArticleFactory(
+                user=user, title="Deleted article", url="https://example.com/article/2"
+            )
+
+    def test_not_logged_in(self, client):
+        response = client.get(self.url)
+
+        assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+    def test_invalid_cursor(self, logged_in_sync_client):
+        response = logged_in_sync_client.get(self.url, data={"cursor": "invalid"})
+
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert response.json() == {"detail": "Invalid cursor"}
+
+    def test_export_changes(self, logged_in_sync_client, user):
+        response = logged_in_sync_client.get(self.url)
+
+        assert response.status_code == HTTPStatus.OK
+        data = response.json()
+        assert [row["article_title"] for row in data["articles"]] == [
+            "Some article",
+            "Deleted article",
+        ]
+        assert data["deleted_articles"] == []
+        assert not data["has_more"]
+
+        with time_machine.travel("2024-06-21 22:00:00", tick=False):
+            deleted_article_id = self.deleted_article.id
+            self.deleted_article.delete()
+            ArticleFactory(user=user, title="New article", url="https://example.com/article/3")
+
+        response = logged_in_sync_client.get(self.url, data={"cursor": data["next_cursor"]})
+
+        assert response.status_code == HTTPStatus.OK
+        data = response.json()
+        assert [row["article_title"] for row in data["articles"]] == ["New article"]
+        assert data["deleted_articles"] == [
+            {
+                "article_id": deleted_article_id,
+                "url": "https://example.com/article/2",
+                "deleted_at": "2024-06-21T22:00:00Z",
+            }
+        ]
+        assert not data["has_more"]
+
+        response = logged_in_sync_client.get(self.url, data={"cursor": data["next_cursor"]})
+
+        assert response.json()["articles"] == []
+        assert response.json()["deleted_articles"] == []
+
+    def test_export_by_pages(self, logged_in_sync_client, mocker):
+        mocker.patch.object(constants, "EXPORT_CHANGES_PAGE_SIZE", 1)
+
+        response = logged_in_sync_client.get(self.url)
+
+        data = response.json()
+        assert [row["article_title"] for row in data["articles"]] == ["Some article"]
+        assert data["has_more"]
+
+        response = logged_in_sync_client.get(self.url, data={"cursor": data["next_cursor"]})
+
+        data = response.json()
+        assert [row["article_title"] for row in data["articles"]] == ["Deleted article"]
+        assert data["has_more"]
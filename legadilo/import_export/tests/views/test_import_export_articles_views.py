@@ -2,6 +2,8 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
+import gzip
+import json
 from http import HTTPStatus
 from io import BytesIO
 from pathlib import Path
@@ -23,8 +25,11 @@ from legadilo.core.utils.time_utils import utcdt
 from legadilo.feeds.models import Feed
 from legadilo.feeds.tests.factories import FeedCategoryFactory, FeedFactory
 from legadilo.feeds.tests.fixtures import get_feed_fixture_content
+from legadilo.import_export import constants
+from legadilo.import_export.tests.factories import run_import_job_from_response
 from legadilo.reading.models import Article
 from legadilo.reading.tests.factories import ArticleFactory, CommentFactory
+from legadilo.users.models import Notification
 
 
 class TestExportArticlesView:
@@ -63,6 +68,21 @@ class TestExportArticlesView:
         assert response.headers["Content-Type"] == "text/csv"
         snapshot.assert_match(read_streamable_response(response), "export_all.csv")
 
+    def test_export_jsonl(self, logged_in_sync_client, user):
+        FeedCategoryFactory(user=user, title="Some category")
+        ArticleFactory(user=user, title="Some article")
+
+        response = logged_in_sync_client.get(self.url, data={"format": "jsonl"})
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers["Content-Type"] == "application/gzip"
+        rows = [
+            json.loads(line)
+            for line in gzip.decompress(b"".join(response.streaming_content)).splitlines()
+        ]
+        assert [row["category_title"] for row in rows] == ["Some category", ""]
+        assert [row["article_title"] for row in rows] == ["", "Some article"]
+
 
 class TestImportExportArticlesView:
     @pytest.fixture(autouse=True)
@@ -118,18 +138,13 @@ class TestImportCustomCSV:
                 },
             )
 
-        assert response.status_code == HTTPStatus.BAD_REQUEST
-        assert response.template_name == "import_export/import_export_articles.html"
-        assert response.context_data["import_custom_csv_form"].errors == {}
+        import_job = run_import_job_from_response(response)
+
+        assert import_job.source_type == constants.ImportJobSourceType.CUSTOM_CSV
+        assert import_job.status == constants.ImportJobStatus.FAILURE
+        assert import_job.error_message == "The file you supplied is not valid."
         assert Feed.objects.count() == 0
         assert Article.objects.count() == 0
-        messages = list(get_messages(response.wsgi_request))
-        assert messages == [
-            Message(
-                level=DEFAULT_LEVELS["ERROR"],
-                message="The file you supplied is not valid.",
-            )
-        ]
 
     def test_import_in_memory_file(self, logged_in_sync_client, httpx_mock):
         httpx_mock.add_response(
@@ -163,18 +178,16 @@ class TestImportCustomCSV:
                 },
             )
 
-        assert response.status_code == HTTPStatus.OK
-        assert response.template_name == "import_export/import_export_articles.html"
-        assert response.context_data["import_custom_csv_form"].errors == {}
+        import_job = run_import_job_from_response(response)
+
+        assert import_job.status == constants.ImportJobStatus.SUCCESS
+        assert import_job.nb_processed_items == 8
+        assert import_job.summary == (
+            "Successfully imported 4 feeds, 3 feed categories and 8 articles."
+        )
+        assert not import_job.file
         assert Feed.objects.count() > 0
         assert Article.objects.count() > 0
-        messages = list(get_messages(response.wsgi_request))
-        assert messages == [
-            Message(
-                level=DEFAULT_LEVELS["SUCCESS"],
-                message="Successfully imported 4 feeds, 3 feed categories and 8 articles.",
-            )
-        ]
 
     def test_import_temporary_file(self, logged_in_sync_client, httpx_mock, settings):
         settings.FILE_UPLOAD_MAX_MEMORY_SIZE = 0
@@ -206,18 +219,62 @@ class TestImportCustomCSV:
                 },
             )
 
-        assert response.status_code == HTTPStatus.OK
-        assert response.template_name == "import_export/import_export_articles.html"
-        assert response.context_data["import_custom_csv_form"].errors == {}
+        import_job = run_import_job_from_response(response)
+
+        assert import_job.status == constants.ImportJobStatus.SUCCESS
+        assert import_job.nb_processed_items == 8
+        assert import_job.summary == (
+            "Successfully imported 4 feeds, 3 feed categories and 8 articles."
+        )
+        assert not import_job.file
         assert Feed.objects.count() > 0
         assert Article.objects.count() > 0
-        messages = list(get_messages(response.wsgi_request))
-        assert messages == [
-            Message(
-                level=DEFAULT_LEVELS["SUCCESS"],
-                message="Successfully imported 4 feeds, 3 feed categories and 8 articles.",
-            )
-        ]
+
+
+class TestImportCustomJsonl:
+    @pytest.fixture(autouse=True)
+    def _setup_data(self):
+        self.url = reverse("import_export:import_export_articles")
+
+    def test_import_invalid_file(self, logged_in_sync_client):
+        buffer = BytesIO(b"not gzip")
+        with InMemoryUploadedFile(
+            buffer, "jsonl_file", "articles.jsonl.gz", "application/gzip", size=8, charset=None
+        ) as file:
+            response = logged_in_sync_client.post(self.url, {"jsonl_file": file})
+
+        import_job = run_import_job_from_response(response)
+
+        assert import_job.source_type == constants.ImportJobSourceType.CUSTOM_JSONL
+        assert import_job.status == constants.ImportJobStatus.FAILURE
+        assert import_job.error_message == "The file you supplied is not valid."
+
+    def test_import_valid_file(self, logged_in_sync_client):
+        row = dict.fromkeys(constants.CSV_HEADER_FIELDS, "")
+        row |= {
+            "article_id": "1",
+            "article_title": "Some article",
+            "article_url": "https://example.com/article/1",
+            "article_content_type": "text/html",
+        }
+        buffer = BytesIO(gzip.compress(json.dumps(row).encode("utf-8") + b"\n"))
+        with InMemoryUploadedFile(
+            buffer,
+            "jsonl_file",
+            "articles.jsonl.gz",
+            "application/gzip",
+            size=buffer.getbuffer().nbytes,
+            charset=None,
+        ) as file:
+            response = logged_in_sync_client.post(self.url, {"jsonl_file": file})
+
+        import_job = run_import_job_from_response(response)
+
+        assert import_job.status == constants.ImportJobStatus.SUCCESS
+        assert import_job.summary == (
+            "Successfully imported 0 feeds, 0 feed categories and 1 articles."
+        )
+        assert Article.objects.get().title == "Some article"
 
 
 class TestImportWallabag:
@@ -242,18 +299,13 @@ class TestImportWallabag:
                 },
             )
 
-        assert response.status_code == HTTPStatus.BAD_REQUEST
-        assert response.template_name == "import_export/import_export_articles.html"
-        assert response.context_data["import_wallabag_form"].errors == {}
+        import_job = run_import_job_from_response(response)
+
+        assert import_job.source_type == constants.ImportJobSourceType.WALLABAG
+        assert import_job.status == constants.ImportJobStatus.FAILURE
+        assert import_job.error_message == "The file you supplied is not valid."
         assert Feed.objects.count() == 0
         assert Article.objects.count() == 0
-        messages = list(get_messages(response.wsgi_request))
-        assert messages == [
-            Message(
-                level=DEFAULT_LEVELS["ERROR"],
-                message="The file you supplied is not valid.",
-            )
-        ]
 
     def test_import_invalid_file(self, logged_in_sync_client):
         with (
@@ -276,18 +328,13 @@ class TestImportWallabag:
                 },
             )
 
-        assert response.status_code == HTTPStatus.BAD_REQUEST
-        assert response.template_name == "import_export/import_export_articles.html"
-        assert response.context_data["import_wallabag_form"].errors == {}
+        import_job = run_import_job_from_response(response)
+
+        assert import_job.source_type == constants.ImportJobSourceType.WALLABAG
+        assert import_job.status == constants.ImportJobStatus.FAILURE
+        assert import_job.error_message == "The file you supplied is not valid."
         assert Feed.objects.count() == 0
         assert Article.objects.count() == 0
-        messages = list(get_messages(response.wsgi_request))
-        assert messages == [
-            Message(
-                level=DEFAULT_LEVELS["ERROR"],
-                message="The file you supplied is not valid.",
-            )
-        ]
 
     def test_import_valid_file(self, logged_in_sync_client, snapshot):
         with (
@@ -310,24 +357,33 @@ class TestImportWallabag:
                 },
             )
 
-        assert response.status_code == HTTPStatus.OK
-        assert response.template_name == "import_export/import_export_articles.html"
-        assert response.context_data["import_wallabag_form"].errors == {}
-        assert Feed.objects.count() == 0
-        assert Article.objects.count() > 0
-        messages = list(get_messages(response.wsgi_request))
-        assert messages == [
-            Message(
-                level=DEFAULT_LEVELS["SUCCESS"],
-                message="Successfully imported 1 articles",
+        import_job = run_import_job_from_response(response)
+
+        assert import_job.status == constants.ImportJobStatus.SUCCESS
+        assert import_job.summary == "Successfully imported 1 articles"
+        assert list(Notification.objects.values_list("title", "content", "info_link")) == [
+            (
+                "Import of your Wallabag file succeeded",
+                "Successfully imported 1 articles",
+                f"/import-export/jobs/{import_job.id}/",
             )
         ]
+        assert Feed.objects.count() == 0
+        assert Article.objects.count() > 0
         snapshot.assert_match(
             serialize_for_snapshot(
                 list(
                     Article.objects.order_by("url").values(
                         *all_model_fields_except(
-                            Article, {"id", "user", "obj_created_at", "obj_updated_at"}
+                            Article,
+                            {
+                                "id",
+                                "user",
+                                "obj_created_at",
+                                "obj_updated_at",
+                                "search_vector",
+                                "url_hash",
+                            },
                         )
                     )
                 )
@@ -8,8 +8,6 @@ from pathlib import Path
 import pytest
 import time_machine
 from django.conf import settings
-from django.contrib.messages import DEFAULT_LEVELS, get_messages
-from django.contrib.messages.storage.base import Message
 from django.core.files.uploadedfile import InMemoryUploadedFile, TemporaryUploadedFile
 from django.urls import reverse
 
@@ -17,6 +15,8 @@ from legadilo.conftest import assert_redirected_to_login_page
 from legadilo.feeds.models import Feed, FeedCategory
 from legadilo.feeds.tests.factories import FeedCategoryFactory, FeedFactory
 from legadilo.feeds.tests.fixtures import get_feed_fixture_content
+from legadilo.import_export import constants
+from legadilo.import_export.tests.factories import run_import_job_from_response
 
 
 @pytest.mark.django_db
@@ -132,17 +132,12 @@ class TestImportFeeds:
                 },
             )
 
-        assert response.status_code == HTTPStatus.BAD_REQUEST
-        assert response.template_name == "import_export/import_feeds.html"
-        assert response.context_data["form"].errors == {}
+        import_job = run_import_job_from_response(response)
+
+        assert import_job.source_type == constants.ImportJobSourceType.OPML
+        assert import_job.status == constants.ImportJobStatus.FAILURE
+        assert import_job.error_message == "The file you supplied is not valid."
         assert Feed.objects.count() == 0
-        messages = list(get_messages(response.wsgi_request))
-        assert messages == [
-            Message(
-                level=DEFAULT_LEVELS["ERROR"],
-                message="The file you supplied is not valid.",
-            )
-        ]
 
     def test_import_in_memory_file(self, logged_in_sync_client, httpx_mock):
         httpx_mock.add_response(
@@ -174,17 +169,12 @@ class TestImportFeeds:
                 },
             )
 
-        assert response.status_code == HTTPStatus.OK
-        assert response.template_name == "import_export/import_feeds.html"
+        import_job = run_import_job_from_response(response)
+
+        assert import_job.status == constants.ImportJobStatus.SUCCESS
+        assert import_job.summary == "Successfully imported 2 feeds into 1 categories."
         assert Feed.objects.count() > 0
         assert FeedCategory.objects.count() > 0
-        messages = list(get_messages(response.wsgi_request))
-        assert messages == [
-            Message(
-                level=DEFAULT_LEVELS["SUCCESS"],
-                message="Successfully imported 2 feeds into 1 categories.",
-            )
-        ]
 
     def test_import_temporary_file(self, logged_in_sync_client, httpx_mock, settings):
         settings.FILE_UPLOAD_MAX_MEMORY_SIZE = 0
@@ -214,14 +204,9 @@ class TestImportFeeds:
                 },
             )
 
-        assert response.status_code == HTTPStatus.OK
-        assert response.template_name == "import_export/import_feeds.html"
+        import_job = run_import_job_from_response(response)
+
+        assert import_job.status == constants.ImportJobStatus.SUCCESS
+        assert import_job.summary == "Successfully imported 2 feeds into 1 categories."
         assert Feed.objects.count() > 0
         assert FeedCategory.objects.count() > 0
-        messages = list(get_messages(response.wsgi_request))
-        assert messages == [
-            Message(
-                level=DEFAULT_LEVELS["SUCCESS"],
-                message="Successfully imported 2 feeds into 1 categories.",
-            )
-        ]
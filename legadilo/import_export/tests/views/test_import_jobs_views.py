@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from http import HTTPStatus
+
+import pytest
+from django.urls import reverse
+
+from legadilo.conftest import assert_redirected_to_login_page
+from legadilo.import_export import constants
+from legadilo.import_export.tests.factories import ImportJobFactory
+
+
+@pytest.mark.django_db
+class TestImportJobView:
+    @pytest.fixture(autouse=True)
+    def _setup_data(self, user):
+        self.import_job = ImportJobFactory(user=user, file_name="my_export.json")
+        self.url = reverse("import_export:import_job", kwargs={"import_job_id": self.import_job.id})
+
+    def test_not_logged_in(self, client):
+        response = client.get(self.url)
+
+        assert_redirected_to_login_page(response)
+
+    def test_view_job_of_other_user(self, logged_in_other_user_sync_client):
+        response = logged_in_other_user_sync_client.get(self.url)
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    def test_pending_job(self, logged_in_sync_client):
+        response = logged_in_sync_client.get(self.url)
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.template_name == "import_export/import_job.html"
+        content = response.content.decode()
+        assert "Import of my_export.json" in content
+        assert "The import will start soon." in content
+        assert f'hx-get="{self.url}"' in content
+
+    def test_poll_running_job(self, logged_in_sync_client):
+        self.import_job.status = constants.ImportJobStatus.RUNNING
+        self.import_job.nb_processed_items = 200
+        self.import_job.save()
+
+        response = logged_in_sync_client.get(self.url, HTTP_HX_REQUEST="true")
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.template_name == "import_export/import_job.html#import-job-status"
+        content = response.content.decode()
+        assert "200 items processed so far." in content
+        assert f'hx-get="{self.url}"' in content
+
+    def test_poll_finished_job(self, logged_in_sync_client):
+        self.import_job.status = constants.ImportJobStatus.SUCCESS
+        self.import_job.nb_imported_articles = 12
+        self.import_job.save()
+
+        response = logged_in_sync_client.get(self.url, HTTP_HX_REQUEST="true")
+
+        assert response.status_code == HTTPStatus.OK
+        content = response.content.decode()
+        assert "Successfully imported 12 articles" in content
+        # The status is not polled anymore.
+        assert "hx-get" not in content
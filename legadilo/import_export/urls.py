@@ -15,4 +15,5 @@ urlpatterns: list[URLPattern] = [
         "articles/import_export/", views.import_export_articles_view, name="import_export_articles"
     ),
     path("articles/export/", views.export_articles_view, name="export_articles"),
+    path("jobs/<int:import_job_id>/", views.import_job_view, name="import_job"),
 ]
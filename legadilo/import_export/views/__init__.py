@@ -4,10 +4,12 @@
 
 from .import_export_articles_views import export_articles_view, import_export_articles_view
 from .import_export_feeds_views import export_feeds_view, import_feeds_view
+from .import_jobs_views import import_job_view
 
 __all__ = [
     "export_articles_view",
     "export_feeds_view",
     "import_export_articles_view",
     "import_feeds_view",
+    "import_job_view",
 ]
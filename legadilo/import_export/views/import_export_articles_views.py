@@ -3,26 +3,21 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
 from http import HTTPStatus
-from json import JSONDecodeError
 
 from django import forms
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import ValidationError
-from django.http import StreamingHttpResponse
+from django.http import HttpResponseRedirect, StreamingHttpResponse
 from django.template.response import TemplateResponse
 from django.utils.translation import gettext_lazy as _
 from django.views.decorators.http import require_GET, require_http_methods
-from pydantic import ValidationError as PydanticValidationError
 
-from legadilo.core.utils.file import ensure_file_on_disk
-from legadilo.import_export.services.exceptions import DataImportError
 from legadilo.users.user_types import AuthenticatedHttpRequest
 
 from .. import constants
-from ..services.custom_csv import import_custom_csv_file
-from ..services.export import export_articles
-from ..services.wallabag import import_wallabag_file
+from ..services.export import export_articles, export_articles_jsonl
+from .import_jobs_views import start_import_job
 
 
 class ImportCustomCsvForm(forms.Form):
@@ -33,6 +28,14 @@ class ImportCustomCsvForm(forms.Form):
     )
 
 
+class ImportCustomJsonlForm(forms.Form):
+    jsonl_file = forms.FileField(
+        label=_("Compressed JSON Lines file"),
+        required=True,
+        widget=forms.ClearableFileInput(attrs={"accept": ".gz"}),
+    )
+
+
 class ImportWallabagForm(forms.Form):
     wallabag_file = forms.FileField(
         label=_("Wallabag export file"),
@@ -51,16 +54,39 @@ class ImportWallabagForm(forms.Form):
 
 @require_http_methods(["GET", "POST"])
 @login_required
-def import_export_articles_view(request: AuthenticatedHttpRequest) -> TemplateResponse:
+def import_export_articles_view(
+    request: AuthenticatedHttpRequest,
+) -> TemplateResponse | HttpResponseRedirect:
     import_custom_csv_form = ImportCustomCsvForm()
+    import_custom_jsonl_form = ImportCustomJsonlForm()
     import_wallabag_form = ImportWallabagForm()
     status = HTTPStatus.OK
 
     if request.method == "POST":
         if "csv_file" in request.FILES:
-            status, import_custom_csv_form = _import_custom_csv(request)
+            import_custom_csv_form = ImportCustomCsvForm(request.POST, request.FILES)
+            if import_custom_csv_form.is_valid():
+                return start_import_job(
+                    request,
+                    constants.ImportJobSourceType.CUSTOM_CSV,
+                    import_custom_csv_form.cleaned_data["csv_file"],
+                )
+        elif "jsonl_file" in request.FILES:
+            import_custom_jsonl_form = ImportCustomJsonlForm(request.POST, request.FILES)
+            if import_custom_jsonl_form.is_valid():
+                return start_import_job(
+                    request,
+                    constants.ImportJobSourceType.CUSTOM_JSONL,
+                    import_custom_jsonl_form.cleaned_data["jsonl_file"],
+                )
         elif "wallabag_file" in request.FILES:
-            status, import_wallabag_form = _import_wallabag(request)
+            import_wallabag_form = ImportWallabagForm(request.POST, request.FILES)
+            if import_wallabag_form.is_valid():
+                return start_import_job(
+                    request,
+                    constants.ImportJobSourceType.WALLABAG,
+                    import_wallabag_form.cleaned_data["wallabag_file"],
+                )
         else:
             status = HTTPStatus.BAD_REQUEST
             messages.error(request, _("This file type is not supported for imports."))
@@ -70,71 +96,23 @@ def import_export_articles_view(request: AuthenticatedHttpRequest) -> TemplateRe
         "import_export/import_export_articles.html",
         {
             "import_custom_csv_form": import_custom_csv_form,
+            "import_custom_jsonl_form": import_custom_jsonl_form,
             "import_wallabag_form": import_wallabag_form,
         },
         status=status,
     )
 
 
-def _import_custom_csv(request: AuthenticatedHttpRequest):
-    import_custom_csv_form = ImportCustomCsvForm(request.POST, request.FILES)
-    status = HTTPStatus.OK
-    if not import_custom_csv_form.is_valid():
-        return status, import_custom_csv_form
-
-    try:
-        with ensure_file_on_disk(import_custom_csv_form.cleaned_data["csv_file"]) as file_path:
-            (
-                nb_imported_articles,
-                nb_imported_feeds,
-                nb_imported_categories,
-            ) = import_custom_csv_file(request.user, file_path)
-    except DataImportError, UnicodeDecodeError, PydanticValidationError:
-        status = HTTPStatus.BAD_REQUEST
-        messages.error(request, _("The file you supplied is not valid."))
-    else:
-        # Reset form
-        import_custom_csv_form = ImportCustomCsvForm()
-        messages.success(
-            request,
-            _(
-                "Successfully imported %(nb_imported_feeds)s feeds, %(nb_imported_categories)s "
-                "feed categories and %(nb_imported_articles)s articles."
-            )
-            % {
-                "nb_imported_feeds": nb_imported_feeds,
-                "nb_imported_categories": nb_imported_categories,
-                "nb_imported_articles": nb_imported_articles,
-            },
-        )
-
-    return status, import_custom_csv_form
-
-
-def _import_wallabag(request: AuthenticatedHttpRequest):
-    import_wallabag_form = ImportWallabagForm(request.POST, request.FILES)
-    status = HTTPStatus.OK
-    if not import_wallabag_form.is_valid():
-        return status, import_wallabag_form
-
-    try:
-        nb_imported_articles = import_wallabag_file(
-            request.user, import_wallabag_form.cleaned_data["wallabag_file"]
-        )
-    except JSONDecodeError, UnicodeDecodeError, PydanticValidationError:
-        status = HTTPStatus.BAD_REQUEST
-        messages.error(request, _("The file you supplied is not valid."))
-    else:
-        # Reset form
-        import_wallabag_form = ImportWallabagForm()
-        messages.success(request, _("Successfully imported %s articles") % nb_imported_articles)
-
-    return status, import_wallabag_form
-
-
 @require_GET
 @login_required
 def export_articles_view(request: AuthenticatedHttpRequest) -> StreamingHttpResponse:
+    if request.GET.get("format") == "jsonl":
+        return StreamingHttpResponse(
+            export_articles_jsonl(request.user),
+            content_type="application/gzip",
+            headers={"Content-Disposition": 'attachment; filename="articles.jsonl.gz"'},
+        )
+
     return StreamingHttpResponse(
         export_articles(request.user),
         content_type="text/csv",
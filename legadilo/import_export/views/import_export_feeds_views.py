@@ -2,22 +2,19 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
-from http import HTTPStatus
-
-from defusedxml.ElementTree import ParseError as XmlParseError
 from django import forms
-from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import ValidationError
+from django.http import HttpResponseRedirect
 from django.template.response import TemplateResponse
 from django.utils.translation import gettext_lazy as _
 from django.views.decorators.http import require_GET, require_http_methods
 
-from legadilo.import_export.services.opml import import_opml_file
 from legadilo.users.user_types import AuthenticatedHttpRequest
 
 from .. import constants
 from ..services.export import build_feeds_export_context
+from .import_jobs_views import start_import_job
 
 
 @require_GET
@@ -49,35 +46,14 @@ class ImportFeedsForm(forms.Form):
 
 @require_http_methods(["GET", "POST"])
 @login_required
-def import_feeds_view(request: AuthenticatedHttpRequest) -> TemplateResponse:
+def import_feeds_view(request: AuthenticatedHttpRequest) -> TemplateResponse | HttpResponseRedirect:
     form = ImportFeedsForm()
-    status = HTTPStatus.OK
 
     if request.method == "POST":
         form = ImportFeedsForm(request.POST, files=request.FILES)
         if form.is_valid():
-            try:
-                nb_imported_feeds, nb_imported_categories = import_opml_file(
-                    request.user, form.cleaned_data["opml_file"]
-                )
-            except XmlParseError:
-                status = HTTPStatus.BAD_REQUEST
-                messages.error(request, _("The file you supplied is not valid."))
-            else:
-                # Reset form
-                form = ImportFeedsForm()
-                messages.success(
-                    request,
-                    _(
-                        "Successfully imported %(nb_imported_feeds)s feeds into "
-                        "%(nb_imported_categories)s categories."
-                    )
-                    % {
-                        "nb_imported_feeds": nb_imported_feeds,
-                        "nb_imported_categories": nb_imported_categories,
-                    },
-                )
+            return start_import_job(
+                request, constants.ImportJobSourceType.OPML, form.cleaned_data["opml_file"]
+            )
 
-    return TemplateResponse(
-        request, "import_export/import_feeds.html", {"form": form}, status=status
-    )
+    return TemplateResponse(request, "import_export/import_feeds.html", {"form": form})
@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from django.contrib.auth.decorators import login_required
+from django.core.files import File
+from django.http import HttpResponseRedirect
+from django.shortcuts import get_object_or_404
+from django.template.response import TemplateResponse
+from django.urls import reverse
+from django.views.decorators.http import require_GET
+
+from legadilo.users.user_types import AuthenticatedHttpRequest
+
+from .. import constants
+from ..models import ImportJob
+
+
+def start_import_job(
+    request: AuthenticatedHttpRequest, source_type: constants.ImportJobSourceType, file: File
+) -> HttpResponseRedirect:
+    """Store the uploaded file for the import workers and redirect to the status of the import."""
+    import_job = ImportJob.objects.create_from_file(request.user, source_type, file)
+    return HttpResponseRedirect(
+        reverse("import_export:import_job", kwargs={"import_job_id": import_job.id})
+    )
+
+
+@require_GET
+@login_required
+def import_job_view(request: AuthenticatedHttpRequest, import_job_id: int) -> TemplateResponse:
+    import_job = get_object_or_404(
+        ImportJob.objects.get_queryset().for_user(request.user), id=import_job_id
+    )
+    # The status is polled while the job is not finished: only render the status then.
+    template_name = (
+        "import_export/import_job.html#import-job-status"
+        if request.htmx
+        else "import_export/import_job.html"
+    )
+
+    return TemplateResponse(
+        request,
+        template_name,
+        {
+            "import_job": import_job,
+            "polling_interval": constants.IMPORT_JOB_STATUS_POLLING_INTERVAL,
+        },
+    )
@@ -8,12 +8,15 @@ from django.db.models import JSONField
 from legadilo.core.forms.widgets import PrettyJSONWidget
 from legadilo.reading.models import (
     Article,
+    ArticleExternalTag,
     ArticleFetchError,
     ArticlesGroup,
     ArticleTag,
     Comment,
+    DeletedArticle,
     ReadingList,
     ReadingListTag,
+    SavedSearch,
     Tag,
 )
 from legadilo.reading.models.tag import SubTagMapping
@@ -69,6 +72,11 @@ class ArticleAdmin(admin.ModelAdmin):
     readonly_fields = ("obj_created_at", "obj_updated_at")
     formfield_overrides = {JSONField: {"widget": PrettyJSONWidget}}
 
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        if "external_tags" in form.changed_data:
+            ArticleExternalTag.objects.update_for_articles([obj])
+
 
 @admin.register(Comment)
 class CommentAdmin(admin.ModelAdmin):
@@ -92,6 +100,14 @@ class ArticleFetchErrorAdmin(admin.ModelAdmin):
     formfield_overrides = {JSONField: {"widget": PrettyJSONWidget}}
 
 
+@admin.register(DeletedArticle)
+class DeletedArticleAdmin(admin.ModelAdmin):
+    search_fields = ["url"]
+    autocomplete_fields = ["user"]
+    list_display = ["__str__", "deleted_at"]
+    readonly_fields = ("deleted_at",)
+
+
 class ArticlesOfGroupInline(admin.TabularInline):
     model = Article
 
@@ -110,6 +126,15 @@ class ArticlesOfGroupInline(admin.TabularInline):
         return super().get_queryset(request).order_by("group_order")
 
 
+@admin.register(SavedSearch)
+class SavedSearchAdmin(admin.ModelAdmin):
+    search_fields = ["title"]
+    autocomplete_fields = ["user"]
+    list_display = ["__str__", "computed_at", "refreshed_at"]
+    readonly_fields = ("article_ids", "computed_at", "refreshed_at")
+    formfield_overrides = {JSONField: {"widget": PrettyJSONWidget}}
+
+
 @admin.register(ArticlesGroup)
 class ArticlesGroupAdmin(admin.ModelAdmin):
     search_fields = ["title"]
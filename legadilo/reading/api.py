@@ -85,7 +85,14 @@ class OutArticleSchema(ModelSchema):
 
     class Meta:
         model = Article
-        exclude = ("user", "obj_created_at", "obj_updated_at")
+        exclude = (
+            "user",
+            "obj_created_at",
+            "obj_updated_at",
+            "search_config",
+            "search_vector",
+            "url_hash",
+        )
 
 
 class ArticleCreation(Schema):
@@ -262,6 +269,7 @@ def update_article_view(
         update_article_group(article, group.slug if group else None)
 
     update_model_from_schema(article, payload, excluded_fields=excluded_fields)
+    Article.objects.get_queryset().filter(id=article_id).mark_as_updated()
 
     return Article.objects.get_queryset().for_api().get(id=article_id)
 
@@ -49,6 +49,13 @@ class ReadingListTagOperator(TextChoices):
     ANY = "ANY", _("Any")
 
 
+class TagFilteringStrategy(TextChoices):
+    # Count the tags of each article. Requires a JOIN with the tags and a GROUP BY.
+    COUNT = "COUNT", _("Count")
+    # Use EXISTS subqueries. No JOIN nor GROUP BY.
+    EXISTS = "EXISTS", _("Exists")
+
+
 class ReadingListOrderDirection(TextChoices):
     ASC = "ASC", _("Ascendant")
     DESC = "DESC", _("Descendant")
@@ -96,7 +103,6 @@ class ArticleSearchOrderBy(TextChoices):
 
 MAX_ARTICLE_FILE_SIZE = 5 * 1024 * 1024  # 5MiB in bytes.
 MAX_OBJECTS_PER_PAGE = 100
-MAX_ARTICLES_PER_PAGE_WITH_READ_ON_SCROLL = 5 * MAX_OBJECTS_PER_PAGE
 PAGINATION_ORPHANS_PERCENTAGE = 0.1  # 10%
 ARTICLE_TITLE_MAX_LENGTH = 300
 ARTICLES_GROUP_TITLE_MAX_LENGTH = 300
@@ -104,6 +110,63 @@ ARTICLE_SOURCE_TITLE_MAX_LENGTH = 300
 MAX_SUMMARY_LENGTH = 255  # In words
 EXTRA_TAGS_TO_REMOVE_FROM_SUMMARY = frozenset({"img", "pre"})
 KEEP_ARTICLE_FETCH_ERROR_FOR = 60  # In days
+KEEP_DELETED_ARTICLES_FOR = 90  # In days
 LANGUAGE_CODE_MAX_LENGTH = 5
 EXTERNAL_ARTICLE_ID_MAX_LENGTH = 512
 MAX_EXPORT_ARTICLES_PER_PAGE = 100
+# Text search configurations used on PostgreSQL.
+DEFAULT_SEARCH_CONFIG = "english"
+SEARCH_CONFIGS_BY_LANGUAGE = {
+    "ar": "arabic",
+    "da": "danish",
+    "de": "german",
+    "el": "greek",
+    "en": "english",
+    "es": "spanish",
+    "fi": "finnish",
+    "fr": "french",
+    "ga": "irish",
+    "hu": "hungarian",
+    "id": "indonesian",
+    "it": "italian",
+    "lt": "lithuanian",
+    "nb": "norwegian",
+    "ne": "nepali",
+    "nl": "dutch",
+    "nn": "norwegian",
+    "no": "norwegian",
+    "pt": "portuguese",
+    "ro": "romanian",
+    "ru": "russian",
+    "sv": "swedish",
+    "ta": "tamil",
+    "tr": "turkish",
+}
+SEARCH_CONFIG_MAX_LENGTH = 30
+# Counters of reading lists with a max age depend on the current time: keep this short.
+UNREAD_COUNTERS_CACHE_TIMEOUT = 5 * 60  # In seconds
+MAX_ARTICLES_AUTOCOMPLETE_CHOICES = 10
+ARTICLES_AUTOCOMPLETE_MIN_QUERY_LENGTH = 2
+# Autocomplete choices are not invalidated when articles change: keep this short.
+ARTICLES_AUTOCOMPLETE_CACHE_TIMEOUT = 60  # In seconds
+MAX_SEARCH_FACET_CHOICES = 10
+# Tags and feeds facets are computed on the most relevant matches only: their ids are sent back in
+# the queries.
+MAX_SEARCH_FACET_ARTICLES = 5_000
+# Facets are not invalidated when articles change: keep this short.
+SEARCH_FACETS_CACHE_TIMEOUT = 60  # In seconds
+SAVED_SEARCH_TITLE_MAX_LENGTH = 300
+SAVED_SEARCH_MAX_ARTICLES = 10_000
+# Some changes don't mark articles as updated: snapshots this old are computed again.
+SAVED_SEARCH_MAX_SNAPSHOT_AGE = 24 * 60 * 60  # In seconds
+# Saved searches are refreshed when they are displayed: avoid a write on each page load.
+SAVED_SEARCH_MIN_REFRESH_INTERVAL = 60  # In seconds
+# Matched terms are wrapped with these markers by the database. They are replaced by mark tags
+# once the snippet is escaped.
+SEARCH_SNIPPET_START_MARKER = "\x02"
+SEARCH_SNIPPET_STOP_MARKER = "\x03"
+SEARCH_SNIPPET_ELLIPSIS = "…"
+# FTS5 doesn't allow snippets of more than 64 tokens.
+SEARCH_SNIPPET_MAX_WORDS = 35
+SEARCH_SNIPPET_MAX_FRAGMENTS = 2
+QUERY_TELEMETRY_STATS_CACHE_TIMEOUT = 7 * 24 * 60 * 60  # In seconds
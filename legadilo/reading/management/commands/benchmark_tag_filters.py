@@ -0,0 +1,149 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import random
+import time
+from uuid import uuid4
+
+from django.core.management import BaseCommand, CommandParser
+from django.db import connection, transaction
+
+from legadilo.core import constants as core_constants
+from legadilo.core.utils.time_utils import utcnow
+from legadilo.core.utils.urls import hash_url
+from legadilo.reading import constants
+from legadilo.reading.models import Article, ArticleTag, Tag
+from legadilo.reading.models.article import ArticlesTagsSearch
+from legadilo.users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the plans and timings of the strategies used to filter articles by tags on "
+        "generated data. All generated data are rolled back at the end."
+    )
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument(
+            "--nb-articles",
+            dest="nb_articles",
+            type=int,
+            default=100_000,
+            help="Number of articles to generate for the benchmark user.",
+        )
+        parser.add_argument(
+            "--nb-tags",
+            dest="nb_tags",
+            type=int,
+            default=20,
+            help="Number of tags to generate for the benchmark user.",
+        )
+        parser.add_argument(
+            "--nb-runs",
+            dest="nb_runs",
+            type=int,
+            default=5,
+            help="Number of times each query is run. The best timing is displayed.",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"Running benchmark on {connection.vendor}")
+        with transaction.atomic():
+            user, tags = self._create_data(options["nb_articles"], options["nb_tags"])
+            for name, tags_search_kwargs in self._build_scenarios(tags):
+                for strategy in constants.TagFilteringStrategy:
+                    self._run_scenario(
+                        user,
+                        f"{name} ({strategy})",
+                        ArticlesTagsSearch(**tags_search_kwargs, strategy=strategy),
+                        options["nb_runs"],
+                    )
+
+            transaction.set_rollback(True)
+
+    def _create_data(self, nb_articles: int, nb_tags: int) -> tuple[User, list[Tag]]:
+        rng = random.Random(42)  # noqa: S311 not used for cryptography
+        user = User.objects.create_user(email=f"benchmark-{uuid4()}@example.com")
+        tags = Tag.objects.bulk_create([
+            Tag(user=user, title=f"Tag {index}", slug=f"tag-{index}") for index in range(nb_tags)
+        ])
+        now = utcnow()
+        for start in range(0, nb_articles, core_constants.PER_PAGE_FOR_BULK_OPERATIONS):
+            articles = Article.objects.bulk_create([
+                Article(
+                    user=user,
+                    title=f"Article {index}",
+                    slug=f"article-{index}",
+                    url=f"https://example.com/articles/{index}.html",
+                    url_hash=hash_url(f"https://example.com/articles/{index}.html"),
+                    read_at=now if rng.random() < 0.5 else None,  # noqa: PLR2004 magic value
+                    published_at=now,
+                )
+                for index in range(
+                    start, min(start + core_constants.PER_PAGE_FOR_BULK_OPERATIONS, nb_articles)
+                )
+            ])
+            ArticleTag.objects.bulk_create([
+                ArticleTag(article=article, tag=tag)
+                for article in articles
+                for tag in rng.sample(tags, rng.randint(0, min(3, len(tags))))
+            ])
+
+        self.stdout.write(f"Created {nb_articles} articles and {nb_tags} tags")
+        return user, tags
+
+    def _build_scenarios(self, tags: list[Tag]) -> list[tuple[str, dict]]:
+        tag_ids_to_include = frozenset(tag.id for tag in tags[:2])
+        tag_ids_to_exclude = frozenset(tag.id for tag in tags[2:4])
+        return [
+            (
+                "Include all",
+                {
+                    "tag_ids_to_include": tag_ids_to_include,
+                    "include_tag_operator": constants.ReadingListTagOperator.ALL,
+                },
+            ),
+            (
+                "Include any",
+                {
+                    "tag_ids_to_include": tag_ids_to_include,
+                    "include_tag_operator": constants.ReadingListTagOperator.ANY,
+                },
+            ),
+            (
+                "Include any, exclude any",
+                {
+                    "tag_ids_to_include": tag_ids_to_include,
+                    "include_tag_operator": constants.ReadingListTagOperator.ANY,
+                    "tag_ids_to_exclude": tag_ids_to_exclude,
+                    "exclude_tag_operator": constants.ReadingListTagOperator.ANY,
+                },
+            ),
+        ]
+
+    def _run_scenario(self, user: User, name: str, tags_search: ArticlesTagsSearch, nb_runs: int):
+        qs = (
+            Article.objects
+            .get_queryset()
+            .for_user(user)
+            .only_unread()
+            .filter_by_tag_ids(tags_search)
+            .default_order_by()
+        )
+        page_qs = qs[: constants.MAX_OBJECTS_PER_PAGE]
+        self.stdout.write(self.style.MIGRATE_HEADING(name))
+        self.stdout.write(page_qs.explain())
+        self.stdout.write(
+            f"First page: {self._time(lambda: list(page_qs.values_list('id', flat=True)), nb_runs)}"
+            f" ms, count: {self._time(qs.count, nb_runs)} ms"
+        )
+
+    def _time(self, func, nb_runs: int) -> str:
+        timings = []
+        for _ in range(nb_runs):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+
+        return f"{min(timings) * 1000:.1f}"
@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import logging
+from itertools import batched
+
+from django.core.management import BaseCommand, CommandError, CommandParser
+
+from legadilo.core import constants as core_constants
+from legadilo.reading.models import Article, ReadingList
+from legadilo.reading.services.unread_counters import (
+    get_all_cached_unread_counters,
+    set_cached_unread_counters,
+)
+from legadilo.users.models import User
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Check that the cached unread counters of reading lists match the values computed from "
+        "the database."
+    )
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            default=False,
+            help="Replace inconsistent cached counters with the values computed from the database.",
+        )
+
+    def handle(self, *args, **options):
+        nb_checked_users = 0
+        inconsistent_user_ids = []
+        all_user_ids = User.objects.order_by("id").values_list("id", flat=True)
+        for user_ids in batched(
+            all_user_ids, core_constants.PER_PAGE_FOR_BULK_OPERATIONS, strict=False
+        ):
+            cached_counters = get_all_cached_unread_counters(user_ids)
+            for user in User.objects.filter(id__in=cached_counters.keys()):
+                nb_checked_users += 1
+                reading_lists = ReadingList.objects.get_all_for_user(user)
+                counters = Article.objects.count_unread_articles_of_reading_lists(
+                    user, reading_lists
+                )
+                if counters == cached_counters[user.id]:
+                    continue
+
+                logger.warning(
+                    "Inconsistent unread counters for user %s: cached %s, expected %s",
+                    user.id,
+                    cached_counters[user.id],
+                    counters,
+                )
+                inconsistent_user_ids.append(user.id)
+                if options["fix"]:
+                    set_cached_unread_counters(user.id, counters)
+
+        logger.info(
+            "Checked unread counters of %s users, %s were inconsistent.",
+            nb_checked_users,
+            len(inconsistent_user_ids),
+        )
+        if inconsistent_user_ids and not options["fix"]:
+            raise CommandError(
+                f"Found inconsistent unread counters for users {inconsistent_user_ids}"
+            )
@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from django.core.management import BaseCommand, CommandParser
+
+from legadilo.reading.services.query_telemetry import get_stats, reset_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Display the stats recorded for the queries used to search and list articles when "
+        "telemetry is enabled, the slowest first."
+    )
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            default=False,
+            help="Delete the recorded stats once displayed.",
+        )
+
+    def handle(self, *args, **options):
+        all_stats = sorted(
+            get_stats().values(),
+            key=lambda stats: stats["total_duration"] / stats["nb_calls"],
+            reverse=True,
+        )
+        if not all_stats:
+            self.stdout.write("No stats recorded.")
+
+        for stats in all_stats:
+            self.stdout.write(
+                f"{stats['name']} ({stats['shape']}): {stats['nb_calls']} calls, "
+                f"{stats['nb_slow_calls']} slow, "
+                f"avg {stats['total_duration'] / stats['nb_calls'] * 1000:.1f}ms, "
+                f"max {stats['max_duration'] * 1000:.1f}ms, "
+                f"avg {stats['nb_rows'] / stats['nb_calls']:.1f} rows"
+            )
+
+        if options["reset"]:
+            reset_stats()
@@ -0,0 +1,49 @@
+# Generated by Django 6.0.4 on 2026-10-18 23:39
+
+import django.db.models.functions.comparison
+from django.conf import settings
+from django.db import connection, migrations, models
+
+from legadilo.core.utils.db import disable_statement_timeout
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("feeds", "0003_fill_missing_slugs"),
+        ("reading", "0005_fill_missing_slugs"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    if connection.vendor == "postgresql":
+        sort_date_index = models.Index(
+            models.F("user"),
+            models.F("is_read"),
+            models.OrderBy(models.F("sort_date"), descending=True, nulls_last=True),
+            models.OrderBy(models.F("id"), descending=True),
+            name="reading_article_sort_date_idx",
+        )
+    else:
+        sort_date_index = models.Index(
+            fields=["user", "is_read", "-sort_date", "-id"], name="reading_article_sort_date_idx"
+        )
+
+    operations = [
+        *disable_statement_timeout(),
+        migrations.AddField(
+            model_name="article",
+            name="sort_date",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.functions.comparison.Coalesce(
+                    "updated_at", "published_at"
+                ),
+                help_text="Date used to sort articles: the last update or the publication date.",
+                null=True,
+                output_field=models.DateTimeField(blank=True, null=True),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=sort_date_index,
+        ),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 6.0.4 on 2026-10-18 23:54
+
+import django.db.models.deletion
+from django.db import connection, migrations, models
+
+import legadilo.core.utils.db
+from legadilo.reading.migrations._sqlite_full_text_search import (
+    CREATE_TRIGGERS_SQL,
+    DROP_TRIGGERS_SQL,
+)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("reading", "0006_article_sort_date"),
+    ]
+
+    operations = [
+        *legadilo.core.utils.db.disable_statement_timeout(),
+        migrations.CreateModel(
+            name="ArticleFullTextSearch",
+            fields=[
+                (
+                    "article",
+                    models.OneToOneField(
+                        db_column="rowid",
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        primary_key=True,
+                        related_name="full_text_search",
+                        serialize=False,
+                        to="reading.article",
+                    ),
+                ),
+                (
+                    "document",
+                    legadilo.core.utils.db.FullTextSearchField(db_column="reading_article_fts"),
+                ),
+            ],
+            options={
+                "db_table": "reading_article_fts",
+                "managed": False,
+            },
+        ),
+    ]
+
+    if connection.vendor == "sqlite":
+        operations.append(
+            migrations.RunSQL(
+                sql=[
+                    """CREATE VIRTUAL TABLE reading_article_fts USING fts5(
+                        title, summary, content, authors, main_source_title,
+                        content='reading_article',
+                        content_rowid='id',
+                        tokenize='porter unicode61 remove_diacritics 2'
+                    )""",
+                    *CREATE_TRIGGERS_SQL,
+                    "INSERT INTO reading_article_fts(reading_article_fts) VALUES ('rebuild')",
+                ],
+                reverse_sql=[
+                    *DROP_TRIGGERS_SQL,
+                    "DROP TABLE reading_article_fts",
+                ],
+            )
+        )
@@ -0,0 +1,96 @@
+# Generated by Django 6.0.4 on 2026-10-19 00:02
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import connection, migrations, models
+
+from legadilo.core.utils.db import disable_statement_timeout
+from legadilo.reading import constants
+from legadilo.reading.migrations._sqlite_full_text_search import keep_full_text_search_triggers
+
+
+def fill_search_configs(apps, schema_editor):
+    if not settings.ARTICLE_SEARCH_CONFIG_FROM_LANGUAGE:
+        return
+
+    Article = apps.get_model("reading", "Article")
+    for language_prefix, search_config in constants.SEARCH_CONFIGS_BY_LANGUAGE.items():
+        Article.objects.filter(
+            models.Q(language__iexact=language_prefix)
+            | models.Q(language__istartswith=f"{language_prefix}-")
+            | models.Q(language__istartswith=f"{language_prefix}_")
+        ).update(search_config=search_config)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("reading", "0007_article_full_text_search"),
+    ]
+
+    operations = [
+        *disable_statement_timeout(),
+        *keep_full_text_search_triggers(
+            migrations.AddField(
+                model_name="article",
+                name="search_config",
+                field=models.CharField(
+                    default="english",
+                    help_text="The text search configuration used to index this article on PostgreSQL.",
+                    max_length=30,
+                ),
+            ),
+            migrations.AddField(
+                model_name="article",
+                name="search_vector",
+                field=django.contrib.postgres.search.SearchVectorField(
+                    blank=True,
+                    editable=False,
+                    help_text="Weighted lexemes of the article used for full text search. Maintained by a trigger on PostgreSQL and always empty on SQLite.",
+                    null=True,
+                ),
+            ),
+        ),
+        migrations.RunPython(fill_search_configs, reverse_code=migrations.RunPython.noop),
+    ]
+
+    if connection.vendor == "postgresql":
+        operations.extend([
+            # Drop the expression index first: it would be needlessly updated by the backfill.
+            migrations.RemoveIndex(
+                model_name="article",
+                name="reading_article_search_vector",
+            ),
+            # A generated column cannot be used: casting search_config to regconfig is not
+            # immutable.
+            migrations.RunSQL(
+                sql=[
+                    """CREATE FUNCTION reading_article_search_vector_update() RETURNS trigger AS $$
+                    BEGIN
+                        NEW.search_vector :=
+                            setweight(to_tsvector(NEW.search_config::regconfig, coalesce(NEW.title, '')), 'A')
+                            || setweight(to_tsvector(NEW.search_config::regconfig, coalesce(NEW.summary, '')), 'B')
+                            || setweight(to_tsvector(NEW.search_config::regconfig, coalesce(NEW.content, '')), 'C')
+                            || setweight(to_tsvector(NEW.search_config::regconfig, coalesce(NEW.authors::text, '')), 'C')
+                            || setweight(to_tsvector(NEW.search_config::regconfig, coalesce(NEW.main_source_title, '')), 'D');
+                        RETURN NEW;
+                    END
+                    $$ LANGUAGE plpgsql""",
+                    """CREATE TRIGGER reading_article_search_vector_update
+                    BEFORE INSERT OR UPDATE OF title, summary, content, authors, main_source_title, search_config
+                    ON reading_article
+                    FOR EACH ROW EXECUTE FUNCTION reading_article_search_vector_update()""",
+                    "UPDATE reading_article SET search_config = search_config",
+                ],
+                reverse_sql=[
+                    "DROP TRIGGER reading_article_search_vector_update ON reading_article",
+                    "DROP FUNCTION reading_article_search_vector_update()",
+                ],
+            ),
+            migrations.AddIndex(
+                model_name="article",
+                index=django.contrib.postgres.indexes.GinIndex(
+                    fields=["search_vector"], name="reading_article_search_vector"
+                ),
+            ),
+        ])
@@ -0,0 +1,24 @@
+# Generated by Django 6.0.4 on 2026-10-19 00:09
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("feeds", "0003_fill_missing_slugs"),
+        ("reading", "0008_article_search_vector"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="tag",
+            index=models.Index(
+                models.F("user"),
+                django.db.models.functions.text.Lower("title"),
+                name="reading_tag_user_lower_title",
+            ),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 6.0.4 on 2026-10-19 00:20
+
+from django.db import connection, migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("reading", "0009_tag_user_lower_title"),
+    ]
+
+    operations = []
+
+    if connection.vendor == "sqlite":
+        # Add prefix indexes for 2 and 3 characters to autocomplete searches. The triggers keeping
+        # the table in sync only reference it by name: they don't need to be recreated.
+        operations.append(
+            migrations.RunSQL(
+                sql=[
+                    "DROP TABLE reading_article_fts",
+                    """CREATE VIRTUAL TABLE reading_article_fts USING fts5(
+                        title, summary, content, authors, main_source_title,
+                        content='reading_article',
+                        content_rowid='id',
+                        tokenize='porter unicode61 remove_diacritics 2',
+                        prefix='2 3'
+                    )""",
+                    "INSERT INTO reading_article_fts(reading_article_fts) VALUES ('rebuild')",
+                ],
+                reverse_sql=[
+                    "DROP TABLE reading_article_fts",
+                    """CREATE VIRTUAL TABLE reading_article_fts USING fts5(
+                        title, summary, content, authors, main_source_title,
+                        content='reading_article',
+                        content_rowid='id',
+                        tokenize='porter unicode61 remove_diacritics 2'
+                    )""",
+                    "INSERT INTO reading_article_fts(reading_article_fts) VALUES ('rebuild')",
+                ],
+            )
+        )
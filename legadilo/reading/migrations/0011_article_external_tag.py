@@ -0,0 +1,82 @@
+# Generated by Django 6.0.4 on 2026-10-19 00:17
+
+import django.db.models.deletion
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import migrations, models
+
+from legadilo.core.utils.db import disable_statement_timeout
+
+
+def fill_article_external_tags(apps, schema_editor):
+    Article = apps.get_model("reading", "Article")
+    ArticleExternalTag = apps.get_model("reading", "ArticleExternalTag")
+    paginator = Paginator(
+        Article.objects
+        .exclude(external_tags=[])
+        .only("id", "user_id", "external_tags")
+        .order_by("id"),
+        500,
+    )
+    for page in paginator:
+        ArticleExternalTag.objects.bulk_create([
+            ArticleExternalTag(
+                article_id=article.id, user_id=article.user_id, lower_title=lower_title
+            )
+            for article in page.object_list
+            for lower_title in dict.fromkeys(tag.strip().lower() for tag in article.external_tags)
+            if lower_title
+        ])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("reading", "0010_article_full_text_search_prefix_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        *disable_statement_timeout(),
+        migrations.CreateModel(
+            name="ArticleExternalTag",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("lower_title", models.TextField()),
+                (
+                    "article",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="article_external_tags",
+                        to="reading.article",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="article_external_tags",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["article_id", "lower_title"],
+                "indexes": [
+                    models.Index(fields=["user", "lower_title"], name="reading_ext_tag_user_title")
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        models.F("article"),
+                        models.F("lower_title"),
+                        name="reading_articleexternaltag_unique_per_article",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(fill_article_external_tags, reverse_code=migrations.RunPython.noop),
+    ]
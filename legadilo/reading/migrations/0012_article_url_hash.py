@@ -0,0 +1,45 @@
+# Generated by Django 6.0.4 on 2026-10-19 00:41
+
+from django.core.paginator import Paginator
+from django.db import migrations, models
+
+from legadilo.core.utils.db import disable_statement_timeout
+from legadilo.core.utils.urls import hash_url
+from legadilo.reading.migrations._sqlite_full_text_search import keep_full_text_search_triggers
+
+
+def fill_url_hashes(apps, schema_editor):
+    Article = apps.get_model("reading", "Article")
+    paginator = Paginator(Article.objects.only("id", "url").order_by("id"), 500)
+    for page in paginator:
+        articles = list(page.object_list)
+        for article in articles:
+            article.url_hash = hash_url(article.url)
+        Article.objects.bulk_update(articles, fields=["url_hash"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("reading", "0011_article_external_tag"),
+    ]
+
+    operations = [
+        *disable_statement_timeout(),
+        *keep_full_text_search_triggers(
+            migrations.AddField(
+                model_name="article",
+                name="url_hash",
+                field=models.BigIntegerField(
+                    default=0,
+                    editable=False,
+                    help_text="Hash of the URL, used to look articles up by URL with a narrow index.",
+                ),
+                preserve_default=False,
+            ),
+        ),
+        migrations.RunPython(fill_url_hashes, reverse_code=migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(fields=["user", "url_hash"], name="reading_art_user_id_515355_idx"),
+        ),
+    ]
@@ -0,0 +1,78 @@
+# Generated by Django 6.0.4 on 2026-10-19 00:35
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("reading", "0012_article_url_hash"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SavedSearch",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("title", models.CharField(max_length=300)),
+                (
+                    "query_string",
+                    models.TextField(
+                        blank=True, help_text="Query string of the search page to edit the search."
+                    ),
+                ),
+                (
+                    "search_query",
+                    models.JSONField(
+                        help_text="Serialized ArticleFullTextSearchQuery to run the search again."
+                    ),
+                ),
+                (
+                    "tags_search",
+                    models.JSONField(
+                        help_text="Serialized ArticlesTagsSearch to run the search again."
+                    ),
+                ),
+                (
+                    "article_ids",
+                    models.JSONField(
+                        blank=True,
+                        default=list,
+                        help_text="Ids of the articles matching the search, in the order of the search.",
+                    ),
+                ),
+                (
+                    "computed_at",
+                    models.DateTimeField(
+                        help_text="When the search was last run on all the articles."
+                    ),
+                ),
+                (
+                    "refreshed_at",
+                    models.DateTimeField(
+                        help_text="When the search was last run on the articles updated since the previous run."
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="saved_searches",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("title", "id"),
+            },
+        ),
+    ]
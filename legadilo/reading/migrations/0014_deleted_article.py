@@ -0,0 +1,52 @@
+# Generated by Django 6.0.4 on 2026-10-19 01:22
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("feeds", "0004_feed_feed_url_hash"),
+        ("reading", "0013_saved_search"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DeletedArticle",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("article_id", models.PositiveBigIntegerField()),
+                ("url", models.URLField(max_length=1024)),
+                ("deleted_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "ordering": ["id"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                fields=["user", "obj_updated_at", "id"], name="reading_art_user_id_e04af2_idx"
+            ),
+        ),
+        migrations.AddField(
+            model_name="deletedarticle",
+            name="user",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="deleted_articles",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="deletedarticle",
+            index=models.Index(fields=["user", "id"], name="reading_del_user_id_0623e9_idx"),
+        ),
+    ]
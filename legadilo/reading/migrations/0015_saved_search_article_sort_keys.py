@@ -0,0 +1,21 @@
+# Generated by Django 6.0.4 on 2026-10-19 02:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("reading", "0014_deleted_article"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="savedsearch",
+            name="article_sort_keys",
+            field=models.JSONField(
+                blank=True,
+                default=list,
+                help_text="Values the search is ordered by for each article of article_ids, to insert the updated articles at their position.",
+            ),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Triggers keeping the FTS5 table used for full text search on SQLite in sync with articles.
+
+SQLite cannot alter most columns in place: Django recreates the reading_article table instead,
+which drops its triggers. Wrap such operations with keep_full_text_search_triggers.
+"""
+
+from django.db import connection, migrations
+from django.db.migrations.operations.base import Operation
+
+CREATE_TRIGGERS_SQL = [
+    """CREATE TRIGGER IF NOT EXISTS reading_article_fts_insert AFTER INSERT ON reading_article
+    BEGIN
+        INSERT INTO reading_article_fts(rowid, title, summary, content, authors, main_source_title)
+        VALUES (new.id, new.title, new.summary, new.content, new.authors, new.main_source_title);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS reading_article_fts_delete AFTER DELETE ON reading_article
+    BEGIN
+        INSERT INTO reading_article_fts(reading_article_fts, rowid, title, summary, content, authors, main_source_title)
+        VALUES ('delete', old.id, old.title, old.summary, old.content, old.authors, old.main_source_title);
+    END""",
+    # Only reindex when an indexed column changes: marking an article as read must stay cheap.
+    """CREATE TRIGGER IF NOT EXISTS reading_article_fts_update
+    AFTER UPDATE OF title, summary, content, authors, main_source_title ON reading_article
+    WHEN old.title IS NOT new.title
+        OR old.summary IS NOT new.summary
+        OR old.content IS NOT new.content
+        OR old.authors IS NOT new.authors
+        OR old.main_source_title IS NOT new.main_source_title
+    BEGIN
+        INSERT INTO reading_article_fts(reading_article_fts, rowid, title, summary, content, authors, main_source_title)
+        VALUES ('delete', old.id, old.title, old.summary, old.content, old.authors, old.main_source_title);
+        INSERT INTO reading_article_fts(rowid, title, summary, content, authors, main_source_title)
+        VALUES (new.id, new.title, new.summary, new.content, new.authors, new.main_source_title);
+    END""",
+]
+DROP_TRIGGERS_SQL = [
+    "DROP TRIGGER reading_article_fts_update",
+    "DROP TRIGGER reading_article_fts_delete",
+    "DROP TRIGGER reading_article_fts_insert",
+]
+
+
+def keep_full_text_search_triggers(*operations: Operation) -> list[Operation]:
+    if connection.vendor != "sqlite":
+        return list(operations)
+
+    return [
+        # Recreate the triggers when the migration is reverted.
+        migrations.RunSQL(sql=migrations.RunSQL.noop, reverse_sql=CREATE_TRIGGERS_SQL),
+        *operations,
+        migrations.RunSQL(sql=CREATE_TRIGGERS_SQL, reverse_sql=migrations.RunSQL.noop),
+    ]
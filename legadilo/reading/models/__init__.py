@@ -4,19 +4,26 @@
 
 from .article import Article
 from .article_fetch_error import ArticleFetchError
+from .article_full_text_search import ArticleFullTextSearch
 from .articles_group import ArticlesGroup
 from .comment import Comment
+from .deleted_article import DeletedArticle
 from .reading_list import ReadingList
-from .tag import ArticlesGroupTag, ArticleTag, ReadingListTag, Tag
+from .saved_search import SavedSearch
+from .tag import ArticleExternalTag, ArticlesGroupTag, ArticleTag, ReadingListTag, Tag
 
 __all__ = [
     "Article",
+    "ArticleExternalTag",
     "ArticleFetchError",
+    "ArticleFullTextSearch",
     "ArticleTag",
     "ArticlesGroup",
     "ArticlesGroupTag",
     "Comment",
+    "DeletedArticle",
     "ReadingList",
     "ReadingListTag",
+    "SavedSearch",
     "Tag",
 ]
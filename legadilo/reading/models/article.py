@@ -2,29 +2,40 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
+import base64
+import binascii
 import json
 import logging
+import operator
 from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
-from functools import cached_property
-from itertools import chain
-from typing import TYPE_CHECKING, Self, assert_never
+from functools import cached_property, reduce
+from itertools import batched, chain
+from typing import TYPE_CHECKING, Self, TypedDict, assert_never
 
 from dateutil.relativedelta import relativedelta
+from django.conf import settings
 from django.contrib.postgres.indexes import GinIndex
-from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
-from django.core.paginator import Paginator
+from django.contrib.postgres.search import (
+    CombinedSearchQuery,
+    SearchHeadline,
+    SearchQuery,
+    SearchRank,
+    SearchVectorField,
+)
 from django.db import connection, models, transaction
-from django.db.models.functions import Coalesce, Lower
+from django.db.models.functions import Coalesce, Lower, NullIf
 from django.utils.translation import gettext_lazy as _
 from ninja.schema import Schema
 from pydantic import ConfigDict
 from slugify import slugify
 
+from legadilo.core import constants as core_constants
 from legadilo.core.utils.collections_utils import CustomJsonEncoder, max_or_none, min_or_none
 from legadilo.core.utils.text import get_nb_words_from_html
 from legadilo.core.utils.time_utils import utcnow
+from legadilo.core.utils.urls import hash_url
 from legadilo.core.utils.validators import (
     CONTENT_TYPES,
     language_code_validator,
@@ -32,10 +43,31 @@ from legadilo.core.utils.validators import (
     table_of_content_validator,
 )
 from legadilo.reading import constants
-from legadilo.reading.models.tag import ArticleTag
+from legadilo.reading.models.tag import (
+    ArticleExternalTag,
+    ArticlesGroupTag,
+    ArticleTag,
+    normalize_external_tag,
+)
+from legadilo.reading.services.articles_autocomplete import (
+    get_cached_autocomplete_choices,
+    set_cached_autocomplete_choices,
+)
+from legadilo.reading.services.query_telemetry import get_filter_shape, record_queries
+from legadilo.reading.services.search_facets import (
+    get_cached_search_facets,
+    set_cached_search_facets,
+)
+from legadilo.reading.services.unread_counters import (
+    get_cached_unread_counters,
+    invalidate_unread_counters,
+    set_cached_unread_counters,
+)
 
-from ...core.utils.db import ExtractEpoch
+from ...core.utils.db import Bm25, ExtractEpoch, Fts5Snippet
 from .article_fetch_error import ArticleFetchError
+from .comment import Comment
+from .deleted_article import DeletedArticle
 
 if TYPE_CHECKING:
     from django_stubs_ext.db.models import TypedModelMeta
@@ -55,17 +87,32 @@ else:
 logger = logging.getLogger(__name__)
 
 
-SEARCH_VECTOR = (
-    SearchVector("title", config="english", weight="A")
-    + SearchVector("summary", config="english", weight="B")
-    + SearchVector("content", config="english", weight="C")
-    + SearchVector("authors", config="english", weight="C")
-    + SearchVector("main_source_title", config="english", weight="D")
-)
+# Weights of the title, summary, content, authors and main_source_title columns of the FTS5 table
+# used on SQLite. Same as the A, B, C, C and D weights of Article.search_vector with PostgreSQL
+# defaults.
+FTS_COLUMNS_WEIGHTS = (1.0, 0.4, 0.2, 0.2, 0.1)
+if connection.vendor == "postgresql":
+    # PostgreSQL sorts NULL values first in descending order: the index must match the NULLS LAST
+    # used by ArticleQuerySet.default_order_by to be usable for sorting.
+    SORT_DATE_INDEX = models.Index(
+        "user",
+        "is_read",
+        models.F("sort_date").desc(nulls_last=True),
+        models.F("id").desc(),
+        name="reading_article_sort_date_idx",
+    )
+else:
+    SORT_DATE_INDEX = models.Index(
+        fields=["user", "is_read", "-sort_date", "-id"],
+        name="reading_article_sort_date_idx",
+    )
 DEFAULT_INDEXES = [
     models.Index(
         fields=["user", "is_read", "is_favorite", "is_for_later"],
-    )
+    ),
+    SORT_DATE_INDEX,
+    models.Index(fields=["user", "url_hash"]),
+    models.Index(fields=["user", "obj_updated_at", "id"]),
 ]
 
 
@@ -78,12 +125,42 @@ class SaveArticleResult:
     is_from_invalid_data: bool = False
 
 
+@dataclass(frozen=True)
+class ArticlesCursor:
+    """Position of an article in a list ordered with ArticleQuerySet.default_order_by."""
+
+    sort_date: datetime | None
+    article_id: int
+
+    @classmethod
+    def from_article(cls, article: Article) -> Self:
+        return cls(sort_date=article.sort_date, article_id=article.id)
+
+    @classmethod
+    def decode(cls, value: str) -> Self | None:
+        try:
+            raw_sort_date, raw_article_id = (
+                base64.urlsafe_b64decode(value.encode()).decode().split("|", maxsplit=1)
+            )
+            return cls(
+                sort_date=datetime.fromisoformat(raw_sort_date) if raw_sort_date else None,
+                article_id=int(raw_article_id),
+            )
+        except ValueError, UnicodeDecodeError, binascii.Error:
+            return None
+
+    def encode(self) -> str:
+        raw_sort_date = self.sort_date.isoformat() if self.sort_date else ""
+        return base64.urlsafe_b64encode(f"{raw_sort_date}|{self.article_id}".encode()).decode()
+
+
 @dataclass(frozen=True)
 class ArticlesTagsSearch:
     tag_ids_to_include: frozenset[int] = frozenset()
     include_tag_operator: constants.ReadingListTagOperator = constants.ReadingListTagOperator.ALL
     tag_ids_to_exclude: frozenset[int] = frozenset()
     exclude_tag_operator: constants.ReadingListTagOperator = constants.ReadingListTagOperator.ALL
+    strategy: constants.TagFilteringStrategy = constants.TagFilteringStrategy.EXISTS
     count_tags_to_include_alias: str = "count_tags_to_include"
     count_tags_to_exclude_alias: str = "count_tags_to_exclude"
 
@@ -146,16 +223,89 @@ class ArticleFullTextSearchQuery(ArticleSearchQuery):
                 assert_never(self.order)
 
 
+def get_search_config(language: str) -> str:
+    if not settings.ARTICLE_SEARCH_CONFIG_FROM_LANGUAGE:
+        return constants.DEFAULT_SEARCH_CONFIG
+
+    language_prefix = language.replace("_", "-").split("-", maxsplit=1)[0].lower()
+    return constants.SEARCH_CONFIGS_BY_LANGUAGE.get(
+        language_prefix, constants.DEFAULT_SEARCH_CONFIG
+    )
+
+
+def _get_enabled_search_configs() -> list[str]:
+    if not settings.ARTICLE_SEARCH_CONFIG_FROM_LANGUAGE:
+        return [constants.DEFAULT_SEARCH_CONFIG]
+
+    return sorted({
+        constants.DEFAULT_SEARCH_CONFIG,
+        *constants.SEARCH_CONFIGS_BY_LANGUAGE.values(),
+    })
+
+
+def _build_search_query(
+    search_query: ArticleFullTextSearchQuery,
+) -> SearchQuery | CombinedSearchQuery:
+    # Articles may be indexed with different configs: the query must be parsed with each of them
+    # to match the lexemes stored in search_vector.
+    return reduce(
+        operator.or_,
+        (
+            SearchQuery(
+                search_query.q,
+                search_type=search_query.search_type.value,
+                config=search_config,
+            )
+            for search_config in _get_enabled_search_configs()
+        ),
+    )
+
+
+def _build_fts_query(search_query: ArticleFullTextSearchQuery) -> str:
+    # Quote what the user typed so it's never interpreted as the FTS5 query syntax.
+    match search_query.search_type:
+        case constants.ArticleSearchType.PHRASE:
+            terms = [search_query.q.strip()] if search_query.q.strip() else []
+        case constants.ArticleSearchType.PLAIN | constants.ArticleSearchType.URL:
+            terms = search_query.q.split()
+        case _:
+            assert_never(search_query.search_type)
+
+    return " ".join('"{}"'.format(term.replace('"', '""')) for term in terms)
+
+
+def _build_fts_prefix_query(prefix: str) -> str:
+    # Only search in titles: they are what is displayed to the user.
+    terms = " ".join('"{}"*'.format(term.replace('"', '""')) for term in prefix.split())
+    return f"title : ({terms})" if terms else ""
+
+
+def _build_prefix_search_query(prefix: str) -> SearchQuery | CombinedSearchQuery:
+    # Only match lexemes with the A weight: they come from the titles.
+    raw_query = " & ".join(
+        "'{}':*A".format(term.replace("\\", "\\\\").replace("'", "''")) for term in prefix.split()
+    )
+    return reduce(
+        operator.or_,
+        (
+            SearchQuery(raw_query, search_type="raw", config=search_config)
+            for search_config in _get_enabled_search_configs()
+        ),
+    )
+
+
 def _build_basic_filters_from_reading_list(search_query: ArticleSearchQuery) -> models.Q:  # noqa: C901, PLR0912 too complex
     filters = models.Q()
 
+    # Use "in" to compare is_read with a value: Django would otherwise generate "NOT is_read" which
+    # prevents SQLite from using SORT_DATE_INDEX to sort articles.
     match search_query.read_status:
         case constants.ReadStatus.ALL:
             pass
         case constants.ReadStatus.ONLY_READ:
-            filters &= models.Q(is_read=True)
+            filters &= models.Q(is_read__in=[True])
         case constants.ReadStatus.ONLY_UNREAD:
-            filters &= models.Q(is_read=False)
+            filters &= models.Q(is_read__in=[False])
         case _:
             assert_never(search_query.read_status)
 
@@ -225,6 +375,18 @@ def _build_tag_search_from_reading_list(reading_list: ReadingList) -> ArticlesTa
 
 def _build_filter_by_tag_ids(
     qs: ArticleQuerySet, tags_search: ArticlesTagsSearch
+) -> tuple[ArticleQuerySet, models.Q]:
+    match tags_search.strategy:
+        case constants.TagFilteringStrategy.COUNT:
+            return _build_filter_by_tag_ids_with_count(qs, tags_search)
+        case constants.TagFilteringStrategy.EXISTS:
+            return qs, _build_filter_by_tag_ids_with_exists(tags_search)
+        case _:
+            assert_never(tags_search.strategy)
+
+
+def _build_filter_by_tag_ids_with_count(
+    qs: ArticleQuerySet, tags_search: ArticlesTagsSearch
 ) -> tuple[ArticleQuerySet, models.Q]:
     filters = models.Q()
 
@@ -260,34 +422,135 @@ def _build_filter_by_tag_ids(
     }), filters
 
 
-class ArticleQuerySet(models.QuerySet["Article"]):
+def _build_filter_by_tag_ids_with_exists(tags_search: ArticlesTagsSearch) -> models.Q:
+    filters = models.Q()
+
+    if tags_search.tag_ids_to_include:
+        filters &= _build_has_tags_filter(
+            tags_search.tag_ids_to_include, tags_search.include_tag_operator
+        )
+
+    if tags_search.tag_ids_to_exclude:
+        filters &= ~_build_has_tags_filter(
+            tags_search.tag_ids_to_exclude, tags_search.exclude_tag_operator
+        )
+
+    return filters
+
+
+def _build_has_tags_filter(
+    tag_ids: frozenset[int], operator: constants.ReadingListTagOperator
+) -> models.Q:
+    article_tags_qs = ArticleTag.objects.filter(article_id=models.OuterRef("pk"))
+    match operator:
+        case constants.ReadingListTagOperator.ALL:
+            # One subquery per tag: the article must have all of them.
+            filters = models.Q()
+            for tag_id in sorted(tag_ids):
+                filters &= models.Q(models.Exists(article_tags_qs.filter(tag_id=tag_id)))
+            return filters
+        case constants.ReadingListTagOperator.ANY:
+            return models.Q(models.Exists(article_tags_qs.filter(tag_id__in=tag_ids)))
+        case _:
+            assert_never(operator)
+
+
+_EXPORTED_ARTICLE_FIELDS = (
+    "id",
+    "group_order",
+    "group_id",
+    "group__title",
+    "group__description",
+    "main_feed_id",
+    "main_feed__title",
+    "main_feed__feed_url",
+    "main_feed__site_url",
+    "main_feed__category_id",
+    "main_feed__category__title",
+    "title",
+    "url",
+    "content",
+    "content_type",
+    "published_at",
+    "updated_at",
+    "authors",
+    "read_at",
+    "is_favorite",
+    "language",
+)
+
+
+def _group_titles(rows: Iterable[tuple[int, str]]) -> dict[int, list[str]]:
+    titles_by_id: dict[int, list[str]] = {}
+    for object_id, title in rows:
+        titles_by_id.setdefault(object_id, []).append(title)
+
+    return titles_by_id
+
+
+class ArticleQuerySet(models.QuerySet["Article"]):  # noqa: PLR0904 too many public methods
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._telemetry: tuple[str, str] | None = None
+
+    def _clone(self) -> Self:
+        clone = super()._clone()
+        clone._telemetry = self._telemetry
+        return clone
+
+    def with_telemetry(self, name: str, shape: str) -> Self:
+        """Record the queries used to fetch or count the articles when telemetry is enabled.
+
+        See legadilo.reading.services.query_telemetry.
+        """
+        if not settings.QUERY_TELEMETRY_ENABLED:
+            return self
+
+        clone = self._chain()
+        clone._telemetry = (name, shape)
+        return clone
+
+    def _fetch_all(self):
+        if self._telemetry is None or self._result_cache is not None:
+            super()._fetch_all()
+            return
+
+        with record_queries(*self._telemetry) as record:
+            super()._fetch_all()
+            record.nb_rows = len(self._result_cache or [])
+
+    def count(self) -> int:
+        if self._telemetry is None or self._result_cache is not None:
+            return super().count()
+
+        name, shape = self._telemetry
+        with record_queries(f"{name}.count", shape) as record:
+            record.nb_rows = super().count()
+        return record.nb_rows
+
     def for_user(self, user: User):
         return self.filter(user=user)
 
     def only_unread(self):
-        return self.filter(is_read=False)
-
-    def _filter_by_reading_list_tags(self, reading_list: ReadingList) -> Self:
-        tags_search = _build_tag_search_from_reading_list(reading_list)
-        return self._filter_by_tag_ids(tags_search)
+        # See _build_basic_filters_from_reading_list for why we compare with a value.
+        return self.filter(is_read__in=[False])
 
-    def _filter_by_tag_ids(self, tags_search: ArticlesTagsSearch):
+    def filter_by_tag_ids(self, tags_search: ArticlesTagsSearch) -> Self:
         qs, filters = _build_filter_by_tag_ids(self, tags_search)
         return qs.filter(filters)
 
     def for_reading_list(self, reading_list: ReadingList) -> Self:
+        search_query = ArticleSearchQuery.from_reading_list(reading_list)
+        tags_search = _build_tag_search_from_reading_list(reading_list)
         return (
             self
             .for_user(reading_list.user)
-            .filter(
-                _build_basic_filters_from_reading_list(
-                    ArticleSearchQuery.from_reading_list(reading_list)
-                )
-            )
-            ._filter_by_reading_list_tags(reading_list)
+            .filter(_build_basic_filters_from_reading_list(search_query))
+            .filter_by_tag_ids(tags_search)
             .select_related("main_feed")
             .prefetch_related("tags")
             .default_order_by(reading_list.order_direction)
+            .with_telemetry("reading_list", get_filter_shape(search_query, tags_search))
         )
 
     def for_tag(self, tag: Tag) -> Self:
@@ -302,18 +565,23 @@ class ArticleQuerySet(models.QuerySet["Article"]):
     def for_external_tag(self, tag: str) -> Self:
         return (
             self
-            .filter(external_tags__icontains=tag)
+            .for_external_tags_search([tag])
             .prefetch_related("tags")
             .select_related("main_feed")
             .default_order_by()
         )
 
     def for_external_tags_search(self, tags: Iterable[str]) -> Self:
-        filters = models.Q()
-        for tag in tags:
-            filters |= models.Q(external_tags__icontains=tag)
-
-        return self.filter(filters)
+        return self.filter(
+            models.Exists(
+                ArticleExternalTag.objects.filter(
+                    article_id=models.OuterRef("pk"),
+                    # Also filter on the user so the (user, lower_title) index can be used.
+                    user_id=models.OuterRef("user_id"),
+                    lower_title__in={normalize_external_tag(tag) for tag in tags},
+                )
+            )
+        )
 
     def for_feed(self) -> Self:
         return self.prefetch_related("tags").select_related("main_feed").default_order_by()
@@ -322,62 +590,125 @@ class ArticleQuerySet(models.QuerySet["Article"]):
         return self.prefetch_related("tags", "comments").select_related("main_feed", "group")
 
     def for_export(self, user: User, *, updated_since: datetime | None = None) -> Self:
-        qs = (
-            self
-            .for_user(user)
-            .select_related("main_feed", "main_feed__category", "group")
-            .prefetch_related("tags", "comments", "group__tags")
-            .order_by("group_order", "id")
-        )
+        qs = self.for_user(user).order_by("group_order", "id")
         if updated_since:
             qs = qs.filter(
                 models.Q(updated_at__gte=updated_since)
-                | models.Q(comments__updated_at__gte=updated_since)
+                | models.Exists(
+                    Comment.objects.filter(
+                        article_id=models.OuterRef("pk"), updated_at__gte=updated_since
+                    )
+                )
             )
 
         return qs
 
-    def update_articles_from_action(self, action: constants.UpdateArticleActions):  # noqa: PLR0911 Too many return statements
-        # Remove order bys to allow UPDATE to work. Otherwise, Django will fail because it can't
-        # resolve the alias_date_field_order field.
+    def update_articles_from_action(self, action: constants.UpdateArticleActions) -> int:
+        if action in {
+            constants.UpdateArticleActions.DO_NOTHING,
+            constants.UpdateArticleActions.MARK_AS_OPENED,
+        }:
+            # Unread counters are not impacted by these actions.
+            return self._update_articles_from_action(action)
+
+        user_ids = self._get_user_ids()
+        nb_updated_articles = self._update_articles_from_action(action)
+        invalidate_unread_counters(user_ids)
+        return nb_updated_articles
+
+    def _update_articles_from_action(self, action: constants.UpdateArticleActions) -> int:  # noqa: PLR0911 Too many return statements
+        # Remove order bys: they are useless for an UPDATE.
         update_qs = self.order_by()
 
         match action:
             case constants.UpdateArticleActions.DO_NOTHING:
                 return 0
             case constants.UpdateArticleActions.MARK_AS_READ:
-                return update_qs.filter(read_at__isnull=True).update(read_at=utcnow())
+                now = utcnow()
+                return update_qs.filter(read_at__isnull=True).update(
+                    read_at=now, obj_updated_at=now
+                )
             case constants.UpdateArticleActions.MARK_AS_UNREAD:
-                return update_qs.update(read_at=None)
+                return update_qs.update(read_at=None, obj_updated_at=utcnow())
             case constants.UpdateArticleActions.MARK_AS_FAVORITE:
-                return update_qs.update(is_favorite=True)
+                return update_qs.update(is_favorite=True, obj_updated_at=utcnow())
             case constants.UpdateArticleActions.UNMARK_AS_FAVORITE:
-                return update_qs.update(is_favorite=False)
+                return update_qs.update(is_favorite=False, obj_updated_at=utcnow())
             case constants.UpdateArticleActions.MARK_AS_FOR_LATER:
-                return update_qs.update(is_for_later=True)
+                return update_qs.update(is_for_later=True, obj_updated_at=utcnow())
             case constants.UpdateArticleActions.UNMARK_AS_FOR_LATER:
-                return update_qs.update(is_for_later=False)
+                return update_qs.update(is_for_later=False, obj_updated_at=utcnow())
             case constants.UpdateArticleActions.MARK_AS_OPENED:
                 return update_qs.filter(opened_at__isnull=True).update(opened_at=utcnow())
             case _:
                 assert_never(action)
 
+    def delete(self):
+        user_ids = self._get_user_ids()
+        DeletedArticle.objects.create_for_articles(
+            self.order_by().values_list("id", "user_id", "url")
+        )
+        deletion_result = super().delete()
+        invalidate_unread_counters(user_ids)
+        return deletion_result
+
+    def mark_as_updated(self) -> int:
+        """Update obj_updated_at: QuerySet.update doesn't do it and incremental exports use it."""
+        return self.order_by().update(obj_updated_at=utcnow())
+
+    def _get_user_ids(self) -> list[int]:
+        return list(self.order_by().values_list("user_id", flat=True).distinct())
+
     def default_order_by(
         self,
         order_direction: constants.ReadingListOrderDirection = constants.ReadingListOrderDirection.DESC,  # noqa: E501
     ) -> Self:
-        order_expression = models.F("alias_date_field_order")
+        order_expression = models.F("sort_date")
         match order_direction:
             case constants.ReadingListOrderDirection.ASC:
                 order = order_expression.asc(nulls_last=True)
+                id_order = "id"
             case constants.ReadingListOrderDirection.DESC:
-                order = order_expression.desc(nulls_last=True)
+                # Databases sorting NULL as the smallest value already put them last. Don't add
+                # the modifier in this case: SQLite wouldn't use SORT_DATE_INDEX to sort with it.
+                order = order_expression.desc(
+                    nulls_last=None if connection.features.order_by_nulls_first else True
+                )
+                id_order = "-id"
             case _:
                 assert_never(order_direction)
 
-        return self.alias(
-            alias_date_field_order=Coalesce(models.F("updated_at"), models.F("published_at"))
-        ).order_by(order)
+        # Order by id too to get a stable order usable with cursors. Combined with filters on user
+        # and is_read, this order is served by SORT_DATE_INDEX.
+        return self.order_by(order, id_order)
+
+    def after_cursor(
+        self,
+        cursor: ArticlesCursor,
+        order_direction: constants.ReadingListOrderDirection = constants.ReadingListOrderDirection.DESC,  # noqa: E501
+    ) -> Self:
+        """Only keep articles after the cursor.
+
+        Must be used on a queryset ordered with default_order_by with the same order direction.
+        """
+        match order_direction:
+            case constants.ReadingListOrderDirection.ASC:
+                lookup = "gt"
+            case constants.ReadingListOrderDirection.DESC:
+                lookup = "lt"
+            case _:
+                assert_never(order_direction)
+
+        id_filter = models.Q(**{f"id__{lookup}": cursor.article_id})
+        if cursor.sort_date is None:
+            # Articles without dates are always last.
+            return self.filter(models.Q(sort_date__isnull=True) & id_filter)
+
+        return self.filter(
+            models.Q(**{f"sort_date__{lookup}": cursor.sort_date})
+            | (models.Q(sort_date=cursor.sort_date) & id_filter)
+            | models.Q(sort_date__isnull=True)
+        )
 
     def for_deletion(self) -> Self:
         return self.prefetch_related("feed_articles", "feed_articles__feed")
@@ -420,50 +751,142 @@ class ArticleQuerySet(models.QuerySet["Article"]):
 
     def for_search(self, search_query: ArticleFullTextSearchQuery) -> Self:
         if connection.vendor == "postgresql":
-            full_text_search_query = SearchQuery(
-                search_query.q,
-                search_type=search_query.search_type.value,
-                config="english",
-            )
-            return (
-                self
-                .alias(search=SEARCH_VECTOR)
-                .annotate(rank=SearchRank(SEARCH_VECTOR, full_text_search_query))
-                .filter(search=full_text_search_query)
+            full_text_search_query = _build_search_query(search_query)
+            return self.annotate(
+                rank=SearchRank(models.F("search_vector"), full_text_search_query)
+            ).filter(search_vector=full_text_search_query)
+
+        return self._filter_by_fts_query(_build_fts_query(search_query))
+
+    def for_prefix_search(self, prefix: str) -> Self:
+        """Search articles with a title containing words starting with the words of prefix."""
+        if not prefix.strip():
+            return self.none()
+
+        if connection.vendor == "postgresql":
+            full_text_search_query = _build_prefix_search_query(prefix)
+            return self.annotate(
+                rank=SearchRank(models.F("search_vector"), full_text_search_query)
+            ).filter(search_vector=full_text_search_query)
+
+        return self._filter_by_fts_query(_build_fts_prefix_query(prefix))
+
+    def _filter_by_fts_query(self, fts_query: str) -> Self:
+        if not fts_query:
+            return self.none()
+
+        return self.annotate(
+            # bm25 is lower for better matches. Negate it to sort like SearchRank. Weights are
+            # given by column and match the weights of search_vector.
+            rank=-Bm25(
+                models.F("full_text_search__document"),
+                *(models.Value(weight) for weight in FTS_COLUMNS_WEIGHTS),
             )
+        ).filter(full_text_search__document__match=fts_query)
 
-        return self.alias(rank=models.F("obj_updated_at")).filter(
-            models.Q(title__icontains=search_query.q)
-            | models.Q(summary__icontains=search_query.q)
-            | models.Q(content__icontains=search_query.q)
-            | models.Q(authors__icontains=search_query.q)
-            | models.Q(main_source_title__icontains=search_query.q)
-        )
+    def for_search_in_content_or_tags(
+        self, user: User, search_query: ArticleFullTextSearchQuery
+    ) -> Self:
+        """Search in the content of the articles or in the title of their tags.
 
-    def for_tags_search(self, search_query: ArticleFullTextSearchQuery) -> Self:
-        return (
-            self
-            .alias(lower_tags_title=Lower("tags__title"))
-            .annotate(rank=models.Value(0))
-            .filter(lower_tags_title=search_query.q.lower())
+        Only PostgreSQL searches in tags: with SQLite, this is the same as for_search.
+        """
+        if connection.vendor != "postgresql":
+            return self.for_search(search_query)
+
+        full_text_search_query = _build_search_query(search_query)
+        # Tags are searched in a subquery to keep the articles unique and a single query to
+        # order and paginate.
+        has_matching_tag = models.Exists(
+            ArticleTag.objects.alias(lower_tag_title=Lower("tag__title")).filter(
+                article_id=models.OuterRef("pk"),
+                tag__user=user,
+                lower_tag_title=search_query.q.lower(),
+            )
         )
+        return self.annotate(
+            rank=SearchRank(models.F("search_vector"), full_text_search_query)
+        ).filter(models.Q(search_vector=full_text_search_query) | has_matching_tag)
+
+    def with_search_snippet(self, search_query: ArticleFullTextSearchQuery) -> Self:
+        """Annotate the fragment of the articles matching the search as search_snippet.
+
+        It's computed by the database and only for the fetched rows: the content of the articles
+        is never loaded. Matched terms are wrapped with the SEARCH_SNIPPET_*_MARKER constants.
+        With SQLite, it must be used on a queryset filtered with for_search.
+        """
+        if connection.vendor == "postgresql":
+            return self.annotate(
+                search_snippet=SearchHeadline(
+                    Coalesce(NullIf("content", models.Value("")), "summary"),
+                    _build_search_query(search_query),
+                    config=models.F("search_config"),
+                    start_sel=constants.SEARCH_SNIPPET_START_MARKER,
+                    stop_sel=constants.SEARCH_SNIPPET_STOP_MARKER,
+                    max_words=constants.SEARCH_SNIPPET_MAX_WORDS,
+                    min_words=constants.SEARCH_SNIPPET_MAX_WORDS // 2,
+                    max_fragments=constants.SEARCH_SNIPPET_MAX_FRAGMENTS,
+                    fragment_delimiter=f" {constants.SEARCH_SNIPPET_ELLIPSIS} ",
+                )
+            )
 
-    def for_url_search(self, urls: list[str]) -> Self:
-        filters = models.Q()
-        for url in urls:
-            filters |= models.Q(url=url)
+        return self.annotate(
+            search_snippet=Fts5Snippet(
+                models.F("full_text_search__document"),
+                # Let SQLite pick the column with the most matches.
+                models.Value(-1),
+                models.Value(constants.SEARCH_SNIPPET_START_MARKER),
+                models.Value(constants.SEARCH_SNIPPET_STOP_MARKER),
+                models.Value(constants.SEARCH_SNIPPET_ELLIPSIS),
+                models.Value(constants.SEARCH_SNIPPET_MAX_WORDS),
+            )
+        )
 
-        return self.filter(filters)
+    def for_url_search(self, urls: Iterable[str]) -> Self:
+        urls = list(urls)
+        # The hashes are used to find the articles with a narrow index. Comparing the URLs too
+        # rules out hash collisions.
+        return self.filter(url_hash__in=[hash_url(url) for url in urls], url__in=urls)
 
     def for_api(self):
         return self.prefetch_related("tags", "group__tags").select_related("group")
 
 
+class ArticleAutocompleteChoice(TypedDict):
+    id: int
+    slug: str
+    title: str
+
+
+class ArticleSearchTagFacet(TypedDict):
+    slug: str
+    title: str
+    nb_articles: int
+
+
+class ArticleSearchFeedFacet(TypedDict):
+    id: int
+    title: str
+    nb_articles: int
+
+
+class ArticleSearchFacets(TypedDict):
+    nb_unread: int
+    nb_read: int
+    nb_favorite: int
+    nb_for_later: int
+    top_tags: list[ArticleSearchTagFacet]
+    top_feeds: list[ArticleSearchFeedFacet]
+
+
 class ArticleManager(models.Manager["Article"]):
     _hints: dict
 
     def get_queryset(self) -> ArticleQuerySet:
-        return ArticleQuerySet(model=self.model, using=self._db, hints=self._hints)
+        # The search vector is only used in queries and maintained by the database: never load it.
+        return ArticleQuerySet(model=self.model, using=self._db, hints=self._hints).defer(
+            "search_vector"
+        )
 
     @transaction.atomic()
     def save_from_list_of_data(
@@ -484,15 +907,12 @@ class ArticleManager(models.Manager["Article"]):
         if len(articles_data) == 0:
             return []
 
-        existing_urls_to_articles = {
-            article.url: article
-            for article in self
-            .get_queryset()
-            .filter(user=user, url__in=[article_data.url for article_data in articles_data])
-            .select_related("user", "user__settings")
-        }
+        existing_urls_to_articles = self.get_by_urls(
+            user, [article_data.url for article_data in articles_data]
+        )
         articles_to_create: list[SaveArticleResult] = []
         articles_to_update: list[SaveArticleResult] = []
+        articles_with_updated_external_tags: list[Article] = []
         seen_urls = set()
         for article_data in articles_data:
             if article_data.url in seen_urls:
@@ -501,9 +921,12 @@ class ArticleManager(models.Manager["Article"]):
             seen_urls.add(article_data.url)
             if article_data.url in existing_urls_to_articles:
                 article_to_update = existing_urls_to_articles[article_data.url]
+                previous_external_tags = list(article_to_update.external_tags)
                 was_updated = article_to_update.update_article_from_data(
                     article_data, force_update=force_update
                 )
+                if was_updated and article_to_update.external_tags != previous_external_tags:
+                    articles_with_updated_external_tags.append(article_to_update)
                 if initial_source_type == constants.ArticleSourceType.MANUAL:
                     if article_to_update.main_source_type == constants.ArticleSourceType.FEED:
                         # We force the source type to manual if we manually add it so prevent any
@@ -538,6 +961,7 @@ class ArticleManager(models.Manager["Article"]):
                     contributors=article_data.contributors,
                     external_tags=article_data.tags,
                     url=article_data.url,
+                    url_hash=hash_url(article_data.url),
                     preview_picture_url=article_data.preview_picture_url,
                     preview_picture_alt=article_data.preview_picture_alt,
                     published_at=article_data.published_at,
@@ -546,6 +970,7 @@ class ArticleManager(models.Manager["Article"]):
                     main_source_title=article_data.source_title,
                     main_feed_id=initial_main_feed_id,
                     language=article_data.language,
+                    search_config=get_search_config(article_data.language),
                     annotations=article_data.annotations,
                     read_at=article_data.read_at,
                     is_favorite=article_data.is_favorite,
@@ -564,6 +989,9 @@ class ArticleManager(models.Manager["Article"]):
         ArticleTag.objects.associate_articles_with_tags(
             [result.article for result in articles_to_create], tags
         )
+        ArticleExternalTag.objects.create_for_articles(
+            result.article for result in articles_to_create
+        )
 
         self.bulk_update(
             [result.article for result in articles_to_update if result.was_updated],
@@ -586,6 +1014,10 @@ class ArticleManager(models.Manager["Article"]):
                 "obj_updated_at",
             ],
         )
+        ArticleExternalTag.objects.update_for_articles(articles_with_updated_external_tags)
+
+        if articles_to_create or any(result.was_updated for result in articles_to_update):
+            invalidate_unread_counters([user.id])
 
         all_results = []
         for result in chain(articles_to_create, articles_to_update):
@@ -644,12 +1076,9 @@ class ArticleManager(models.Manager["Article"]):
         If the article already exists, its content, title and summary won't be updated. Its tags
         will and debugging data will be saved.
         """
-        article_urls_to_articles = {
-            article.url: article
-            for article in self.get_queryset().filter(
-                user=user, url__in=[fetch_result.url for fetch_result in fetch_article_results]
-            )
-        }
+        article_urls_to_articles = self.get_by_urls(
+            user, [fetch_result.url for fetch_result in fetch_article_results]
+        )
         existing_article_urls = set(article_urls_to_articles.keys())
         articles_to_create = []
         for fetch_result in fetch_article_results:
@@ -659,6 +1088,7 @@ class ArticleManager(models.Manager["Article"]):
             article = self.model(
                 user=user,
                 url=fetch_result.url,
+                url_hash=hash_url(fetch_result.url),
                 main_source_title=fetch_result.article_data.source_title,
                 main_source_type=constants.ArticleSourceType.MANUAL,
                 title=fetch_result.article_data.title,
@@ -672,6 +1102,8 @@ class ArticleManager(models.Manager["Article"]):
 
         self.bulk_create(articles_to_create, unique_fields=["user", "url"])
         ArticleTag.objects.associate_articles_with_tags(articles_to_create, tags)
+        if articles_to_create:
+            invalidate_unread_counters([user.id])
 
         article_fetch_errors_to_create = [
             ArticleFetchError(
@@ -694,6 +1126,26 @@ class ArticleManager(models.Manager["Article"]):
             for article in article_urls_to_articles.values()
         ]
 
+    def get_by_urls(self, user: User, urls: Iterable[str]) -> dict[str, Article]:
+        """Get the articles of the user with the given URLs, by URL.
+
+        The URLs are looked up in batches to keep the IN lists of the queries short.
+        """
+        articles_by_url = {}
+        for urls_batch in batched(
+            dict.fromkeys(urls), core_constants.PER_PAGE_FOR_BULK_OPERATIONS, strict=False
+        ):
+            articles_by_url.update(
+                (article.url, article)
+                for article in self
+                .get_queryset()
+                .for_user(user)
+                .for_url_search(urls_batch)
+                .select_related("user", "user__settings")
+            )
+
+        return articles_by_url
+
     def get_articles_of_reading_list(self, reading_list: ReadingList) -> ArticleQuerySet:
         return self.get_queryset().for_reading_list(reading_list)
 
@@ -717,7 +1169,29 @@ class ArticleManager(models.Manager["Article"]):
                 & filters,
             )
 
-        return qs.aggregate(**aggregations)
+        with record_queries("unread_counters", f"reading_lists={len(reading_lists)}") as record:
+            counters = qs.aggregate(**aggregations)
+            record.nb_rows = sum(counters.values())
+
+        return counters
+
+    def get_unread_counters_of_reading_lists(
+        self, user: User, reading_lists: list[ReadingList]
+    ) -> dict[str, int]:
+        """Same as count_unread_articles_of_reading_lists but cached.
+
+        The cache is invalidated each time articles, their tags or reading lists of the user are
+        changed. Use the check_unread_counters command to make sure it's consistent.
+        """
+        counters = get_cached_unread_counters(
+            user.id, [reading_list.slug for reading_list in reading_lists]
+        )
+        if counters:
+            return counters
+
+        counters = self.count_unread_articles_of_reading_lists(user, reading_lists)
+        set_cached_unread_counters(user.id, counters)
+        return counters
 
     def get_articles_of_tag(self, tag: Tag) -> ArticleQuerySet:
         return self.get_queryset().for_tag(tag)
@@ -726,49 +1200,118 @@ class ArticleManager(models.Manager["Article"]):
         return self.get_queryset().for_user(user).for_external_tag(tag)
 
     def export(self, user: User, *, updated_since: datetime | None = None):
+        """Yield the rows to export by batches of articles.
+
+        Only the exported columns are fetched and the batches are paginated on the sort key instead
+        of with an offset: each batch costs the same whatever its position in the export. The tags
+        and comments of each batch are fetched with one query each, already sorted.
+        """
         articles_qs = self.get_queryset().for_export(user, updated_since=updated_since)
-        paginator = Paginator(articles_qs, constants.MAX_EXPORT_ARTICLES_PER_PAGE)
-        for page_index in paginator.page_range:
-            page = paginator.page(page_index)
-            articles = []
-            for article in page.object_list:
-                articles.append({
-                    "group_id": article.group.id if article.group else "",
-                    "group_title": article.group.title if article.group else "",
-                    "group_description": article.group.description if article.group else "",
-                    "group_tags": json.dumps([tag.title for tag in article.group.tags.all()])
-                    if article.group
-                    else "[]",
-                    "category_id": article.main_feed.category_id if article.main_feed else "",
-                    "category_title": article.main_feed.category.title
-                    if article.main_feed and article.main_feed.category
-                    else "",
-                    "feed_id": article.main_feed_id or "",
-                    "feed_title": article.main_feed.title if article.main_feed else "",
-                    "feed_url": article.main_feed.feed_url if article.main_feed else "",
-                    "feed_site_url": article.main_feed.site_url if article.main_feed else "",
-                    "article_id": article.id,
-                    "article_title": article.title,
-                    "article_url": article.url,
-                    "article_content": article.content,
-                    "article_content_type": article.content_type,
-                    "article_date_published": article.published_at.isoformat()
-                    if article.published_at
-                    else "",
-                    "article_date_updated": article.updated_at.isoformat()
-                    if article.updated_at
-                    else "",
-                    "article_authors": json.dumps(article.authors) if article.authors else "",
-                    "article_tags": json.dumps([tag.title for tag in article.tags.all()]),
-                    "article_read_at": article.read_at.isoformat() if article.read_at else "",
-                    "article_is_favorite": article.is_favorite,
-                    "article_lang": article.language,
-                    "article_comments": json.dumps([
-                        comment.text for comment in article.comments.all()
-                    ]),
-                })
+        last_article = None
+        while True:
+            batch_qs = articles_qs
+            if last_article is not None:
+                batch_qs = batch_qs.filter(
+                    models.Q(group_order__gt=last_article["group_order"])
+                    | models.Q(group_order=last_article["group_order"], id__gt=last_article["id"])
+                )
+            articles = list(
+                batch_qs.values(*_EXPORTED_ARTICLE_FIELDS)[: constants.MAX_EXPORT_ARTICLES_PER_PAGE]
+            )
+            if not articles:
+                return
+
+            yield self._build_export_rows(articles)
+            if len(articles) < constants.MAX_EXPORT_ARTICLES_PER_PAGE:
+                return
+            last_article = articles[-1]
+
+    def export_changes(
+        self, user: User, *, after: tuple[datetime, int] | None, limit: int
+    ) -> tuple[list[dict], tuple[datetime, int] | None]:
+        """Export the articles updated after the given (obj_updated_at, id) position.
+
+        The articles are sorted by their last update: the position of the last exported article is
+        returned to get the next changes. Articles are marked as updated when their group, main feed
+        or its category is deleted. They are not when one of them is only renamed: the new title is
+        exported with the next change of the article.
+        """
+        articles_qs = self.get_queryset().for_user(user).order_by("obj_updated_at", "id")
+        if after is not None:
+            obj_updated_at, article_id = after
+            articles_qs = articles_qs.filter(
+                models.Q(obj_updated_at__gt=obj_updated_at)
+                | models.Q(obj_updated_at=obj_updated_at, id__gt=article_id)
+            )
+        articles = list(articles_qs.values(*_EXPORTED_ARTICLE_FIELDS, "obj_updated_at")[:limit])
+        if not articles:
+            return [], None
 
-            yield articles
+        return self._build_export_rows(articles), (
+            articles[-1]["obj_updated_at"],
+            articles[-1]["id"],
+        )
+
+    def _build_export_rows(self, articles: list[dict]) -> list[dict]:
+        article_ids = [article["id"] for article in articles]
+        tags_by_article = _group_titles(
+            ArticleTag.objects
+            .filter(article_id__in=article_ids)
+            .order_by("article_id", "tag__title", "tag_id")
+            .values_list("article_id", "tag__title")
+        )
+        comments_by_article = _group_titles(
+            Comment.objects
+            .filter(article_id__in=article_ids)
+            .order_by("article_id", "created_at", "id")
+            .values_list("article_id", "text")
+        )
+        group_ids = {article["group_id"] for article in articles if article["group_id"]}
+        tags_by_group = (
+            _group_titles(
+                ArticlesGroupTag.objects
+                .filter(articles_group_id__in=group_ids)
+                .order_by("articles_group_id", "tag__title", "tag_id")
+                .values_list("articles_group_id", "tag__title")
+            )
+            if group_ids
+            else {}
+        )
+
+        return [
+            {
+                "group_id": article["group_id"] or "",
+                "group_title": article["group__title"] or "",
+                "group_description": article["group__description"] or "",
+                "group_tags": json.dumps(tags_by_group.get(article["group_id"], []))
+                if article["group_id"]
+                else "[]",
+                "category_id": article["main_feed__category_id"] if article["main_feed_id"] else "",
+                "category_title": article["main_feed__category__title"] or "",
+                "feed_id": article["main_feed_id"] or "",
+                "feed_title": article["main_feed__title"] or "",
+                "feed_url": article["main_feed__feed_url"] or "",
+                "feed_site_url": article["main_feed__site_url"] or "",
+                "article_id": article["id"],
+                "article_title": article["title"],
+                "article_url": article["url"],
+                "article_content": article["content"],
+                "article_content_type": article["content_type"],
+                "article_date_published": article["published_at"].isoformat()
+                if article["published_at"]
+                else "",
+                "article_date_updated": article["updated_at"].isoformat()
+                if article["updated_at"]
+                else "",
+                "article_authors": json.dumps(article["authors"]) if article["authors"] else "",
+                "article_tags": json.dumps(tags_by_article.get(article["id"], [])),
+                "article_read_at": article["read_at"].isoformat() if article["read_at"] else "",
+                "article_is_favorite": article["is_favorite"],
+                "article_lang": article["language"],
+                "article_comments": json.dumps(comments_by_article.get(article["id"], [])),
+            }
+            for article in articles
+        ]
 
     def search(
         self,
@@ -786,7 +1329,7 @@ class ArticleManager(models.Manager["Article"]):
         )
 
         if tags_search:
-            articles_qs = articles_qs._filter_by_tag_ids(tags_search)
+            articles_qs = articles_qs.filter_by_tag_ids(tags_search)
 
         if search_query.linked_with_feeds:
             articles_qs = articles_qs.filter(feeds__id__in=search_query.linked_with_feeds)
@@ -799,16 +1342,101 @@ class ArticleManager(models.Manager["Article"]):
         if search_query.search_type == constants.ArticleSearchType.URL:
             articles_qs = articles_qs.for_url_search([search_query.q])
         elif search_query.q:
-            full_text_articles_qs = articles_qs.for_search(search_query)
-            if connection.vendor == "postgresql":
-                tags_articles_qs = articles_qs.for_tags_search(search_query)
-                articles_qs = tags_articles_qs.union(full_text_articles_qs)
-            else:
-                articles_qs = full_text_articles_qs
+            articles_qs = (
+                articles_qs
+                .for_search_in_content_or_tags(user, search_query)
+                .with_search_snippet(search_query)
+                .order_by(search_query.order_by, "id")
+            )
+
+        return articles_qs.with_telemetry("search", get_filter_shape(search_query, tags_search))
+
+    def get_autocomplete_choices(self, user: User, query: str) -> list[ArticleAutocompleteChoice]:
+        """Get the most relevant articles with a title matching the query as it's typed.
+
+        It's called on each keystroke: choices are cached for a short time.
+        """
+        if len(query.strip()) < constants.ARTICLES_AUTOCOMPLETE_MIN_QUERY_LENGTH:
+            return []
 
-            articles_qs = articles_qs.order_by(search_query.order_by, "id")
+        choices = get_cached_autocomplete_choices(user.id, query)
+        if choices is not None:
+            return choices
 
-        return articles_qs
+        choices = [
+            ArticleAutocompleteChoice(id=article_id, slug=slug, title=title)
+            for article_id, slug, title in self
+            .get_queryset()
+            .for_user(user)
+            .for_prefix_search(query)
+            .order_by("-rank", "-sort_date", "-id")
+            .values_list("id", "slug", "title")[: constants.MAX_ARTICLES_AUTOCOMPLETE_CHOICES]
+        ]
+        set_cached_autocomplete_choices(user.id, query, choices)
+        return choices
+
+    def get_search_facets(
+        self,
+        user: User,
+        search_query: ArticleFullTextSearchQuery,
+        tags_search: ArticlesTagsSearch,
+        *,
+        use_cache: bool = True,
+    ) -> ArticleSearchFacets:
+        """Count the articles matching the search by status, tag and feed.
+
+        Statuses are counted on all the matched articles in one aggregation. Tags and feeds are
+        counted on the most relevant matches only, up to MAX_SEARCH_FACET_ARTICLES.
+        """
+        if use_cache and (facets := get_cached_search_facets(user.id, search_query, tags_search)):
+            return facets
+
+        search_qs = self.search(user, search_query, tags_search)
+        status_counts = search_qs.order_by().aggregate(
+            nb_unread=models.Count("id", filter=models.Q(is_read=False)),
+            nb_read=models.Count("id", filter=models.Q(is_read=True)),
+            nb_favorite=models.Count("id", filter=models.Q(is_favorite=True)),
+            nb_for_later=models.Count("id", filter=models.Q(is_for_later=True)),
+        )
+        top_tags = []
+        top_feeds = []
+        if status_counts["nb_unread"] or status_counts["nb_read"]:
+            matched_article_ids = list(
+                search_qs.values_list("id", flat=True)[: constants.MAX_SEARCH_FACET_ARTICLES]
+            )
+            top_tags = [
+                ArticleSearchTagFacet(slug=slug, title=title, nb_articles=nb_articles)
+                for slug, title, nb_articles in ArticleTag.objects
+                .filter(article_id__in=matched_article_ids)
+                .values("tag__slug", "tag__title")
+                .annotate(nb_articles=models.Count("article_id"))
+                .order_by("-nb_articles", "tag__title")
+                .values_list("tag__slug", "tag__title", "nb_articles")[
+                    : constants.MAX_SEARCH_FACET_CHOICES
+                ]
+            ]
+            top_feeds = [
+                ArticleSearchFeedFacet(id=feed_id, title=title, nb_articles=nb_articles)
+                for feed_id, title, nb_articles in self
+                .get_queryset()
+                .filter(id__in=matched_article_ids, feeds__isnull=False)
+                .values("feeds__id", "feeds__title")
+                .annotate(nb_articles=models.Count("id"))
+                .order_by("-nb_articles", "feeds__title")
+                .values_list("feeds__id", "feeds__title", "nb_articles")[
+                    : constants.MAX_SEARCH_FACET_CHOICES
+                ]
+            ]
+        facets = ArticleSearchFacets(
+            nb_unread=status_counts["nb_unread"],
+            nb_read=status_counts["nb_read"],
+            nb_favorite=status_counts["nb_favorite"],
+            nb_for_later=status_counts["nb_for_later"],
+            top_tags=top_tags,
+            top_feeds=top_feeds,
+        )
+        set_cached_search_facets(user.id, search_query, tags_search, facets)
+        return facets
 
     def cleanup_articles(self):
         return self.get_queryset().for_cleanup().delete()
@@ -835,12 +1463,15 @@ class ArticleManager(models.Manager["Article"]):
             max_group_order=Coalesce(models.Max("group_order"), 0)
         )["max_group_order"]
         articles_to_update = []
+        now = utcnow()
         for order, article in enumerate(articles, start=max_group_order + 1):
             if article in articles_already_linked_to_other_group:
                 continue
 
             article.group = group
             article.group_order = order
+            # bulk_update doesn't update auto_now fields.
+            article.obj_updated_at = now
             articles_to_update.append(article)
 
         self.bulk_update(
@@ -848,6 +1479,7 @@ class ArticleManager(models.Manager["Article"]):
             fields=(
                 "group",
                 "group_order",
+                "obj_updated_at",
             ),
         )
 
@@ -859,7 +1491,10 @@ class ArticleManager(models.Manager["Article"]):
         max_new_order_value = max(new_order.values())
         group_order_articles_not_in_mapping = max_new_order_value + 1
 
+        now = utcnow()
         for article in articles:
+            # bulk_update doesn't update auto_now fields.
+            article.obj_updated_at = now
             if article.id in new_order:
                 article.group_order = new_order[article.id]
             else:
@@ -873,7 +1508,7 @@ class ArticleManager(models.Manager["Article"]):
             group_order=models.F("id") + group_order_articles_not_in_mapping
         )
 
-        self.bulk_update(articles, fields=["group_order"])
+        self.bulk_update(articles, fields=["group_order", "obj_updated_at"])
 
 
 class Article(models.Model):
@@ -899,6 +1534,10 @@ class Article(models.Model):
         validators=[list_of_strings_validator], blank=True, default=list
     )
     url = models.URLField(max_length=1_024)
+    url_hash = models.BigIntegerField(
+        editable=False,
+        help_text=_("Hash of the URL, used to look articles up by URL with a narrow index."),
+    )
     preview_picture_url = models.URLField(blank=True, max_length=1_024)
     preview_picture_alt = models.TextField(blank=True)
     external_tags = models.JSONField(
@@ -928,6 +1567,20 @@ class Article(models.Model):
         help_text=_("The language code for this article"),
         validators=[language_code_validator],
     )
+    search_config = models.CharField(
+        default=constants.DEFAULT_SEARCH_CONFIG,
+        max_length=constants.SEARCH_CONFIG_MAX_LENGTH,
+        help_text=_("The text search configuration used to index this article on PostgreSQL."),
+    )
+    search_vector = SearchVectorField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text=_(
+            "Weighted lexemes of the article used for full text search. Maintained by a trigger "
+            "on PostgreSQL and always empty on SQLite."
+        ),
+    )
     table_of_content = models.JSONField(
         validators=[table_of_content_validator],
         blank=True,
@@ -945,6 +1598,13 @@ class Article(models.Model):
         output_field=models.BooleanField(),
         db_persist=True,
     )
+    sort_date = models.GeneratedField(
+        expression=Coalesce("updated_at", "published_at"),
+        output_field=models.DateTimeField(null=True, blank=True),
+        db_persist=True,
+        null=True,
+        help_text=_("Date used to sort articles: the last update or the publication date."),
+    )
     opened_at = models.DateTimeField(null=True, blank=True)
     was_opened = models.GeneratedField(
         expression=models.Case(
@@ -1025,7 +1685,7 @@ class Article(models.Model):
             indexes = [
                 *DEFAULT_INDEXES,
                 GinIndex(
-                    SEARCH_VECTOR,
+                    fields=["search_vector"],
                     name="%(app_label)s_%(class)s_search_vector",
                 ),
             ]
@@ -1040,8 +1700,16 @@ class Article(models.Model):
 
     def save(self, *args, **kwargs):
         self.slug = self.slug or slugify(self.title) or str(_("no-slug"))
+        self.url_hash = hash_url(self.url)
+
+        super().save(*args, **kwargs)
+        invalidate_unread_counters([self.user_id])
 
-        return super().save(*args, **kwargs)
+    def delete(self, *args, **kwargs):
+        DeletedArticle.objects.create_for_articles([(self.id, self.user_id, self.url)])
+        deletion_result = super().delete(*args, **kwargs)
+        invalidate_unread_counters([self.user_id])
+        return deletion_result
 
     def update_article_from_data(
         self, article_data: ArticleData, *, force_update: bool = False
@@ -0,0 +1,38 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from typing import TYPE_CHECKING
+
+from django.db import models
+
+from legadilo.core.utils.db import FullTextSearchField
+
+if TYPE_CHECKING:
+    from django_stubs_ext.db.models import TypedModelMeta
+else:
+    TypedModelMeta = object
+
+
+class ArticleFullTextSearch(models.Model):
+    """FTS5 index of articles, only available on SQLite.
+
+    The virtual table and the triggers keeping it in sync with the articles are created by a
+    migration. The model is only used to join the index on articles when searching.
+    """
+
+    article = models.OneToOneField(
+        "reading.Article",
+        primary_key=True,
+        db_column="rowid",
+        related_name="full_text_search",
+        on_delete=models.DO_NOTHING,
+    )
+    document = FullTextSearchField(db_column="reading_article_fts")
+
+    class Meta(TypedModelMeta):
+        managed = False
+        db_table = "reading_article_fts"
+
+    def __str__(self):
+        return f"ArticleFullTextSearch(article_id={self.article_id})"
@@ -135,6 +135,11 @@ class ArticlesGroup(models.Model):
         self.slug = slugify(self.title)
         return super().save(*args, **kwargs)
 
+    def delete(self, *args, **kwargs):
+        # The group of the articles is set to NULL by the database: it doesn't update them.
+        self.articles.all().mark_as_updated()
+        return super().delete(*args, **kwargs)
+
     def update_from_details(self, title: str, description: str):
         self.title = title
         self.description = description
@@ -0,0 +1,82 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Self
+
+from dateutil.relativedelta import relativedelta
+from django.db import models
+
+from legadilo.core.utils.time_utils import utcnow
+from legadilo.core.utils.types import DeletionResult
+from legadilo.reading import constants
+
+if TYPE_CHECKING:
+    from django_stubs_ext.db.models import TypedModelMeta
+
+    from legadilo.users.models import User
+else:
+    TypedModelMeta = object
+
+
+class DeletedArticleQuerySet(models.QuerySet["DeletedArticle"]):
+    def for_user(self, user: User) -> Self:
+        return self.filter(user=user)
+
+    def for_cleanup(self) -> Self:
+        return self.filter(
+            deleted_at__lt=utcnow() - relativedelta(days=constants.KEEP_DELETED_ARTICLES_FOR)
+        )
+
+
+class DeletedArticleManager(models.Manager["DeletedArticle"]):
+    _hints: dict
+
+    def get_queryset(self) -> DeletedArticleQuerySet:
+        return DeletedArticleQuerySet(model=self.model, using=self._db, hints=self._hints)
+
+    def create_for_articles(self, articles: Iterable[tuple[int, int, str]]):
+        """Record the deletion of the articles given as (article id, user id, url) tuples."""
+        self.bulk_create(
+            [
+                self.model(article_id=article_id, user_id=user_id, url=url)
+                for article_id, user_id, url in articles
+            ],
+            batch_size=1_000,
+        )
+
+    def export_after(self, user: User, *, deleted_article_id: int, limit: int) -> list[dict]:
+        """List the deletions recorded after the given one, the oldest first."""
+        return list(
+            self
+            .get_queryset()
+            .for_user(user)
+            .filter(id__gt=deleted_article_id)
+            .order_by("id")
+            .values("id", "article_id", "url", "deleted_at")[:limit]
+        )
+
+    def cleanup(self) -> DeletionResult:
+        return self.get_queryset().for_cleanup().delete()
+
+
+class DeletedArticle(models.Model):
+    """Record of a deleted article so incremental exports can report the deletion."""
+
+    article_id = models.PositiveBigIntegerField()
+    url = models.URLField(max_length=1_024)
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    user = models.ForeignKey(
+        "users.User", related_name="deleted_articles", on_delete=models.CASCADE
+    )
+
+    objects = DeletedArticleManager()
+
+    class Meta(TypedModelMeta):
+        ordering = ["id"]
+        indexes = [models.Index(fields=["user", "id"])]
+
+    def __str__(self):
+        return f"DeletedArticle(article_id={self.article_id}, url={self.url})"
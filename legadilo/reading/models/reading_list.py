@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from django.core.exceptions import ValidationError
@@ -11,6 +12,8 @@ from django.utils.translation import gettext_lazy as _
 from slugify import slugify
 
 from legadilo.reading import constants
+from legadilo.reading.models.tag import ReadingListTag
+from legadilo.reading.services.unread_counters import invalidate_unread_counters
 from legadilo.users.models import User
 
 if TYPE_CHECKING:
@@ -19,6 +22,33 @@ else:
     TypedModelMeta = object
 
 
+@dataclass(frozen=True)
+class ReadingListsContext:
+    """All the reading lists of a user with their tags.
+
+    Load it once per request and use it to find the displayed reading list, build the sidebar and
+    compute unread counters without querying reading lists again.
+    """
+
+    reading_lists: list[ReadingList]
+
+    def get_reading_list(self, reading_list_slug: str | None) -> ReadingList:
+        for reading_list in self.reading_lists:
+            if (reading_list_slug is None and reading_list.is_default) or (
+                reading_list.slug == reading_list_slug
+            ):
+                return reading_list
+
+        raise ReadingList.DoesNotExist
+
+    def get_reading_list_by_id(self, reading_list_id: int) -> ReadingList:
+        for reading_list in self.reading_lists:
+            if reading_list.id == reading_list_id:
+                return reading_list
+
+        raise ReadingList.DoesNotExist
+
+
 class ReadingListManager(models.Manager["ReadingList"]):
     @transaction.atomic()
     def create_default_lists(self, user: User):
@@ -86,9 +116,20 @@ class ReadingListManager(models.Manager["ReadingList"]):
 
     def get_all_for_user(self, user: User) -> list[ReadingList]:
         return list(
-            self.filter(user=user).select_related("user").prefetch_related("reading_list_tags")
+            self
+            .filter(user=user)
+            .select_related("user")
+            .prefetch_related(
+                models.Prefetch(
+                    "reading_list_tags",
+                    queryset=ReadingListTag.objects.select_related("tag"),
+                )
+            )
         )
 
+    def get_context_for_user(self, user: User) -> ReadingListsContext:
+        return ReadingListsContext(reading_lists=self.get_all_for_user(user))
+
     @transaction.atomic()
     def make_default(self, reading_list: ReadingList):
         current_default_reading_list = self.get_reading_list(
@@ -251,10 +292,21 @@ class ReadingList(models.Model):
 
     def save(self, *args, **kwargs):
         self.slug = slugify(self.title)
-        return super().save(*args, **kwargs)
+        super().save(*args, **kwargs)
+        invalidate_unread_counters([self.user_id])
+
+    def get_tag_slugs(self, filter_type: constants.ReadingListTagFilterType) -> list[str]:
+        # Use the prefetched tags of get_all_for_user instead of making a query.
+        return [
+            reading_list_tag.tag.slug
+            for reading_list_tag in self.reading_list_tags.all()
+            if reading_list_tag.filter_type == filter_type
+        ]
 
     def delete(self, *args, **kwargs):
         if self.is_default:
             raise ValidationError("Cannot delete default list")
 
-        return super().delete(*args, **kwargs)
+        deletion_result = super().delete(*args, **kwargs)
+        invalidate_unread_counters([self.user_id])
+        return deletion_result
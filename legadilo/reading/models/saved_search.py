@@ -0,0 +1,239 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import bisect
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from functools import cmp_to_key
+from typing import TYPE_CHECKING, Any, Self
+
+from django.db import connection, models
+from django.utils.translation import gettext_lazy as _
+
+from legadilo.core.utils.time_utils import utcnow
+from legadilo.reading import constants
+
+from ...users.models import User
+from .article import Article, ArticleFullTextSearchQuery, ArticleQuerySet, ArticlesTagsSearch
+
+if TYPE_CHECKING:
+    from django_stubs_ext.db.models import TypedModelMeta
+
+else:
+    TypedModelMeta = object
+
+
+def _get_sort_fields(articles_qs: ArticleQuerySet) -> list[tuple[str, bool]]:
+    """List the (field name, descending) pairs the queryset is ordered by."""
+    ordering = articles_qs.query.order_by or Article._meta.ordering
+    return [(str(field).removeprefix("-"), str(field).startswith("-")) for field in ordering]
+
+
+def _to_sort_key(value: Any) -> Any:
+    # Sort keys are stored as JSON.
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return value
+
+
+def _compare_sort_keys(
+    sort_fields: list[tuple[str, bool]], keys: Sequence[Any], other_keys: Sequence[Any]
+) -> int:
+    for (_field_name, descending), value, other_value in zip(
+        sort_fields, keys, other_keys, strict=True
+    ):
+        if value == other_value:
+            continue
+        if value is None or other_value is None:
+            is_greater = (value is None) == connection.features.nulls_order_largest
+        else:
+            is_greater = value > other_value
+        return -1 if is_greater == descending else 1
+    return 0
+
+
+class SavedSearchQuerySet(models.QuerySet["SavedSearch"]):
+    def for_user(self, user: User) -> Self:
+        return self.filter(user=user)
+
+
+class SavedSearchManager(models.Manager["SavedSearch"]):
+    _hints: dict
+
+    def get_queryset(self) -> SavedSearchQuerySet:
+        return SavedSearchQuerySet(model=self.model, using=self._db, hints=self._hints)
+
+    def create_from_search(
+        self,
+        user: User,
+        title: str,
+        query_string: str,
+        search_query: ArticleFullTextSearchQuery,
+        tags_search: ArticlesTagsSearch,
+    ) -> SavedSearch:
+        saved_search = self.model(
+            user=user,
+            title=title,
+            query_string=query_string,
+            search_query=search_query.model_dump(mode="json"),
+            tags_search={
+                "tag_ids_to_include": sorted(tags_search.tag_ids_to_include),
+                "include_tag_operator": tags_search.include_tag_operator,
+                "tag_ids_to_exclude": sorted(tags_search.tag_ids_to_exclude),
+                "exclude_tag_operator": tags_search.exclude_tag_operator,
+            },
+        )
+        return self.refresh_snapshot(saved_search, full=True)
+
+    def refresh_snapshot(self, saved_search: SavedSearch, *, full: bool = False) -> SavedSearch:
+        """Update the ids of the articles matching the saved search.
+
+        Unless a full refresh is requested or the snapshot is too old, the search is only run again
+        on the articles saved or updated since the last refresh, changes of status and tags
+        included. Those that don't match anymore are removed from the snapshot and the others are
+        inserted at their position in the order of the search with the sort keys stored along the
+        ids. The other articles of the snapshot are left untouched: articles past the
+        SAVED_SEARCH_MAX_ARTICLES cap only come back with a full refresh. Incremental refreshes
+        are done at most once every SAVED_SEARCH_MIN_REFRESH_INTERVAL seconds.
+        """
+        if (
+            full
+            or saved_search.is_snapshot_outdated
+            # Snapshots computed before the sort keys were stored.
+            or len(saved_search.article_sort_keys) != len(saved_search.article_ids)
+        ):
+            return self._compute_snapshot(saved_search)
+
+        if saved_search.refreshed_at > utcnow() - timedelta(
+            seconds=constants.SAVED_SEARCH_MIN_REFRESH_INTERVAL
+        ):
+            return saved_search
+
+        return self._refresh_snapshot_incrementally(saved_search)
+
+    def _compute_snapshot(self, saved_search: SavedSearch) -> SavedSearch:
+        refreshed_at = utcnow()
+        search_qs = self._search(saved_search)
+        entries = self._list_entries(search_qs)[: constants.SAVED_SEARCH_MAX_ARTICLES]
+        saved_search.article_ids = [article_id for article_id, _keys in entries]
+        saved_search.article_sort_keys = [keys for _article_id, keys in entries]
+        saved_search.computed_at = refreshed_at
+        saved_search.refreshed_at = refreshed_at
+        saved_search.save()
+        return saved_search
+
+    def _refresh_snapshot_incrementally(self, saved_search: SavedSearch) -> SavedSearch:
+        refreshed_at = utcnow()
+        updated_article_ids = set(
+            Article.objects
+            .get_queryset()
+            .for_user(saved_search.user)
+            .filter(obj_updated_at__gte=saved_search.refreshed_at)
+            .values_list("id", flat=True)
+        )
+        if not updated_article_ids:
+            return saved_search
+
+        search_qs = self._search(saved_search)
+        sort_fields = _get_sort_fields(search_qs)
+        entries = [
+            (article_id, keys)
+            for article_id, keys in zip(
+                saved_search.article_ids, saved_search.article_sort_keys, strict=True
+            )
+            if article_id not in updated_article_ids
+        ]
+        sort_key = cmp_to_key(
+            lambda entry, other_entry: _compare_sort_keys(sort_fields, entry[1], other_entry[1])
+        )
+        for entry in self._list_entries(search_qs.filter(id__in=updated_article_ids)):
+            bisect.insort(entries, entry, key=sort_key)
+        entries = entries[: constants.SAVED_SEARCH_MAX_ARTICLES]
+
+        saved_search.article_ids = [article_id for article_id, _keys in entries]
+        saved_search.article_sort_keys = [keys for _article_id, keys in entries]
+        saved_search.refreshed_at = refreshed_at
+        saved_search.save(
+            update_fields=["article_ids", "article_sort_keys", "refreshed_at", "updated_at"]
+        )
+        return saved_search
+
+    def _list_entries(self, search_qs: ArticleQuerySet) -> list[tuple[int, list[Any]]]:
+        """List the (id, sort keys) of the articles matching the search, in its order."""
+        field_names = [field_name for field_name, _descending in _get_sort_fields(search_qs)]
+        return [
+            (article_id, [_to_sort_key(value) for value in values])
+            for article_id, *values in search_qs.values_list("id", *field_names)
+        ]
+
+    def _search(self, saved_search: SavedSearch) -> ArticleQuerySet:
+        return Article.objects.search(
+            saved_search.user, saved_search.get_search_query(), saved_search.get_tags_search()
+        )
+
+
+class SavedSearch(models.Model):
+    title = models.CharField(max_length=constants.SAVED_SEARCH_TITLE_MAX_LENGTH)
+    query_string = models.TextField(
+        blank=True, help_text=_("Query string of the search page to edit the search.")
+    )
+    search_query = models.JSONField(
+        help_text=_("Serialized ArticleFullTextSearchQuery to run the search again.")
+    )
+    tags_search = models.JSONField(
+        help_text=_("Serialized ArticlesTagsSearch to run the search again.")
+    )
+    article_ids = models.JSONField(
+        default=list,
+        blank=True,
+        help_text=_("Ids of the articles matching the search, in the order of the search."),
+    )
+    article_sort_keys = models.JSONField(
+        default=list,
+        blank=True,
+        help_text=_(
+            "Values the search is ordered by for each article of article_ids, to insert the "
+            "updated articles at their position."
+        ),
+    )
+    computed_at = models.DateTimeField(
+        help_text=_("When the search was last run on all the articles.")
+    )
+    refreshed_at = models.DateTimeField(
+        help_text=_("When the search was last run on the articles updated since the previous run.")
+    )
+
+    user = models.ForeignKey("users.User", related_name="saved_searches", on_delete=models.CASCADE)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = SavedSearchManager()
+
+    class Meta(TypedModelMeta):
+        ordering = ("title", "id")
+
+    def __str__(self):
+        return f"SavedSearch(id={self.id}, title={self.title})"
+
+    @property
+    def is_snapshot_outdated(self) -> bool:
+        return self.computed_at < utcnow() - timedelta(
+            seconds=constants.SAVED_SEARCH_MAX_SNAPSHOT_AGE
+        )
+
+    def get_search_query(self) -> ArticleFullTextSearchQuery:
+        return ArticleFullTextSearchQuery.model_validate(self.search_query)
+
+    def get_tags_search(self) -> ArticlesTagsSearch:
+        return ArticlesTagsSearch(
+            tag_ids_to_include=frozenset(self.tags_search["tag_ids_to_include"]),
+            include_tag_operator=constants.ReadingListTagOperator(
+                self.tags_search["include_tag_operator"]
+            ),
+            tag_ids_to_exclude=frozenset(self.tags_search["tag_ids_to_exclude"]),
+            exclude_tag_operator=constants.ReadingListTagOperator(
+                self.tags_search["exclude_tag_operator"]
+            ),
+        )
@@ -8,11 +8,13 @@ from typing import TYPE_CHECKING, Self, TypedDict
 
 from django.core.paginator import Paginator
 from django.db import models, transaction
+from django.db.models.functions import Lower
 from slugify import slugify
 
 from legadilo.core import constants as core_constants
 from legadilo.core.utils.types import FormChoices
 from legadilo.reading import constants
+from legadilo.reading.services.unread_counters import invalidate_unread_counters
 from legadilo.users.models import User
 
 if TYPE_CHECKING:
@@ -204,6 +206,10 @@ class Tag(models.Model):
                 "slug", "user_id", name="%(app_label)s_%(class)s_tag_slug_unique_for_user"
             )
         ]
+        indexes = [
+            # Used to search articles by the title of their tags.
+            models.Index("user", Lower("title"), name="%(app_label)s_%(class)s_user_lower_title"),
+        ]
         ordering = ["title", "id"]
 
     def __str__(self):
@@ -213,6 +219,12 @@ class Tag(models.Model):
         self.slug = slugify(self.title)
         return super().save(*args, **kwargs)
 
+    def delete(self, *args, **kwargs):
+        # Deleting a tag can change the articles in the reading lists.
+        deletion_result = super().delete(*args, **kwargs)
+        invalidate_unread_counters([self.user_id])
+        return deletion_result
+
 
 class ArticleTagQuerySet(models.QuerySet["ArticleTag"]):
     def for_articles_and_tags(self, articles: Iterable[Article], tags: Iterable[Tag]) -> Self:
@@ -255,6 +267,26 @@ class ArticleTagManager(models.Manager["ArticleTag"]):
                 if (article.id, tag.id) not in existing_article_tag_urls
             ]
             self.bulk_create(article_tags_to_create)
+            invalidate_unread_counters(
+                article_tag.article.user_id for article_tag in article_tags_to_create
+            )
+
+    def associate_new_articles_with_tags(
+        self, articles_with_tags: Iterable[tuple[Article, Iterable[Tag]]]
+    ):
+        """Associate each article with its own tags.
+
+        The articles must have just been created: their existing tags are not checked.
+        """
+        article_tags_to_create = [
+            self.model(article=article, tag=tag)
+            for article, tags in articles_with_tags
+            for tag in tags
+        ]
+        self.bulk_create(article_tags_to_create)
+        invalidate_unread_counters(
+            article_tag.article.user_id for article_tag in article_tags_to_create
+        )
 
     def dissociate_article_with_tags_not_in_list(self, article: Article, tags: Iterable[Tag]):
         existing_article_tag_slugs = set(article.tags.all().values_list("slug", flat=True))
@@ -263,6 +295,7 @@ class ArticleTagManager(models.Manager["ArticleTag"]):
 
         if article_tag_slugs_to_delete:
             article.article_tags.filter(tag__slug__in=article_tag_slugs_to_delete).delete()
+            invalidate_unread_counters([article.user_id])
 
     def dissociate_articles_with_tags(
         self, all_articles: Sequence[Article] | ArticleQuerySet, tags: Iterable[Tag]
@@ -272,6 +305,7 @@ class ArticleTagManager(models.Manager["ArticleTag"]):
         )
         for page in paginator:
             self.get_queryset().for_articles_and_tags(page.object_list, tags).delete()
+            invalidate_unread_counters(article.user_id for article in page.object_list)
 
 
 class ArticleTag(models.Model):
@@ -294,6 +328,64 @@ class ArticleTag(models.Model):
         return f"ArticleTag(article={self.article}, tag={self.tag})"
 
 
+def normalize_external_tag(tag: str) -> str:
+    return tag.strip().lower()
+
+
+class ArticleExternalTagManager(models.Manager["ArticleExternalTag"]):
+    _hints: dict
+
+    def create_for_articles(self, articles: Iterable[Article]):
+        self.bulk_create([
+            self.model(article=article, user_id=article.user_id, lower_title=lower_title)
+            for article in articles
+            for lower_title in dict.fromkeys(
+                normalize_external_tag(tag) for tag in article.external_tags
+            )
+            if lower_title
+        ])
+
+    def update_for_articles(self, articles: Iterable[Article]):
+        """Replace the external tags of the articles with the content of their external_tags.
+
+        Must be called in a transaction.
+        """
+        articles = list(articles)
+        if not articles:
+            return
+
+        self.get_queryset().filter(article__in=articles).delete()
+        self.create_for_articles(articles)
+
+
+class ArticleExternalTag(models.Model):
+    """Normalized copy of Article.external_tags to filter articles on them with an index."""
+
+    article = models.ForeignKey(
+        "reading.Article", related_name="article_external_tags", on_delete=models.CASCADE
+    )
+    user = models.ForeignKey(
+        "users.User", related_name="article_external_tags", on_delete=models.CASCADE
+    )
+    lower_title = models.TextField()
+
+    objects = ArticleExternalTagManager()
+
+    class Meta(TypedModelMeta):
+        constraints = [
+            models.UniqueConstraint(
+                "article", "lower_title", name="%(app_label)s_%(class)s_unique_per_article"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["user", "lower_title"], name="reading_ext_tag_user_title"),
+        ]
+        ordering = ["article_id", "lower_title"]
+
+    def __str__(self):
+        return f"ArticleExternalTag(article={self.article}, lower_title={self.lower_title})"
+
+
 class ReadingListTagQuerySet(models.QuerySet["ReadingListTag"]):
     def for_reading_list(self, filter_type: constants.ReadingListTagFilterType):
         return (
@@ -335,6 +427,7 @@ class ReadingListTagManager(models.Manager["ReadingListTag"]):
             update_fields=["filter_type"],
             unique_fields=["reading_list", "tag"],
         )
+        invalidate_unread_counters([reading_list.user_id])
 
 
 class ReadingListTag(models.Model):
@@ -0,0 +1,35 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import hashlib
+from typing import TYPE_CHECKING
+
+from django.core.cache import cache
+
+from legadilo.reading import constants
+
+if TYPE_CHECKING:
+    from legadilo.reading.models.article import ArticleAutocompleteChoice
+
+
+def _get_cache_key(user_id: int, query: str) -> str:
+    normalized_query = " ".join(query.lower().split())
+    query_hash = hashlib.sha256(normalized_query.encode()).hexdigest()
+    return f"reading:articles_autocomplete:{user_id}:{query_hash}"
+
+
+def get_cached_autocomplete_choices(
+    user_id: int, query: str
+) -> list[ArticleAutocompleteChoice] | None:
+    return cache.get(_get_cache_key(user_id, query))
+
+
+def set_cached_autocomplete_choices(
+    user_id: int, query: str, choices: list[ArticleAutocompleteChoice]
+):
+    cache.set(
+        _get_cache_key(user_id, query),
+        choices,
+        timeout=constants.ARTICLES_AUTOCOMPLETE_CACHE_TIMEOUT,
+    )
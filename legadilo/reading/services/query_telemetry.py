@@ -0,0 +1,165 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Opt-in telemetry of the queries used to list articles.
+
+Enable it with the QUERY_TELEMETRY_ENABLED setting. Queries are grouped by name and by the shape
+of their filters: which filters are used, but not their values. Stats are kept in the cache and
+can be displayed with the query_telemetry_stats command.
+"""
+
+import dataclasses
+import logging
+import operator
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from enum import Enum
+from typing import Any, TypedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, connection, transaction
+
+from legadilo.reading import constants
+
+logger = logging.getLogger(__name__)
+
+_STATS_CACHE_KEY = "reading:query_telemetry:stats"
+
+
+class QueryTelemetryStats(TypedDict):
+    name: str
+    shape: str
+    nb_calls: int
+    nb_slow_calls: int
+    nb_rows: int
+    total_duration: float
+    max_duration: float
+
+
+@dataclasses.dataclass
+class QueryTelemetryRecord:
+    name: str
+    shape: str
+    nb_rows: int = 0
+    executed_queries: list[tuple[str, Any, float]] = dataclasses.field(default_factory=list)
+
+
+def get_filter_shape(*filters: Any) -> str:
+    """Describe which filters are used without their values.
+
+    Accept pydantic models and dataclasses. Only the values of enums are kept: they change the
+    query itself. Other values are replaced by a placeholder.
+    """
+    parts = []
+    for filter_ in filters:
+        if filter_ is None:
+            continue
+
+        if dataclasses.is_dataclass(filter_):
+            defaults = {field.name: field.default for field in dataclasses.fields(filter_)}
+            values = dataclasses.asdict(filter_)
+        else:
+            defaults = {name: field.default for name, field in type(filter_).model_fields.items()}
+            values = filter_.model_dump()
+
+        for name, value in values.items():
+            # Aliases only name the annotations of the query: they don't change its shape.
+            if value == defaults[name] or name.endswith("_alias"):
+                continue
+
+            normalized_value = value.value if isinstance(value, Enum) else "?"
+            parts.append(f"{name}={normalized_value}")
+
+    return ",".join(sorted(parts)) or "-"
+
+
+@contextmanager
+def record_queries(name: str, shape: str) -> Generator[QueryTelemetryRecord]:
+    """Record the duration of the queries executed in the block.
+
+    The caller is expected to fill the number of rows of the record. Queries slower than the
+    QUERY_TELEMETRY_SLOW_QUERY_THRESHOLD setting are logged with their plan.
+    """
+    record = QueryTelemetryRecord(name=name, shape=shape)
+    if not settings.QUERY_TELEMETRY_ENABLED:
+        yield record
+        return
+
+    def execute_wrapper(execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            record.executed_queries.append((sql, params, time.perf_counter() - start))
+
+    start = time.perf_counter()
+    with connection.execute_wrapper(execute_wrapper):
+        yield record
+    duration = time.perf_counter() - start
+
+    is_slow = duration * 1000 >= settings.QUERY_TELEMETRY_SLOW_QUERY_THRESHOLD
+    if is_slow:
+        _log_slow_queries(record, duration)
+    _update_stats(record, duration, is_slow=is_slow)
+
+
+def _log_slow_queries(record: QueryTelemetryRecord, duration: float):
+    if not record.executed_queries:
+        return
+
+    sql, params, query_duration = max(record.executed_queries, key=operator.itemgetter(2))
+    try:
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"{connection.ops.explain_query_prefix()} {sql}", params)
+            plan = "\n".join(str(row[-1]) for row in cursor.fetchall())
+    except DatabaseError:
+        logger.exception("Failed to explain slow query %s", sql)
+        plan = ""
+
+    logger.warning(
+        "Slow %s query (%s) took %.3fs for %s rows. Its slowest SQL query took %.3fs:\n%s\n%s",
+        record.name,
+        record.shape,
+        duration,
+        record.nb_rows,
+        query_duration,
+        sql,
+        plan,
+    )
+
+
+def _update_stats(record: QueryTelemetryRecord, duration: float, *, is_slow: bool):
+    # Concurrent updates may be lost: this is fine for statistics.
+    all_stats = get_stats()
+    key = f"{record.name}|{record.shape}"
+    stats = all_stats.get(
+        key,
+        QueryTelemetryStats(
+            name=record.name,
+            shape=record.shape,
+            nb_calls=0,
+            nb_slow_calls=0,
+            nb_rows=0,
+            total_duration=0,
+            max_duration=0,
+        ),
+    )
+    stats["nb_calls"] += 1
+    stats["nb_slow_calls"] += int(is_slow)
+    stats["nb_rows"] += record.nb_rows
+    stats["total_duration"] += duration
+    stats["max_duration"] = max(stats["max_duration"], duration)
+    all_stats[key] = stats
+    cache.set(_STATS_CACHE_KEY, all_stats, timeout=constants.QUERY_TELEMETRY_STATS_CACHE_TIMEOUT)
+
+
+def get_stats() -> dict[str, QueryTelemetryStats]:
+    stats = cache.get(_STATS_CACHE_KEY)
+    return stats if isinstance(stats, dict) else {}
+
+
+def reset_stats():
+    cache.delete(_STATS_CACHE_KEY)
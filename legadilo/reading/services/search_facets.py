@@ -0,0 +1,55 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import dataclasses
+import hashlib
+import json
+from typing import TYPE_CHECKING
+
+from django.core.cache import cache
+
+from legadilo.reading import constants
+
+if TYPE_CHECKING:
+    from legadilo.reading.models.article import (
+        ArticleFullTextSearchQuery,
+        ArticleSearchFacets,
+        ArticlesTagsSearch,
+    )
+
+
+def _serialize_set(value: frozenset | set) -> list:
+    # Sets are sorted so equal queries always share the same key.
+    return sorted(value)
+
+
+def _get_cache_key(
+    user_id: int, search_query: ArticleFullTextSearchQuery, tags_search: ArticlesTagsSearch
+) -> str:
+    serialized_query = json.dumps(
+        {"query": search_query.model_dump(), "tags_search": dataclasses.asdict(tags_search)},
+        sort_keys=True,
+        default=_serialize_set,
+    )
+    query_hash = hashlib.sha256(serialized_query.encode()).hexdigest()
+    return f"reading:search_facets:{user_id}:{query_hash}"
+
+
+def get_cached_search_facets(
+    user_id: int, search_query: ArticleFullTextSearchQuery, tags_search: ArticlesTagsSearch
+) -> ArticleSearchFacets | None:
+    return cache.get(_get_cache_key(user_id, search_query, tags_search))
+
+
+def set_cached_search_facets(
+    user_id: int,
+    search_query: ArticleFullTextSearchQuery,
+    tags_search: ArticlesTagsSearch,
+    facets: ArticleSearchFacets,
+):
+    cache.set(
+        _get_cache_key(user_id, search_query, tags_search),
+        facets,
+        timeout=constants.SEARCH_FACETS_CACHE_TIMEOUT,
+    )
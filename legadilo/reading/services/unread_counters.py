@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from collections.abc import Iterable
+
+from django.core.cache import cache
+from django.db import transaction
+
+from legadilo.reading import constants
+
+
+def _get_cache_key(user_id: int) -> str:
+    return f"reading:unread_counters:{user_id}"
+
+
+def get_cached_unread_counters(user_id: int, reading_list_slugs: Iterable[str]) -> dict[str, int]:
+    """Get the cached unread counters of a user.
+
+    Only return them if they were computed for exactly the supplied reading lists. Otherwise,
+    return an empty dict to signal the counters must be computed again.
+    """
+    cached_counters = cache.get(_get_cache_key(user_id))
+    if not isinstance(cached_counters, dict) or set(cached_counters.keys()) != set(
+        reading_list_slugs
+    ):
+        return {}
+
+    return cached_counters
+
+
+def get_all_cached_unread_counters(user_ids: Iterable[int]) -> dict[int, dict[str, int]]:
+    user_ids = list(user_ids)
+    cached_counters = cache.get_many([_get_cache_key(user_id) for user_id in user_ids])
+    return {
+        user_id: cached_counters[_get_cache_key(user_id)]
+        for user_id in user_ids
+        if _get_cache_key(user_id) in cached_counters
+    }
+
+
+def set_cached_unread_counters(user_id: int, counters: dict[str, int]):
+    cache.set(
+        _get_cache_key(user_id),
+        counters,
+        timeout=constants.UNREAD_COUNTERS_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_unread_counters(user_ids: Iterable[int | None]):
+    """Drop the cached counters of the given users.
+
+    Counters are dropped immediately and once again when the current transaction is committed. This
+    prevents a concurrent request from caching counters computed before the commit.
+    """
+    cache_keys = [_get_cache_key(user_id) for user_id in set(user_ids) if user_id is not None]
+    if not cache_keys:
+        return
+
+    cache.delete_many(cache_keys)
+    transaction.on_commit(lambda: cache.delete_many(cache_keys))
@@ -2,9 +2,13 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
+import html
+import re
+
 from django.template.defaultfilters import stringfilter
 from django.template.defaulttags import register
 from django.urls import reverse
+from django.utils.html import escape, strip_tags
 from django.utils.safestring import mark_safe
 from markdown_it import MarkdownIt
 
@@ -12,6 +16,12 @@ from legadilo.core.utils.security import sanitize_keep_safe_tags
 from legadilo.reading import constants
 from legadilo.reading.models import Article, ArticlesGroup, ReadingList
 
+_PARTIAL_HTML_TAG_RE = re.compile(r"<[^>]*$")
+_SEARCH_SNIPPET_MATCH_RE = re.compile(
+    f"{constants.SEARCH_SNIPPET_START_MARKER}([^{constants.SEARCH_SNIPPET_START_MARKER}"
+    f"{constants.SEARCH_SNIPPET_STOP_MARKER}]*){constants.SEARCH_SNIPPET_STOP_MARKER}"
+)
+
 
 @register.filter
 def read_action_url(article: Article) -> str:
@@ -113,6 +123,20 @@ def markdown(value: str) -> str:
     return mark_safe(cleaned_value)  # noqa: S308 suspicious-mark-safe-usage
 
 
+@register.filter
+@stringfilter
+def search_snippet(value: str) -> str:
+    # The snippet is cut from the HTML content: it may end with a partial tag and markers may have
+    # been removed with the tags they were in.
+    cleaned_value = html.unescape(_PARTIAL_HTML_TAG_RE.sub("", strip_tags(value)))
+    cleaned_value = escape(" ".join(cleaned_value.split()))
+    cleaned_value = _SEARCH_SNIPPET_MATCH_RE.sub(r"<mark>\1</mark>", cleaned_value)
+    cleaned_value = cleaned_value.replace(constants.SEARCH_SNIPPET_START_MARKER, "").replace(
+        constants.SEARCH_SNIPPET_STOP_MARKER, ""
+    )
+    return mark_safe(cleaned_value)  # noqa: S308 suspicious-mark-safe-usage
+
+
 @register.filter
 def open_original_with_link(article: Article) -> bool:
     return not article.content or bool(
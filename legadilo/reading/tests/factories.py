@@ -9,7 +9,15 @@ from factory.django import DjangoModelFactory
 
 from legadilo.users.tests.factories import UserFactory
 
-from ..models import Article, ArticleFetchError, ArticlesGroup, Comment, ReadingList, Tag
+from ..models import (
+    Article,
+    ArticleExternalTag,
+    ArticleFetchError,
+    ArticlesGroup,
+    Comment,
+    ReadingList,
+    Tag,
+)
 from ..services.article_fetching import ArticleData, FetchArticleResult
 
 
@@ -28,8 +36,14 @@ class ArticleFactory(DjangoModelFactory):
 
     user = factory.SubFactory(UserFactory)
 
+    @factory.post_generation
+    def article_external_tags(self, create: bool, extracted, **kwargs):
+        if create and self.external_tags:
+            ArticleExternalTag.objects.create_for_articles([self])
+
     class Meta:
         model = Article
+        skip_postgeneration_save = True
 
 
 class ReadingListFactory(DjangoModelFactory):
@@ -191,7 +191,7 @@ class TestCreateArticleView:
     ):
         mocked_fetch_article_data = mocker.patch("legadilo.reading.api.fetch_article_data")
 
-        with django_assert_num_queries(18):
+        with django_assert_num_queries(19):
             response = logged_in_sync_client.post(
                 self.url,
                 {
@@ -526,14 +526,14 @@ class TestUpdateArticleView:
         assert response.status_code == HTTPStatus.NOT_FOUND
 
     def test_no_update(self, logged_in_sync_client, django_assert_num_queries, snapshot):
-        with django_assert_num_queries(11):
+        with django_assert_num_queries(12):
             response = logged_in_sync_client.patch(self.url, {}, content_type="application/json")
 
         assert response.status_code == HTTPStatus.OK
         snapshot.assert_match(serialize_for_snapshot(response.json()), "article.json")
 
     def test_update(self, logged_in_sync_client, django_assert_num_queries, snapshot):
-        with django_assert_num_queries(12):
+        with django_assert_num_queries(13):
             response = logged_in_sync_client.patch(
                 self.url,
                 {
@@ -555,7 +555,7 @@ class TestUpdateArticleView:
         tag_to_delete = TagFactory(user=user, title="Tag to delete")
         self.article.tags.add(existing_tag, tag_to_delete)
 
-        with django_assert_num_queries(19):
+        with django_assert_num_queries(20):
             response = logged_in_sync_client.patch(
                 self.url,
                 {
@@ -574,8 +574,8 @@ class TestUpdateArticleView:
     @pytest.mark.parametrize(
         ("group_id_attr", "nb_requests"),
         [
-            pytest.param("id", 23, id="group_id"),
-            pytest.param("slug", 25, id="group_slug"),
+            pytest.param("id", 24, id="group_id"),
+            pytest.param("slug", 26, id="group_slug"),
         ],
     )
     def test_update_with_group(
@@ -612,7 +612,7 @@ class TestUpdateArticleView:
         self.article.group = group
         self.article.save()
 
-        with django_assert_num_queries(15):
+        with django_assert_num_queries(16):
             response = logged_in_sync_client.patch(
                 self.url,
                 {
@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from legadilo.reading.models import Article, ReadingList
+from legadilo.reading.services.unread_counters import (
+    get_cached_unread_counters,
+    set_cached_unread_counters,
+)
+from legadilo.reading.tests.factories import ArticleFactory, ReadingListFactory
+
+
+@pytest.mark.django_db
+class TestCheckUnreadCountersCommand:
+    def test_no_cached_counters(self, user):
+        ReadingListFactory(user=user)
+
+        call_command("check_unread_counters")
+
+    def test_consistent_counters(self, user):
+        ReadingListFactory(user=user)
+        ArticleFactory(user=user)
+        Article.objects.get_unread_counters_of_reading_lists(
+            user, ReadingList.objects.get_all_for_user(user)
+        )
+
+        call_command("check_unread_counters")
+
+    def test_inconsistent_counters(self, user):
+        reading_list = ReadingListFactory(user=user)
+        ArticleFactory(user=user)
+        set_cached_unread_counters(user.id, {reading_list.slug: 10})
+
+        with pytest.raises(CommandError):
+            call_command("check_unread_counters")
+
+        assert get_cached_unread_counters(user.id, [reading_list.slug]) == {reading_list.slug: 10}
+
+    def test_fix_inconsistent_counters(self, user):
+        reading_list = ReadingListFactory(user=user)
+        ArticleFactory(user=user)
+        set_cached_unread_counters(user.id, {reading_list.slug: 10})
+
+        call_command("check_unread_counters", fix=True)
+
+        assert get_cached_unread_counters(user.id, [reading_list.slug]) == {reading_list.slug: 1}
@@ -0,0 +1,35 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from legadilo.reading.models import Article
+from legadilo.reading.models.article import ArticleFullTextSearchQuery
+from legadilo.reading.services.query_telemetry import get_stats
+from legadilo.reading.tests.factories import ArticleFactory
+
+
+@pytest.mark.django_db
+class TestQueryTelemetryStatsCommand:
+    def test_no_stats(self):
+        stdout = StringIO()
+
+        call_command("query_telemetry_stats", stdout=stdout)
+
+        assert stdout.getvalue() == "No stats recorded.\n"
+
+    def test_display_and_reset(self, user, settings):
+        settings.QUERY_TELEMETRY_ENABLED = True
+        ArticleFactory(user=user, title="Claudius")
+        list(Article.objects.search(user, ArticleFullTextSearchQuery(q="Claudius")))
+        stdout = StringIO()
+
+        call_command("query_telemetry_stats", "--reset", stdout=stdout)
+
+        assert stdout.getvalue().startswith("search (q=?): 1 calls, 0 slow, avg ")
+        assert stdout.getvalue().endswith(", avg 1.0 rows\n")
+        assert get_stats() == {}
@@ -11,20 +11,27 @@ import pytest
 import time_machine
 from django.db import connection, models
 
+from legadilo.core import constants as core_constants
 from legadilo.core.utils.testing import serialize_for_snapshot
 from legadilo.core.utils.time_utils import utcdt, utcnow
+from legadilo.core.utils.urls import hash_url
 from legadilo.core.utils.validators import TableOfContentTopItem
 from legadilo.feeds.tests.factories import FeedArticleFactory, FeedCategoryFactory, FeedFactory
 from legadilo.reading import constants
 from legadilo.reading.models import (
     Article,
     ArticleFetchError,
+    ArticleTag,
+    DeletedArticle,
     ReadingList,
     ReadingListTag,
 )
 from legadilo.reading.models.article import (
     ArticleFullTextSearchQuery,
+    ArticlesCursor,
+    ArticlesTagsSearch,
     _build_basic_filters_from_reading_list,
+    get_search_config,
 )
 from legadilo.reading.services.article_fetching import ArticleData
 from legadilo.reading.tests.factories import (
@@ -43,12 +50,12 @@ from legadilo.reading.tests.factories import (
     [
         pytest.param(
             {"read_status": constants.ReadStatus.ONLY_UNREAD},
-            models.Q(is_read=False),
+            models.Q(is_read__in=[False]),
             id="unread_only",
         ),
         pytest.param(
             {"read_status": constants.ReadStatus.ONLY_READ},
-            models.Q(is_read=True),
+            models.Q(is_read__in=[True]),
             id="read_only",
         ),
         pytest.param(
@@ -124,7 +131,7 @@ from legadilo.reading.tests.factories import (
                 "read_status": constants.ReadStatus.ONLY_UNREAD,
                 "favorite_status": constants.FavoriteStatus.ONLY_FAVORITE,
             },
-            models.Q(is_read=False) & models.Q(is_favorite=True),
+            models.Q(is_read__in=[False]) & models.Q(is_favorite=True),
             id="simple-combination",
         ),
         pytest.param(
@@ -136,7 +143,7 @@ from legadilo.reading.tests.factories import (
                 "articles_reading_time_operator": constants.ArticlesReadingTimeOperator.MORE_THAN,
                 "articles_reading_time": 5,
             },
-            models.Q(is_read=False)
+            models.Q(is_read__in=[False])
             & models.Q(is_favorite=True)
             & models.Q(
                 published_at__gt=datetime(2024, 2, 19, 21, 8, 0, tzinfo=UTC),
@@ -157,6 +164,23 @@ def test_build_filters_from_reading_list(
     assert filters == expected_filter
 
 
+@pytest.mark.parametrize(
+    ("config_from_language", "language", "expected_search_config"),
+    [
+        pytest.param(False, "fr", "english", id="disabled"),
+        pytest.param(True, "fr", "french", id="language"),
+        pytest.param(True, "pt-BR", "portuguese", id="language-with-region"),
+        pytest.param(True, "NL_be", "dutch", id="language-with-underscore"),
+        pytest.param(True, "", "english", id="no-language"),
+        pytest.param(True, "ja", "english", id="unsupported-language"),
+    ],
+)
+def test_get_search_config(settings, config_from_language, language, expected_search_config):
+    settings.ARTICLE_SEARCH_CONFIG_FROM_LANGUAGE = config_from_language
+
+    assert get_search_config(language) == expected_search_config
+
+
 @pytest.mark.django_db
 class TestArticleQuerySet:
     def test_for_user(self, user, other_user):
@@ -421,6 +445,39 @@ class TestArticleQuerySet:
 
         assert articles == [article_linked_to_no_tag, article_linked_to_one_tag]
 
+    @pytest.mark.parametrize("include_tag_operator", constants.ReadingListTagOperator.values)
+    @pytest.mark.parametrize("exclude_tag_operator", constants.ReadingListTagOperator.values)
+    def test_filter_by_tag_ids_strategies_give_same_results(
+        self, user, include_tag_operator, exclude_tag_operator
+    ):
+        tag1_to_include = TagFactory(user=user)
+        tag2_to_include = TagFactory(user=user)
+        tag1_to_exclude = TagFactory(user=user)
+        tag2_to_exclude = TagFactory(user=user)
+        all_tags = [tag1_to_include, tag2_to_include, tag1_to_exclude, tag2_to_exclude]
+        for index in range(2 ** len(all_tags)):
+            article = ArticleFactory(user=user)
+            article.tags.add(*[tag for bit, tag in enumerate(all_tags) if index & (1 << bit)])
+        tags_search_kwargs = {
+            "tag_ids_to_include": frozenset([tag1_to_include.id, tag2_to_include.id]),
+            "include_tag_operator": include_tag_operator,
+            "tag_ids_to_exclude": frozenset([tag1_to_exclude.id, tag2_to_exclude.id]),
+            "exclude_tag_operator": exclude_tag_operator,
+        }
+
+        articles_with_count = Article.objects.get_queryset().filter_by_tag_ids(
+            ArticlesTagsSearch(**tags_search_kwargs, strategy=constants.TagFilteringStrategy.COUNT)
+        )
+        articles_with_exists = Article.objects.get_queryset().filter_by_tag_ids(
+            ArticlesTagsSearch(**tags_search_kwargs, strategy=constants.TagFilteringStrategy.EXISTS)
+        )
+
+        assert len(articles_with_exists) > 0
+        assert sorted(article.id for article in articles_with_count) == sorted(
+            article.id for article in articles_with_exists
+        )
+        assert "GROUP BY" not in str(articles_with_exists.query)
+
     def test_for_reading_list_with_tags(self, user, django_assert_num_queries):
         reading_list = ReadingListFactory(
             user=user,
@@ -545,6 +602,32 @@ class TestArticleQuerySet:
         for attr_name, attr_value in attrs.items():
             assert getattr(article, attr_name) == attr_value
 
+    def test_update_articles_from_action_marks_articles_as_updated(self):
+        with time_machine.travel("2024-04-19 12:00:00", tick=False):
+            article = ArticleFactory(is_favorite=False)
+
+        with time_machine.travel("2024-04-20 12:00:00", tick=False):
+            Article.objects.get_queryset().filter(id=article.id).update_articles_from_action(
+                constants.UpdateArticleActions.MARK_AS_FAVORITE
+            )
+
+        article.refresh_from_db()
+        assert article.obj_updated_at == utcdt(2024, 4, 20, 12)
+
+    def test_delete_records_deleted_articles(self, user, other_user):
+        article = ArticleFactory(user=user, url="https://example.com/article/1")
+        other_article = ArticleFactory(user=other_user, url="https://example.com/article/2")
+        other_article_id = other_article.id
+        ArticleFactory(user=user)
+
+        Article.objects.get_queryset().filter(id=article.id).delete()
+        other_article.delete()
+
+        assert list(DeletedArticle.objects.values_list("article_id", "user_id", "url")) == [
+            (article.id, user.id, "https://example.com/article/1"),
+            (other_article_id, other_user.id, "https://example.com/article/2"),
+        ]
+
     def test_default_order_by(self):
         article_only_published_at = ArticleFactory(
             title="Only published at", published_at=utcdt(2024, 5, 28), updated_at=None
@@ -577,6 +660,50 @@ class TestArticleQuerySet:
             article_no_dates,
         ]
 
+    @pytest.mark.parametrize("order_direction", constants.ReadingListOrderDirection.values)
+    def test_after_cursor(self, user, order_direction):
+        ArticleFactory(user=user, published_at=utcdt(2024, 5, 28), updated_at=None)
+        ArticleFactory(user=user, published_at=None, updated_at=utcdt(2024, 5, 31))
+        ArticleFactory(user=user, published_at=utcdt(2024, 5, 29), updated_at=utcdt(2024, 5, 30))
+        ArticleFactory(user=user, published_at=utcdt(2024, 5, 30), updated_at=None)
+        ArticleFactory(user=user, published_at=None, updated_at=None)
+        ArticleFactory(user=user, published_at=None, updated_at=None)
+        articles_qs = Article.objects.get_queryset().default_order_by(
+            constants.ReadingListOrderDirection(order_direction)
+        )
+        all_articles = list(articles_qs)
+
+        for index, article in enumerate(all_articles):
+            cursor = ArticlesCursor.from_article(article)
+
+            articles_after_cursor = list(
+                articles_qs.after_cursor(
+                    cursor, constants.ReadingListOrderDirection(order_direction)
+                )
+            )
+
+            assert articles_after_cursor == all_articles[index + 1 :]
+
+    def test_default_order_by_uses_sort_date_index(self, user):
+        ArticleFactory.create_batch(5, user=user, read_at=None)
+        articles_qs = (
+            Article.objects
+            .get_queryset()
+            .for_user(user)
+            .only_unread()
+            .default_order_by()[: constants.MAX_OBJECTS_PER_PAGE]
+        )
+
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                # Tables are too small for the planner to pick an index otherwise.
+                cursor.execute("SET LOCAL enable_seqscan = off")
+            plan = articles_qs.explain()
+
+        assert "reading_article_sort_date_idx" in plan
+        assert "TEMP B-TREE" not in plan
+        assert "Sort" not in plan
+
     def test_for_cleanup(self, user, other_user):
         ArticleFactory(
             title="Unread not linked to a feed (to keep)",
@@ -705,28 +832,147 @@ class TestArticleQuerySet:
             search_in_content,
             search_in_main_source_title,
         ]
-        if connection.vendor == "postgresql":
-            assert searched_articles == expected_searched_articles
-        else:
-            assert {article.id for article in searched_articles} == {
-                article.id for article in expected_searched_articles
-            }
+        assert searched_articles == expected_searched_articles
+
+    @pytest.mark.parametrize(
+        ("search_type", "q", "expected_titles"),
+        [
+            pytest.param(
+                constants.ArticleSearchType.PLAIN,
+                "claudius emperor",
+                ["Claudius the emperor", "The emperor Claudius"],
+                id="plain",
+            ),
+            pytest.param(
+                constants.ArticleSearchType.PHRASE,
+                "the emperor Claudius",
+                ["The emperor Claudius"],
+                id="phrase",
+            ),
+            pytest.param(
+                constants.ArticleSearchType.PLAIN,
+                'claudius" OR "nero',
+                [],
+                id="quotes-are-not-query-syntax",
+            ),
+            pytest.param(
+                constants.ArticleSearchType.PLAIN, "NEAR(claudius*", [], id="operators-are-escaped"
+            ),
+            pytest.param(constants.ArticleSearchType.PLAIN, "  ", [], id="blank"),
+        ],
+    )
+    def test_for_search_query_syntax(self, user, search_type, q, expected_titles):
+        ArticleFactory(user=user, title="Claudius the emperor")
+        ArticleFactory(user=user, title="The emperor Claudius")
+        ArticleFactory(user=user, title="Nero")
+
+        searched_articles = (
+            Article.objects
+            .get_queryset()
+            .for_search(ArticleFullTextSearchQuery(q=q, search_type=search_type))
+            .order_by("title")
+        )
+
+        assert [article.title for article in searched_articles] == expected_titles
+
+    @pytest.mark.parametrize(
+        ("prefix", "expected_titles"),
+        [
+            pytest.param("clau", ["Claudius the emperor", "The emperor Claudius"], id="one-word"),
+            pytest.param("emp clau", ["Claudius the emperor", "The emperor Claudius"], id="words"),
+            pytest.param("Claudius", ["Claudius the emperor", "The emperor Claudius"], id="word"),
+            pytest.param("ner", [], id="only-in-content"),
+            pytest.param(
+                'clau"*', ["Claudius the emperor", "The emperor Claudius"], id="quotes-are-escaped"
+            ),
+            pytest.param("NEAR(clau", [], id="operators-are-escaped"),
+            pytest.param("  ", [], id="blank"),
+        ],
+    )
+    def test_for_prefix_search(self, user, prefix, expected_titles):
+        ArticleFactory(user=user, title="Claudius the emperor")
+        ArticleFactory(user=user, title="The emperor Claudius")
+        ArticleFactory(user=user, title="Other", content="Nero")
+
+        searched_articles = (
+            Article.objects.get_queryset().for_prefix_search(prefix).order_by("title")
+        )
+
+        assert [article.title for article in searched_articles] == expected_titles
+
+    @pytest.mark.skipif(connection.vendor != "sqlite", reason="SQLite specific test")
+    def test_full_text_search_index_is_kept_in_sync(self, user):
+        article = ArticleFactory(user=user, title="Claudius")
+        article_to_delete = ArticleFactory(user=user, title="Claudius")
+        search_query = ArticleFullTextSearchQuery(q="Nero")
 
-    def test_for_tags_search(self, user):
-        ArticleFactory(title="Claudius", user=user)
-        article = ArticleFactory(title="Correctly tagged", user=user)
+        article.title = "Nero"
+        article.save()
+        Article.objects.filter(id=article_to_delete.id).update(summary="Nero")
+        article_to_delete.delete()
+
+        assert list(Article.objects.get_queryset().for_search(search_query)) == [article]
+        assert not Article.objects.get_queryset().for_search(
+            ArticleFullTextSearchQuery(q="Claudius")
+        )
+        with connection.cursor() as cursor:
+            # Check the integrity of the index against the content of the articles.
+            cursor.execute(
+                "INSERT INTO reading_article_fts(reading_article_fts, rank) "
+                "VALUES ('integrity-check', 1)"
+            )
+
+    @pytest.mark.skipif(connection.vendor != "postgresql", reason="PostgreSQL specific test")
+    def test_search_vector_is_kept_in_sync(self, user):
+        article = ArticleFactory(user=user, title="Claudius")
+        ArticleFactory(user=user, title="Claudius")
+        search_query = ArticleFullTextSearchQuery(q="Nero")
+
+        article.title = "Nero"
+        article.save()
+
+        assert list(Article.objects.get_queryset().for_search(search_query)) == [article]
+        assert (
+            Article.objects
+            .get_queryset()
+            .for_search(ArticleFullTextSearchQuery(q="Claudius"))
+            .count()
+            == 1
+        )
+
+    @pytest.mark.skipif(connection.vendor != "postgresql", reason="PostgreSQL specific test")
+    def test_for_search_with_search_config_from_language(self, user, settings):
+        settings.ARTICLE_SEARCH_CONFIG_FROM_LANGUAGE = True
+        french_article = ArticleFactory(user=user, title="Mangeons", search_config="french")
+        ArticleFactory(user=user, title="Mangeons")
+
+        searched_articles = list(
+            Article.objects.get_queryset().for_search(ArticleFullTextSearchQuery(q="manger"))
+        )
+
+        assert searched_articles == [french_article]
+
+    @pytest.mark.skipif(connection.vendor != "postgresql", reason="PostgreSQL specific test")
+    def test_for_search_in_content_or_tags(self, user, other_user):
+        ArticleFactory(title="Does not match search", user=user)
+        search_in_title = ArticleFactory(title="Claudius", user=user)
+        tagged_article = ArticleFactory(title="Correctly tagged", user=user)
         tag_that_matches = TagFactory(title="Claudius", user=user)
-        article.tags.add(tag_that_matches)
+        tagged_article.tags.add(tag_that_matches)
+        search_in_title.tags.add(tag_that_matches)
         other_article = ArticleFactory(title="Other article", user=user)
-        other_tag = TagFactory(title="Other tag", user=user)
-        other_article.tags.add(other_tag)
-        article.tags.add(other_tag)
+        other_article.tags.add(TagFactory(title="Other tag", user=user))
+        article_with_tag_of_other_user = ArticleFactory(title="Tagged by other user", user=user)
+        article_with_tag_of_other_user.tags.add(TagFactory(title="Claudius", user=other_user))
 
         searched_articles = list(
-            Article.objects.get_queryset().for_tags_search(ArticleFullTextSearchQuery(q="claudius"))
+            Article.objects
+            .get_queryset()
+            .for_search_in_content_or_tags(user, ArticleFullTextSearchQuery(q="claudius"))
+            .order_by("-rank", "id")
         )
 
-        assert searched_articles == [article]
+        assert searched_articles == [search_in_title, tagged_article]
 
     def test_for_url_search(self, user):
         searched_url = "https://example.com/articles/1"
@@ -743,6 +989,32 @@ class TestArticleQuerySet:
 
 @pytest.mark.django_db
 class TestArticleManager:
+    def test_get_by_urls(self, user, other_user, django_assert_num_queries, monkeypatch):
+        monkeypatch.setattr(core_constants, "PER_PAGE_FOR_BULK_OPERATIONS", 2)
+        article1 = ArticleFactory(user=user, url="https://example.com/articles/1")
+        article2 = ArticleFactory(user=user, url="https://example.com/articles/2")
+        article3 = ArticleFactory(user=user, url="https://example.com/articles/3")
+        ArticleFactory(user=other_user, url="https://example.com/articles/1")
+
+        with django_assert_num_queries(2):
+            articles_by_url = Article.objects.get_by_urls(
+                user,
+                [
+                    article1.url,
+                    article2.url,
+                    article1.url,
+                    "https://example.com/articles/unknown",
+                    article3.url,
+                ],
+            )
+
+        assert articles_by_url == {
+            article1.url: article1,
+            article2.url: article2,
+            article3.url: article3,
+        }
+        assert article1.url_hash == hash_url(article1.url)
+
     @time_machine.travel("2024-06-01 12:00:00", tick=False)
     def test_save_from_list_of_data(self, user, django_assert_num_queries):
         tag1 = TagFactory(user=user)
@@ -766,7 +1038,7 @@ class TestArticleManager:
         existing_article_with_tag.tags.add(tag1)
         now_dt = utcnow()
 
-        with django_assert_num_queries(7), time_machine.travel("2024-06-02 12:00:00", tick=False):
+        with django_assert_num_queries(8), time_machine.travel("2024-06-02 12:00:00", tick=False):
             Article.objects.save_from_list_of_data(
                 user,
                 [
@@ -1053,6 +1325,71 @@ class TestArticleManager:
             reading_list4.slug: 1,
         }
 
+    def test_get_unread_counters_of_reading_lists(self, user, django_assert_num_queries):
+        reading_list = ReadingListFactory(user=user)
+        tag = TagFactory(user=user)
+        reading_list_with_tag = ReadingListFactory(user=user)
+        ReadingListTag.objects.associate_reading_list_with_tags(
+            reading_list_with_tag, [tag], constants.ReadingListTagFilterType.INCLUDE
+        )
+        article = ArticleFactory(user=user)
+        reading_lists = ReadingList.objects.get_all_for_user(user)
+
+        with django_assert_num_queries(1):
+            counts = Article.objects.get_unread_counters_of_reading_lists(user, reading_lists)
+
+        assert counts == {reading_list.slug: 1, reading_list_with_tag.slug: 0}
+
+        with django_assert_num_queries(0):
+            cached_counts = Article.objects.get_unread_counters_of_reading_lists(
+                user, reading_lists
+            )
+
+        assert cached_counts == counts
+
+        ArticleTag.objects.associate_articles_with_tags([article], [tag])
+        with django_assert_num_queries(1):
+            counts = Article.objects.get_unread_counters_of_reading_lists(user, reading_lists)
+
+        assert counts == {reading_list.slug: 1, reading_list_with_tag.slug: 1}
+
+        Article.objects.filter(id=article.id).update_articles_from_action(
+            constants.UpdateArticleActions.MARK_AS_READ
+        )
+        with django_assert_num_queries(1):
+            counts = Article.objects.get_unread_counters_of_reading_lists(user, reading_lists)
+
+        assert counts == {reading_list.slug: 0, reading_list_with_tag.slug: 0}
+
+    def test_get_unread_counters_of_reading_lists_reading_lists_changed(
+        self, user, django_assert_num_queries
+    ):
+        reading_list = ReadingListFactory(user=user)
+        ArticleFactory(user=user)
+        Article.objects.get_unread_counters_of_reading_lists(
+            user, ReadingList.objects.get_all_for_user(user)
+        )
+        other_reading_list = ReadingListFactory(user=user)
+        reading_lists = ReadingList.objects.get_all_for_user(user)
+
+        with django_assert_num_queries(1):
+            counts = Article.objects.get_unread_counters_of_reading_lists(user, reading_lists)
+
+        assert counts == {reading_list.slug: 1, other_reading_list.slug: 1}
+
+    def test_get_unread_counters_of_reading_lists_after_article_creation(
+        self, user, django_assert_num_queries
+    ):
+        reading_list = ReadingListFactory(user=user)
+        reading_lists = ReadingList.objects.get_all_for_user(user)
+        Article.objects.get_unread_counters_of_reading_lists(user, reading_lists)
+
+        Article.objects.save_from_list_of_data(user, [ArticleDataFactory()], [])
+        with django_assert_num_queries(1):
+            counts = Article.objects.get_unread_counters_of_reading_lists(user, reading_lists)
+
+        assert counts == {reading_list.slug: 1}
+
     def test_get_articles_of_tag(self, user, django_assert_num_queries):
         tag_to_display = TagFactory(user=user)
         other_tag = TagFactory(user=user)
@@ -1076,12 +1413,13 @@ class TestArticleManager:
         article = ArticleFactory(user=user, external_tags=["Test"])
         article.tags.add(tag)
         ArticleFactory(user=user, external_tags=["Other tag"])
+        ArticleFactory(user=user, external_tags=["Test suite"])
         properly_tagged_article = ArticleFactory(user=user)
         properly_tagged_article.tags.add(tag)
         ArticleFactory(external_tags=["Just", "Some", "Test"])
 
         with django_assert_num_queries(2):
-            articles = list(Article.objects.get_articles_with_external_tag(user, "Test"))
+            articles = list(Article.objects.get_articles_with_external_tag(user, " test"))
 
         assert articles == [article]
 
@@ -1256,7 +1594,7 @@ class TestArticleManager:
             updated_at=utcdt(2024, 6, 23, 12, 0, 0),
         )
 
-        with django_assert_num_queries(12):
+        with django_assert_num_queries(11):
             articles = self._export_all_articles(user)
 
         assert len(articles) == 3
@@ -1308,6 +1646,7 @@ class TestArticleManager:
         )
         with time_machine.travel("2025-06-04"):
             CommentFactory(article=article_with_recent_comment, text="A comment")
+            CommentFactory(article=article_with_recent_comment, text="Another comment")
 
         articles = self._export_all_articles(user, utcdt(2025, 6, 1))
 
@@ -1316,6 +1655,29 @@ class TestArticleManager:
         assert articles[0][0]["article_id"] == recent_article.id
         assert articles[0][1]["article_id"] == article_with_recent_comment.id
 
+    def test_export_changes(self, user, other_user):
+        ArticleFactory(user=other_user)
+        with time_machine.travel("2024-06-01 12:00:00", tick=False):
+            first_article = ArticleFactory(user=user, title="First")
+            second_article = ArticleFactory(user=user, title="Second")
+        with time_machine.travel("2024-06-02 12:00:00", tick=False):
+            third_article = ArticleFactory(user=user, title="Third")
+
+        first_rows, first_position = Article.objects.export_changes(user, after=None, limit=2)
+        second_rows, second_position = Article.objects.export_changes(
+            user, after=first_position, limit=2
+        )
+        last_rows, last_position = Article.objects.export_changes(
+            user, after=second_position, limit=2
+        )
+
+        assert [row["article_id"] for row in first_rows] == [first_article.id, second_article.id]
+        assert first_position == (utcdt(2024, 6, 1, 12), second_article.id)
+        assert [row["article_id"] for row in second_rows] == [third_article.id]
+        assert second_position == (utcdt(2024, 6, 2, 12), third_article.id)
+        assert last_rows == []
+        assert last_position is None
+
     def _export_all_articles(self, user, updated_since=None):
         all_articles = []
         for articles in Article.objects.export(user, updated_since=updated_since):
@@ -1332,6 +1694,23 @@ class TestArticleManager:
 
         assert found_articles == [search_in_title]
 
+    def test_search_snippet(self, user):
+        ArticleFactory(
+            user=user,
+            title="Emperors",
+            summary="A summary",
+            content="<p>Claudius was born in Lugdunum.</p><p>He ruled after Caligula.</p>",
+        )
+        search_query = ArticleFullTextSearchQuery(q="Claudius")
+
+        article = Article.objects.search(user, search_query).get()
+
+        assert (
+            f"{constants.SEARCH_SNIPPET_START_MARKER}Claudius"
+            f"{constants.SEARCH_SNIPPET_STOP_MARKER}" in article.search_snippet
+        )
+        assert "Lugdunum" in article.search_snippet
+
     def test_search_url(self, user):
         article = ArticleFactory(title="Test", user=user)
         search_query = ArticleFullTextSearchQuery(
@@ -1355,6 +1734,110 @@ class TestArticleManager:
 
         assert found_articles == [search_in_title, tagged_article]
 
+    def test_get_autocomplete_choices(self, user, other_user, django_assert_num_queries):
+        ArticleFactory(user=other_user, title="Claudius other user")
+        ArticleFactory(user=user, title="Nero")
+        article = ArticleFactory(user=user, title="Claudius")
+
+        with django_assert_num_queries(1):
+            choices = Article.objects.get_autocomplete_choices(user, "clau")
+        with django_assert_num_queries(0):
+            cached_choices = Article.objects.get_autocomplete_choices(user, " CLAU ")
+
+        assert choices == [{"id": article.id, "slug": article.slug, "title": "Claudius"}]
+        assert cached_choices == choices
+
+    def test_get_autocomplete_choices_query_too_short(self, user, django_assert_num_queries):
+        ArticleFactory(user=user, title="Claudius")
+
+        with django_assert_num_queries(0):
+            choices = Article.objects.get_autocomplete_choices(user, "c")
+
+        assert choices == []
+
+    def test_get_search_facets(self, user, other_user, django_assert_num_queries):
+        tag = TagFactory(user=user, title="Poetry")
+        other_tag = TagFactory(user=user, title="History")
+        feed = FeedFactory(user=user, title="Roman feed")
+        read_article = ArticleFactory(user=user, title="Claudius", read_at=utcnow())
+        read_article.tags.add(tag, other_tag)
+        favorite_article = ArticleFactory(user=user, title="Claudius", is_favorite=True)
+        favorite_article.tags.add(tag)
+        FeedArticleFactory(feed=feed, article=favorite_article)
+        FeedArticleFactory(feed=feed, article=read_article)
+        ArticleFactory(user=user, title="Claudius", is_for_later=True)
+        not_matched_article = ArticleFactory(user=user, title="Nero")
+        not_matched_article.tags.add(other_tag)
+        ArticleFactory(user=other_user, title="Claudius")
+        search_query = ArticleFullTextSearchQuery(q="Claudius")
+        tags_search = ArticlesTagsSearch()
+
+        with django_assert_num_queries(4):
+            facets = Article.objects.get_search_facets(user, search_query, tags_search)
+        with django_assert_num_queries(0):
+            cached_facets = Article.objects.get_search_facets(
+                user, ArticleFullTextSearchQuery(q="Claudius"), ArticlesTagsSearch()
+            )
+
+        assert facets == {
+            "nb_unread": 2,
+            "nb_read": 1,
+            "nb_favorite": 1,
+            "nb_for_later": 1,
+            "top_tags": [
+                {"slug": tag.slug, "title": "Poetry", "nb_articles": 2},
+                {"slug": other_tag.slug, "title": "History", "nb_articles": 1},
+            ],
+            "top_feeds": [{"id": feed.id, "title": "Roman feed", "nb_articles": 2}],
+        }
+        assert cached_facets == facets
+
+    def test_get_search_facets_without_cache(self, user, django_assert_num_queries):
+        search_query = ArticleFullTextSearchQuery(q="Claudius")
+        tags_search = ArticlesTagsSearch()
+        Article.objects.get_search_facets(user, search_query, tags_search)
+        ArticleFactory(user=user, title="Claudius")
+
+        with django_assert_num_queries(4):
+            facets = Article.objects.get_search_facets(
+                user, search_query, tags_search, use_cache=False
+            )
+
+        assert facets["nb_unread"] == 1
+
+    def test_get_search_facets_no_match(self, user, django_assert_num_queries):
+        ArticleFactory(user=user, title="Nero")
+
+        with django_assert_num_queries(1):
+            facets = Article.objects.get_search_facets(
+                user, ArticleFullTextSearchQuery(q="Claudius"), ArticlesTagsSearch()
+            )
+
+        assert facets == {
+            "nb_unread": 0,
+            "nb_read": 0,
+            "nb_favorite": 0,
+            "nb_for_later": 0,
+            "top_tags": [],
+            "top_feeds": [],
+        }
+
+    def test_get_search_facets_on_most_relevant_articles(self, user, monkeypatch):
+        monkeypatch.setattr(constants, "MAX_SEARCH_FACET_ARTICLES", 2)
+        tag = TagFactory(user=user)
+        for _ in range(3):
+            article = ArticleFactory(user=user, title="Claudius", is_favorite=True)
+            article.tags.add(tag)
+
+        facets = Article.objects.get_search_facets(
+            user, ArticleFullTextSearchQuery(q="Claudius"), ArticlesTagsSearch(), use_cache=False
+        )
+
+        # Statuses are counted on all matches, tags only on the most relevant ones.
+        assert facets["nb_unread"] == 3
+        assert facets["nb_favorite"] == 3
+        assert facets["top_tags"] == [{"slug": tag.slug, "title": tag.title, "nb_articles": 2}]
+
     def test_search_with_advanced_filters(self, user, other_user):
         ArticleFactory(user=user, title="Claudius read", read_at=utcnow())
         ArticleFactory(user=user, title="Claudius", read_at=None)
@@ -1417,6 +1900,9 @@ class TestArticleManager:
             deletion_result = Article.objects.cleanup_articles()
 
         assert deletion_result == (1, {"reading.Article": 1})
+        assert list(DeletedArticle.objects.values_list("article_id", "user_id")) == [
+            (read_1_day_retention_to_cleanup.id, user.id)
+        ]
         feed_article_to_keep.refresh_from_db()
         assert feed_article_to_keep.article == read_keep_one_and_seven_days_retention_to_keep
         feed_article_to_deleted.refresh_from_db()
@@ -1492,6 +1978,22 @@ class TestArticleManager:
         assert other_independent_article.group is None
         assert other_independent_article.group_order == 0
 
+    def test_link_and_reorder_in_group_mark_articles_as_updated(self, user):
+        group = ArticlesGroupFactory(user=user)
+        with time_machine.travel("2024-06-01 12:00:00", tick=False):
+            article = ArticleFactory(user=user)
+            other_article = ArticleFactory(user=user)
+
+        with time_machine.travel("2024-06-02 12:00:00", tick=False):
+            Article.objects.link_articles_to_group(group, [article, other_article])
+        with time_machine.travel("2024-06-03 12:00:00", tick=False):
+            Article.objects.reorder_in_group(group, {other_article.id: 1})
+
+        assert list(Article.objects.order_by("id").values_list("obj_updated_at", flat=True)) == [
+            utcdt(2024, 6, 3, 12),
+            utcdt(2024, 6, 3, 12),
+        ]
+
 
 class TestArticleModel:
     @pytest.mark.django_db
@@ -1719,3 +2221,15 @@ class TestArticleModel:
         assert article.title == "Test title"
         assert article.summary == "Test summary"
         assert article.reading_time == 10
+
+
+class TestArticlesCursor:
+    @pytest.mark.parametrize("sort_date", [utcdt(2024, 5, 28, 12, 30, 15, 42), None])
+    def test_encode_decode(self, sort_date):
+        cursor = ArticlesCursor(sort_date=sort_date, article_id=12)
+
+        assert ArticlesCursor.decode(cursor.encode()) == cursor
+
+    @pytest.mark.parametrize("value", ["", "not-base-64!", "aW52YWxpZA==", "fG5hbg=="])
+    def test_decode_invalid_value(self, value):
+        assert ArticlesCursor.decode(value) is None
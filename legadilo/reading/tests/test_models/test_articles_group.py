@@ -2,8 +2,9 @@
 #
 #  SPDX-License-Identifier: AGPL-3.0-or-later
 import pytest
+import time_machine
 
-from legadilo.core.utils.time_utils import utcnow
+from legadilo.core.utils.time_utils import utcdt, utcnow
 from legadilo.reading.models import ArticlesGroup
 from legadilo.reading.tests.factories import ArticleFactory, ArticlesGroupFactory, TagFactory
 
@@ -138,3 +139,18 @@ class TestArticlesGroupManager:
         groups = list(ArticlesGroup.objects.list_for_admin(user, "groups", tag_slugs=[tag.slug]))
 
         assert groups == [group]
+
+
+@pytest.mark.django_db
+class TestArticlesGroupModel:
+    def test_delete_marks_articles_as_updated(self, user):
+        group = ArticlesGroupFactory(user=user)
+        with time_machine.travel("2024-06-01 12:00:00", tick=False):
+            article = ArticleFactory(user=user, group=group)
+
+        with time_machine.travel("2024-06-02 12:00:00", tick=False):
+            group.delete()
+
+        article.refresh_from_db()
+        assert article.group is None
+        assert article.obj_updated_at == utcdt(2024, 6, 2, 12)
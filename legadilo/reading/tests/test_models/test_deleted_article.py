@@ -0,0 +1,50 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pytest
+import time_machine
+
+from legadilo.reading.models import DeletedArticle
+
+
+def _create_deleted_article(user, article_id: int) -> DeletedArticle:
+    return DeletedArticle.objects.create(
+        user=user, article_id=article_id, url=f"https://example.com/article/{article_id}"
+    )
+
+
+@pytest.mark.django_db
+class TestDeletedArticleManager:
+    def test_export_after(self, user, other_user):
+        first_deleted_article = _create_deleted_article(user, 1)
+        _create_deleted_article(other_user, 2)
+        second_deleted_article = _create_deleted_article(user, 3)
+        third_deleted_article = _create_deleted_article(user, 4)
+
+        deleted_articles = DeletedArticle.objects.export_after(
+            user, deleted_article_id=first_deleted_article.id, limit=2
+        )
+
+        assert [deleted_article["id"] for deleted_article in deleted_articles] == [
+            second_deleted_article.id,
+            third_deleted_article.id,
+        ]
+        assert deleted_articles[0] == {
+            "id": second_deleted_article.id,
+            "article_id": 3,
+            "url": "https://example.com/article/3",
+            "deleted_at": second_deleted_article.deleted_at,
+        }
+
+    def test_cleanup(self, user):
+        with time_machine.travel("2024-03-01 12:00:00"):
+            _create_deleted_article(user, 1)
+        with time_machine.travel("2024-05-01 12:00:00"):
+            deleted_article_to_keep = _create_deleted_article(user, 2)
+
+        with time_machine.travel("2024-06-15 12:00:00"):
+            deletion_result = DeletedArticle.objects.cleanup()
+
+        assert deletion_result == (1, {"reading.DeletedArticle": 1})
+        assert list(DeletedArticle.objects.all()) == [deleted_article_to_keep]
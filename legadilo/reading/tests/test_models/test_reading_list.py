@@ -5,8 +5,10 @@
 import pytest
 from django.db import IntegrityError, connection
 
+from legadilo.reading import constants
+from legadilo.reading.models import ReadingListTag
 from legadilo.reading.models.reading_list import ReadingList
-from legadilo.reading.tests.factories import ReadingListFactory
+from legadilo.reading.tests.factories import ReadingListFactory, TagFactory
 
 
 @pytest.mark.django_db
@@ -72,6 +74,23 @@ class TestReadingListManager:
         assert reading_list_2.order == 110
         assert reading_list_other_user.order == 20
 
+    def test_get_context_for_user(self, user, other_user, django_assert_num_queries):
+        default_reading_list = ReadingListFactory(user=user, is_default=True, order=10)
+        reading_list = ReadingListFactory(user=user, title="My reading list", order=0)
+        ReadingListFactory(user=other_user, title="My reading list")
+
+        with django_assert_num_queries(2):
+            reading_lists_ctx = ReadingList.objects.get_context_for_user(user)
+
+        assert reading_lists_ctx.reading_lists == [reading_list, default_reading_list]
+        assert reading_lists_ctx.get_reading_list(None) == default_reading_list
+        assert reading_lists_ctx.get_reading_list("my-reading-list") == reading_list
+        assert reading_lists_ctx.get_reading_list_by_id(reading_list.id) == reading_list
+        with pytest.raises(ReadingList.DoesNotExist):
+            reading_lists_ctx.get_reading_list("unknown")
+        with pytest.raises(ReadingList.DoesNotExist):
+            reading_lists_ctx.get_reading_list_by_id(-1)
+
 
 @pytest.mark.django_db
 class TestReadingListModel:
@@ -108,3 +127,22 @@ class TestReadingListModel:
         ReadingListFactory(title="Reading List")
 
         assert ReadingList.objects.count() == 2
+
+    def test_get_tag_slugs(self, user, django_assert_num_queries):
+        reading_list = ReadingListFactory(user=user)
+        tag_to_include = TagFactory(user=user, title="Included")
+        tag_to_exclude = TagFactory(user=user, title="Excluded")
+        ReadingListTag.objects.associate_reading_list_with_tags(
+            reading_list, [tag_to_include], constants.ReadingListTagFilterType.INCLUDE
+        )
+        ReadingListTag.objects.associate_reading_list_with_tags(
+            reading_list, [tag_to_exclude], constants.ReadingListTagFilterType.EXCLUDE
+        )
+        (reading_list,) = ReadingList.objects.get_all_for_user(user)
+
+        with django_assert_num_queries(0):
+            tags_to_include = reading_list.get_tag_slugs(constants.ReadingListTagFilterType.INCLUDE)
+            tags_to_exclude = reading_list.get_tag_slugs(constants.ReadingListTagFilterType.EXCLUDE)
+
+        assert tags_to_include == [tag_to_include.slug]
+        assert tags_to_exclude == [tag_to_exclude.slug]
@@ -0,0 +1,249 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pytest
+import time_machine
+
+from legadilo.reading import constants
+from legadilo.reading.models import Article, SavedSearch
+from legadilo.reading.models.article import ArticleFullTextSearchQuery, ArticlesTagsSearch
+from legadilo.reading.tests.factories import ArticleFactory, TagFactory
+
+
+@pytest.mark.django_db
+class TestSavedSearchManager:
+    @pytest.fixture(autouse=True)
+    def _setup_data(self, user):
+        self.tag = TagFactory(user=user)
+        with time_machine.travel("2024-06-01 11:00:00", tick=False):
+            self.article = ArticleFactory(user=user, title="Claudius")
+            self.article_without_tag = ArticleFactory(user=user, title="Claudius")
+            other_article = ArticleFactory(user=user, title="Nero")
+        self.article.tags.add(self.tag)
+        other_article.tags.add(self.tag)
+
+    @time_machine.travel("2024-06-01 12:00:00", tick=False)
+    def test_create_from_search(self, user, django_assert_num_queries):
+        with django_assert_num_queries(2):
+            saved_search = SavedSearch.objects.create_from_search(
+                user,
+                "Claudius",
+                "q=Claudius",
+                ArticleFullTextSearchQuery(q="Claudius"),
+                ArticlesTagsSearch(tag_ids_to_include=frozenset([self.tag.id])),
+            )
+
+        assert saved_search.article_ids == [self.article.id]
+        assert len(saved_search.article_sort_keys) == 1
+        assert saved_search.computed_at == saved_search.refreshed_at
+        assert saved_search.get_search_query() == ArticleFullTextSearchQuery(q="Claudius")
+        assert saved_search.get_tags_search() == ArticlesTagsSearch(
+            tag_ids_to_include=frozenset([self.tag.id])
+        )
+
+    def test_refresh_snapshot_without_updated_articles(self, user, django_assert_num_queries):
+        with time_machine.travel("2024-06-01 12:00:00", tick=False):
+            saved_search = SavedSearch.objects.create_from_search(
+                user,
+                "Claudius",
+                "",
+                ArticleFullTextSearchQuery(q="Claudius"),
+                ArticlesTagsSearch(),
+            )
+
+        with (
+            time_machine.travel("2024-06-01 13:00:00", tick=False),
+            django_assert_num_queries(1),
+        ):
+            saved_search = SavedSearch.objects.refresh_snapshot(saved_search)
+
+        assert set(saved_search.article_ids) == {self.article.id, self.article_without_tag.id}
+
+    def test_refresh_snapshot_incrementally(self, user, django_assert_num_queries):
+        with time_machine.travel("2024-06-01 12:00:00", tick=False):
+            saved_search = SavedSearch.objects.create_from_search(
+                user,
+                "Claudius",
+                "",
+                ArticleFullTextSearchQuery(q="Claudius"),
+                ArticlesTagsSearch(),
+            )
+        with time_machine.travel("2024-06-01 13:00:00", tick=False):
+            new_article = ArticleFactory(user=user, title="Claudius again")
+            self.article.title = "Nero"
+            self.article.save()
+
+        with (
+            time_machine.travel("2024-06-01 14:00:00", tick=False),
+            django_assert_num_queries(3),
+        ):
+            saved_search = SavedSearch.objects.refresh_snapshot(saved_search)
+
+        assert set(saved_search.article_ids) == {new_article.id, self.article_without_tag.id}
+        assert saved_search.computed_at.hour == 12
+        assert saved_search.refreshed_at.hour == 14
+        # Articles are in the order of the search.
+        article_ids = saved_search.article_ids
+        assert SavedSearch.objects.refresh_snapshot(saved_search, full=True).article_ids == (
+            article_ids
+        )
+
+    def test_refresh_snapshot_incrementally_keeps_search_order(self, user):
+        with time_machine.travel("2024-06-01 12:00:00", tick=False):
+            old_article = ArticleFactory(
+                user=user, title="Caligula", published_at="2024-01-01T00:00:00+00:00"
+            )
+            recent_article = ArticleFactory(
+                user=user, title="Caligula", published_at="2024-05-01T00:00:00+00:00"
+            )
+            saved_search = SavedSearch.objects.create_from_search(
+                user,
+                "Caligula",
+                "",
+                ArticleFullTextSearchQuery(
+                    q="Caligula", order=constants.ArticleSearchOrderBy.ARTICLE_DATE_DESC
+                ),
+                ArticlesTagsSearch(),
+            )
+        with time_machine.travel("2024-06-01 13:00:00", tick=False):
+            Article.objects.filter(id=old_article.id).update_articles_from_action(
+                constants.UpdateArticleActions.MARK_AS_FAVORITE
+            )
+            new_article = ArticleFactory(
+                user=user, title="Caligula", published_at="2024-03-01T00:00:00+00:00"
+            )
+
+        with time_machine.travel("2024-06-01 14:00:00", tick=False):
+            saved_search = SavedSearch.objects.refresh_snapshot(saved_search)
+
+        assert saved_search.article_ids == [recent_article.id, new_article.id, old_article.id]
+
+    def test_refresh_snapshot_incrementally_with_null_sort_keys(self, user):
+        with time_machine.travel("2024-06-01 12:00:00", tick=False):
+            read_article = ArticleFactory(
+                user=user, title="Caligula", read_at="2024-05-01T00:00:00+00:00"
+            )
+            unread_article = ArticleFactory(user=user, title="Caligula", read_at=None)
+            saved_search = SavedSearch.objects.create_from_search(
+                user,
+                "Caligula",
+                "",
+                ArticleFullTextSearchQuery(
+                    q="Caligula", order=constants.ArticleSearchOrderBy.READ_AT_DESC
+                ),
+                ArticlesTagsSearch(),
+            )
+        with time_machine.travel("2024-06-01 13:00:00", tick=False):
+            new_read_article = ArticleFactory(
+                user=user, title="Caligula", read_at="2024-03-01T00:00:00+00:00"
+            )
+            new_unread_article = ArticleFactory(user=user, title="Caligula", read_at=None)
+
+        with time_machine.travel("2024-06-01 14:00:00", tick=False):
+            saved_search = SavedSearch.objects.refresh_snapshot(saved_search)
+
+        assert set(saved_search.article_ids) == {
+            read_article.id,
+            unread_article.id,
+            new_read_article.id,
+            new_unread_article.id,
+        }
+        article_ids = saved_search.article_ids
+        assert SavedSearch.objects.refresh_snapshot(saved_search, full=True).article_ids == (
+            article_ids
+        )
+
+    def test_refresh_snapshot_incrementally_only_searches_updated_articles(self, user):
+        with time_machine.travel("2024-06-01 12:00:00", tick=False):
+            saved_search = SavedSearch.objects.create_from_search(
+                user,
+                "Claudius",
+                "",
+                ArticleFullTextSearchQuery(q="Claudius"),
+                ArticlesTagsSearch(),
+            )
+        with time_machine.travel("2024-06-01 13:00:00", tick=False):
+            # Not marked as updated: the snapshot must keep it as is.
+            Article.objects.filter(id=self.article_without_tag.id).update(title="Nero")
+            new_article = ArticleFactory(user=user, title="Claudius again")
+
+        with time_machine.travel("2024-06-01 14:00:00", tick=False):
+            saved_search = SavedSearch.objects.refresh_snapshot(saved_search)
+
+        assert set(saved_search.article_ids) == {
+            self.article.id,
+            self.article_without_tag.id,
+            new_article.id,
+        }
+        assert len(saved_search.article_sort_keys) == 3
+
+    def test_refresh_snapshot_without_sort_keys(self, user):
+        with time_machine.travel("2024-06-01 12:00:00", tick=False):
+            saved_search = SavedSearch.objects.create_from_search(
+                user,
+                "Claudius",
+                "",
+                ArticleFullTextSearchQuery(q="Claudius"),
+                ArticlesTagsSearch(),
+            )
+        saved_search.article_sort_keys = []
+        saved_search.save()
+
+        with time_machine.travel("2024-06-01 12:00:30", tick=False):
+            saved_search = SavedSearch.objects.refresh_snapshot(saved_search)
+
+        assert saved_search.computed_at.second == 30
+        assert len(saved_search.article_sort_keys) == 2
+
+    def test_refresh_snapshot_throttled(self, user, django_assert_num_queries):
+        with time_machine.travel("2024-06-01 12:00:00", tick=False):
+            saved_search = SavedSearch.objects.create_from_search(
+                user,
+                "Claudius",
+                "",
+                ArticleFullTextSearchQuery(q="Claudius"),
+                ArticlesTagsSearch(),
+            )
+            ArticleFactory(user=user, title="Claudius")
+
+        with (
+            time_machine.travel("2024-06-01 12:00:30", tick=False),
+            django_assert_num_queries(0),
+        ):
+            saved_search = SavedSearch.objects.refresh_snapshot(saved_search)
+
+        assert len(saved_search.article_ids) == 2
+
+        with time_machine.travel("2024-06-01 12:01:01", tick=False):
+            saved_search = SavedSearch.objects.refresh_snapshot(saved_search)
+
+        assert len(saved_search.article_ids) == 3
+
+    def test_refresh_outdated_snapshot(self, user):
+        with time_machine.travel("2024-06-01 12:00:00", tick=False):
+            saved_search = SavedSearch.objects.create_from_search(
+                user,
+                "Unread",
+                "",
+                ArticleFullTextSearchQuery(read_status=constants.ReadStatus.ONLY_UNREAD),
+                ArticlesTagsSearch(),
+            )
+        with time_machine.travel("2024-06-01 12:30:00", tick=False):
+            # Changing the status marks the article as updated.
+            Article.objects.filter(id=self.article_without_tag.id).update_articles_from_action(
+                constants.UpdateArticleActions.MARK_AS_READ
+            )
+
+        with time_machine.travel("2024-06-01 13:00:00", tick=False):
+            saved_search = SavedSearch.objects.refresh_snapshot(saved_search)
+            assert len(saved_search.article_ids) == 2
+            saved_search = SavedSearch.objects.refresh_snapshot(saved_search, full=True)
+            assert len(saved_search.article_ids) == 2
+
+        with time_machine.travel("2024-06-03 13:00:00", tick=False):
+            ArticleFactory(user=user, read_at=None)
+            saved_search = SavedSearch.objects.refresh_snapshot(saved_search)
+
+        assert len(saved_search.article_ids) == 3
+        assert saved_search.computed_at.day == 3
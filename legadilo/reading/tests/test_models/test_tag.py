@@ -5,7 +5,7 @@
 import pytest
 
 from legadilo.reading import constants
-from legadilo.reading.models import ArticleTag, ReadingListTag, Tag
+from legadilo.reading.models import ArticleExternalTag, ArticleTag, ReadingListTag, Tag
 from legadilo.reading.models.tag import ArticlesGroupTag, SubTagMapping
 from legadilo.reading.tests.factories import (
     ArticleFactory,
@@ -280,6 +280,40 @@ class TestArticleTagManager:
 
 
 @pytest.mark.django_db
+class TestArticleExternalTagManager:
+    def test_create_for_articles(self, user, django_assert_num_queries):
+        article = ArticleFactory(user=user)
+        article.external_tags = [" Some Tag", "some tag", "", "Other"]
+
+        with django_assert_num_queries(1):
+            ArticleExternalTag.objects.create_for_articles([article])
+
+        assert list(article.article_external_tags.values_list("user_id", "lower_title")) == [
+            (user.id, "other"),
+            (user.id, "some tag"),
+        ]
+
+    def test_update_for_articles(self, user, django_assert_num_queries):
+        article = ArticleFactory(user=user, external_tags=["Initial", "Kept"])
+        other_article = ArticleFactory(user=user, external_tags=["Initial"])
+        article.external_tags = ["Kept", "Updated"]
+
+        with django_assert_num_queries(2):
+            ArticleExternalTag.objects.update_for_articles([article])
+
+        assert list(article.article_external_tags.values_list("lower_title", flat=True)) == [
+            "kept",
+            "updated",
+        ]
+        assert list(other_article.article_external_tags.values_list("lower_title", flat=True)) == [
+            "initial"
+        ]
+
+    def test_update_for_no_articles(self, django_assert_num_queries):
+        with django_assert_num_queries(0):
+            ArticleExternalTag.objects.update_for_articles([])
+
+
 class TestReadingListTagManager:
     def test_get_selected_values(self, user):
         reading_list = ReadingListFactory(user=user)
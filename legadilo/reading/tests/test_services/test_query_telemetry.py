@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: 2026 Legadilo contributors
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import pytest
+
+from legadilo.reading import constants
+from legadilo.reading.models import Article, ReadingList
+from legadilo.reading.models.article import ArticleFullTextSearchQuery, ArticlesTagsSearch
+from legadilo.reading.services.query_telemetry import get_filter_shape, get_stats, record_queries
+from legadilo.reading.tests.factories import ArticleFactory, ReadingListFactory
+
+
+def test_get_filter_shape():
+    shape = get_filter_shape(
+        ArticleFullTextSearchQuery(
+            q="Claudius",
+            read_status=constants.ReadStatus.ONLY_UNREAD,
+            linked_with_feeds=frozenset([1, 2]),
+        ),
+        ArticlesTagsSearch(tag_ids_to_include=frozenset([3])),
+        None,
+    )
+
+    assert shape == (
+        f"linked_with_feeds=?,q=?,read_status={constants.ReadStatus.ONLY_UNREAD.value},"
+        "tag_ids_to_include=?"
+    )
+
+
+def test_get_filter_shape_without_filters():
+    assert get_filter_shape(ArticleFullTextSearchQuery(), ArticlesTagsSearch()) == "-"
+
+
+@pytest.mark.django_db
+class TestRecordQueries:
+    def test_disabled(self, user, django_assert_num_queries):
+        ArticleFactory(user=user, title="Claudius")
+
+        with django_assert_num_queries(2):
+            articles = list(Article.objects.search(user, ArticleFullTextSearchQuery(q="Claudius")))
+
+        assert len(articles) == 1
+        assert get_stats() == {}
+
+    def test_search(self, user, settings):
+        settings.QUERY_TELEMETRY_ENABLED = True
+        ArticleFactory(user=user, title="Claudius")
+        ArticleFactory(user=user, title="Claudius")
+        articles_qs = Article.objects.search(user, ArticleFullTextSearchQuery(q="Claudius"))
+
+        list(articles_qs)
+        # The first count is done with the fetched articles.
+        articles_qs.count()
+        articles_qs.all().count()
+        articles_qs.all().count()
+
+        stats = get_stats()
+        assert set(stats) == {"search|q=?", "search.count|q=?"}
+        assert stats["search|q=?"]["nb_calls"] == 1
+        assert stats["search|q=?"]["nb_rows"] == 2
+        assert stats["search|q=?"]["nb_slow_calls"] == 0
+        assert stats["search.count|q=?"]["nb_calls"] == 2
+        assert stats["search.count|q=?"]["nb_rows"] == 4
+
+    def test_reading_list_and_unread_counters(self, user, settings):
+        settings.QUERY_TELEMETRY_ENABLED = True
+        reading_list = ReadingListFactory(user=user, read_status=constants.ReadStatus.ONLY_UNREAD)
+        ArticleFactory(user=user)
+
+        list(Article.objects.get_articles_of_reading_list(reading_list))
+        Article.objects.count_unread_articles_of_reading_lists(
+            user, ReadingList.objects.get_all_for_user(user)
+        )
+
+        stats = get_stats()
+        assert set(stats) == {
+            f"reading_list|read_status={constants.ReadStatus.ONLY_UNREAD.value}",
+            "unread_counters|reading_lists=1",
+        }
+        assert stats["unread_counters|reading_lists=1"]["nb_rows"] == 1
+
+    def test_log_slow_queries(self, user, settings, mocker):
+        settings.QUERY_TELEMETRY_ENABLED = True
+        settings.QUERY_TELEMETRY_SLOW_QUERY_THRESHOLD = 0
+        mocked_logger = mocker.patch("legadilo.reading.services.query_telemetry.logger")
+        ArticleFactory(user=user)
+
+        with record_queries("test", "shape") as record:
+            record.nb_rows = len(list(Article.objects.all()))
+
+        assert get_stats()["test|shape"]["nb_slow_calls"] == 1
+        mocked_logger.exception.assert_not_called()
+        mocked_logger.warning.assert_called_once()
+        message, name, shape, _duration, nb_rows, _query_duration, sql, plan = (
+            mocked_logger.warning.call_args.args
+        )
+        assert message.startswith("Slow %s query (%s) took")
+        assert (name, shape, nb_rows) == ("test", "shape", 1)
+        assert "reading_article" in sql
+        assert plan
@@ -11,6 +11,7 @@ from legadilo.reading.templatetags import (
     for_later_action_url,
     markdown,
     read_action_url,
+    search_snippet,
 )
 from legadilo.reading.tests.factories import ArticleFactory
 
@@ -111,3 +112,34 @@ def test_markdown(markdown_input, expected_output):
     rendered_value = markdown(markdown_input)
 
     assert rendered_value == expected_output
+
+
+@pytest.mark.parametrize(
+    ("snippet", "expected_output"),
+    [
+        pytest.param(
+            "Claudius \x02was\x03 born…",
+            "Claudius <mark>was</mark> born…",
+            id="matched-terms",
+        ),
+        pytest.param(
+            "<p>Claudius</p>\n<p>\x02<em>was</em>\x03 born</p> in <a hre",
+            "Claudius <mark>was</mark> born in",
+            id="with-html",
+        ),
+        pytest.param(
+            "<script>\x02alert\x03('Claudius')</script> &amp; Nero",
+            "<mark>alert</mark>(&#x27;Claudius&#x27;) &amp; Nero",
+            id="with-dangerous-html",
+        ),
+        pytest.param(
+            '<a href="\x02claudius\x03">Claudius</a> \x02was',
+            "Claudius was",
+            id="with-markers-in-tags",
+        ),
+    ],
+)
+def test_search_snippet(snippet, expected_output):
+    rendered_value = search_snippet(snippet)
+
+    assert rendered_value == expected_output
@@ -49,7 +49,7 @@ class TestUpdateArticleView:
         assert response.status_code == HTTPStatus.NOT_FOUND
 
     def test_update_article_view(self, logged_in_sync_client, django_assert_num_queries):
-        with django_assert_num_queries(17):
+        with django_assert_num_queries(16):
             response = logged_in_sync_client.post(
                 self.mark_as_read_url,
                 data={"displayed_reading_list_id": str(self.reading_list.id)},
@@ -74,6 +74,21 @@ class TestUpdateArticleView:
         assert self.article.is_read
         assert b"<article" in response.content
 
+    def test_update_article_view_with_reading_list_of_other_user(
+        self, other_user, logged_in_sync_client
+    ):
+        reading_list_other_user = ReadingListFactory(user=other_user)
+
+        response = logged_in_sync_client.post(
+            self.mark_as_read_url,
+            data={"displayed_reading_list_id": str(reading_list_other_user.id)},
+            HTTP_REFERER="http://testserver/reading/",
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.context_data["displayed_reading_list"] is None
+        assert response.context_data["count_articles_of_current_reading_list"] is None
+
     def test_update_article_view_with_htmx_mark_for_later_reading_list_dont_include_for_later(
         self, user, logged_in_sync_client, django_assert_num_queries
     ):
@@ -81,7 +96,7 @@ class TestUpdateArticleView:
             user=user, for_later_status=constants.ForLaterStatus.ONLY_NOT_FOR_LATER
         )
 
-        with django_assert_num_queries(17):
+        with django_assert_num_queries(16):
             response = logged_in_sync_client.post(
                 reverse(
                     "reading:update_article",
@@ -111,7 +126,7 @@ class TestUpdateArticleView:
             user=user, for_later_status=constants.ForLaterStatus.ONLY_FOR_LATER
         )
 
-        with django_assert_num_queries(17):
+        with django_assert_num_queries(16):
             response = logged_in_sync_client.post(
                 reverse(
                     "reading:update_article",
@@ -137,7 +152,7 @@ class TestUpdateArticleView:
     def test_update_article_view_with_htmx_mark_for_later_reading_list_include_all(
         self, user, logged_in_sync_client, django_assert_num_queries
     ):
-        with django_assert_num_queries(17):
+        with django_assert_num_queries(16):
             response = logged_in_sync_client.post(
                 reverse(
                     "reading:update_article",
@@ -163,7 +178,7 @@ class TestUpdateArticleView:
     def test_update_article_view_for_article_details_read_status_action(
         self, logged_in_sync_client, django_assert_num_queries
     ):
-        with django_assert_num_queries(11):
+        with django_assert_num_queries(12):
             response = logged_in_sync_client.post(
                 self.mark_as_read_url,
                 data={"for_article_details": "True"},
@@ -177,7 +192,7 @@ class TestUpdateArticleView:
     def test_update_article_view_for_article_details_read_and_go_next_status_action_no_next(
         self, logged_in_sync_client, django_assert_num_queries
     ):
-        with django_assert_num_queries(11):
+        with django_assert_num_queries(12):
             response = logged_in_sync_client.post(
                 self.mark_as_read_url,
                 data={"for_article_details": "True", "read_and_go_to_next": ""},
@@ -196,7 +211,7 @@ class TestUpdateArticleView:
         self.article.save()
         next_article = ArticleFactory(user=user, group=group, group_order=2)
 
-        with django_assert_num_queries(12):
+        with django_assert_num_queries(13):
             response = logged_in_sync_client.post(
                 self.mark_as_read_url,
                 data={"for_article_details": "True", "read_and_go_to_next": ""},
@@ -214,7 +229,7 @@ class TestUpdateArticleView:
     def test_update_article_view_for_article_details_favorite_status_action(
         self, logged_in_sync_client, django_assert_num_queries
     ):
-        with django_assert_num_queries(11):
+        with django_assert_num_queries(12):
             response = logged_in_sync_client.post(
                 self.mark_as_favorite_url,
                 data={"for_article_details": "True"},
@@ -250,7 +265,7 @@ class TestMarkArticlesAsReadInBulkView:
         assert response.status_code == HTTPStatus.BAD_REQUEST
 
     def test_mark_one_article_as_read(self, logged_in_sync_client, django_assert_num_queries):
-        with django_assert_num_queries(17):
+        with django_assert_num_queries(16):
             response = logged_in_sync_client.post(
                 self.url,
                 {
@@ -283,7 +298,7 @@ class TestMarkArticlesAsReadInBulkView:
         other_article = ArticleFactory(user=user, read_at=None)
         article_other_user = ArticleFactory(user=other_user, read_at=None)
 
-        with django_assert_num_queries(17):
+        with django_assert_num_queries(16):
             response = logged_in_sync_client.post(
                 self.url,
                 {
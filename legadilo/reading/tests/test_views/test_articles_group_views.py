@@ -55,7 +55,7 @@ class TestArticlesGroupDetailsView:
         )
         ArticleFactory(user=user, read_at=None)
 
-        with django_assert_num_queries(16):
+        with django_assert_num_queries(17):
             response = logged_in_sync_client.post(self.url, {"mark_all_as_read": ""})
 
         assert response.status_code == HTTPStatus.OK
@@ -66,7 +66,7 @@ class TestArticlesGroupDetailsView:
         assert self.group.articles.all().filter(read_at__isnull=True).count() == 0
 
     def test_delete_group(self, user, logged_in_sync_client, django_assert_num_queries):
-        with django_assert_num_queries(12):
+        with django_assert_num_queries(13):
             response = logged_in_sync_client.post(self.url, {"action": "delete_group"})
 
         assert response.status_code == HTTPStatus.FOUND
@@ -79,7 +79,7 @@ class TestArticlesGroupDetailsView:
     def test_delete_group_and_all_its_articles(
         self, user, logged_in_sync_client, django_assert_num_queries
     ):
-        with django_assert_num_queries(18):
+        with django_assert_num_queries(24):
             response = logged_in_sync_client.post(
                 self.url, {"action": "delete_group_and_all_articles"}
             )
@@ -207,7 +207,7 @@ class TestArticlesGroupReadAllArticlesView:
         )
         ArticleFactory(user=user, read_at=None)
 
-        with django_assert_num_queries(8):
+        with django_assert_num_queries(9):
             response = logged_in_sync_client.post(self.url, {})
 
         assert response.status_code == HTTPStatus.FOUND
@@ -46,7 +46,7 @@ class TestCreateCommentView:
     def test_create(self, logged_in_sync_client, user, django_assert_num_queries):
         article = Article.objects.create(user=user)
 
-        with django_assert_num_queries(7):
+        with django_assert_num_queries(8):
             response = logged_in_sync_client.post(
                 self.url,
                 data={
@@ -147,7 +147,7 @@ class TestEditCommentView:
         assert response.context_data["comment"] == self.comment
 
     def test_edit(self, logged_in_sync_client, django_assert_num_queries):
-        with django_assert_num_queries(7):
+        with django_assert_num_queries(8):
             response = logged_in_sync_client.post(self.url, data={"text": "Updated text"})
 
         assert response.status_code == HTTPStatus.OK
@@ -173,7 +173,7 @@ class TestDeleteCommentView:
         assert response.status_code == HTTPStatus.NOT_FOUND
 
     def test_delete(self, logged_in_sync_client, django_assert_num_queries):
-        with django_assert_num_queries(7):
+        with django_assert_num_queries(8):
             response = logged_in_sync_client.post(self.url)
 
         assert response.status_code == HTTPStatus.OK
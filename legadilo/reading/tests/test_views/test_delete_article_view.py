@@ -41,7 +41,7 @@ class TestDeleteArticleView:
         assert response.status_code == HTTPStatus.NOT_FOUND
 
     def test_delete_with_from_url(self, logged_in_sync_client, django_assert_num_queries):
-        with django_assert_num_queries(15):
+        with django_assert_num_queries(18):
             response = logged_in_sync_client.post(self.url, {"from_url": self.reading_list_url})
 
         assert response.status_code == HTTPStatus.OK
@@ -50,7 +50,7 @@ class TestDeleteArticleView:
         assert Article.objects.count() == 0
 
     def test_delete(self, logged_in_sync_client, django_assert_num_queries):
-        with django_assert_num_queries(18):
+        with django_assert_num_queries(19):
             response = logged_in_sync_client.post(
                 self.url,
                 {
@@ -77,7 +77,7 @@ class TestDeleteArticleView:
     def test_delete_article_for_article_details(
         self, logged_in_sync_client, django_assert_num_queries
     ):
-        with django_assert_num_queries(12):
+        with django_assert_num_queries(15):
             response = logged_in_sync_client.post(
                 self.url, {"from_url": self.reading_list_url, "for_article_details": "True"}
             )
@@ -93,7 +93,7 @@ class TestDeleteArticleView:
         feed = FeedFactory(user=user)
         feed_article = FeedArticleFactory(feed=feed, article=self.article)
 
-        with django_assert_num_queries(13):
+        with django_assert_num_queries(16):
             response = logged_in_sync_client.post(
                 self.url, {"from_url": self.reading_list_url, "for_article_details": "True"}
             )
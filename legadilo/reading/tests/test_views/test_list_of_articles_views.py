@@ -4,16 +4,18 @@
 
 from datetime import UTC, datetime
 from http import HTTPStatus
+from unittest.mock import patch
 
 import pytest
-from django.core.paginator import Paginator
+import time_machine
 from django.template.defaultfilters import urlencode
 from django.urls import reverse
 
 from legadilo.conftest import assert_redirected_to_login_page
-from legadilo.core.utils.time_utils import utcnow
+from legadilo.core.utils.time_utils import utcdt, utcnow
 from legadilo.reading import constants
-from legadilo.reading.models import ArticleTag
+from legadilo.reading.models import Article, ArticleTag
+from legadilo.reading.models.article import ArticlesCursor
 from legadilo.reading.tests.factories import ArticleFactory, ReadingListFactory, TagFactory
 
 
@@ -65,7 +67,7 @@ class TestReadingListWithArticlesView:
         assert response.status_code == HTTPStatus.NOT_FOUND
 
     def test_default_view(self, logged_in_sync_client, django_assert_num_queries):
-        with django_assert_num_queries(16):
+        with django_assert_num_queries(11):
             response = logged_in_sync_client.get(self.default_reading_list_url)
 
         assert response.status_code == HTTPStatus.OK
@@ -80,12 +82,11 @@ class TestReadingListWithArticlesView:
             "auto_refresh_interval": 0,
             "is_reading_on_scroll_enabled": False,
         }
-        assert isinstance(response.context_data["articles_paginator"], Paginator)
-        assert response.context_data["articles_page"].object_list == [self.unread_article]
+        assert response.context_data["articles"] == [self.unread_article]
         assert response.context_data.get("update_articles_form") is None
 
     def test_reading_list_view(self, logged_in_sync_client, django_assert_num_queries):
-        with django_assert_num_queries(16):
+        with django_assert_num_queries(11):
             response = logged_in_sync_client.get(self.reading_list_url)
 
         assert response.status_code == HTTPStatus.OK
@@ -100,14 +101,41 @@ class TestReadingListWithArticlesView:
             "is_reading_on_scroll_enabled": True,
             "auto_refresh_interval": 1,
         }
-        assert isinstance(response.context_data["articles_paginator"], Paginator)
-        assert response.context_data["articles_page"].object_list == [
+        assert response.context_data["articles"] == [
             self.read_article,
             self.unread_article,
         ]
         assert response.context_data["from_url"] == self.reading_list_url
         assert response.context_data.get("update_articles_form") is None
 
+    def test_reading_list_view_with_cursor(self, logged_in_sync_client, django_assert_num_queries):
+        with patch.object(constants, "MAX_OBJECTS_PER_PAGE", 1):
+            response = logged_in_sync_client.get(self.reading_list_url)
+
+            assert response.status_code == HTTPStatus.OK
+            assert response.context_data["articles"] == [self.read_article]
+            assert response.context_data["count_articles_of_current_reading_list"]() == 2
+            next_cursor = response.context_data["next_cursor"]
+            assert next_cursor == ArticlesCursor.from_article(self.read_article).encode()
+
+            with django_assert_num_queries(9):
+                response = logged_in_sync_client.get(
+                    self.reading_list_url, {"cursor": next_cursor}, HTTP_HX_REQUEST="true"
+                )
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.template_name == "reading/list_of_articles.html#articles-page"
+        assert response.context_data["articles"] == [self.unread_article]
+        assert response.context_data["next_cursor"] is None
+        assert "reading_lists" not in response.context_data
+
+    def test_reading_list_view_with_invalid_cursor(self, logged_in_sync_client):
+        response = logged_in_sync_client.get(self.reading_list_url, {"cursor": "invalid"})
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.context_data["is_first_page"]
+        assert response.context_data["articles"] == [self.read_article, self.unread_article]
+
 
 @pytest.mark.django_db
 class TestTagWithArticlesView:
@@ -134,7 +162,7 @@ class TestTagWithArticlesView:
         assert response.status_code == HTTPStatus.NOT_FOUND
 
     def test_tag_with_articles_view(self, logged_in_sync_client, django_assert_num_queries):
-        with django_assert_num_queries(11):
+        with django_assert_num_queries(10):
             response = logged_in_sync_client.get(self.url)
 
         assert response.status_code == HTTPStatus.OK
@@ -146,8 +174,7 @@ class TestTagWithArticlesView:
         assert response.context_data["displayed_reading_list"] is None
         assert response.context_data["reading_lists"] == []
         assert response.context_data["js_cfg"] == {}
-        assert isinstance(response.context_data["articles_paginator"], Paginator)
-        assert response.context_data["articles_page"].object_list == [
+        assert response.context_data["articles"] == [
             self.article_in_list,
         ]
         assert response.context_data["update_articles_form"] is not None
@@ -183,7 +210,7 @@ class TestUpdateArticlesFromTagWithArticlesView:
         }
 
     def test_only_article_update_action(self, logged_in_sync_client, django_assert_num_queries):
-        with django_assert_num_queries(14):
+        with django_assert_num_queries(15):
             response = logged_in_sync_client.post(
                 self.url, {"update_action": constants.UpdateArticleActions.MARK_AS_READ}
             )
@@ -200,7 +227,7 @@ class TestUpdateArticlesFromTagWithArticlesView:
         assert self.article_not_in_list.tags.count() == 2
 
     def test_with_tag_actions(self, logged_in_sync_client, django_assert_num_queries):
-        with django_assert_num_queries(27):
+        with django_assert_num_queries(26):
             response = logged_in_sync_client.post(
                 self.url,
                 {
@@ -230,6 +257,20 @@ class TestUpdateArticlesFromTagWithArticlesView:
             self.tag_to_remove.slug,
         }
 
+    def test_remove_displayed_tag_marks_articles_as_updated(self, logged_in_sync_client):
+        with time_machine.travel("2026-01-02 12:00:00", tick=False):
+            response = logged_in_sync_client.post(
+                self.url, {"remove_tags": [self.tag_to_display.slug]}
+            )
+
+        assert response.status_code == HTTPStatus.OK
+        assert list(Article.objects.order_by("id").values_list("obj_updated_at", flat=True)) == [
+            utcdt(2026, 1, 2, 12),
+            utcdt(2026, 1, 2, 12),
+            self.article_not_in_list.obj_updated_at,
+        ]
+        assert self.article_in_list.tags.count() == 0
+
 
 class TestExternalTagWithArticleView:
     @pytest.fixture(autouse=True)
@@ -250,10 +291,10 @@ class TestExternalTagWithArticleView:
         response = logged_in_other_user_sync_client.get(self.url)
 
         assert response.status_code == HTTPStatus.OK
-        assert list(response.context_data["articles_page"].object_list) == []
+        assert response.context_data["articles"] == []
 
     def test_tag_with_articles_view(self, logged_in_sync_client, django_assert_num_queries):
-        with django_assert_num_queries(10):
+        with django_assert_num_queries(9):
             response = logged_in_sync_client.get(self.url)
 
         assert response.status_code == HTTPStatus.OK
@@ -262,8 +303,7 @@ class TestExternalTagWithArticleView:
         assert response.context_data["displayed_reading_list"] is None
         assert response.context_data["reading_lists"] == []
         assert response.context_data["js_cfg"] == {}
-        assert isinstance(response.context_data["articles_paginator"], Paginator)
-        assert response.context_data["articles_page"].object_list == [
+        assert response.context_data["articles"] == [
             self.article_in_list,
         ]
         assert response.context_data["update_articles_form"] is not None
@@ -277,5 +317,4 @@ class TestExternalTagWithArticleView:
         assert response.context_data["displayed_reading_list"] is None
         assert response.context_data["reading_lists"] == []
         assert response.context_data["js_cfg"] == {}
-        assert isinstance(response.context_data["articles_paginator"], Paginator)
-        assert list(response.context_data["articles_page"].object_list) == []
+        assert response.context_data["articles"] == []
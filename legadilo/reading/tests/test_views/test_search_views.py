@@ -14,6 +14,8 @@ from legadilo.core.utils.testing import AnyOfType, dict_to_query_dict
 from legadilo.feeds.models import Feed
 from legadilo.feeds.tests.factories import FeedFactory
 from legadilo.reading import constants
+from legadilo.reading.models import SavedSearch
+from legadilo.reading.models.article import ArticleFullTextSearchQuery, ArticlesTagsSearch
 from legadilo.reading.tests.factories import ArticleFactory, TagFactory
 from legadilo.reading.views.search_views import SearchForm
 
@@ -166,6 +168,14 @@ class TestSearchView:
         assert response.context_data["articles"] == [article]
         assert response.context_data["total_results"] == 1
 
+    def test_search_displays_snippets(self, user, logged_in_sync_client):
+        ArticleFactory(title="Emperors", content="<p>Claudius ruled after Caligula.</p>", user=user)
+
+        response = logged_in_sync_client.get(self.url, data={"q": "Claudius"})
+
+        assert response.status_code == HTTPStatus.OK
+        assert "<mark>Claudius</mark> ruled after Caligula." in response.content.decode()
+
     def test_search_with_accents(self, user, logged_in_sync_client):
         article = ArticleFactory(title="Poésie", user=user)
         ArticleFactory(user=user)
@@ -242,6 +252,18 @@ class TestSearchView:
         assert response.context_data["search_form"].is_valid()
         assert response.context_data["articles"] == [feed_article]
         assert response.context_data["total_results"] == 1
+        assert response.context_data["facets"]["top_feeds"] == [
+            {"id": feed.id, "title": feed.title, "nb_articles": 1}
+        ]
+
+    def test_search_without_results(self, user, logged_in_sync_client):
+        ArticleFactory(user=user, title="Claudius")
+
+        response = logged_in_sync_client.get(self.url, data={"q": "Maximus"})
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.context_data["total_results"] == 0
+        assert response.context_data["facets"] is None
 
     def test_update_search(self, user, logged_in_sync_client):
         ArticleFactory(user=user, title="Claudius")
@@ -259,6 +281,7 @@ class TestSearchView:
             },
             doseq=True,
         )
+        logged_in_sync_client.get(f"{self.url}?{get_data}")
 
         response = logged_in_sync_client.post(
             f"{self.url}?{get_data}",
@@ -281,3 +304,144 @@ class TestSearchView:
         assert response.context_data["search_form"].is_valid()
         assert response.context_data["articles"] == [article_with_tag_to_include]
         assert response.context_data["total_results"] == 1
+        # Facets must not come from the cache filled before the update.
+        assert response.context_data["facets"]["nb_read"] == 1
+        assert response.context_data["facets"]["nb_unread"] == 0
+
+
+@pytest.mark.django_db
+class TestArticlesAutocompleteView:
+    @pytest.fixture(autouse=True)
+    def _setup_data(self, user):
+        self.url = reverse("reading:articles_autocomplete")
+        self.article = ArticleFactory(user=user, title="Claudius the emperor")
+        ArticleFactory(user=user, title="Nero")
+
+    def test_not_logged_in(self, client):
+        response = client.get(self.url)
+
+        assert response.status_code == HTTPStatus.FORBIDDEN
+
+    def test_other_user(self, logged_in_other_user_sync_client):
+        response = logged_in_other_user_sync_client.get(self.url, data={"q": "clau"})
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == []
+
+    def test_autocomplete(self, logged_in_sync_client, django_assert_num_queries):
+        with django_assert_num_queries(6):
+            response = logged_in_sync_client.get(self.url, data={"q": "clau emp"})
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == [
+            {
+                "value": self.article.id,
+                "label": "Claudius the emperor",
+                "url": f"http://testserver/reading/articles/{self.article.id}-claudius-the-emperor/",
+            }
+        ]
+
+    def test_autocomplete_with_htmx(self, logged_in_sync_client):
+        response = logged_in_sync_client.get(self.url, data={"q": "clau"}, HTTP_HX_REQUEST="true")
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.template_name == "reading/search.html#search-suggestions"
+        assert " ".join(response.content.decode().split()) == (
+            '<option value="Claudius the emperor"></option>'
+        )
+
+
+@pytest.mark.django_db
+class TestSaveSearchView:
+    @pytest.fixture(autouse=True)
+    def _setup_data(self):
+        self.url = reverse("reading:save_search")
+
+    def test_not_logged_in(self, client):
+        response = client.post(self.url)
+
+        assert_redirected_to_login_page(response)
+
+    def test_save_search(self, user, logged_in_sync_client):
+        article = ArticleFactory(user=user, title="Claudius")
+        ArticleFactory(user=user, title="Nero")
+
+        response = logged_in_sync_client.post(f"{self.url}?q=Claudius", data={"title": "My search"})
+
+        saved_search = SavedSearch.objects.get()
+        assert response.status_code == HTTPStatus.FOUND
+        assert response["Location"] == reverse(
+            "reading:saved_search", kwargs={"saved_search_id": saved_search.id}
+        )
+        assert saved_search.user == user
+        assert saved_search.title == "My search"
+        assert saved_search.query_string == "q=Claudius"
+        assert saved_search.article_ids == [article.id]
+
+    def test_save_invalid_search(self, logged_in_sync_client):
+        response = logged_in_sync_client.post(
+            f"{self.url}?articles_max_age_value=2", data={"title": "My search"}
+        )
+
+        assert response.status_code == HTTPStatus.FOUND
+        assert response["Location"] == f"{reverse('reading:search')}?articles_max_age_value=2"
+        assert SavedSearch.objects.count() == 0
+
+
+@pytest.mark.django_db
+class TestSavedSearchView:
+    @pytest.fixture(autouse=True)
+    def _setup_data(self, user):
+        self.article = ArticleFactory(user=user, title="Claudius")
+        self.saved_search = SavedSearch.objects.create_from_search(
+            user,
+            "My search",
+            "q=Claudius",
+            ArticleFullTextSearchQuery(q="Claudius"),
+            ArticlesTagsSearch(),
+        )
+        self.url = reverse("reading:saved_search", kwargs={"saved_search_id": self.saved_search.id})
+
+    def test_not_logged_in(self, client):
+        response = client.get(self.url)
+
+        assert_redirected_to_login_page(response)
+
+    def test_other_user(self, logged_in_other_user_sync_client):
+        response = logged_in_other_user_sync_client.get(self.url)
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    def test_view(self, user, logged_in_sync_client, django_assert_num_queries):
+        deleted_article = ArticleFactory(user=user, title="Claudius")
+        self.saved_search.article_ids.append(deleted_article.id)
+        self.saved_search.article_sort_keys.append(self.saved_search.article_sort_keys[0])
+        self.saved_search.save()
+        deleted_article.delete()
+
+        # The snapshot was just computed: it's not refreshed again.
+        with django_assert_num_queries(9):
+            response = logged_in_sync_client.get(self.url)
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.template_name == "reading/saved_search.html"
+        assert response.context_data["saved_search"] == self.saved_search
+        assert response.context_data["articles"] == [self.article]
+
+    def test_refresh(self, user, logged_in_sync_client):
+        new_article = ArticleFactory(user=user, title="Claudius")
+
+        response = logged_in_sync_client.post(self.url, data={"action": "refresh"})
+
+        assert response.status_code == HTTPStatus.OK
+        assert set(response.context_data["saved_search"].article_ids) == {
+            self.article.id,
+            new_article.id,
+        }
+
+    def test_delete(self, logged_in_sync_client):
+        response = logged_in_sync_client.post(self.url, data={"action": "delete"})
+
+        assert response.status_code == HTTPStatus.FOUND
+        assert response["Location"] == reverse("reading:search")
+        assert SavedSearch.objects.count() == 0
@@ -72,6 +72,17 @@ urlpatterns = [
         "lists/edit/<int:reading_list_id>/", views.reading_list_edit_view, name="edit_reading_list"
     ),
     path("search/", views.search_view, name="search"),
+    path(
+        "search/autocomplete/",
+        views.articles_autocomplete_view,
+        name="articles_autocomplete",
+    ),
+    path("search/saved/", views.save_search_view, name="save_search"),
+    path(
+        "search/saved/<int:saved_search_id>/",
+        views.saved_search_view,
+        name="saved_search",
+    ),
     path("comment/", views.create_comment_view, name="create_comment"),
     path("comment/<int:pk>/", views.display_comment_view, name="display_comment"),
     path("comment/<int:pk>/edit/", views.edit_comment_view, name="edit_comment"),
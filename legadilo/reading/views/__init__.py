@@ -30,7 +30,12 @@ from .reading_lists_admin_views import (
     reading_list_admin_view,
     reading_list_edit_view,
 )
-from .search_views import search_view
+from .search_views import (
+    articles_autocomplete_view,
+    save_search_view,
+    saved_search_view,
+    search_view,
+)
 from .tag_views import tags_autocomplete_view
 from .tags_admin_views import edit_tag_view, tags_admin_view
 
@@ -38,6 +43,7 @@ __all__ = [
     "add_article_view",
     "article_details_view",
     "article_groups_read_all_articles_view",
+    "articles_autocomplete_view",
     "articles_group_autocomplete_view",
     "articles_group_details_view",
     "articles_groups_list_view",
@@ -53,6 +59,8 @@ __all__ = [
     "reading_list_edit_view",
     "reading_list_with_articles_view",
     "refetch_article_view",
+    "save_search_view",
+    "saved_search_view",
     "search_view",
     "tag_with_articles_view",
     "tags_admin_view",
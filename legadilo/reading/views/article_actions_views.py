@@ -100,11 +100,10 @@ def get_common_template_context(
     deleting_article: bool = False,
 ) -> dict[str, Any]:
     from_url = get_from_url_for_article_details(request, request.POST)
+    reading_lists_ctx = ReadingList.objects.get_context_for_user(request.user)
     try:
         displayed_reading_list_id = int(request.POST.get("displayed_reading_list_id"))  # type: ignore[arg-type]
-        displayed_reading_list = ReadingList.objects.select_related("user").get(
-            id=displayed_reading_list_id
-        )
+        displayed_reading_list = reading_lists_ctx.get_reading_list_by_id(displayed_reading_list_id)
         count_articles_of_current_reading_list = Article.objects.get_articles_of_reading_list(
             displayed_reading_list
         ).count()
@@ -129,13 +128,12 @@ def get_common_template_context(
         js_cfg = {}
         delete_article_card = False
 
-    reading_lists = ReadingList.objects.get_all_for_user(request.user)
-    count_unread_articles_of_reading_lists = Article.objects.count_unread_articles_of_reading_lists(
-        request.user, reading_lists
+    count_unread_articles_of_reading_lists = Article.objects.get_unread_counters_of_reading_lists(
+        request.user, reading_lists_ctx.reading_lists
     )
 
     return {
-        "reading_lists": reading_lists,
+        "reading_lists": reading_lists_ctx.reading_lists,
         "count_unread_articles_of_reading_lists": count_unread_articles_of_reading_lists,
         "displayed_reading_list": displayed_reading_list,
         "js_cfg": js_cfg,
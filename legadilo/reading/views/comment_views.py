@@ -65,6 +65,7 @@ def create_comment_view(
 
     article = get_object_or_404(Article, id=form.cleaned_data["article_id"], user=request.user)
     comment = Comment.objects.create(article=article, text=form.cleaned_data["text"])
+    Article.objects.get_queryset().filter(id=article.id).mark_as_updated()
 
     return TemplateResponse(
         request,
@@ -100,6 +101,7 @@ def edit_comment_view(request: AuthenticatedHttpRequest, pk: int) -> TemplateRes
         form = CommentArticleForm(request.POST, instance=comment)
         if form.is_valid():
             form.save()
+            Article.objects.get_queryset().filter(id=comment.article_id).mark_as_updated()
             return TemplateResponse(
                 request, "reading/partials/comment.html#comment-card", {"comment": comment}
             )
@@ -120,5 +122,6 @@ def delete_comment_view(request: AuthenticatedHttpRequest, pk: int) -> HttpRespo
     comment = get_object_or_404(Comment, pk=pk, article__user=request.user)
 
     comment.delete()
+    Article.objects.get_queryset().filter(id=comment.article_id).mark_as_updated()
 
     return HttpResponse()
@@ -204,7 +204,10 @@ def _handle_articles_group_save(
 @require_http_methods(["POST"])
 @login_required
 def refetch_article_view(request: AuthenticatedHttpRequest) -> HttpResponseRedirect:
-    article = get_object_or_404(Article, url=request.POST.get("url"), user=request.user)
+    article = get_object_or_404(
+        Article.objects.get_queryset().for_url_search([request.POST.get("url", "")]),
+        user=request.user,
+    )
     _status, _form, save_result = _handle_article_save(
         request,
         force_update=True,
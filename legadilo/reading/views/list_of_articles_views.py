@@ -3,13 +3,13 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
 
+from functools import cache
 from http import HTTPStatus
 from typing import Any
 from urllib.parse import unquote_plus, urlencode
 
 from django import forms
 from django.contrib.auth.decorators import login_required
-from django.core.paginator import Paginator
 from django.db import transaction
 from django.http import Http404, HttpResponse, HttpResponseRedirect
 from django.shortcuts import get_object_or_404
@@ -22,11 +22,10 @@ from django.views.decorators.http import require_GET, require_http_methods
 from config import settings
 from legadilo.core.forms.fields import MultipleTagsField
 from legadilo.core.forms.widgets import SelectMultipleAutocompleteWidget
-from legadilo.core.utils.pagination import get_requested_page
-from legadilo.core.utils.validators import get_page_number_from_request
 from legadilo.reading import constants
 from legadilo.reading.models import Article, ArticleTag, ReadingList, Tag
-from legadilo.reading.models.article import ArticleQuerySet
+from legadilo.reading.models.article import ArticleQuerySet, ArticlesCursor
+from legadilo.reading.models.reading_list import ReadingListsContext
 from legadilo.users.user_types import AuthenticatedHttpRequest
 
 from ._utils import get_js_cfg_from_reading_list
@@ -38,10 +37,9 @@ from ._utils import get_js_cfg_from_reading_list
 def reading_list_with_articles_view(
     request: AuthenticatedHttpRequest, reading_list_slug: str | None = None
 ) -> HttpResponse:
+    reading_lists_ctx = ReadingList.objects.get_context_for_user(request.user)
     try:
-        displayed_reading_list = ReadingList.objects.get_reading_list(
-            request.user, reading_list_slug
-        )
+        displayed_reading_list = reading_lists_ctx.get_reading_list(reading_list_slug)
     except ReadingList.DoesNotExist as e:
         if reading_list_slug is not None:
             raise Http404("No reading list found") from e
@@ -64,17 +62,19 @@ def reading_list_with_articles_view(
                     "articles_reading_time": displayed_reading_list.articles_reading_time,
                     "articles_reading_time_operator": displayed_reading_list.articles_reading_time_operator,  # noqa: E501
                     "include_tag_operator": displayed_reading_list.include_tag_operator,
-                    "tags_to_include": displayed_reading_list.reading_list_tags.get_selected_values(
+                    "tags_to_include": displayed_reading_list.get_tag_slugs(
                         constants.ReadingListTagFilterType.INCLUDE
                     ),
                     "exclude_tag_operator": displayed_reading_list.exclude_tag_operator,
-                    "tags_to_exclude": displayed_reading_list.reading_list_tags.get_selected_values(
+                    "tags_to_exclude": displayed_reading_list.get_tag_slugs(
                         constants.ReadingListTagFilterType.EXCLUDE
                     ),
                 },
                 doseq=True,
             ),
         },
+        order_direction=constants.ReadingListOrderDirection(displayed_reading_list.order_direction),
+        reading_lists_ctx=reading_lists_ctx,
     )
 
 
@@ -83,45 +83,57 @@ def _display_list_of_articles(
     articles_qs: ArticleQuerySet,
     page_ctx: dict[str, Any],
     *,
+    order_direction: constants.ReadingListOrderDirection = constants.ReadingListOrderDirection.DESC,
+    reading_lists_ctx: ReadingListsContext | None = None,
     status: HTTPStatus = HTTPStatus.OK,
 ) -> TemplateResponse:
-    articles_per_page = (
-        constants.MAX_ARTICLES_PER_PAGE_WITH_READ_ON_SCROLL
-        if page_ctx.get("js_cfg", {}).get("is_reading_on_scroll_enabled")
-        else constants.MAX_OBJECTS_PER_PAGE
-    )
-    articles_paginator = Paginator(
-        articles_qs,
-        articles_per_page,
-        # Prevent pages with less that 10% of the number of articles. Display them on the previous
-        # page instead of as orphans.
-        orphans=int(articles_per_page * constants.PAGINATION_ORPHANS_PERCENTAGE),
-    )
-    requested_page = get_page_number_from_request(request)
-    articles_page = get_requested_page(articles_paginator, requested_page)
-    reading_lists = ReadingList.objects.get_all_for_user(request.user)
-    count_unread_articles_of_reading_lists = Article.objects.count_unread_articles_of_reading_lists(
-        request.user, reading_lists
+    cursor = ArticlesCursor.decode(request.GET.get("cursor", ""))
+    page_qs = articles_qs.after_cursor(cursor, order_direction) if cursor else articles_qs
+    # Fetch one more article to know whether there is a next page without counting.
+    articles = list(page_qs[: constants.MAX_OBJECTS_PER_PAGE + 1])
+    next_cursor = None
+    if len(articles) > constants.MAX_OBJECTS_PER_PAGE:
+        articles = articles[: constants.MAX_OBJECTS_PER_PAGE]
+        next_cursor = ArticlesCursor.from_article(articles[-1]).encode()
+
+    articles_page_ctx = {
+        **page_ctx,
+        "articles": articles,
+        "is_first_page": cursor is None,
+        "next_cursor": next_cursor,
+        "from_url": request.get_full_path(),
+    }
+    headers = {
+        "Pragma": "no-cache",
+        "Cache-Control": "no-cache, no-store, must-revalidate, max-age=0",
+    }
+    if cursor and request.htmx and not request.htmx.boosted:
+        # Infinite scroll: only render the next articles.
+        return TemplateResponse(
+            request,
+            "reading/list_of_articles.html#articles-page",
+            articles_page_ctx,
+            status=status,
+            headers=headers,
+        )
+
+    if reading_lists_ctx is None:
+        reading_lists_ctx = ReadingList.objects.get_context_for_user(request.user)
+    count_unread_articles_of_reading_lists = Article.objects.get_unread_counters_of_reading_lists(
+        request.user, reading_lists_ctx.reading_lists
     )
 
     response_ctx = {
-        **page_ctx,
+        **articles_page_ctx,
         "base": {
             "fluid_content": True,
         },
-        "reading_lists": reading_lists,
+        "reading_lists": reading_lists_ctx.reading_lists,
         "count_unread_articles_of_reading_lists": count_unread_articles_of_reading_lists,
-        "count_articles_of_current_reading_list": articles_paginator.count,
-        "articles_page": articles_page,
-        "next_page_number": articles_page.next_page_number if articles_page.has_next() else None,
-        "articles_paginator": articles_paginator,
-        "elided_page_range": articles_paginator.get_elided_page_range(requested_page),
-        "from_url": request.get_full_path(),
-    }
-
-    headers = {
-        "Pragma": "no-cache",
-        "Cache-Control": "no-cache, no-store, must-revalidate, max-age=0",
+        # Only count when the template needs it and if we can't know it already.
+        "count_articles_of_current_reading_list": len(articles)
+        if cursor is None and next_cursor is None
+        else cache(articles_qs.count),
     }
 
     return TemplateResponse(
@@ -241,16 +253,23 @@ def update_list_of_articles(request: AuthenticatedHttpRequest, articles_qs: Arti
     if not form.is_valid():
         return HTTPStatus.BAD_REQUEST, form
 
+    # Changing the tags can change the articles matching the queryset: capture them first.
+    updated_articles_qs = Article.objects.get_queryset().filter(
+        id__in=list(articles_qs.order_by().values_list("id", flat=True))
+    )
     if form.cleaned_data["add_tags"]:
         tags_to_add = Tag.objects.get_or_create_from_list(
             request.user, form.cleaned_data["add_tags"]
         )
-        ArticleTag.objects.associate_articles_with_tags(articles_qs.all(), tags_to_add)
+        ArticleTag.objects.associate_articles_with_tags(updated_articles_qs.all(), tags_to_add)
 
     if form.cleaned_data["remove_tags"]:
         tags_to_delete = Tag.objects.get_from_list(request.user, form.cleaned_data["remove_tags"])
-        ArticleTag.objects.dissociate_articles_with_tags(articles_qs.all(), tags_to_delete)
+        ArticleTag.objects.dissociate_articles_with_tags(updated_articles_qs.all(), tags_to_delete)
+
+    if form.cleaned_data["add_tags"] or form.cleaned_data["remove_tags"]:
+        updated_articles_qs.all().mark_as_updated()
 
-    articles_qs.all().update_articles_from_action(form.cleaned_data["update_action"])
+    updated_articles_qs.all().update_articles_from_action(form.cleaned_data["update_action"])
 
     return HTTPStatus.OK, UpdateArticlesForm()
@@ -6,27 +6,31 @@ import logging
 from http import HTTPStatus
 
 from django import forms
+from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
 from django.db import models
-from django.http import QueryDict
+from django.http import HttpResponseRedirect, JsonResponse, QueryDict
+from django.shortcuts import get_object_or_404
 from django.template.response import TemplateResponse
-from django.urls import reverse_lazy
+from django.urls import reverse, reverse_lazy
 from django.utils.translation import gettext_lazy as _
-from django.views.decorators.http import require_http_methods
+from django.views.decorators.http import require_GET, require_http_methods, require_POST
 
 from legadilo.core.forms.fields import MultipleTagsField
 from legadilo.core.forms.widgets import SelectMultipleAutocompleteWidget
+from legadilo.core.utils.pagination import get_requested_page
 from legadilo.core.utils.types import FormChoices
-from legadilo.core.utils.validators import is_url_valid
+from legadilo.core.utils.validators import get_page_number_from_request, is_url_valid
 from legadilo.reading import constants
-from legadilo.reading.models import Article, Tag
+from legadilo.reading.models import Article, SavedSearch, Tag
 from legadilo.reading.models.article import (
     ArticleFullTextSearchQuery,
-    ArticleQuerySet,
     ArticlesTagsSearch,
 )
 from legadilo.users.user_types import AuthenticatedHttpRequest
+from legadilo.users.view_decorators import require_cookie_login_or_api_auth
 
 from ...users.models import User
 from .list_of_articles_views import UpdateArticlesForm, update_list_of_articles
@@ -41,7 +45,21 @@ class FeedMultipleChoiceField(forms.ModelMultipleChoiceField):
 
 class SearchForm(forms.Form):
     # Main fields.
-    q = forms.CharField(required=False, min_length=0, label=_("Search query"))
+    q = forms.CharField(
+        required=False,
+        min_length=0,
+        label=_("Search query"),
+        widget=forms.TextInput(
+            attrs={
+                "list": "search-suggestions",
+                "autocomplete": "off",
+                "hx-get": reverse_lazy("reading:articles_autocomplete"),
+                "hx-trigger": "input changed delay:300ms",
+                "hx-target": "#search-suggestions",
+                "hx-sync": "this:replace",
+            }
+        ),
+    )
     search_type = forms.ChoiceField(
         required=False,
         choices=constants.ArticleSearchType.choices,
@@ -266,22 +284,18 @@ class SearchForm(forms.Form):
             raise ValidationError(errors)
 
 
+class SaveSearchForm(forms.Form):
+    title = forms.CharField(
+        label=_("Title of the saved search"),
+        max_length=constants.SAVED_SEARCH_TITLE_MAX_LENGTH,
+    )
+
+
 @require_http_methods(["GET", "POST"])
 @login_required
 def search_view(request: AuthenticatedHttpRequest) -> TemplateResponse:
     status = HTTPStatus.OK
-    tags_to_include_choices = Tag.objects.get_putative_choices(
-        request.user, request.GET.getlist("tags_to_include", [])
-    )
-    tags_to_exclude_choices = Tag.objects.get_putative_choices(
-        request.user, request.GET.getlist("tags_to_exclude", [])
-    )
-    search_form = SearchForm(
-        request.GET,
-        tags_to_include_choices=tags_to_include_choices,
-        tags_to_exclude_choices=tags_to_exclude_choices,
-        feeds_qs=request.user.feeds.all(),
-    )
+    search_form = _build_search_form(request)
     update_articles_form = UpdateArticlesForm(request.POST)
     # We don't do anything unless we have a valid search.
     if not search_form.is_valid():
@@ -293,24 +307,34 @@ def search_view(request: AuthenticatedHttpRequest) -> TemplateResponse:
                 "update_articles_form": update_articles_form,
                 "articles": [],
                 "total_results": 0,
+                "facets": None,
+                "save_search_form": SaveSearchForm(),
+                "saved_searches": SavedSearch.objects.get_queryset().for_user(request.user),
             },
             status=HTTPStatus.BAD_REQUEST,
         )
 
+    search_query, tags_search = _build_search_queries(request.user, search_form)
     if request.method == "POST":
         # We update the articles of the current search.
-        articles_qs = _search(request.user, search_form)
-        # articles_qs is based on a union, so we can't rely on filter or paginators. Since we need
-        # these features, we extract the ids of the articles to update and build a new QS.
+        articles_qs = Article.objects.search(request.user, search_query, tags_search)
+        # articles_qs is ranked and ordered by relevance: this is useless to update the articles.
+        # Extract the ids of the articles to update and build a new QS.
         article_ids_to_update = set(articles_qs.values_list("id", flat=True))
         status, update_articles_form = update_list_of_articles(
             request, Article.objects.get_queryset().filter(id__in=article_ids_to_update)
         )
 
     # Articles have been updated. Some may not be part of the search anymore. Rerun it.
-    articles_qs = _search(request.user, search_form)
+    articles_qs = Article.objects.search(request.user, search_query, tags_search)
     articles = list(articles_qs[: constants.MAX_OBJECTS_PER_PAGE])
     total_results = articles_qs.count()
+    facets = None
+    if total_results > 0:
+        # Cached facets may not reflect the articles we just updated.
+        facets = Article.objects.get_search_facets(
+            request.user, search_query, tags_search, use_cache=request.method != "POST"
+        )
 
     return TemplateResponse(
         request,
@@ -320,12 +344,32 @@ def search_view(request: AuthenticatedHttpRequest) -> TemplateResponse:
             "update_articles_form": update_articles_form,
             "articles": articles,
             "total_results": total_results,
+            "facets": facets,
+            "save_search_form": SaveSearchForm(),
+            "saved_searches": SavedSearch.objects.get_queryset().for_user(request.user),
         },
         status=status,
     )
 
 
-def _search(user: User, search_form: SearchForm) -> ArticleQuerySet:
+def _build_search_form(request: AuthenticatedHttpRequest) -> SearchForm:
+    tags_to_include_choices = Tag.objects.get_putative_choices(
+        request.user, request.GET.getlist("tags_to_include", [])
+    )
+    tags_to_exclude_choices = Tag.objects.get_putative_choices(
+        request.user, request.GET.getlist("tags_to_exclude", [])
+    )
+    return SearchForm(
+        request.GET,
+        tags_to_include_choices=tags_to_include_choices,
+        tags_to_exclude_choices=tags_to_exclude_choices,
+        feeds_qs=request.user.feeds.all(),
+    )
+
+
+def _build_search_queries(
+    user: User, search_form: SearchForm
+) -> tuple[ArticleFullTextSearchQuery, ArticlesTagsSearch]:
     tags_to_include = search_form.cleaned_data.get("tags_to_include", [])
     tags_to_exclude = search_form.cleaned_data.get("tags_to_exclude", [])
     all_slugs = {
@@ -366,4 +410,107 @@ def _search(user: User, search_form: SearchForm) -> ArticleQuerySet:
             "exclude_tag_operator", constants.ReadingListTagOperator.ALL
         ),
     )
-    return Article.objects.search(user, query, articles_tags_search)
+    return query, articles_tags_search
+
+
+@require_POST
+@login_required
+def save_search_view(request: AuthenticatedHttpRequest) -> HttpResponseRedirect:
+    search_form = _build_search_form(request)
+    save_search_form = SaveSearchForm(request.POST)
+    if not search_form.is_valid() or not save_search_form.is_valid():
+        messages.error(request, _("Failed to save the search. Please check it and try again."))
+        return HttpResponseRedirect(f"{reverse('reading:search')}?{request.GET.urlencode()}")
+
+    search_query, tags_search = _build_search_queries(request.user, search_form)
+    saved_search = SavedSearch.objects.create_from_search(
+        request.user,
+        save_search_form.cleaned_data["title"],
+        request.GET.urlencode(),
+        search_query,
+        tags_search,
+    )
+    return HttpResponseRedirect(
+        reverse("reading:saved_search", kwargs={"saved_search_id": saved_search.id})
+    )
+
+
+@require_http_methods(["GET", "POST"])
+@login_required
+def saved_search_view(
+    request: AuthenticatedHttpRequest, saved_search_id: int
+) -> TemplateResponse | HttpResponseRedirect:
+    saved_search = get_object_or_404(
+        SavedSearch.objects.get_queryset().for_user(request.user).select_related("user"),
+        id=saved_search_id,
+    )
+    if request.method == "POST" and request.POST.get("action") == "delete":
+        saved_search.delete()
+        return HttpResponseRedirect(reverse("reading:search"))
+
+    saved_search = SavedSearch.objects.refresh_snapshot(
+        saved_search, full=request.method == "POST" and request.POST.get("action") == "refresh"
+    )
+    # Articles are served from the snapshot: only the articles of the page are fetched, by id.
+    articles_paginator = Paginator(
+        saved_search.article_ids,
+        constants.MAX_OBJECTS_PER_PAGE,
+        orphans=int(constants.MAX_OBJECTS_PER_PAGE * constants.PAGINATION_ORPHANS_PERCENTAGE),
+    )
+    requested_page = get_page_number_from_request(request)
+    articles_page = get_requested_page(articles_paginator, requested_page)
+    articles_by_id = (
+        Article.objects
+        .get_queryset()
+        .for_user(request.user)
+        .select_related("main_feed")
+        .prefetch_related("tags")
+        .in_bulk(articles_page.object_list)
+    )
+
+    return TemplateResponse(
+        request,
+        "reading/saved_search.html",
+        {
+            "saved_search": saved_search,
+            # Deleted articles are still in the snapshot until the next full refresh.
+            "articles": [
+                articles_by_id[article_id]
+                for article_id in articles_page.object_list
+                if article_id in articles_by_id
+            ],
+            "articles_page": articles_page,
+            "articles_paginator": articles_paginator,
+            "elided_page_range": articles_paginator.get_elided_page_range(requested_page),
+            "from_url": reverse(
+                "reading:saved_search", kwargs={"saved_search_id": saved_search.id}
+            ),
+        },
+    )
+
+
+@require_GET
+@require_cookie_login_or_api_auth
+def articles_autocomplete_view(request: AuthenticatedHttpRequest):
+    choices = Article.objects.get_autocomplete_choices(request.user, request.GET.get("q", ""))
+    if request.htmx:
+        return TemplateResponse(
+            request, "reading/search.html#search-suggestions", {"autocomplete_choices": choices}
+        )
+
+    return JsonResponse(
+        [
+            {
+                "value": choice["id"],
+                "label": choice["title"],
+                "url": request.build_absolute_uri(
+                    reverse(
+                        "reading:article_details",
+                        kwargs={"article_id": choice["id"], "article_slug": choice["slug"]},
+                    )
+                ),
+            }
+            for choice in choices
+        ],
+        safe=False,
+    )
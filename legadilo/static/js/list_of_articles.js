@@ -24,7 +24,11 @@
   };
 
   const setupReadAction = () => {
-    for (const openOriginalButton of document.querySelectorAll(".open-original")) {
+    // Articles of the next pages are loaded on scroll: only set up the new ones.
+    for (const openOriginalButton of document.querySelectorAll(
+      ".open-original:not([data-read-action-setup])",
+    )) {
+      openOriginalButton.dataset.readActionSetup = "true";
       openOriginalButton.addEventListener("click", openAndMarkAsRead);
       openOriginalButton.addEventListener("auxclick", openAndMarkAsRead);
     }
@@ -210,6 +214,7 @@
   window.addEventListener("load", () => {
     jsCfg = JSON.parse(document.head.querySelector("#js-cfg").textContent);
     setupReadAction();
+    document.addEventListener("htmx:afterSettle", setupReadAction);
     setupReadOnScroll();
     setupAutoRefresh();
     setupMobileScroll();